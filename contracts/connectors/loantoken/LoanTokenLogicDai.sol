@@ -236,18 +236,6 @@ contract LoanTokenLogicDai is LoanTokenLogicStandard {
             .div(10**9);
     }
 
-    function totalSupplyInterestRate(
-        uint256 assetSupply)
-        public
-        view
-        returns (uint256)
-    {
-        uint256 supplyRate = super.totalSupplyInterestRate(assetSupply);
-        return supplyRate != 0 ?
-            supplyRate :
-            dsr();
-    }
-
 
     /* Internal functions */
 
@@ -261,7 +249,7 @@ contract LoanTokenLogicDai is LoanTokenLogicStandard {
     {
         require (depositAmount != 0, "17");
 
-        uint256 currentPrice = _tokenPrice(_totalAssetSupply(0));
+        uint256 currentPrice = _tokenPrice(_totalAssetSupply(_getPoolState(false), 0));
         uint256 currentChaiPrice;
         IERC20 inAsset;
 
@@ -314,7 +302,7 @@ contract LoanTokenLogicDai is LoanTokenLogicStandard {
             burnAmount = balanceOf(msg.sender);
         }
 
-        uint256 currentPrice = _tokenPrice(_totalAssetSupply(0));
+        uint256 currentPrice = _tokenPrice(_totalAssetSupply(_getPoolState(false), 0));
 
         uint256 loanAmountOwed = burnAmount
             .mul(currentPrice)
@@ -451,14 +439,28 @@ contract LoanTokenLogicDai is LoanTokenLogicStandard {
 
     /* Internal View functions */
 
+    function _totalSupplyInterestRate(
+        PoolState memory state,
+        uint256 assetSupply)
+        internal
+        view
+        returns (uint256)
+    {
+        uint256 supplyRate = super._totalSupplyInterestRate(state, assetSupply);
+        return supplyRate != 0 ?
+            supplyRate :
+            dsr();
+    }
+
     // next supply interest adjustment
     function _supplyInterestRate(
-        uint256 assetBorrow,
+        PoolState memory state,
         uint256 assetSupply)
         internal
         view
         returns (uint256)
     {
+        uint256 assetBorrow = state.assetBorrow;
         uint256 _dsr = dsr();
         if (assetBorrow != 0 && assetSupply >= assetBorrow) {
             uint256 localBalance = _getDai().balanceOf(address(this));
@@ -482,9 +484,9 @@ contract LoanTokenLogicDai is LoanTokenLogicStandard {
                 );
             }
 
-            uint256 rate = _avgBorrowInterestRate(assetBorrow)
+            uint256 rate = _avgBorrowInterestRate(assetBorrow, state.interestOwedPerDay)
                 .mul(_utilRate)
-                .mul(SafeMath.sub(WEI_PERCENT_PRECISION, IBZx(bZxContract).lendingFeePercent()))
+                .mul(SafeMath.sub(WEI_PERCENT_PRECISION, state.lendingFeePercent))
                 .div(WEI_PERCENT_PRECISION);
             return rate
                 .add(_dsr)
@@ -44,6 +44,15 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
     bytes32 internal constant iToken_LowerAdminAddress = 0x7ad06df6a0af6bd602d90db766e0d5f253b45187c3717a0f9026ea8b10ff0d4b;    // keccak256("iToken_LowerAdminAddress")
     bytes32 internal constant iToken_LowerAdminContract = 0x34b31cff1dbd8374124bd4505521fc29cab0f9554a5386ba7d784a4e611c7e31;   // keccak256("iToken_LowerAdminContract")
 
+    // protocol and token state read once per call, see _getPoolState
+    struct PoolState {
+        uint256 assetBorrow;            // totalAssetBorrow
+        uint256 assetBalance;           // _underlyingBalance
+        uint256 interestOwedPerDay;     // 0 unless read with interest
+        uint256 interestUnPaid;         // 0 unless read with interest, net of the lending fee
+        uint256 lendingFeePercent;      // 0 unless read with interest
+    }
+
 
     constructor(
         address _newOwner)
@@ -409,12 +418,8 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
         view
         returns (uint256) // price
     {
-        uint256 interestUnPaid;
-        if (lastSettleTime_ != uint88(block.timestamp)) {
-            (,interestUnPaid) = _getAllInterest();
-        }
-
-        return _tokenPrice(_totalAssetSupply(interestUnPaid));
+        PoolState memory state = _getPoolState(lastSettleTime_ != uint88(block.timestamp));
+        return _tokenPrice(_totalAssetSupply(state, state.interestUnPaid));
     }
 
     function checkpointPrice(
@@ -431,8 +436,9 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
         view
         returns (uint256)
     {
-        uint256 totalSupply = _totalAssetSupply(0);
-        uint256 totalBorrow = totalAssetBorrow();
+        PoolState memory state = _getPoolState(false);
+        uint256 totalSupply = _totalAssetSupply(state, 0);
+        uint256 totalBorrow = state.assetBorrow;
         if (totalSupply > totalBorrow) {
             return totalSupply - totalBorrow;
         }
@@ -443,7 +449,8 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
         view
         returns (uint256)
     {
-        return _avgBorrowInterestRate(totalAssetBorrow());
+        (uint256 interestOwedPerDay,,,uint256 assetBorrow) = _getAllInterest();
+        return _avgBorrowInterestRate(assetBorrow, interestOwedPerDay);
     }
 
     // the minimum rate the next base protocol borrower will receive for variable-rate loans
@@ -470,7 +477,8 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
         view
         returns (uint256)
     {
-        return totalSupplyInterestRate(_totalAssetSupply(0));
+        PoolState memory state = _getPoolState(true);
+        return _totalSupplyInterestRate(state, _totalAssetSupply(state, 0));
     }
 
     function nextSupplyInterestRate(
@@ -479,7 +487,8 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
         view
         returns (uint256)
     {
-        return totalSupplyInterestRate(_totalAssetSupply(0).add(supplyAmount));
+        PoolState memory state = _getPoolState(true);
+        return _totalSupplyInterestRate(state, _totalAssetSupply(state, 0).add(supplyAmount));
     }
 
     function totalSupplyInterestRate(
@@ -488,13 +497,7 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
         view
         returns (uint256)
     {
-        uint256 assetBorrow = totalAssetBorrow();
-        if (assetBorrow != 0) {
-            return _supplyInterestRate(
-                assetBorrow,
-                assetSupply
-            );
-        }
+        return _totalSupplyInterestRate(_getPoolState(true), assetSupply);
     }
 
     function totalAssetBorrow()
@@ -513,12 +516,8 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
         view
         returns (uint256)
     {
-        uint256 interestUnPaid;
-        if (lastSettleTime_ != uint88(block.timestamp)) {
-            (,interestUnPaid) = _getAllInterest();
-        }
-
-        return _totalAssetSupply(interestUnPaid);
+        PoolState memory state = _getPoolState(lastSettleTime_ != uint88(block.timestamp));
+        return _totalAssetSupply(state, state.interestUnPaid);
     }
 
     function getMaxEscrowAmount(
@@ -593,13 +592,14 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
         returns (uint256) // depositAmount
     {
         if (borrowAmount != 0) {
+            PoolState memory state = _getPoolState(lastSettleTime_ != uint88(block.timestamp));
             (,,uint256 newBorrowAmount) = _getInterestRateAndBorrowAmount(
                 borrowAmount,
-                totalAssetSupply(),
+                state,
                 initialLoanDuration
             );
 
-            if (newBorrowAmount <= _underlyingBalance()) {
+            if (newBorrowAmount <= state.assetBalance) {
                 if (collateralTokenAddress == address(0)) {
                     collateralTokenAddress = wethToken;
                 }
@@ -634,13 +634,14 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
                 depositAmount
             );
 
+            PoolState memory state = _getPoolState(lastSettleTime_ != uint88(block.timestamp));
             (,,borrowAmount) = _getInterestRateAndBorrowAmount(
                 borrowAmount,
-                totalAssetSupply(),
+                state,
                 initialLoanDuration
             );
 
-            if (borrowAmount > _underlyingBalance()) {
+            if (borrowAmount > state.assetBalance) {
                 borrowAmount = 0;
             }
         }
@@ -658,7 +659,7 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
     {
         require (depositAmount != 0, "17");
 
-        uint256 currentPrice = _tokenPrice(_totalAssetSupply(0));
+        uint256 currentPrice = _tokenPrice(_totalAssetSupply(_getPoolState(false), 0));
         mintAmount = depositAmount
             .mul(WEI_PRECISION)
             .div(currentPrice);
@@ -691,12 +692,13 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
             burnAmount = balanceOf(msg.sender);
         }
 
-        uint256 currentPrice = _tokenPrice(_totalAssetSupply(0));
+        PoolState memory state = _getPoolState(false);
+        uint256 currentPrice = _tokenPrice(_totalAssetSupply(state, 0));
 
         uint256 loanAmountOwed = burnAmount
             .mul(currentPrice)
             .div(WEI_PRECISION);
-        uint256 loanAmountAvailableInContract = _underlyingBalance();
+        uint256 loanAmountAvailableInContract = state.assetBalance;
 
         loanAmountPaid = loanAmountOwed;
         require(loanAmountPaid <= loanAmountAvailableInContract, "37");
@@ -754,7 +756,7 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
         // interestRate, interestInitialAmount, borrowAmount (newBorrowAmount)
         (sentAmounts[0], sentAmounts[2], sentAmounts[1]) = _getInterestRateAndBorrowAmount(
             withdrawAmount,
-            _totalAssetSupply(0), // interest is settled above
+            _getPoolState(false), // interest is settled above
             initialLoanDuration
         );
 
@@ -877,7 +879,7 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
 
     function _getInterestRateAndBorrowAmount(
         uint256 borrowAmount,
-        uint256 assetSupply,
+        PoolState memory state,
         uint256 initialLoanDuration) // duration in seconds
         internal
         view
@@ -885,7 +887,8 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
     {
         interestRate = _nextBorrowInterestRate2(
             borrowAmount,
-            assetSupply
+            _totalAssetSupply(state, state.interestUnPaid),
+            state.assetBorrow
         );
 
         // newBorrowAmount = borrowAmount * 10^18 / (10^18 - (interestRate * initialLoanDuration * 10^18 / (31536000 * 10^20)))
@@ -1088,31 +1091,47 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
     }
 
     function _avgBorrowInterestRate(
-        uint256 assetBorrow)
+        uint256 assetBorrow,
+        uint256 interestOwedPerDay)
         internal
-        view
+        pure
         returns (uint256)
     {
         if (assetBorrow != 0) {
-            (uint256 interestOwedPerDay,) = _getAllInterest();
             return interestOwedPerDay
                 .mul(365 * WEI_PERCENT_PRECISION)
                 .div(assetBorrow);
         }
     }
 
-    // next supply interest adjustment
+    function _totalSupplyInterestRate(
+        PoolState memory state,
+        uint256 assetSupply)
+        internal
+        view
+        returns (uint256)
+    {
+        if (state.assetBorrow != 0) {
+            return _supplyInterestRate(
+                state,
+                assetSupply
+            );
+        }
+    }
+
+    // next supply interest adjustment, state is read with interest
     function _supplyInterestRate(
-        uint256 assetBorrow,
+        PoolState memory state,
         uint256 assetSupply)
         internal
         view
         returns (uint256)
     {
+        uint256 assetBorrow = state.assetBorrow;
         if (assetBorrow != 0 && assetSupply >= assetBorrow) {
-            return _avgBorrowInterestRate(assetBorrow)
+            return _avgBorrowInterestRate(assetBorrow, state.interestOwedPerDay)
                 .mul(_utilizationRate(assetBorrow, assetSupply))
-                .mul(SafeMath.sub(WEI_PERCENT_PRECISION, IBZx(bZxContract).lendingFeePercent()))
+                .mul(SafeMath.sub(WEI_PERCENT_PRECISION, state.lendingFeePercent))
                 .div(WEI_PERCENT_PRECISION * WEI_PERCENT_PRECISION);
         }
     }
@@ -1123,14 +1142,14 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
         view
         returns (uint256)
     {
-        uint256 interestUnPaid;
-        if (borrowAmount != 0) {
-            if (lastSettleTime_ != uint88(block.timestamp)) {
-                (,interestUnPaid) = _getAllInterest();
-            }
+        // unpaid interest is only counted for a new borrow
+        PoolState memory state = _getPoolState(
+            borrowAmount != 0 && lastSettleTime_ != uint88(block.timestamp)
+        );
 
-            uint256 balance = _underlyingBalance()
-                .add(interestUnPaid);
+        if (borrowAmount != 0) {
+            uint256 balance = state.assetBalance
+                .add(state.interestUnPaid);
             if (borrowAmount > balance) {
                 borrowAmount = balance;
             }
@@ -1138,19 +1157,21 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
 
         return _nextBorrowInterestRate2(
             borrowAmount,
-            _totalAssetSupply(interestUnPaid)
+            _totalAssetSupply(state, state.interestUnPaid),
+            state.assetBorrow
         );
     }
 
     function _nextBorrowInterestRate2(
         uint256 newBorrowAmount,
-        uint256 assetSupply)
+        uint256 assetSupply,
+        uint256 assetBorrow)
         internal
         view
         returns (uint256 nextRate)
     {
         uint256 utilRate = _utilizationRate(
-            totalAssetBorrow().add(newBorrowAmount),
+            assetBorrow.add(newBorrowAmount),
             assetSupply
         );
 
@@ -1201,16 +1222,32 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
         }
     }
 
+    // reads the pool once, the interest data only when withInterest
+    function _getPoolState(
+        bool withInterest)
+        internal
+        view
+        returns (PoolState memory state)
+    {
+        if (withInterest) {
+            (state.interestOwedPerDay, state.interestUnPaid, state.lendingFeePercent, state.assetBorrow) = _getAllInterest();
+        } else {
+            state.assetBorrow = totalAssetBorrow();
+        }
+        state.assetBalance = _underlyingBalance();
+    }
+
     function _getAllInterest()
         internal
         view
         returns (
             uint256 interestOwedPerDay,
-            uint256 interestUnPaid)
+            uint256 interestUnPaid,
+            uint256 interestFeePercent,
+            uint256 principalTotal)
     {
         // interestPaid, interestPaidDate, interestOwedPerDay, interestUnPaid, interestFeePercent, principalTotal
-        uint256 interestFeePercent;
-        (,,interestOwedPerDay,interestUnPaid,interestFeePercent,) = IBZx(bZxContract).getLenderInterestData(
+        (,,interestOwedPerDay,interestUnPaid,interestFeePercent,principalTotal) = IBZx(bZxContract).getLenderInterestData(
             address(this),
             loanTokenAddress
         );
@@ -1237,11 +1274,13 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
 
         uint256 initialMargin = SafeMath.div(WEI_PRECISION * WEI_PERCENT_PRECISION, leverageAmount);
 
+        PoolState memory state = _getPoolState(false);
         interestRate = _nextBorrowInterestRate2(
             totalDeposit
                 .mul(WEI_PERCENT_PRECISION)
                 .div(initialMargin),
-            _totalAssetSupply(0)
+            _totalAssetSupply(state, 0),
+            state.assetBorrow
         );
 
         // assumes that loan, collateral, and interest token are the same
@@ -1255,6 +1294,7 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
     }
 
     function _totalAssetSupply(
+        PoolState memory state,
         uint256 interestUnPaid)
         internal
         view
@@ -1263,8 +1303,8 @@ contract LoanTokenLogicStandard is AdvancedToken, GasTokenUser {
         if (totalSupply_ != 0) {
             uint256 assetsBalance = _flTotalAssetSupply; // temporary locked totalAssetSupply during a flash loan transaction
             if (assetsBalance == 0) {
-                assetsBalance = _underlyingBalance()
-                    .add(totalAssetBorrow());
+                assetsBalance = state.assetBalance
+                    .add(state.assetBorrow);
             }
 
             return assetsBalance
@@ -0,0 +1,167 @@
+/**
+ * Copyright 2017-2021, bZeroX, LLC. All Rights Reserved.
+ * Licensed under the Apache License, Version 2.0.
+ */
+
+pragma solidity 0.5.17;
+pragma experimental ABIEncoderV2;
+
+import "../LoanTokenLogicStandard.sol";
+
+
+// LoanTokenLogicStandard with the protocol and the underlying balance replaced by settable values.
+// It also answers the IBZx views the iToken reads, so it can stand in for the protocol off-chain.
+contract LoanTokenLogicStandardMock is LoanTokenLogicStandard {
+
+    uint256 public totalPrincipal;
+    uint256 public underlyingBalance;
+    uint256 public interestOwedPerDay;
+    uint256 public interestUnPaid;
+    uint256 public lendingFeePercent;
+
+    constructor(
+        address _newOwner)
+        public
+        LoanTokenLogicStandard(_newOwner)
+    {}
+
+    function setDemandCurve(
+        uint256 _baseRate,
+        uint256 _rateMultiplier,
+        uint256 _targetLevel,
+        uint256 _kinkLevel,
+        uint256 _maxScaleRate)
+        public
+    {
+        baseRate = _baseRate;
+        rateMultiplier = _rateMultiplier;
+        targetLevel = _targetLevel;
+        kinkLevel = _kinkLevel;
+        maxScaleRate = _maxScaleRate;
+    }
+
+    function setPool(
+        uint256 _totalSupply,
+        uint256 _totalPrincipal,
+        uint256 _underlyingBalance)
+        public
+    {
+        totalSupply_ = _totalSupply;
+        totalPrincipal = _totalPrincipal;
+        underlyingBalance = _underlyingBalance;
+    }
+
+    // mint and burn move _loanTokenAddress, priced at _initialPrice until there is a supply
+    function setLoanToken(
+        address _loanTokenAddress,
+        uint256 _initialPrice)
+        public
+    {
+        loanTokenAddress = _loanTokenAddress;
+        initialPrice = _initialPrice;
+    }
+
+    function setLenderInterest(
+        uint256 _interestOwedPerDay,
+        uint256 _interestUnPaid,
+        uint256 _lendingFeePercent)
+        public
+    {
+        interestOwedPerDay = _interestOwedPerDay;
+        interestUnPaid = _interestUnPaid;
+        lendingFeePercent = _lendingFeePercent;
+    }
+
+    function getTotalPrincipal(
+        address,
+        address)
+        external
+        view
+        returns (uint256)
+    {
+        return totalPrincipal;
+    }
+
+    function getLenderInterestData(
+        address,
+        address)
+        external
+        view
+        returns (uint256, uint256, uint256, uint256, uint256, uint256)
+    {
+        return (0, 0, interestOwedPerDay, interestUnPaid, lendingFeePercent, totalPrincipal);
+    }
+
+    function nextBorrowInterestRate2(
+        uint256 newBorrowAmount,
+        uint256 assetSupply)
+        public
+        view
+        returns (uint256)
+    {
+        return _nextBorrowInterestRate2(newBorrowAmount, assetSupply, totalPrincipal);
+    }
+
+    function preMarginData(
+        uint256 loanTokenSent,
+        uint256 leverageAmount)
+        public
+        view
+        returns (uint256 borrowAmount, uint256 interestRate)
+    {
+        (borrowAmount, interestRate,,) = _getPreMarginData(
+            address(0),
+            0,
+            loanTokenSent,
+            leverageAmount
+        );
+    }
+
+    function totalAssetBorrow()
+        public
+        view
+        returns (uint256)
+    {
+        return totalPrincipal;
+    }
+
+    function _underlyingBalance()
+        internal
+        view
+        returns (uint256)
+    {
+        return underlyingBalance;
+    }
+
+    function _getAllInterest()
+        internal
+        view
+        returns (uint256, uint256, uint256, uint256)
+    {
+        return (
+            interestOwedPerDay,
+            interestUnPaid
+                .mul(SafeMath.sub(WEI_PERCENT_PRECISION, lendingFeePercent))
+                .div(WEI_PERCENT_PRECISION),
+            lendingFeePercent,
+            totalPrincipal
+        );
+    }
+
+    // there is no protocol to settle with
+    function _settleInterest()
+        internal
+    {}
+
+    // deposits are in the loan token
+    function _totalDeposit(
+        address,
+        uint256,
+        uint256 loanTokenSent)
+        internal
+        view
+        returns (uint256 totalDeposit, uint256 collateralToLoanRate)
+    {
+        return (loanTokenSent, WEI_PRECISION);
+    }
+}
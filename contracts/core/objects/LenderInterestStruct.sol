@@ -13,5 +13,6 @@ contract LenderInterestStruct {
         uint256 owedTotal;          // total interest owed for all loans of asset (assuming they go to full term)
         uint256 paidTotal;          // total interest paid so far for asset
         uint256 updatedTimestamp;   // last update
+        uint256 pendingTotal;       // interest paid so far and not yet transferred to the lender, before the lending fee
     }
 }
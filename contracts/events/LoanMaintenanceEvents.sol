@@ -83,4 +83,11 @@ contract LoanMaintenanceEvents {
         uint256 depositValueAsLoanToken; // net value of deposit denominated as loanToken
         uint256 depositValueAsCollateralToken; // net value of deposit denominated as collateralToken
     }
+
+    struct LiquidatableLoanData {
+        bytes32 loanId; // id of the loan
+        uint256 currentMargin; // current margin
+        uint256 maxLiquidatable; // current max liquidatable
+        uint256 maxSeizable; // current max seizable
+    }
 }
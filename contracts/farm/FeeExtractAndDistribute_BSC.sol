@@ -42,6 +42,15 @@ contract FeeExtractAndDistribute_BSC is Upgradeable {
 
     mapping(IERC20 => uint256) public tokenHeld;
 
+    // BNB value below which an asset is left out of sweepFeesAboveThreshold, see getSweepPlan
+    uint256 public minSwapValue;
+
+    // asset => intermediate asset its fees are swapped to before BNB, pooled with the other assets using it
+    mapping(address => address) public swapHops;
+
+    // hop => number of assets swapped through it, an asset in use as a hop can't have a hop itself
+    mapping(address => uint256) public swapHopUsers;
+
     event ExtractAndDistribute();
 
     event AssetSwap(
@@ -81,6 +90,111 @@ contract FeeExtractAndDistribute_BSC is Upgradeable {
         _extractAndDistribute(assets);
     }
 
+    function sweepFeesAboveThreshold() public // sweepFeesByAssetAboveThreshold() does checkPause
+    {
+        sweepFeesByAssetAboveThreshold(currentFeeTokens);
+    }
+
+    function sweepFeesByAssetAboveThreshold(address[] memory assets)
+        public
+        checkPause
+        onlyEOA
+    {
+        (address[] memory sweepAssets,) = getSweepPlan(assets);
+        if (sweepAssets.length != 0) {
+            _extractAndDistribute(sweepAssets);
+        }
+    }
+
+    // assets with fees worth at least minSwapValue, valued in BNB from the pair reserves (BZRX is not swapped and has no value)
+    function getSweepPlan(address[] memory assets)
+        public
+        view
+        returns (address[] memory sweepAssets, uint256[] memory valuesInBNB)
+    {
+        return _getSweepPlan(assets, BNB);
+    }
+
+    function _getSweepPlan(address[] memory assets, address outAsset)
+        internal
+        view
+        returns (address[] memory sweepAssets, uint256[] memory values)
+    {
+        uint256[] memory amountsHeld = _queryFees(assets);
+
+        uint256[] memory assetValues = new uint256[](assets.length);
+        bool[] memory isSwept = new bool[](assets.length);
+        uint256 count;
+        address asset;
+        uint256 amount;
+        for (uint256 i = 0; i < assets.length; i++) {
+            asset = assets[i];
+            amount = amountsHeld[i].add(exportedFees[asset]);
+            if (amount == 0 || asset == BGOV) {
+                continue;
+            }
+            if (asset == BZRX) {
+                isSwept[i] = true;
+            } else {
+                assetValues[i] = asset == outAsset
+                    ? amount
+                    : _estimateOutput(asset, outAsset, amount);
+                isSwept[i] = assetValues[i] >= minSwapValue;
+            }
+            if (isSwept[i]) {
+                count++;
+            }
+        }
+
+        sweepAssets = new address[](count);
+        values = new uint256[](count);
+        count = 0;
+        for (uint256 i = 0; i < assets.length; i++) {
+            if (isSwept[i]) {
+                sweepAssets[count] = assets[i];
+                values[count++] = assetValues[i];
+            }
+        }
+    }
+
+    // output of swapping amount along the same path as _swapFeesTo, 0 if a pair is missing
+    function _estimateOutput(
+        address asset,
+        address outAsset,
+        uint256 amount
+    ) internal view returns (uint256) {
+        address hop = swapHops[asset];
+        address[] memory path;
+        if (hop == ZERO_ADDRESS || hop == outAsset) {
+            path = new address[](2);
+            path[1] = outAsset;
+        } else {
+            path = new address[](3);
+            path[1] = hop;
+            path[2] = outAsset;
+        }
+        path[0] = asset;
+
+        try _router().getAmountsOut(amount, path) returns (uint256[] memory amounts) {
+            return amounts[amounts.length - 1];
+        } catch {
+            return 0;
+        }
+    }
+
+    function _queryFees(address[] memory assets)
+        internal
+        view
+        virtual
+        returns (uint256[] memory amountsHeld)
+    {
+        (amountsHeld,) = bZx.queryFees(assets, IBZx.FeeClaimType.All);
+    }
+
+    function _router() internal view virtual returns (IUniswapV2Router) {
+        return pancakeRouterV2;
+    }
+
     function _extractAndDistribute(address[] memory assets) internal {
         uint256[] memory amounts = bZx.withdrawFees(
             assets,
@@ -96,21 +210,9 @@ contract FeeExtractAndDistribute_BSC is Upgradeable {
         uint256 bnbOutput = exportedFees[BNB];
         exportedFees[BNB] = 0;
 
-        address asset;
-        uint256 amount;
-        for (uint256 i = 0; i < assets.length; i++) {
-            asset = assets[i];
-            if (asset == BGOV || asset == BZRX || asset == BNB) {
-                continue;
-            }
-            amount = exportedFees[asset];
-            exportedFees[asset] = 0;
-
-            if (amount != 0) {
-                bnbOutput += _swapWithPair(asset, BNB, amount);
-            }
-        }
+        bnbOutput += _swapFeesTo(assets, BNB);
 
+        uint256 amount;
         if (bnbOutput != 0) {
             amount = (bnbOutput * 15e18) / 1e20; // burn (15%)
             uint256 sellAmount = amount; // sell for BZRX (15%)
@@ -160,6 +262,48 @@ contract FeeExtractAndDistribute_BSC is Upgradeable {
         }
     }
 
+    function _swapFeesTo(address[] memory assets, address outAsset)
+        internal
+        returns (uint256 output)
+    {
+        address asset;
+        address hop;
+        uint256 amount;
+
+        // fees of assets with a hop are pooled into it first
+        for (uint256 i = 0; i < assets.length; i++) {
+            asset = assets[i];
+            hop = swapHops[asset];
+            if (hop == ZERO_ADDRESS || hop == outAsset || asset == BGOV || asset == BZRX || asset == outAsset) {
+                continue;
+            }
+            amount = exportedFees[asset];
+            if (amount != 0) {
+                exportedFees[asset] = 0;
+                exportedFees[hop] = exportedFees[hop].add(
+                    _swapWithPair(asset, hop, amount)
+                );
+            }
+        }
+
+        // then each asset or hop is swapped once, a pooled hop is emptied by its first swap
+        for (uint256 i = 0; i < assets.length; i++) {
+            asset = assets[i];
+            if (asset == BGOV || asset == BZRX || asset == outAsset) {
+                continue;
+            }
+            hop = swapHops[asset];
+            if (hop != ZERO_ADDRESS && hop != outAsset) {
+                asset = hop;
+            }
+            amount = exportedFees[asset];
+            if (amount != 0) {
+                exportedFees[asset] = 0;
+                output += _swapWithPair(asset, outAsset, amount);
+            }
+        }
+    }
+
     function _swapWithPair(
         address inAsset,
         address outAsset,
@@ -169,7 +313,7 @@ contract FeeExtractAndDistribute_BSC is Upgradeable {
         path[0] = inAsset;
         path[1] = outAsset;
 
-        uint256[] memory amounts = pancakeRouterV2.swapExactTokensForTokens(
+        uint256[] memory amounts = _router().swapExactTokensForTokens(
             inAmount,
             1, // amountOutMin
             path,
@@ -193,16 +337,43 @@ contract FeeExtractAndDistribute_BSC is Upgradeable {
     function setFeeTokens(address[] calldata tokens) external onlyOwner {
         currentFeeTokens = tokens;
         for (uint256 i = 0; i < tokens.length; i++) {
-            IERC20(tokens[i]).safeApprove(address(pancakeRouterV2), 0);
-            IERC20(tokens[i]).safeApprove(
-                address(pancakeRouterV2),
-                uint256(-1)
-            );
+            IERC20(tokens[i]).safeApprove(address(_router()), 0);
+            IERC20(tokens[i]).safeApprove(address(_router()), uint256(-1));
         }
         IERC20(BGOV).safeApprove(address(chef), 0);
         IERC20(BGOV).safeApprove(address(chef), uint256(-1));
     }
 
+    function setMinSwapValue(uint256 _minSwapValue) external onlyOwner {
+        minSwapValue = _minSwapValue;
+    }
+
+    // a zero hop swaps the asset straight to BNB
+    function setSwapHops(address[] calldata assets, address[] calldata hops)
+        external
+        onlyOwner
+    {
+        require(assets.length == hops.length, "count mismatch");
+        for (uint256 i = 0; i < assets.length; i++) {
+            require(hops[i] != assets[i] && hops[i] != BGOV && hops[i] != BZRX, "invalid hop");
+            require(swapHops[hops[i]] == ZERO_ADDRESS, "nested hop");
+            require(hops[i] == ZERO_ADDRESS || swapHopUsers[assets[i]] == 0, "nested hop");
+
+            address currentHop = swapHops[assets[i]];
+            if (currentHop != ZERO_ADDRESS) {
+                swapHopUsers[currentHop] = swapHopUsers[currentHop].sub(1);
+            }
+            if (hops[i] != ZERO_ADDRESS) {
+                swapHopUsers[hops[i]] = swapHopUsers[hops[i]].add(1);
+            }
+            swapHops[assets[i]] = hops[i];
+            if (hops[i] != ZERO_ADDRESS && hops[i] != BNB) {
+                IERC20(hops[i]).safeApprove(address(_router()), 0);
+                IERC20(hops[i]).safeApprove(address(_router()), uint256(-1));
+            }
+        }
+    }
+
     function depositToken(IERC20 token, uint256 amount) external onlyOwner {
         token.safeTransferFrom(msg.sender, address(this), amount);
 
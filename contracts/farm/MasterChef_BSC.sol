@@ -83,6 +83,20 @@ contract MasterChef_BSC is Upgradeable {
     mapping(address => uint256) public altRewardsDebt;      // user => amount
     mapping(uint256 => uint256) public altRewardsPerShare;  // pid => amount
 
+    // lazy reward accounting, see migrateToLazyRewards
+    bool public lazyRewardsEnabled;
+    // GOVReward per allocation point, times 1e12
+    uint256 public accGOVPerAllocPoint;
+    uint256 public lastGlobalRewardBlock;
+    // pid => accGOVPerAllocPoint at the last pool update
+    mapping(uint256 => uint256) public poolGOVPerAllocPointPaid;
+
+    event EmissionCheckpoint(
+        uint256 accGOVPerAllocPoint,
+        uint256 GOVPerBlock,
+        uint256 totalAllocPoint
+    );
+
     function initialize(
         GovToken _GOV,
         address _devaddr,
@@ -108,7 +122,9 @@ contract MasterChef_BSC is Upgradeable {
         onlyOwner
         nonDuplicated(_lpToken)
     {
-        if (_withUpdate) {
+        if (lazyRewardsEnabled) {
+            poolGOVPerAllocPointPaid[poolInfo.length] = _checkpointRewards();
+        } else if (_withUpdate) {
             massUpdatePools();
         }
         uint256 lastRewardBlock =
@@ -123,6 +139,10 @@ contract MasterChef_BSC is Upgradeable {
                 accGOVPerShare: 0
             })
         );
+
+        if (lazyRewardsEnabled) {
+            emit EmissionCheckpoint(accGOVPerAllocPoint, GOVPerBlock, totalAllocPoint);
+        }
     }
 
     // Update the given pool's GOV allocation point. Can only be called by the owner.
@@ -130,7 +150,14 @@ contract MasterChef_BSC is Upgradeable {
         public
         onlyOwner
     {
-        if (_withUpdate) {
+        if (lazyRewardsEnabled) {
+            // settles the pool at its current allocation; updatePool can't run while paused,
+            // the pool's pending reward is then counted at the new allocation as with _withUpdate = false
+            _checkpointRewards();
+            if (notPaused) {
+                updatePool(_pid);
+            }
+        } else if (_withUpdate) {
             massUpdatePools();
         }
 
@@ -144,6 +171,10 @@ contract MasterChef_BSC is Upgradeable {
         if (block.number < pool.lastRewardBlock) {
             pool.lastRewardBlock = startBlock;
         }
+
+        if (lazyRewardsEnabled) {
+            emit EmissionCheckpoint(accGOVPerAllocPoint, GOVPerBlock, totalAllocPoint);
+        }
     }
 
     function transferTokenOwnership(address newOwner)
@@ -171,8 +202,16 @@ contract MasterChef_BSC is Upgradeable {
         public
         onlyOwner
     {
-        massUpdatePools();
+        if (lazyRewardsEnabled) {
+            _checkpointRewards();
+        } else {
+            massUpdatePools();
+        }
         GOVPerBlock = _GOVPerBlock;
+
+        if (lazyRewardsEnabled) {
+            emit EmissionCheckpoint(accGOVPerAllocPoint, GOVPerBlock, totalAllocPoint);
+        }
     }
 
     function getMultiplier(uint256 _from, uint256 _to)
@@ -259,12 +298,7 @@ contract MasterChef_BSC is Upgradeable {
         uint256 accGOVPerShare = pool.accGOVPerShare.mul(1e18);
         uint256 lpSupply = balanceOf[_pid];
         if (block.number > pool.lastRewardBlock && lpSupply != 0) {
-            uint256 multiplier =
-                getMultiplierPrecise(pool.lastRewardBlock, block.number);
-            uint256 GOVReward =
-                multiplier.mul(GOVPerBlock).mul(pool.allocPoint).div(
-                    totalAllocPoint
-                );
+            uint256 GOVReward = _pendingPoolReward(_pid, pool);
             accGOVPerShare = accGOVPerShare.add(
                 GOVReward.mul(1e12).div(lpSupply)
             );
@@ -328,15 +362,19 @@ contract MasterChef_BSC is Upgradeable {
             return;
         }
         uint256 lpSupply = balanceOf[_pid];
+        uint256 GOVReward;
+        if (lazyRewardsEnabled) {
+            GOVReward = _settlePoolReward(_pid, pool.allocPoint);
+        } else if (lpSupply != 0) {
+            GOVReward = getMultiplierPrecise(pool.lastRewardBlock, block.number)
+                .mul(GOVPerBlock)
+                .mul(pool.allocPoint)
+                .div(totalAllocPoint);
+        }
         if (lpSupply == 0) {
             pool.lastRewardBlock = block.number;
             return;
         }
-        uint256 multiplier = getMultiplierPrecise(pool.lastRewardBlock, block.number);
-        uint256 GOVReward =
-            multiplier.mul(GOVPerBlock).mul(pool.allocPoint).div(
-                totalAllocPoint
-            );
         coordinator.mint(devaddr, GOVReward.div(1e19));
         coordinator.mint(address(this), GOVReward.div(1e18));
         pool.accGOVPerShare = pool.accGOVPerShare.add(
@@ -345,6 +383,79 @@ contract MasterChef_BSC is Upgradeable {
         pool.lastRewardBlock = block.number;
     }
 
+    // Switches to lazy reward accounting: a pool is settled against the global
+    // accGOVPerAllocPoint when it is touched, so add, set and emission changes
+    // no longer update every pool. All pools are settled one last time here.
+    function migrateToLazyRewards() public onlyOwner {
+        require(!lazyRewardsEnabled, "migrated");
+        massUpdatePools();
+
+        lazyRewardsEnabled = true;
+        lastGlobalRewardBlock = block.number > startBlock ? block.number : startBlock;
+        emit EmissionCheckpoint(accGOVPerAllocPoint, GOVPerBlock, totalAllocPoint);
+    }
+
+    function _accGOVPerAllocPointNow()
+        internal
+        view
+        returns (uint256 acc)
+    {
+        acc = accGOVPerAllocPoint;
+        uint256 lastBlock = lastGlobalRewardBlock;
+        uint256 allocPoints = totalAllocPoint;
+        if (block.number > lastBlock && allocPoints != 0) {
+            // the multiplier covers the declining epochs between the two blocks
+            acc = acc.add(
+                getMultiplierPrecise(lastBlock, block.number)
+                    .mul(GOVPerBlock)
+                    .mul(1e12)
+                    .div(allocPoints)
+            );
+        }
+    }
+
+    // brings accGOVPerAllocPoint to the current block, before GOVPerBlock or totalAllocPoint change
+    function _checkpointRewards()
+        internal
+        returns (uint256 acc)
+    {
+        if (block.number <= lastGlobalRewardBlock) {
+            return accGOVPerAllocPoint;
+        }
+        acc = _accGOVPerAllocPointNow();
+        accGOVPerAllocPoint = acc;
+        lastGlobalRewardBlock = block.number;
+    }
+
+    function _settlePoolReward(uint256 _pid, uint256 _allocPoint)
+        internal
+        returns (uint256)
+    {
+        uint256 acc = _checkpointRewards();
+        uint256 GOVReward = _allocPoint
+            .mul(acc.sub(poolGOVPerAllocPointPaid[_pid]))
+            .div(1e12);
+        poolGOVPerAllocPointPaid[_pid] = acc;
+        return GOVReward;
+    }
+
+    // GOVReward (times 1e18) of a pool since its lastRewardBlock
+    function _pendingPoolReward(uint256 _pid, IMasterChef.PoolInfo storage pool)
+        internal
+        view
+        returns (uint256)
+    {
+        if (lazyRewardsEnabled) {
+            return pool.allocPoint
+                .mul(_accGOVPerAllocPointNow().sub(poolGOVPerAllocPointPaid[_pid]))
+                .div(1e12);
+        }
+        return getMultiplierPrecise(pool.lastRewardBlock, block.number)
+            .mul(GOVPerBlock)
+            .mul(pool.allocPoint)
+            .div(totalAllocPoint);
+    }
+
     // Anyone can contribute GOV to a given pool
     function addExternalReward(uint256 _amount) public checkNoPause {
         IMasterChef.PoolInfo storage pool = poolInfo[GOV_POOL_ID];
@@ -67,6 +67,12 @@ contract MasterChef_Polygon is Upgradeable {
 
     // add the GOV pool first to have ID 0
     uint256 internal constant GOV_POOL_ID = 0;
+
+    // _periodBlocks = 1296000 = 60 * 60 * 24 * 30 / 2 = blocks_in_30_days (assume 2 second blocks)
+    uint256 internal constant BONUS_PERIOD_BLOCKS = 1296000;
+    // cumulative multiplier over the whole bonus period, times 1e18
+    uint256 internal constant BONUS_PERIOD_MULTIPLIER = 7128000000000373248000000;
+
     event AddExternalReward(
         address indexed sender,
         uint256 indexed pid,
@@ -90,6 +96,20 @@ contract MasterChef_Polygon is Upgradeable {
     // total locked rewards for a user
     mapping(address => uint256) public lockedRewards;
 
+    // lazy reward accounting, see migrateToLazyRewards
+    bool public lazyRewardsEnabled;
+    // GOVReward per allocation point, times 1e12
+    uint256 public accGOVPerAllocPoint;
+    uint256 public lastGlobalRewardBlock;
+    // pid => accGOVPerAllocPoint at the last pool update
+    mapping(uint256 => uint256) public poolGOVPerAllocPointPaid;
+
+    event EmissionCheckpoint(
+        uint256 accGOVPerAllocPoint,
+        uint256 GOVPerBlock,
+        uint256 totalAllocPoint
+    );
+
     function initialize(
         GovToken _GOV,
         address _devaddr,
@@ -113,7 +133,9 @@ contract MasterChef_Polygon is Upgradeable {
         onlyOwner
         nonDuplicated(_lpToken)
     {
-        if (_withUpdate) {
+        if (lazyRewardsEnabled) {
+            poolGOVPerAllocPointPaid[poolInfo.length] = _checkpointRewards();
+        } else if (_withUpdate) {
             massUpdatePools();
         }
         uint256 lastRewardBlock =
@@ -128,6 +150,10 @@ contract MasterChef_Polygon is Upgradeable {
                 accGOVPerShare: 0
             })
         );
+
+        if (lazyRewardsEnabled) {
+            emit EmissionCheckpoint(accGOVPerAllocPoint, GOVPerBlock, totalAllocPoint);
+        }
     }
 
     // Update the given pool's GOV allocation point. Can only be called by the owner.
@@ -135,7 +161,11 @@ contract MasterChef_Polygon is Upgradeable {
         public
         onlyOwner
     {
-        if (_withUpdate) {
+        if (lazyRewardsEnabled) {
+            // settles the pool at its current allocation
+            _checkpointRewards();
+            updatePool(_pid);
+        } else if (_withUpdate) {
             massUpdatePools();
         }
 
@@ -149,6 +179,10 @@ contract MasterChef_Polygon is Upgradeable {
         if (block.number < pool.lastRewardBlock) {
             pool.lastRewardBlock = startBlock;
         }
+
+        if (lazyRewardsEnabled) {
+            emit EmissionCheckpoint(accGOVPerAllocPoint, GOVPerBlock, totalAllocPoint);
+        }
     }
 
     function transferTokenOwnership(address newOwner)
@@ -199,50 +233,30 @@ contract MasterChef_Polygon is Upgradeable {
 
     function _getDecliningMultipler(uint256 _from, uint256 _to, uint256 _bonusStartBlock)
         internal
-        view
+        pure
         returns (uint256)
     {
-        // _periodBlocks = 1296000 = 60 * 60 * 24 * 30 / 2 = blocks_in_30_days (assume 2 second blocks)
-        uint256 _bonusEndBlock = _bonusStartBlock + 1296000;
+        return _getCumulativeMultiplier(_to, _bonusStartBlock)
+            .sub(_getCumulativeMultiplier(_from, _bonusStartBlock));
+    }
+
+    // sum of the per block multipliers from _bonusStartBlock to _block, times 1e18
+    function _getCumulativeMultiplier(uint256 _block, uint256 _bonusStartBlock)
+        internal
+        pure
+        returns (uint256)
+    {
+        uint256 _blocks = _block.sub(_bonusStartBlock);
+        if (_blocks >= BONUS_PERIOD_BLOCKS) {
+            return _blocks.sub(BONUS_PERIOD_BLOCKS).mul(1e18).add(BONUS_PERIOD_MULTIPLIER);
+        }
 
         // multiplier = 10e18
         // declinePerBlock = 6944444444444 = (10e18 - 1e18) / _periodBlocks
-
-        uint256 _startMultipler;
-        uint256 _endMultipler;
-        uint256 _avgMultiplier;
-
-        if (_to <= _bonusEndBlock) {
-            _startMultipler = SafeMath.sub(10e18,
-                _from.sub(_bonusStartBlock)
-                    .mul(6944444444444)
-            );
-
-            _endMultipler = SafeMath.sub(10e18,
-                _to.sub(_bonusStartBlock)
-                    .mul(6944444444444)
-            );
-
-            _avgMultiplier = (_startMultipler + _endMultipler) / 2;
-
-            return _to.sub(_from).mul(_avgMultiplier);
-        } else if (_from >= _bonusEndBlock) {
-            return _to.sub(_from).mul(1e18);
-        } else {
-
-            _startMultipler = SafeMath.sub(10e18,
-                _from.sub(_bonusStartBlock)
-                    .mul(6944444444444)
-            );
-
-            _endMultipler = 1e18;
-
-            _avgMultiplier = (_startMultipler + _endMultipler) / 2;
-
-            return _bonusEndBlock.sub(_from).mul(_avgMultiplier).add(
-                    _to.sub(_bonusEndBlock).mul(1e18)
-                );
-        }
+        // 10e18 * _blocks - declinePerBlock * _blocks^2 / 2
+        return _blocks.mul(10e18).sub(
+            _blocks.mul(_blocks).mul(3472222222222)
+        );
     }
     
     function _pendingGOV(uint256 _pid, address _user)
@@ -255,12 +269,7 @@ contract MasterChef_Polygon is Upgradeable {
         uint256 accGOVPerShare = pool.accGOVPerShare.mul(1e18);
         uint256 lpSupply = balanceOf[_pid];
         if (block.number > pool.lastRewardBlock && lpSupply != 0) {
-            uint256 multiplier =
-                getMultiplierPrecise(pool.lastRewardBlock, block.number);
-            uint256 GOVReward =
-                multiplier.mul(GOVPerBlock).mul(pool.allocPoint).div(
-                    totalAllocPoint
-                );
+            uint256 GOVReward = _pendingPoolReward(_pid, pool);
             accGOVPerShare = accGOVPerShare.add(
                 GOVReward.mul(1e12).div(lpSupply)
             );
@@ -294,15 +303,19 @@ contract MasterChef_Polygon is Upgradeable {
             return;
         }
         uint256 lpSupply = balanceOf[_pid];
+        uint256 GOVReward;
+        if (lazyRewardsEnabled) {
+            GOVReward = _settlePoolReward(_pid, pool.allocPoint);
+        } else if (lpSupply != 0) {
+            GOVReward = getMultiplierPrecise(pool.lastRewardBlock, block.number)
+                .mul(GOVPerBlock)
+                .mul(pool.allocPoint)
+                .div(totalAllocPoint);
+        }
         if (lpSupply == 0) {
             pool.lastRewardBlock = block.number;
             return;
         }
-        uint256 multiplier = getMultiplierPrecise(pool.lastRewardBlock, block.number);
-        uint256 GOVReward =
-            multiplier.mul(GOVPerBlock).mul(pool.allocPoint).div(
-                totalAllocPoint
-            );
         coordinator.mint(devaddr, GOVReward.div(1e19));
         coordinator.mint(address(this), GOVReward.div(1e18));
         pool.accGOVPerShare = pool.accGOVPerShare.add(
@@ -311,6 +324,79 @@ contract MasterChef_Polygon is Upgradeable {
         pool.lastRewardBlock = block.number;
     }
 
+    // Switches to lazy reward accounting: a pool is settled against the global
+    // accGOVPerAllocPoint when it is touched, so add, set and emission changes
+    // no longer update every pool. All pools are settled one last time here.
+    function migrateToLazyRewards() public onlyOwner {
+        require(!lazyRewardsEnabled, "migrated");
+        massUpdatePools();
+
+        lazyRewardsEnabled = true;
+        lastGlobalRewardBlock = block.number > startBlock ? block.number : startBlock;
+        emit EmissionCheckpoint(accGOVPerAllocPoint, GOVPerBlock, totalAllocPoint);
+    }
+
+    function _accGOVPerAllocPointNow()
+        internal
+        view
+        returns (uint256 acc)
+    {
+        acc = accGOVPerAllocPoint;
+        uint256 lastBlock = lastGlobalRewardBlock;
+        uint256 allocPoints = totalAllocPoint;
+        if (block.number > lastBlock && allocPoints != 0) {
+            // the multiplier covers the declining epochs between the two blocks
+            acc = acc.add(
+                getMultiplierPrecise(lastBlock, block.number)
+                    .mul(GOVPerBlock)
+                    .mul(1e12)
+                    .div(allocPoints)
+            );
+        }
+    }
+
+    // brings accGOVPerAllocPoint to the current block, before GOVPerBlock or totalAllocPoint change
+    function _checkpointRewards()
+        internal
+        returns (uint256 acc)
+    {
+        if (block.number <= lastGlobalRewardBlock) {
+            return accGOVPerAllocPoint;
+        }
+        acc = _accGOVPerAllocPointNow();
+        accGOVPerAllocPoint = acc;
+        lastGlobalRewardBlock = block.number;
+    }
+
+    function _settlePoolReward(uint256 _pid, uint256 _allocPoint)
+        internal
+        returns (uint256)
+    {
+        uint256 acc = _checkpointRewards();
+        uint256 GOVReward = _allocPoint
+            .mul(acc.sub(poolGOVPerAllocPointPaid[_pid]))
+            .div(1e12);
+        poolGOVPerAllocPointPaid[_pid] = acc;
+        return GOVReward;
+    }
+
+    // GOVReward (times 1e18) of a pool since its lastRewardBlock
+    function _pendingPoolReward(uint256 _pid, PoolInfo storage pool)
+        internal
+        view
+        returns (uint256)
+    {
+        if (lazyRewardsEnabled) {
+            return pool.allocPoint
+                .mul(_accGOVPerAllocPointNow().sub(poolGOVPerAllocPointPaid[_pid]))
+                .div(1e12);
+        }
+        return getMultiplierPrecise(pool.lastRewardBlock, block.number)
+            .mul(GOVPerBlock)
+            .mul(pool.allocPoint)
+            .div(totalAllocPoint);
+    }
+
     // Anyone can contribute GOV to a given pool
     function addExternalReward(uint256 _amount) public {
         PoolInfo storage pool = poolInfo[GOV_POOL_ID];
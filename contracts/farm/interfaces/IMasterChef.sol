@@ -109,6 +109,27 @@ interface IMasterChef {
         view
         returns(bool);
 
+    function lazyRewardsEnabled()
+        external
+        view
+        returns(bool);
+
+    // GOVReward per allocation point, times 1e12
+    function accGOVPerAllocPoint()
+        external
+        view
+        returns(uint256);
+
+    function lastGlobalRewardBlock()
+        external
+        view
+        returns(uint256);
+
+    function poolGOVPerAllocPointPaid(uint256)
+        external
+        view
+        returns(uint256);
+
     function poolLength()
         external
         view
@@ -210,4 +231,9 @@ interface IMasterChef {
         uint256 indexed pid,
         uint256 amount
     );
+    event EmissionCheckpoint(
+        uint256 accGOVPerAllocPoint,
+        uint256 GOVPerBlock,
+        uint256 totalAllocPoint
+    );
 }
\ No newline at end of file
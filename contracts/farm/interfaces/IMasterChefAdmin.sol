@@ -24,4 +24,8 @@ interface IMasterChefAdmin is IMasterChef {
         external;
     function migrateToBalanceOf(uint256 _pid)
         external;
+    function setGOVPerBlock(uint256 _GOVPerBlock)
+        external;
+    function migrateToLazyRewards()
+        external;
 }
\ No newline at end of file
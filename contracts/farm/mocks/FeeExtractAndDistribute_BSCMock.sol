@@ -0,0 +1,75 @@
+/**
+ * Copyright 2017-2021, bZeroX, LLC <https://bzx.network/>. All Rights Reserved.
+ * Licensed under the Apache License, Version 2.0.
+ */
+
+pragma solidity 0.6.12;
+pragma experimental ABIEncoderV2;
+
+import "../FeeExtractAndDistribute_BSC.sol";
+
+
+// swaps through a settable router and reports settable fees, so the planner and the swaps can be tested without the BSC contracts
+contract FeeExtractAndDistribute_BSCMock is FeeExtractAndDistribute_BSC {
+
+    IUniswapV2Router public router;
+
+    mapping(address => uint256) public feesHeld;
+
+    function setRouter(IUniswapV2Router newRouter) public {
+        router = newRouter;
+    }
+
+    // setFeeTokens also approves BGOV, which isn't deployed locally
+    function approveRouter(address[] memory assets) public {
+        for (uint256 i = 0; i < assets.length; i++) {
+            IERC20(assets[i]).safeApprove(address(router), uint256(-1));
+        }
+    }
+
+    function setFeesHeld(address[] memory assets, uint256[] memory amounts) public {
+        require(assets.length == amounts.length, "count mismatch");
+        for (uint256 i = 0; i < assets.length; i++) {
+            feesHeld[assets[i]] = amounts[i];
+        }
+    }
+
+    // the tokens are expected to be sent to this contract
+    function setExportedFees(address[] memory assets, uint256[] memory amounts) public {
+        require(assets.length == amounts.length, "count mismatch");
+        for (uint256 i = 0; i < assets.length; i++) {
+            exportedFees[assets[i]] = amounts[i];
+        }
+    }
+
+    function getSweepPlanTo(address[] memory assets, address outAsset)
+        public
+        view
+        returns (address[] memory sweepAssets, uint256[] memory values)
+    {
+        return _getSweepPlan(assets, outAsset);
+    }
+
+    function swapFeesTo(address[] memory assets, address outAsset)
+        public
+        returns (uint256)
+    {
+        return _swapFeesTo(assets, outAsset);
+    }
+
+    function _queryFees(address[] memory assets)
+        internal
+        view
+        override
+        returns (uint256[] memory amountsHeld)
+    {
+        amountsHeld = new uint256[](assets.length);
+        for (uint256 i = 0; i < assets.length; i++) {
+            amountsHeld[i] = feesHeld[assets[i]];
+        }
+    }
+
+    function _router() internal view override returns (IUniswapV2Router) {
+        return router;
+    }
+}
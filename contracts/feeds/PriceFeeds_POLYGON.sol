@@ -25,11 +25,16 @@ contract PriceFeeds_POLYGON is Constants, Ownable {
 
     bool public globalPricingPaused = false;
 
+    mapping (address => mapping (address => uint256)) public decimalPrecisions; // sourceToken => destToken => precision
+    address[] public precisionTokens;                           // tokens with decimals set, in the order they were added
+    mapping (address => bool) public isPrecisionToken;
+
     constructor()
         public
     {
         // set decimals for ether
         decimals[address(wethToken)] = 18;
+        _setDecimalPrecisions(address(wethToken));
     }
 
     function queryRate(
@@ -46,6 +51,20 @@ contract PriceFeeds_POLYGON is Constants, Ownable {
         );
     }
 
+    function queryRates(
+        address[] memory sourceTokens,
+        address[] memory destTokens)
+        public
+        view
+        returns (uint256[] memory rates, uint256[] memory precisions)
+    {
+        require(!globalPricingPaused, "pricing is paused");
+        return _queryRates(
+            sourceTokens,
+            destTokens
+        );
+    }
+
     function queryPrecision(
         address sourceToken,
         address destToken)
@@ -80,6 +99,32 @@ contract PriceFeeds_POLYGON is Constants, Ownable {
             .div(precision);
     }
 
+    //// NOTE: This function returns 0s during a pause, rather than a revert. Ensure calling contracts handle correctly. ///
+    function queryReturns(
+        address[] memory sourceTokens,
+        address[] memory destTokens,
+        uint256[] memory sourceAmounts)
+        public
+        view
+        returns (uint256[] memory destAmounts)
+    {
+        require(sourceTokens.length == sourceAmounts.length, "count mismatch");
+        destAmounts = new uint256[](sourceTokens.length);
+        if (globalPricingPaused) {
+            return destAmounts;
+        }
+        (uint256[] memory rates, uint256[] memory precisions) = _queryRates(
+            sourceTokens,
+            destTokens
+        );
+
+        for (uint256 i = 0; i < sourceTokens.length; i++) {
+            destAmounts[i] = sourceAmounts[i]
+                .mul(rates[i])
+                .div(precisions[i]);
+        }
+    }
+
     function checkPriceDisagreement(
         address sourceToken,
         address destToken,
@@ -301,9 +346,18 @@ contract PriceFeeds_POLYGON is Constants, Ownable {
     {
         for (uint256 i = 0; i < tokens.length; i++) {
             decimals[address(tokens[i])] = tokens[i].decimals();
+            _setDecimalPrecisions(address(tokens[i]));
         }
     }
 
+    function getPrecisionTokensCount()
+        external
+        view
+        returns (uint256)
+    {
+        return precisionTokens.length;
+    }
+
     function setGlobalPricingPaused(
         bool isPaused)
         external
@@ -343,6 +397,58 @@ contract PriceFeeds_POLYGON is Constants, Ownable {
         }
     }
 
+    // same as _queryRate for each pair, but each distinct token's feed is only read once
+    function _queryRates(
+        address[] memory sourceTokens,
+        address[] memory destTokens)
+        internal
+        view
+        returns (uint256[] memory rates, uint256[] memory precisions)
+    {
+        require(sourceTokens.length == destTokens.length, "count mismatch");
+        rates = new uint256[](sourceTokens.length);
+        precisions = new uint256[](sourceTokens.length);
+
+        address[] memory tokens = new address[](sourceTokens.length * 2);
+        uint256[] memory tokenRates = new uint256[](sourceTokens.length * 2);
+
+        for (uint256 i = 0; i < sourceTokens.length; i++) {
+            if (sourceTokens[i] != destTokens[i]) {
+                uint256 sourceRate = _queryRateCallCached(sourceTokens[i], tokens, tokenRates);
+                uint256 destRate = _queryRateCallCached(destTokens[i], tokens, tokenRates);
+
+                rates[i] = sourceRate
+                    .mul(WEI_PRECISION)
+                    .div(destRate);
+
+                precisions[i] = _getDecimalPrecision(sourceTokens[i], destTokens[i]);
+            } else {
+                rates[i] = WEI_PRECISION;
+                precisions[i] = WEI_PRECISION;
+            }
+        }
+    }
+
+    function _queryRateCallCached(
+        address token,
+        address[] memory tokens,
+        uint256[] memory tokenRates)
+        internal
+        view
+        returns (uint256 rate)
+    {
+        uint256 i;
+        for (; i < tokens.length && tokens[i] != address(0); i++) {
+            if (tokens[i] == token) {
+                return tokenRates[i];
+            }
+        }
+
+        rate = _queryRateCall(token);
+        tokens[i] = token;
+        tokenRates[i] = rate;
+    }
+
     function _queryRateCall(
         address token)
         internal
@@ -355,6 +461,45 @@ contract PriceFeeds_POLYGON is Constants, Ownable {
         require(rate != 0 && (rate >> 128) == 0, "price error");
     }
 
+    // caches the precision of every pair of the token with the other tokens that have decimals set
+    function _setDecimalPrecisions(
+        address token)
+        internal
+    {
+        if (!isPrecisionToken[token]) {
+            isPrecisionToken[token] = true;
+            precisionTokens.push(token);
+        }
+
+        uint256 tokenDecimals = decimals[token];
+        for (uint256 i = 0; i < precisionTokens.length; i++) {
+            address otherToken = precisionTokens[i];
+            if (otherToken != token) {
+                uint256 otherDecimals = decimals[otherToken];
+                decimalPrecisions[token][otherToken] = _computeDecimalPrecision(tokenDecimals, otherDecimals);
+                decimalPrecisions[otherToken][token] = _computeDecimalPrecision(otherDecimals, tokenDecimals);
+            }
+        }
+    }
+
+    function _computeDecimalPrecision(
+        uint256 sourceTokenDecimals,
+        uint256 destTokenDecimals)
+        internal
+        pure
+        returns (uint256)
+    {
+        if (destTokenDecimals >= sourceTokenDecimals) {
+            if (destTokenDecimals - sourceTokenDecimals > 18) {
+                // not cached; _getDecimalPrecision reverts for this pair as before
+                return 0;
+            }
+            return 10**(18 - (destTokenDecimals - sourceTokenDecimals));
+        } else {
+            return 10**(18 + (sourceTokenDecimals - destTokenDecimals));
+        }
+    }
+
     function _getDecimalPrecision(
         address sourceToken,
         address destToken)
@@ -365,6 +510,10 @@ contract PriceFeeds_POLYGON is Constants, Ownable {
         if (sourceToken == destToken) {
             return WEI_PRECISION;
         } else {
+            uint256 precision = decimalPrecisions[sourceToken][destToken];
+            if (precision != 0)
+                return precision;
+
             uint256 sourceTokenDecimals = decimals[sourceToken];
             if (sourceTokenDecimals == 0)
                 sourceTokenDecimals = IERC20(sourceToken).decimals();
@@ -0,0 +1,65 @@
+/**
+ * Copyright 2017-2021, bZeroX, LLC. All Rights Reserved.
+ * Licensed under the Apache License, Version 2.0.
+ */
+
+pragma solidity 0.5.17;
+
+import "../../openzeppelin/Ownable.sol";
+import "../IPriceFeedsExt.sol";
+
+
+// replays a preloaded answer series, one round at a time (local testing only)
+contract PriceFeedReplayMock is IPriceFeedsExt, Ownable {
+
+    int256[] public answers;
+    uint256 public currentRound;
+    uint256 public latestTimestamp;
+
+    function latestAnswer()
+        external
+        view
+        returns (int256)
+    {
+        if (answers.length == 0) {
+            return 0;
+        }
+        return answers[currentRound];
+    }
+
+    function getAnswersCount()
+        external
+        view
+        returns (uint256)
+    {
+        return answers.length;
+    }
+
+    function pushAnswers(
+        int256[] calldata newAnswers)
+        external
+        onlyOwner
+    {
+        for (uint256 i = 0; i < newAnswers.length; i++) {
+            answers.push(newAnswers[i]);
+        }
+    }
+
+    function clearAnswers()
+        external
+        onlyOwner
+    {
+        delete answers;
+        currentRound = 0;
+    }
+
+    function setRound(
+        uint256 round)
+        external
+        onlyOwner
+    {
+        require(round < answers.length, "invalid round");
+        currentRound = round;
+        latestTimestamp = block.timestamp;
+    }
+}
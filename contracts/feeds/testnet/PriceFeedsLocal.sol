@@ -32,6 +32,12 @@ contract PriceFeedsLocal is PriceFeeds {
         if (sourceToken == destToken) {
             rate = WEI_PRECISION;
             precision = WEI_PRECISION;
+        } else if (address(pricesFeeds[sourceToken]) != address(0) && address(pricesFeeds[destToken]) != address(0)) {
+            // both tokens have a feed set (ex: PriceFeedReplayMock), price them as PriceFeeds does
+            (rate, precision) = super._queryRate(
+                sourceToken,
+                destToken
+            );
         } else {
             if (rates[sourceToken][destToken] != 0) {
                 rate = rates[sourceToken][destToken];
@@ -50,6 +56,25 @@ contract PriceFeedsLocal is PriceFeeds {
     }
 
 
+    function _queryRates(
+        address[] memory sourceTokens,
+        address[] memory destTokens)
+        internal
+        view
+        returns (uint256[] memory pairRates, uint256[] memory pairPrecisions)
+    {
+        require(sourceTokens.length == destTokens.length, "count mismatch");
+        pairRates = new uint256[](sourceTokens.length);
+        pairPrecisions = new uint256[](sourceTokens.length);
+
+        for (uint256 i = 0; i < sourceTokens.length; i++) {
+            (pairRates[i], pairPrecisions[i]) = _queryRate(
+                sourceTokens[i],
+                destTokens[i]
+            );
+        }
+    }
+
     function setRates(
         address sourceToken,
         address destToken,
@@ -79,6 +79,32 @@ contract PriceFeedsTestnets is PriceFeeds {
         }
     }
 
+    function _queryRates(
+        address[] memory sourceTokens,
+        address[] memory destTokens)
+        internal
+        view
+        returns (uint256[] memory pairRates, uint256[] memory pairPrecisions)
+    {
+        if (feedType == FeedTypes.Chainlink) {
+            return super._queryRates(
+                sourceTokens,
+                destTokens
+            );
+        }
+
+        require(sourceTokens.length == destTokens.length, "count mismatch");
+        pairRates = new uint256[](sourceTokens.length);
+        pairPrecisions = new uint256[](sourceTokens.length);
+
+        for (uint256 i = 0; i < sourceTokens.length; i++) {
+            (pairRates[i], pairPrecisions[i]) = _queryRate(
+                sourceTokens[i],
+                destTokens[i]
+            );
+        }
+    }
+
     function setCustomRate(
         address sourceToken,
         address destToken,
@@ -113,6 +113,28 @@ contract HelperImpl is Ownable {
     }
 
 
+    struct Call {
+        address target;
+        bytes data;
+    }
+
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    // generic batch of view calls, failed calls are returned with success false when allowFailure is set
+    function aggregate(Call[] calldata calls, bool allowFailure)
+        public view
+        returns (Result[] memory results)
+    {
+        results = new Result[](calls.length);
+        for (uint256 i = 0; i < calls.length; i++) {
+            (results[i].success, results[i].returnData) = calls[i].target.staticcall(calls[i].data);
+            require(allowFailure || results[i].success, "call failed");
+        }
+    }
+
     struct ReserveDetail{
         address iToken;
         uint256 totalAssetSupply;
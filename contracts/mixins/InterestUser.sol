@@ -14,7 +14,8 @@ import "./FeesHelper.sol";
 contract InterestUser is State, VaultController, FeesHelper {
     using SafeERC20 for IERC20;
 
-    function _payInterest(
+    // settles interest owed to the lender into pendingTotal, it is transferred by _payInterest
+    function _accrueInterest(
         address lender,
         address interestToken)
         internal
@@ -39,17 +40,37 @@ contract InterestUser is State, VaultController, FeesHelper {
                 lenderInterestLocal.owedTotal = lenderInterestLocal.owedTotal
                     .sub(interestOwedNow);
 
-                _payInterestTransfer(
-                    lender,
-                    interestToken,
-                    interestOwedNow
-                );
+                lenderInterestLocal.pendingTotal = lenderInterestLocal.pendingTotal
+                    .add(interestOwedNow);
             }
         } else {
             lenderInterestLocal.updatedTimestamp = block.timestamp;
         }
     }
 
+    function _payInterest(
+        address lender,
+        address interestToken)
+        internal
+    {
+        _accrueInterest(
+            lender,
+            interestToken
+        );
+
+        LenderInterest storage lenderInterestLocal = lenderInterest[lender][interestToken];
+        uint256 interestPending = lenderInterestLocal.pendingTotal;
+        if (interestPending != 0) {
+            lenderInterestLocal.pendingTotal = 0;
+
+            _payInterestTransfer(
+                lender,
+                interestToken,
+                interestPending
+            );
+        }
+    }
+
     function _payInterestTransfer(
         address lender,
         address interestToken,
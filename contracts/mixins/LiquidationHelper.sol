@@ -6,6 +6,7 @@
 pragma solidity 0.5.17;
 
 import "../core/State.sol";
+import "../../interfaces/IPriceFeeds.sol";
 
 
 contract LiquidationHelper is State {
@@ -66,4 +67,47 @@ contract LiquidationHelper is State {
 
         return (maxLiquidatable, maxSeizable);
     }
+
+    // normalized rate as computed by PriceFeeds.getCurrentMargin
+    function _getCollateralToLoanRate(
+        address loanToken,
+        address collateralToken)
+        internal
+        view
+        returns (uint256 collateralToLoanRate)
+    {
+        if (collateralToken == loanToken) {
+            return WEI_PRECISION;
+        }
+
+        uint256 collateralToLoanPrecision;
+        (collateralToLoanRate, collateralToLoanPrecision) = IPriceFeeds(priceFeeds).queryRate(
+            collateralToken,
+            loanToken
+        );
+        collateralToLoanRate = collateralToLoanRate
+            .mul(WEI_PRECISION)
+            .div(collateralToLoanPrecision);
+    }
+
+    // mirrors PriceFeeds.getCurrentMargin for a rate from _getCollateralToLoanRate
+    function _getCurrentMarginWithRate(
+        uint256 principal,
+        uint256 collateral,
+        uint256 collateralToLoanRate)
+        internal
+        pure
+        returns (uint256 currentMargin)
+    {
+        uint256 collateralToLoanAmount = collateral
+            .mul(collateralToLoanRate)
+            .div(WEI_PRECISION);
+
+        if (principal != 0 && collateralToLoanAmount >= principal) {
+            currentMargin = collateralToLoanAmount
+                .sub(principal)
+                .mul(WEI_PERCENT_PRECISION)
+                .div(principal);
+        }
+    }
 }
@@ -17,6 +17,7 @@ contract LoanClosings is LoanClosingsBase {
         onlyOwner
     {
         _setTarget(this.liquidate.selector, target);
+        _setTarget(this.liquidateBatch.selector, target);
         _setTarget(this.rollover.selector, target);
         _setTarget(this.closeWithDeposit.selector, target);
         _setTarget(this.closeWithSwap.selector, target);
@@ -42,6 +43,25 @@ contract LoanClosings is LoanClosingsBase {
         );
     }
 
+    // loans that are closed or healthy by the time the batch executes are skipped (returned amounts are 0)
+    function liquidateBatch(
+        bytes32[] calldata loanIds,
+        address receiver,
+        uint256[] calldata closeAmounts) // denominated in loanToken
+        external
+        nonReentrant
+        returns (
+            uint256[] memory loanCloseAmounts,
+            uint256[] memory seizedAmounts
+        )
+    {
+        return _liquidateBatch(
+            loanIds,
+            receiver,
+            closeAmounts
+        );
+    }
+
     function rollover(
         bytes32 loanId,
         bytes calldata /*loanDataBytes*/) // for future use
@@ -23,6 +23,11 @@ contract LoanClosingsBase is State, LoanClosingsEvents, VaultController, Interes
         Liquidation
     }
 
+    struct RateCache {
+        bytes32 pairKey;
+        uint256 collateralToLoanRate;
+    }
+
     function _liquidate(
         bytes32 loanId,
         address receiver,
@@ -55,6 +60,134 @@ contract LoanClosingsBase is State, LoanClosingsEvents, VaultController, Interes
             receiver = msg.sender;
         }
 
+        (loanCloseAmount, seizedAmount) = _liquidateWithMargin(
+            loanLocal,
+            loanParamsLocal,
+            closeAmount,
+            currentMargin,
+            collateralToLoanRate
+        );
+        require(loanCloseAmount != 0, "nothing to liquidate");
+
+        seizedToken = loanParamsLocal.collateralToken;
+
+        _withdrawAsset(
+            seizedToken,
+            receiver,
+            seizedAmount
+        );
+    }
+
+    function _liquidateBatch(
+        bytes32[] memory loanIds,
+        address receiver,
+        uint256[] memory closeAmounts)
+        internal
+        returns (
+            uint256[] memory loanCloseAmounts,
+            uint256[] memory seizedAmounts
+        )
+    {
+        require(loanIds.length == closeAmounts.length, "count mismatch");
+
+        if (receiver == address(0)) {
+            receiver = msg.sender;
+        }
+
+        loanCloseAmounts = new uint256[](loanIds.length);
+        seizedAmounts = new uint256[](loanIds.length);
+
+        // seized collateral is withdrawn once per token after all loans are processed
+        address[] memory seizedTokens = new address[](loanIds.length);
+        uint256[] memory seizedTotals = new uint256[](loanIds.length);
+
+        // consecutive loans on the same pair reuse the last rate queried
+        RateCache memory rateCache;
+
+        for (uint256 i = 0; i < loanIds.length; i++) {
+            (loanCloseAmounts[i], seizedAmounts[i]) = _liquidateBatchItem(
+                loanIds[i],
+                closeAmounts[i],
+                rateCache,
+                seizedTokens,
+                seizedTotals
+            );
+        }
+
+        for (uint256 i = 0; i < seizedTokens.length && seizedTokens[i] != address(0); i++) {
+            _withdrawAsset(
+                seizedTokens[i],
+                receiver,
+                seizedTotals[i]
+            );
+        }
+    }
+
+    // closed, healthy or unliquidatable loans are skipped rather than reverting the batch
+    function _liquidateBatchItem(
+        bytes32 loanId,
+        uint256 closeAmount,
+        RateCache memory rateCache,
+        address[] memory seizedTokens,
+        uint256[] memory seizedTotals)
+        internal
+        returns (uint256 loanCloseAmount, uint256 seizedAmount)
+    {
+        Loan memory loanLocal = loans[loanId];
+        if (!loanLocal.active || closeAmount == 0) {
+            return (0, 0);
+        }
+
+        LoanParams memory loanParamsLocal = loanParams[loanLocal.loanParamsId];
+
+        bytes32 pairKey = keccak256(abi.encodePacked(loanParamsLocal.loanToken, loanParamsLocal.collateralToken));
+        if (pairKey != rateCache.pairKey) {
+            rateCache.pairKey = pairKey;
+            rateCache.collateralToLoanRate = _getCollateralToLoanRate(
+                loanParamsLocal.loanToken,
+                loanParamsLocal.collateralToken
+            );
+        }
+
+        uint256 currentMargin = _getCurrentMarginWithRate(
+            loanLocal.principal,
+            loanLocal.collateral,
+            rateCache.collateralToLoanRate
+        );
+        if (currentMargin > loanParamsLocal.maintenanceMargin) {
+            return (0, 0);
+        }
+
+        (loanCloseAmount, seizedAmount) = _liquidateWithMargin(
+            loanLocal,
+            loanParamsLocal,
+            closeAmount,
+            currentMargin,
+            rateCache.collateralToLoanRate
+        );
+
+        if (seizedAmount != 0) {
+            for (uint256 i = 0; i < seizedTokens.length; i++) {
+                if (seizedTokens[i] == loanParamsLocal.collateralToken || seizedTokens[i] == address(0)) {
+                    seizedTokens[i] = loanParamsLocal.collateralToken;
+                    seizedTotals[i] = seizedTotals[i]
+                        .add(seizedAmount);
+                    break;
+                }
+            }
+        }
+    }
+
+    // settles a liquidation of an unhealthy loan, except for sending the seized collateral to the liquidator
+    function _liquidateWithMargin(
+        Loan memory loanLocal,
+        LoanParams memory loanParamsLocal,
+        uint256 closeAmount,
+        uint256 currentMargin,
+        uint256 collateralToLoanRate)
+        internal
+        returns (uint256 loanCloseAmount, uint256 seizedAmount)
+    {
         loanCloseAmount = closeAmount;
 
         (uint256 maxLiquidatable, uint256 maxSeizable) = _getLiquidationAmounts(
@@ -78,7 +211,10 @@ contract LoanClosingsBase is State, LoanClosingsEvents, VaultController, Interes
             seizedAmount = maxSeizable;
         }
 
-        require(loanCloseAmount != 0, "nothing to liquidate");
+        if (loanCloseAmount == 0) {
+            // nothing was settled, the caller decides whether to revert
+            return (0, 0);
+        }
 
         // liquidator deposits the principal being closed
         _returnPrincipalWithDeposit(
@@ -112,17 +248,9 @@ contract LoanClosingsBase is State, LoanClosingsEvents, VaultController, Interes
             );
         }
 
-        seizedToken = loanParamsLocal.collateralToken;
-
         if (seizedAmount != 0) {
             loanLocal.collateral = loanLocal.collateral
                 .sub(seizedAmount);
-
-            _withdrawAsset(
-                seizedToken,
-                receiver,
-                seizedAmount
-            );
         }
 
         _emitClosingEvents(
@@ -165,8 +293,8 @@ contract LoanClosingsBase is State, LoanClosingsEvents, VaultController, Interes
 
         LoanParams memory loanParamsLocal = loanParams[loanLocal.loanParamsId];
 
-        // pay outstanding interest to lender
-        _payInterest(
+        // settle outstanding interest to lender, it is transferred by withdrawAccruedInterest
+        _accrueInterest(
             loanLocal.lender,
             loanParamsLocal.loanToken
         );
@@ -804,8 +932,8 @@ contract LoanClosingsBase is State, LoanClosingsEvents, VaultController, Interes
         internal
         returns (uint256)
     {
-        // pay outstanding interest to lender
-        _payInterest(
+        // settle outstanding interest to lender, it is transferred by withdrawAccruedInterest
+        _accrueInterest(
             loanLocal.lender,
             loanParamsLocal.loanToken
         );
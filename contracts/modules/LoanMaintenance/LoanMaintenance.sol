@@ -181,7 +181,7 @@ contract LoanMaintenance is State, LoanMaintenanceEvents, VaultController, Inter
         address loanToken)
         external
     {
-        // pay outstanding interest to lender
+        // pay outstanding and pending interest to lender
         _payInterest(
             msg.sender, // lender
             loanToken
@@ -212,8 +212,8 @@ contract LoanMaintenance is State, LoanMaintenanceEvents, VaultController, Inter
 
         require(msg.value == 0 || (!useCollateral && loanParamsLocal.loanToken == address(wethToken)), "wrong asset sent");
 
-        // pay outstanding interest to lender
-        _payInterest(
+        // settle outstanding interest to lender, it is transferred by withdrawAccruedInterest
+        _accrueInterest(
             loanLocal.lender,
             loanParamsLocal.loanToken
         );
@@ -326,8 +326,8 @@ contract LoanMaintenance is State, LoanMaintenanceEvents, VaultController, Inter
 
         require(loanLocal.endTimestamp > block.timestamp, "loan term has ended");
 
-        // pay outstanding interest to lender
-        _payInterest(
+        // settle outstanding interest to lender, it is transferred by withdrawAccruedInterest
+        _accrueInterest(
             loanLocal.lender,
             loanParamsLocal.loanToken
         );
@@ -480,11 +480,12 @@ contract LoanMaintenance is State, LoanMaintenanceEvents, VaultController, Inter
         if (interestUnPaid > lenderInterestLocal.owedTotal)
             interestUnPaid = lenderInterestLocal.owedTotal;
 
+        // paid interest not yet transferred is still owed to the lender
         return (
             lenderInterestLocal.paidTotal,
             lenderInterestLocal.paidTotal != 0 ? lenderInterestLocal.updatedTimestamp : 0,
             lenderInterestLocal.owedPerDay,
-            lenderInterestLocal.updatedTimestamp != 0 ? interestUnPaid : 0,
+            lenderInterestLocal.updatedTimestamp != 0 ? interestUnPaid.add(lenderInterestLocal.pendingTotal) : 0,
             lendingFeePercent,
             lenderInterestLocal.principalTotal
         );
@@ -8,9 +8,13 @@ pragma experimental ABIEncoderV2;
 
 import "../../core/State.sol";
 import "../../events/LoanMaintenanceEvents.sol";
+import "../../mixins/LiquidationHelper.sol";
 
 
-contract LoanMaintenance_2 is State, LoanMaintenanceEvents {
+contract LoanMaintenance_2 is State, LoanMaintenanceEvents, LiquidationHelper {
+
+    // gas kept aside so getLiquidatableLoans can always finish the current loan and return
+    uint256 internal constant LIQUIDATABLE_SCAN_GAS_RESERVE = 100000;
 
     function initialize(
         address target)
@@ -18,6 +22,7 @@ contract LoanMaintenance_2 is State, LoanMaintenanceEvents {
         onlyOwner
     {
         _setTarget(this.transferLoan.selector, target);
+        _setTarget(this.getLiquidatableLoans.selector, target);
     }
 
     function transferLoan(
@@ -46,4 +51,92 @@ contract LoanMaintenance_2 is State, LoanMaintenanceEvents {
             loanId
         );
     }
+
+    // Walks activeLoansSet forward from cursor and returns only loans at or below maintenance margin.
+    // Scanning stops early when gas runs low, after at least one loan, so the set can be swept with a fixed gas budget per call.
+    // The sweep is complete when nextCursor == getActiveLoansCount().
+    function getLiquidatableLoans(
+        uint256 cursor,
+        uint256 count)
+        external
+        view
+        returns (LiquidatableLoanData[] memory loansData, uint256 nextCursor)
+    {
+        uint256 end = cursor.add(count).min256(activeLoansSet.length());
+        if (cursor >= end) {
+            return (loansData, end);
+        }
+
+        loansData = new LiquidatableLoanData[](end - cursor);
+        LiquidatableLoanData memory loanData;
+        uint256 idx;
+
+        // consecutive loans on the same pair reuse the last rate queried
+        bytes32 pairKey;
+        uint256 collateralToLoanRate;
+
+        for (nextCursor = cursor; nextCursor < end; nextCursor++) {
+            // the first loan is always processed so every call makes progress
+            if (nextCursor != cursor && gasleft() < LIQUIDATABLE_SCAN_GAS_RESERVE) {
+                break;
+            }
+
+            (loanData, pairKey, collateralToLoanRate) = _getLiquidatableLoan(
+                activeLoansSet.get(nextCursor), // loanId
+                pairKey,
+                collateralToLoanRate
+            );
+            if (loanData.loanId != 0) {
+                loansData[idx++] = loanData;
+            }
+        }
+
+        assembly {
+            mstore(loansData, idx)
+        }
+    }
+
+    function _getLiquidatableLoan(
+        bytes32 loanId,
+        bytes32 lastPairKey,
+        uint256 lastCollateralToLoanRate)
+        internal
+        view
+        returns (LiquidatableLoanData memory loanData, bytes32 pairKey, uint256 collateralToLoanRate)
+    {
+        Loan storage loanLocal = loans[loanId];
+        LoanParams storage loanParamsLocal = loanParams[loanLocal.loanParamsId];
+
+        address loanToken = loanParamsLocal.loanToken;
+        address collateralToken = loanParamsLocal.collateralToken;
+
+        pairKey = keccak256(abi.encodePacked(loanToken, collateralToken));
+        collateralToLoanRate = pairKey == lastPairKey ?
+            lastCollateralToLoanRate :
+            _getCollateralToLoanRate(loanToken, collateralToken);
+
+        uint256 principal = loanLocal.principal;
+        uint256 collateral = loanLocal.collateral;
+        uint256 currentMargin = _getCurrentMarginWithRate(
+            principal,
+            collateral,
+            collateralToLoanRate
+        );
+
+        uint256 maintenanceMargin = loanParamsLocal.maintenanceMargin;
+        if (currentMargin > maintenanceMargin) {
+            return (loanData, pairKey, collateralToLoanRate);
+        }
+
+        loanData.loanId = loanId;
+        loanData.currentMargin = currentMargin;
+        (loanData.maxLiquidatable, loanData.maxSeizable) = _getLiquidationAmounts(
+            principal,
+            collateral,
+            currentMargin,
+            maintenanceMargin,
+            collateralToLoanRate,
+            liquidationIncentivePercent[loanToken][collateralToken]
+        );
+    }
 }
@@ -592,8 +592,8 @@ contract LoanOpenings is State, LoanOpeningsEvents, VaultController, InterestUse
         internal
         returns (uint256 interestAmountRequired)
     {
-        // pay outstanding interest to lender
-        _payInterest(
+        // settle outstanding interest to lender, it is transferred by withdrawAccruedInterest
+        _accrueInterest(
             loanLocal.lender,
             loanParamsLocal.loanToken
         );
@@ -38,6 +38,11 @@ contract StakingConstants {
 
     uint256 public constant BZRXWeightStored = 1e18;
 
+    // gas estimates used by getSweepPlan to skip fee dust
+    uint256 internal constant withdrawFeeGas =             30000; // per asset, bZx.withdrawFees
+    uint256 internal constant uniswapConversionGas =       150000; // per asset, _convertFeeWithUniswap
+    uint256 internal constant curveConversionGas =         250000; // once for DAI, USDC and USDT, _convertFeesWithCurve
+
     struct DelegatedTokens {
         address user;
         uint256 BZRX;
@@ -356,11 +356,13 @@ contract StakingV1 is StakingState, StakingConstants {
     modifier updateRewards(address account) {
         uint256 _bzrxPerTokenStored = bzrxPerTokenStored;
         uint256 _stableCoinPerTokenStored = stableCoinPerTokenStored;
+        uint256 _vestingLastSync = vestingLastSync[account];
 
         (uint256 bzrxRewardsEarned, uint256 stableCoinRewardsEarned, uint256 bzrxRewardsVesting, uint256 stableCoinRewardsVesting) = _earned(
             account,
             _bzrxPerTokenStored,
-            _stableCoinPerTokenStored
+            _stableCoinPerTokenStored,
+            _vestingLastSync
         );
         bzrxRewardsPerTokenPaid[account] = _bzrxPerTokenStored;
         stableCoinRewardsPerTokenPaid[account] = _stableCoinPerTokenStored;
@@ -374,7 +376,8 @@ contract StakingV1 is StakingState, StakingConstants {
             bzrxRewardsEarned,
             stableCoinRewardsEarned,
             bzrxRewardsVesting,
-            stableCoinRewardsVesting
+            stableCoinRewardsVesting,
+            _vestingLastSync
         );
         vestingLastSync[account] = block.timestamp;
 
@@ -387,10 +390,59 @@ contract StakingV1 is StakingState, StakingConstants {
         view
         returns (uint256 bzrxRewardsEarned, uint256 stableCoinRewardsEarned, uint256 bzrxRewardsVesting, uint256 stableCoinRewardsVesting)
     {
-        (bzrxRewardsEarned, stableCoinRewardsEarned, bzrxRewardsVesting, stableCoinRewardsVesting) = _earned(
+        return _earnedAt(
             account,
             bzrxPerTokenStored,
-            stableCoinPerTokenStored
+            stableCoinPerTokenStored,
+            _vestingMultiplier(0, block.timestamp)
+        );
+    }
+
+    function earnedBatch(
+        address[] calldata accounts)
+        external
+        view
+        returns (
+            uint256[] memory bzrxRewardsEarned,
+            uint256[] memory stableCoinRewardsEarned,
+            uint256[] memory bzrxRewardsVesting,
+            uint256[] memory stableCoinRewardsVesting
+        )
+    {
+        uint256 _bzrxPerTokenStored = bzrxPerTokenStored;
+        uint256 _stableCoinPerTokenStored = stableCoinPerTokenStored;
+        uint256 multiplier = _vestingMultiplier(0, block.timestamp);
+
+        bzrxRewardsEarned = new uint256[](accounts.length);
+        stableCoinRewardsEarned = new uint256[](accounts.length);
+        bzrxRewardsVesting = new uint256[](accounts.length);
+        stableCoinRewardsVesting = new uint256[](accounts.length);
+        for (uint256 i = 0; i < accounts.length; i++) {
+            (bzrxRewardsEarned[i], stableCoinRewardsEarned[i], bzrxRewardsVesting[i], stableCoinRewardsVesting[i]) = _earnedAt(
+                accounts[i],
+                _bzrxPerTokenStored,
+                _stableCoinPerTokenStored,
+                multiplier
+            );
+        }
+    }
+
+    // vestedMultiplier: _vestingMultiplier(0, block.timestamp), shared by batch callers
+    function _earnedAt(
+        address account,
+        uint256 _bzrxPerToken,
+        uint256 _stableCoinPerToken,
+        uint256 vestedMultiplier)
+        internal
+        view
+        returns (uint256 bzrxRewardsEarned, uint256 stableCoinRewardsEarned, uint256 bzrxRewardsVesting, uint256 stableCoinRewardsVesting)
+    {
+        uint256 lastSync = vestingLastSync[account];
+        (bzrxRewardsEarned, stableCoinRewardsEarned, bzrxRewardsVesting, stableCoinRewardsVesting) = _earned(
+            account,
+            _bzrxPerToken,
+            _stableCoinPerToken,
+            lastSync
         );
 
         (bzrxRewardsEarned, stableCoinRewardsEarned) = _syncVesting(
@@ -398,23 +450,19 @@ contract StakingV1 is StakingState, StakingConstants {
             bzrxRewardsEarned,
             stableCoinRewardsEarned,
             bzrxRewardsVesting,
-            stableCoinRewardsVesting
+            stableCoinRewardsVesting,
+            lastSync
         );
 
         // discount vesting amounts for vesting time
-        uint256 multiplier = vestedBalanceForAmount(
-            1e36,
-            0,
-            block.timestamp
-        );
         bzrxRewardsVesting = bzrxRewardsVesting
             .sub(bzrxRewardsVesting
-                .mul(multiplier)
+                .mul(vestedMultiplier)
                 .div(1e36)
             );
         stableCoinRewardsVesting = stableCoinRewardsVesting
             .sub(stableCoinRewardsVesting
-                .mul(multiplier)
+                .mul(vestedMultiplier)
                 .div(1e36)
             );
     }
@@ -422,7 +470,8 @@ contract StakingV1 is StakingState, StakingConstants {
     function _earned(
         address account,
         uint256 _bzrxPerToken,
-        uint256 _stableCoinPerToken)
+        uint256 _stableCoinPerToken,
+        uint256 lastSync)
         internal
         view
         returns (uint256 bzrxRewardsEarned, uint256 stableCoinRewardsEarned, uint256 bzrxRewardsVesting, uint256 stableCoinRewardsVesting)
@@ -438,9 +487,15 @@ contract StakingV1 is StakingState, StakingConstants {
         if (bzrxPerTokenUnpaid != 0 || stableCoinPerTokenUnpaid != 0) {
             uint256 value;
             uint256 multiplier;
-            uint256 lastSync;
 
             (uint256 vestedBalance, uint256 vestingBalance) = balanceOfStored(account);
+            if (vestingBalance != 0) {
+                // share of the vBZRX vesting schedule already vested at the last sync
+                multiplier = _vestingMultiplier(
+                    0,
+                    lastSync
+                );
+            }
 
             value = vestedBalance
                 .mul(bzrxPerTokenUnpaid);
@@ -463,12 +518,6 @@ contract StakingV1 is StakingState, StakingConstants {
                     .add(value);
 
                 // true up earned amount to vBZRX vesting schedule
-                lastSync = vestingLastSync[account];
-                multiplier = vestedBalanceForAmount(
-                    1e36,
-                    0,
-                    lastSync
-                );
                 value = value
                     .mul(multiplier);
                 value /= 1e36;
@@ -484,14 +533,6 @@ contract StakingV1 is StakingState, StakingConstants {
                     .add(value);
 
                 // true up earned amount to vBZRX vesting schedule
-                if (lastSync == 0) {
-                    lastSync = vestingLastSync[account];
-                    multiplier = vestedBalanceForAmount(
-                        1e36,
-                        0,
-                        lastSync
-                    );
-                }
                 value = value
                     .mul(multiplier);
                 value /= 1e36;
@@ -506,17 +547,15 @@ contract StakingV1 is StakingState, StakingConstants {
         uint256 bzrxRewardsEarned,
         uint256 stableCoinRewardsEarned,
         uint256 bzrxRewardsVesting,
-        uint256 stableCoinRewardsVesting)
+        uint256 stableCoinRewardsVesting,
+        uint256 lastVestingSync)
         internal
         view
         returns (uint256, uint256)
     {
-        uint256 lastVestingSync = vestingLastSync[account];
-
         if (lastVestingSync != block.timestamp) {
             uint256 rewardsVested;
-            uint256 multiplier = vestedBalanceForAmount(
-                1e36,
+            uint256 multiplier = _vestingMultiplier(
                 lastVestingSync,
                 block.timestamp
             );
@@ -678,16 +717,78 @@ contract StakingV1 is StakingState, StakingConstants {
         );
     }
 
+    function balanceOfByAssetsBatch(
+        address[] calldata accounts)
+        external
+        view
+        returns (
+            uint256[] memory bzrxBalances,
+            uint256[] memory iBZRXBalances,
+            uint256[] memory vBZRXBalances,
+            uint256[] memory LPTokenBalances
+        )
+    {
+        bzrxBalances = new uint256[](accounts.length);
+        iBZRXBalances = new uint256[](accounts.length);
+        vBZRXBalances = new uint256[](accounts.length);
+        LPTokenBalances = new uint256[](accounts.length);
+        for (uint256 i = 0; i < accounts.length; i++) {
+            bzrxBalances[i] = _balancesPerToken[BZRX][accounts[i]];
+            iBZRXBalances[i] = _balancesPerToken[iBZRX][accounts[i]];
+            vBZRXBalances[i] = _balancesPerToken[vBZRX][accounts[i]];
+            LPTokenBalances[i] = _balancesPerToken[LPToken][accounts[i]];
+        }
+    }
+
     function balanceOfStored(
         address account)
         public
         view
         returns (uint256 vestedBalance, uint256 vestingBalance)
+    {
+        return _balanceOfStored(
+            account,
+            vBZRXWeightStored,
+            iBZRXWeightStored,
+            LPTokenWeightStored
+        );
+    }
+
+    function balanceOfStoredBatch(
+        address[] calldata accounts)
+        external
+        view
+        returns (uint256[] memory vestedBalances, uint256[] memory vestingBalances)
+    {
+        uint256 _vBZRXWeightStored = vBZRXWeightStored;
+        uint256 _iBZRXWeightStored = iBZRXWeightStored;
+        uint256 _LPTokenWeightStored = LPTokenWeightStored;
+
+        vestedBalances = new uint256[](accounts.length);
+        vestingBalances = new uint256[](accounts.length);
+        for (uint256 i = 0; i < accounts.length; i++) {
+            (vestedBalances[i], vestingBalances[i]) = _balanceOfStored(
+                accounts[i],
+                _vBZRXWeightStored,
+                _iBZRXWeightStored,
+                _LPTokenWeightStored
+            );
+        }
+    }
+
+    function _balanceOfStored(
+        address account,
+        uint256 vBZRXWeight,
+        uint256 iBZRXWeight,
+        uint256 LPTokenWeight)
+        internal
+        view
+        returns (uint256 vestedBalance, uint256 vestingBalance)
     {
         uint256 balance = _balancesPerToken[vBZRX][account];
         if (balance != 0) {
-            vestingBalance = _balancesPerToken[vBZRX][account]
-                    .mul(vBZRXWeightStored)
+            vestingBalance = balance
+                    .mul(vBZRXWeight)
                     .div(1e18);
         }
 
@@ -696,7 +797,7 @@ contract StakingV1 is StakingState, StakingConstants {
         balance = _balancesPerToken[iBZRX][account];
         if (balance != 0) {
             vestedBalance = balance
-                .mul(iBZRXWeightStored)
+                .mul(iBZRXWeight)
                 .div(1e18)
                 .add(vestedBalance);
         }
@@ -704,7 +805,7 @@ contract StakingV1 is StakingState, StakingConstants {
         balance = _balancesPerToken[LPToken][account];
         if (balance != 0) {
             vestedBalance = balance
-                .mul(LPTokenWeightStored)
+                .mul(LPTokenWeight)
                 .div(1e18)
                 .add(vestedBalance);
         }
@@ -715,18 +816,63 @@ contract StakingV1 is StakingState, StakingConstants {
         public
         view
         returns (uint256 totalVotes)
+    {
+        return _delegateBalanceOf(
+            account,
+            _startingVBZRXBalance - vestedBalanceForAmount( // overflow not possible
+                _startingVBZRXBalance,
+                0,
+                block.timestamp
+            ),
+            ILoanPool(iBZRX).tokenPrice(),
+            IERC20(BZRX).balanceOf(LPToken),
+            IERC20(LPToken).totalSupply()
+        );
+    }
+
+    function delegateBalanceOfBatch(
+        address[] calldata accounts)
+        external
+        view
+        returns (uint256[] memory totalVotes)
+    {
+        uint256 unvestedVBZRX = _startingVBZRXBalance - vestedBalanceForAmount( // overflow not possible
+            _startingVBZRXBalance,
+            0,
+            block.timestamp
+        );
+        uint256 iBZRXPrice = ILoanPool(iBZRX).tokenPrice();
+        uint256 LPTokenBZRXBalance = IERC20(BZRX).balanceOf(LPToken);
+        uint256 LPTokenSupply = IERC20(LPToken).totalSupply();
+
+        totalVotes = new uint256[](accounts.length);
+        for (uint256 i = 0; i < accounts.length; i++) {
+            totalVotes[i] = _delegateBalanceOf(
+                accounts[i],
+                unvestedVBZRX,
+                iBZRXPrice,
+                LPTokenBZRXBalance,
+                LPTokenSupply
+            );
+        }
+    }
+
+    function _delegateBalanceOf(
+        address account,
+        uint256 unvestedVBZRX,
+        uint256 iBZRXPrice,
+        uint256 LPTokenBZRXBalance,
+        uint256 LPTokenSupply)
+        internal
+        view
+        returns (uint256 totalVotes)
     {
         uint256 vBZRXBalance = _balancesPerToken[vBZRX][account];
         if (vBZRXBalance != 0) {
             // staked vBZRX counts has 1/2 a vote, that's prorated based on total vested
             totalVotes = vBZRXBalance
-                .mul(_startingVBZRXBalance -
-                    vestedBalanceForAmount( // overflow not possible
-                        _startingVBZRXBalance,
-                        0,
-                        block.timestamp
-                    )
-                ).div(_startingVBZRXBalance) / 2;
+                .mul(unvestedVBZRX)
+                .div(_startingVBZRXBalance) / 2;
 
             // user is attributed a staked balance of vested BZRX, from their last update to the present
             totalVotes = vestedBalanceForAmount(
@@ -741,14 +887,14 @@ contract StakingV1 is StakingState, StakingConstants {
             .add(totalVotes);
 
         totalVotes = _balancesPerToken[iBZRX][account]
-            .mul(ILoanPool(iBZRX).tokenPrice())
+            .mul(iBZRXPrice)
             .div(1e18)
             .add(totalVotes);
 
         // LPToken votes are measured based on amount of underlying BZRX staked
-        totalVotes = IERC20(BZRX).balanceOf(LPToken)
+        totalVotes = LPTokenBZRXBalance
             .mul(_balancesPerToken[LPToken][account])
-            .div(IERC20(LPToken).totalSupply())
+            .div(LPTokenSupply)
             .add(totalVotes);
     }
 
@@ -814,6 +960,36 @@ contract StakingV1 is StakingState, StakingConstants {
         }
     }
 
+    // vestedBalanceForAmount(1e36, lastUpdate, vestingEndTime) without the SafeMath calls
+    function _vestingMultiplier(
+        uint256 lastUpdate,
+        uint256 vestingEndTime)
+        internal
+        view
+        returns (uint256)
+    {
+        if (vestingEndTime > block.timestamp) {
+            vestingEndTime = block.timestamp;
+        }
+        if (vestingEndTime <= lastUpdate ||
+            vestingEndTime <= vestingCliffTimestamp ||
+            lastUpdate >= vestingEndTimestamp) {
+            return 0;
+        }
+        if (lastUpdate <= vestingCliffTimestamp && vestingEndTime >= vestingEndTimestamp) {
+            // the whole schedule: vestingEndTimestamp - vestingCliffTimestamp == vestingDurationAfterCliff
+            return 1e36;
+        }
+
+        if (lastUpdate < vestingCliffTimestamp) {
+            lastUpdate = vestingCliffTimestamp;
+        }
+        if (vestingEndTime > vestingEndTimestamp) {
+            vestingEndTime = vestingEndTimestamp;
+        }
+        return (vestingEndTime - lastUpdate) * 1e36 / vestingDurationAfterCliff; // overflow not possible
+    }
+
 
     // Fee Conversion Logic //
 
@@ -837,6 +1013,83 @@ contract StakingV1 is StakingState, StakingConstants {
         (bzrxRewards, crv3Rewards) = _distributeFees();
     }
 
+    function sweepFeesAboveDust()
+        public
+        // sweepFeesByAssetAboveDust() does checkPause
+        returns (uint256 bzrxRewards, uint256 crv3Rewards)
+    {
+        return sweepFeesByAssetAboveDust(currentFeeTokens);
+    }
+
+    // only withdraws and converts the assets worth sweeping at tx.gasprice (see getSweepPlan)
+    function sweepFeesByAssetAboveDust(
+        address[] memory assets)
+        public
+        checkPause
+        onlyEOA
+        returns (uint256 bzrxRewards, uint256 crv3Rewards)
+    {
+        (assets,) = getSweepPlan(assets, tx.gasprice);
+        if (assets.length != 0) {
+            uint256[] memory amounts = _withdrawFees(assets);
+            _convertFees(assets, amounts);
+        }
+        (bzrxRewards, crv3Rewards) = _distributeFees();
+    }
+
+    // sweepAssets: assets whose held fees are worth at least the gas to withdraw and convert them at gasPrice.
+    // DAI, USDC and USDT share one Curve deposit, so they are swept together or not at all.
+    // valuesInEth: value of each input asset's held fees
+    function getSweepPlan(
+        address[] memory assets,
+        uint256 gasPrice)
+        public
+        view
+        returns (address[] memory sweepAssets, uint256[] memory valuesInEth)
+    {
+        (uint256[] memory amountsHeld,) = bZx.queryFees(assets, IBZx.FeeClaimType.All);
+        address priceFeeds = bZx.priceFeeds();
+
+        valuesInEth = new uint256[](assets.length);
+        bool[] memory isSwept = new bool[](assets.length);
+        uint256 count;
+        uint256 stableCoinValue;
+        uint256 stableCoinCount;
+        for (uint256 i = 0; i < assets.length; i++) {
+            if (amountsHeld[i] == 0) {
+                continue;
+            }
+            valuesInEth[i] = _amountInEth(priceFeeds, assets[i], amountsHeld[i]);
+
+            if (_isCurveAsset(assets[i])) {
+                stableCoinValue = stableCoinValue
+                    .add(valuesInEth[i]);
+                stableCoinCount++;
+            } else if (valuesInEth[i] >= (assets[i] == BZRX ? withdrawFeeGas : withdrawFeeGas + uniswapConversionGas).mul(gasPrice)) {
+                isSwept[i] = true;
+                count++;
+            }
+        }
+
+        if (stableCoinCount != 0 &&
+            stableCoinValue >= stableCoinCount.mul(withdrawFeeGas).add(curveConversionGas).mul(gasPrice)) {
+            for (uint256 i = 0; i < assets.length; i++) {
+                if (amountsHeld[i] != 0 && _isCurveAsset(assets[i])) {
+                    isSwept[i] = true;
+                    count++;
+                }
+            }
+        }
+
+        sweepAssets = new address[](count);
+        count = 0;
+        for (uint256 i = 0; i < assets.length; i++) {
+            if (isSwept[i]) {
+                sweepAssets[count++] = assets[i];
+            }
+        }
+    }
+
     function _withdrawFees(
         address[] memory assets)
         internal
@@ -975,6 +1228,38 @@ contract StakingV1 is StakingState, StakingConstants {
         );
     }
 
+    function _isCurveAsset(
+        address asset)
+        internal
+        pure
+        returns (bool)
+    {
+        return asset == DAI || asset == USDC || asset == USDT;
+    }
+
+    // 0 if the asset has no price feed
+    function _amountInEth(
+        address priceFeeds,
+        address asset,
+        uint256 amount)
+        internal
+        view
+        returns (uint256 ethAmount)
+    {
+        (bool success, bytes memory data) = priceFeeds.staticcall(
+            abi.encodeWithSelector(
+                IPriceFeeds(priceFeeds).amountInEth.selector,
+                asset,
+                amount
+            )
+        );
+        if (success) {
+            assembly {
+                ethAmount := mload(add(data, 32))
+            }
+        }
+    }
+
     function _convertFeeWithUniswap(
         address asset,
         uint256 amount,
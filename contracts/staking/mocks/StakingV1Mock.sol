@@ -0,0 +1,100 @@
+/**
+ * Copyright 2017-2021, bZeroX, LLC <https://bzx.network/>. All Rights Reserved.
+ * Licensed under the Apache License, Version 2.0.
+ */
+
+pragma solidity 0.5.17;
+pragma experimental ABIEncoderV2;
+
+import "../StakingV1.sol";
+
+
+// writes staker state directly, so StakingV1 views can be tested without the mainnet tokens
+contract StakingV1Mock is StakingV1 {
+
+    function setBalances(
+        address token,
+        address[] memory accounts,
+        uint256[] memory values)
+        public
+    {
+        require(accounts.length == values.length, "count mismatch");
+        for (uint256 i = 0; i < accounts.length; i++) {
+            _totalSupplyPerToken[token] = _totalSupplyPerToken[token]
+                .sub(_balancesPerToken[token][accounts[i]])
+                .add(values[i]);
+            _balancesPerToken[token][accounts[i]] = values[i];
+        }
+    }
+
+    function setRewardsPerTokenPaid(
+        address[] memory accounts,
+        uint256[] memory bzrxPaid,
+        uint256[] memory stableCoinPaid)
+        public
+    {
+        require(accounts.length == bzrxPaid.length && accounts.length == stableCoinPaid.length, "count mismatch");
+        for (uint256 i = 0; i < accounts.length; i++) {
+            bzrxRewardsPerTokenPaid[accounts[i]] = bzrxPaid[i];
+            stableCoinRewardsPerTokenPaid[accounts[i]] = stableCoinPaid[i];
+        }
+    }
+
+    function setRewards(
+        address[] memory accounts,
+        uint256[] memory bzrxAmounts,
+        uint256[] memory stableCoinAmounts)
+        public
+    {
+        require(accounts.length == bzrxAmounts.length && accounts.length == stableCoinAmounts.length, "count mismatch");
+        for (uint256 i = 0; i < accounts.length; i++) {
+            bzrxRewards[accounts[i]] = bzrxAmounts[i];
+            stableCoinRewards[accounts[i]] = stableCoinAmounts[i];
+        }
+    }
+
+    function setVesting(
+        address[] memory accounts,
+        uint256[] memory bzrxAmounts,
+        uint256[] memory stableCoinAmounts,
+        uint256[] memory lastSync)
+        public
+    {
+        require(accounts.length == bzrxAmounts.length && accounts.length == stableCoinAmounts.length && accounts.length == lastSync.length, "count mismatch");
+        for (uint256 i = 0; i < accounts.length; i++) {
+            bzrxVesting[accounts[i]] = bzrxAmounts[i];
+            stableCoinVesting[accounts[i]] = stableCoinAmounts[i];
+            vestingLastSync[accounts[i]] = lastSync[i];
+        }
+    }
+
+    function setPerTokenStored(
+        uint256 _bzrxPerTokenStored,
+        uint256 _stableCoinPerTokenStored)
+        public
+    {
+        bzrxPerTokenStored = _bzrxPerTokenStored;
+        stableCoinPerTokenStored = _stableCoinPerTokenStored;
+    }
+
+    function setWeightsStored(
+        uint256 _vBZRXWeightStored,
+        uint256 _iBZRXWeightStored,
+        uint256 _LPTokenWeightStored)
+        public
+    {
+        vBZRXWeightStored = _vBZRXWeightStored;
+        iBZRXWeightStored = _iBZRXWeightStored;
+        LPTokenWeightStored = _LPTokenWeightStored;
+    }
+
+    function vestingMultiplier(
+        uint256 lastUpdate,
+        uint256 vestingEndTime)
+        external
+        view
+        returns (uint256)
+    {
+        return _vestingMultiplier(lastUpdate, vestingEndTime);
+    }
+}
@@ -0,0 +1,489 @@
+/**
+ * Copyright 2017-2021, bZeroX, LLC. All Rights Reserved.
+ * Licensed under the Apache License, Version 2.0.
+ */
+
+pragma solidity 0.5.17;
+
+import "../../core/State.sol";
+import "../../interfaces/IUniswapV2Router.sol";
+import "../../openzeppelin/SafeERC20.sol";
+import "../ISwapsImpl.sol";
+
+
+// shared logic of the SwapsImplUniswapV2_* connectors
+contract SwapsImplUniswapV2Base is State, ISwapsImpl {
+    using SafeERC20 for IERC20;
+
+    struct SwapRoute {
+        address midToken;           // address(0) for the direct path
+        uint256 amountOut;          // total amount out, including the split
+        address splitMidToken;
+        uint256 splitAmountIn;      // part of amountIn sent through splitMidToken, 0 if not split
+    }
+
+    uint256 internal constant MAX_ROUTE_COUNT = 8;
+
+    // connector storage. dexSwap is delegatecalled by the protocol, so these are only read through _getSwapRouteConfig
+    mapping (bytes32 => address[]) internal swapRoutes;     // keccak256(sourceToken, destToken) => mid tokens tried, address(0) for the direct path
+    bool public splitRoutingEnabled;
+
+    event SetSwapRoute(
+        address indexed sourceToken,
+        address indexed destToken,
+        address[] midTokens
+    );
+
+    event SetSplitRouting(
+        bool enabled
+    );
+
+    function dexSwap(
+        address sourceTokenAddress,
+        address destTokenAddress,
+        address receiverAddress,
+        address returnToSenderAddress,
+        uint256 minSourceTokenAmount,
+        uint256 maxSourceTokenAmount,
+        uint256 requiredDestTokenAmount)
+        public
+        returns (uint256 destTokenAmountReceived, uint256 sourceTokenAmountUsed)
+    {
+        require(sourceTokenAddress != destTokenAddress, "source == dest");
+        require(supportedTokens[sourceTokenAddress] && supportedTokens[destTokenAddress], "invalid tokens");
+
+        IERC20 sourceToken = IERC20(sourceTokenAddress);
+        address _thisAddress = address(this);
+
+        (sourceTokenAmountUsed, destTokenAmountReceived) = _swapWithUni(
+            sourceTokenAddress,
+            destTokenAddress,
+            receiverAddress,
+            minSourceTokenAmount,
+            maxSourceTokenAmount,
+            requiredDestTokenAmount
+        );
+
+        if (returnToSenderAddress != _thisAddress && sourceTokenAmountUsed < maxSourceTokenAmount) {
+            // send unused source token back
+            sourceToken.safeTransfer(
+                returnToSenderAddress,
+                maxSourceTokenAmount-sourceTokenAmountUsed
+            );
+        }
+    }
+
+    function dexExpectedRate(
+        address sourceTokenAddress,
+        address destTokenAddress,
+        uint256 sourceTokenAmount)
+        public
+        view
+        returns (uint256 expectedRate)
+    {
+        revert("unsupported");
+    }
+
+    // amountOut includes the second leg when split routing is enabled and pays more
+    function dexAmountOut(
+        address sourceTokenAddress,
+        address destTokenAddress,
+        uint256 amountIn)
+        public
+        view
+        returns (uint256 amountOut, address midToken)
+    {
+        if (sourceTokenAddress == destTokenAddress) {
+            amountOut = amountIn;
+        } else if (amountIn != 0) {
+            SwapRoute memory route = _getSwapRoute(
+                sourceTokenAddress,
+                destTokenAddress,
+                amountIn
+            );
+            amountOut = route.amountOut;
+            midToken = route.midToken;
+        }
+    }
+
+    function dexAmountOutWithSplit(
+        address sourceTokenAddress,
+        address destTokenAddress,
+        uint256 amountIn)
+        public
+        view
+        returns (uint256 amountOut, address midToken, address splitMidToken, uint256 splitAmountIn)
+    {
+        if (sourceTokenAddress == destTokenAddress) {
+            amountOut = amountIn;
+        } else if (amountIn != 0) {
+            SwapRoute memory route = _getSwapRoute(
+                sourceTokenAddress,
+                destTokenAddress,
+                amountIn
+            );
+            return (route.amountOut, route.midToken, route.splitMidToken, route.splitAmountIn);
+        }
+    }
+
+    function dexAmountIn(
+        address sourceTokenAddress,
+        address destTokenAddress,
+        uint256 amountOut)
+        public
+        view
+        returns (uint256 amountIn, address midToken)
+    {
+        if (sourceTokenAddress == destTokenAddress) {
+            amountIn = amountOut;
+        } else if (amountOut != 0) {
+            (address[] memory midTokens,) = _getSwapRouteConfig(
+                sourceTokenAddress,
+                destTokenAddress
+            );
+
+            amountIn = uint256(-1);
+            uint256 tmpValue;
+            for (uint256 i = 0; i < midTokens.length; i++) {
+                if (midTokens[i] == sourceTokenAddress || midTokens[i] == destTokenAddress) {
+                    continue;
+                }
+                tmpValue = _getAmountIn(
+                    amountOut,
+                    _getPath(sourceTokenAddress, midTokens[i], destTokenAddress)
+                );
+                if (tmpValue < amountIn) {
+                    amountIn = tmpValue;
+                    midToken = midTokens[i];
+                }
+            }
+
+            if (amountIn == uint256(-1)) {
+                amountIn = 0;
+            }
+        }
+    }
+
+    function _getAmountOut(
+        uint256 amountIn,
+        address[] memory path)
+        public
+        view
+        returns (uint256 amountOut)
+    {
+        (bool success, bytes memory data) = _getRouter().staticcall(
+            abi.encodeWithSelector(
+                0xd06ca61f, // keccak("getAmountsOut(uint256,address[])")
+                amountIn,
+                path
+            )
+        );
+        if (success) {
+            uint256 len = data.length;
+            assembly {
+                amountOut := mload(add(data, len)) // last amount value array
+            }
+        }
+    }
+
+    function _getAmountIn(
+        uint256 amountOut,
+        address[] memory path)
+        public
+        view
+        returns (uint256 amountIn)
+    {
+        (bool success, bytes memory data) = _getRouter().staticcall(
+            abi.encodeWithSelector(
+                0x1f00ca74, // keccak("getAmountsIn(uint256,address[])")
+                amountOut,
+                path
+            )
+        );
+        if (success) {
+            uint256 len = data.length;
+            assembly {
+                amountIn := mload(add(data, 96)) // first amount value in array
+            }
+        }
+        if (amountIn == 0) {
+            amountIn = uint256(-1);
+        }
+    }
+
+    function setSwapApprovals(
+        address[] memory tokens)
+        public
+    {
+        address router = _getRouter();
+        for (uint256 i = 0; i < tokens.length; i++) {
+            IERC20(tokens[i]).safeApprove(router, 0);
+            IERC20(tokens[i]).safeApprove(router, uint256(-1));
+        }
+    }
+
+    // an empty midTokens list restores the connector's default route
+    function setSwapRoute(
+        address sourceToken,
+        address destToken,
+        address[] memory midTokens)
+        public
+        onlyOwner
+    {
+        require(midTokens.length <= MAX_ROUTE_COUNT, "too many routes");
+        swapRoutes[keccak256(abi.encodePacked(sourceToken, destToken))] = midTokens;
+
+        emit SetSwapRoute(
+            sourceToken,
+            destToken,
+            midTokens
+        );
+    }
+
+    function setSplitRouting(
+        bool enabled)
+        external
+        onlyOwner
+    {
+        splitRoutingEnabled = enabled;
+
+        emit SetSplitRouting(
+            enabled
+        );
+    }
+
+    // mid tokens tried for the pair, in order. address(0) is the direct path
+    function getSwapRoute(
+        address sourceToken,
+        address destToken)
+        public
+        view
+        returns (address[] memory midTokens)
+    {
+        midTokens = swapRoutes[keccak256(abi.encodePacked(sourceToken, destToken))];
+        if (midTokens.length == 0) {
+            address[] memory defaultMidTokens = _getDefaultMidTokens();
+            midTokens = new address[](defaultMidTokens.length + 1);
+            for (uint256 i = 0; i < defaultMidTokens.length; i++) {
+                midTokens[i + 1] = defaultMidTokens[i];
+            }
+        }
+    }
+
+    function getSwapRouteConfig(
+        address sourceToken,
+        address destToken)
+        external
+        view
+        returns (address[] memory midTokens, bool splitEnabled)
+    {
+        return (getSwapRoute(sourceToken, destToken), splitRoutingEnabled);
+    }
+
+    function _getRouter()
+        internal
+        view
+        returns (address);
+
+    // wethToken first, then the connector's bridge tokens
+    function _getDefaultMidTokens()
+        internal
+        view
+        returns (address[] memory);
+
+    function _getSwapRouteConfig(
+        address sourceToken,
+        address destToken)
+        internal
+        view
+        returns (address[] memory midTokens, bool splitEnabled)
+    {
+        address impl = swapsImpl;
+        if (impl == address(0) || impl == address(this)) {
+            // called on the connector itself
+            return (getSwapRoute(sourceToken, destToken), splitRoutingEnabled);
+        }
+
+        // delegatecalled by the protocol: read the route table from the connector's own storage
+        return SwapsImplUniswapV2Base(impl).getSwapRouteConfig(sourceToken, destToken);
+    }
+
+    function _getSwapRoute(
+        address sourceToken,
+        address destToken,
+        uint256 amountIn)
+        internal
+        view
+        returns (SwapRoute memory route)
+    {
+        (address[] memory midTokens, bool splitEnabled) = _getSwapRouteConfig(
+            sourceToken,
+            destToken
+        );
+
+        // single pass over the candidates, keeping the best and second best paths
+        SwapRoute memory runnerUp;
+        uint256 tmpValue;
+        for (uint256 i = 0; i < midTokens.length; i++) {
+            if (midTokens[i] == sourceToken || midTokens[i] == destToken) {
+                continue;
+            }
+            tmpValue = _getAmountOut(
+                amountIn,
+                _getPath(sourceToken, midTokens[i], destToken)
+            );
+            if (tmpValue > route.amountOut) {
+                runnerUp.midToken = route.midToken;
+                runnerUp.amountOut = route.amountOut;
+                route.midToken = midTokens[i];
+                route.amountOut = tmpValue;
+            } else if (tmpValue > runnerUp.amountOut) {
+                runnerUp.midToken = midTokens[i];
+                runnerUp.amountOut = tmpValue;
+            }
+        }
+
+        if (splitEnabled && runnerUp.amountOut != 0) {
+            _setSplit(
+                sourceToken,
+                destToken,
+                amountIn,
+                route,
+                runnerUp.midToken
+            );
+        }
+    }
+
+    // tries sending 25%, 50% and 75% of amountIn through the second best path
+    function _setSplit(
+        address sourceToken,
+        address destToken,
+        uint256 amountIn,
+        SwapRoute memory route,
+        address splitMidToken)
+        internal
+        view
+    {
+        address[] memory path = _getPath(sourceToken, route.midToken, destToken);
+        address[] memory splitPath = _getPath(sourceToken, splitMidToken, destToken);
+
+        uint256 splitAmountIn;
+        uint256 amountOut;
+        uint256 splitAmountOut;
+        for (uint256 share = 25; share < 100; share += 25) {
+            splitAmountIn = amountIn
+                .mul(share)
+                .div(100);
+            if (splitAmountIn == 0) {
+                continue;
+            }
+
+            amountOut = _getAmountOut(amountIn - splitAmountIn, path);
+            splitAmountOut = _getAmountOut(splitAmountIn, splitPath);
+            if (amountOut == 0 || splitAmountOut == 0) {
+                continue;
+            }
+
+            amountOut = amountOut
+                .add(splitAmountOut);
+            if (amountOut > route.amountOut) {
+                route.amountOut = amountOut;
+                route.splitMidToken = splitMidToken;
+                route.splitAmountIn = splitAmountIn;
+            }
+        }
+    }
+
+    function _getPath(
+        address sourceToken,
+        address midToken,
+        address destToken)
+        internal
+        pure
+        returns (address[] memory path)
+    {
+        if (midToken != address(0)) {
+            path = new address[](3);
+            path[0] = sourceToken;
+            path[1] = midToken;
+            path[2] = destToken;
+        } else {
+            path = new address[](2);
+            path[0] = sourceToken;
+            path[1] = destToken;
+        }
+    }
+
+    function _swapWithUni(
+        address sourceTokenAddress,
+        address destTokenAddress,
+        address receiverAddress,
+        uint256 minSourceTokenAmount,
+        uint256 maxSourceTokenAmount,
+        uint256 requiredDestTokenAmount)
+        internal
+        returns (uint256 sourceTokenAmountUsed, uint256 destTokenAmountReceived)
+    {
+        if (requiredDestTokenAmount != 0) {
+            address midToken;
+            (sourceTokenAmountUsed, midToken) = dexAmountIn(
+                sourceTokenAddress,
+                destTokenAddress,
+                requiredDestTokenAmount
+            );
+            if (sourceTokenAmountUsed == 0) {
+                return (0, 0);
+            }
+            require(sourceTokenAmountUsed <= maxSourceTokenAmount, "source amount too high");
+
+            destTokenAmountReceived = _swapOnPath(
+                sourceTokenAmountUsed,
+                _getPath(sourceTokenAddress, midToken, destTokenAddress),
+                receiverAddress
+            );
+        } else {
+            sourceTokenAmountUsed = minSourceTokenAmount;
+            SwapRoute memory route = _getSwapRoute(
+                sourceTokenAddress,
+                destTokenAddress,
+                sourceTokenAmountUsed
+            );
+            if (route.amountOut == 0) {
+                return (0, 0);
+            }
+
+            destTokenAmountReceived = _swapOnPath(
+                sourceTokenAmountUsed - route.splitAmountIn,
+                _getPath(sourceTokenAddress, route.midToken, destTokenAddress),
+                receiverAddress
+            );
+            if (route.splitAmountIn != 0) {
+                destTokenAmountReceived = destTokenAmountReceived.add(
+                    _swapOnPath(
+                        route.splitAmountIn,
+                        _getPath(sourceTokenAddress, route.splitMidToken, destTokenAddress),
+                        receiverAddress
+                    )
+                );
+            }
+        }
+    }
+
+    function _swapOnPath(
+        uint256 amountIn,
+        address[] memory path,
+        address receiverAddress)
+        internal
+        returns (uint256)
+    {
+        uint256[] memory amounts = IUniswapV2Router(_getRouter()).swapExactTokensForTokens(
+            amountIn,
+            1, // amountOutMin
+            path,
+            receiverAddress,
+            block.timestamp
+        );
+
+        return amounts[amounts.length - 1];
+    }
+}
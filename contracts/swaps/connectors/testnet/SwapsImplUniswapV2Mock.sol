@@ -0,0 +1,53 @@
+/**
+ * Copyright 2017-2021, bZeroX, LLC. All Rights Reserved.
+ * Licensed under the Apache License, Version 2.0.
+ */
+
+pragma solidity 0.5.17;
+
+import "../SwapsImplUniswapV2Base.sol";
+
+
+// SwapsImplUniswapV2Base over a local router (TestUniswapV2Router), called directly rather than delegatecalled (local testing only)
+contract SwapsImplUniswapV2Mock is SwapsImplUniswapV2Base {
+
+    address public uniswapRouter;
+    address[] internal defaultMidTokens;
+
+    function setRouter(
+        address router,
+        address[] memory midTokens)
+        public
+        onlyOwner
+    {
+        uniswapRouter = router;
+        defaultMidTokens = midTokens;
+    }
+
+    function setSupportedTokens(
+        address[] memory tokens,
+        bool toggle)
+        public
+        onlyOwner
+    {
+        for (uint256 i = 0; i < tokens.length; i++) {
+            supportedTokens[tokens[i]] = toggle;
+        }
+    }
+
+    function _getRouter()
+        internal
+        view
+        returns (address)
+    {
+        return uniswapRouter;
+    }
+
+    function _getDefaultMidTokens()
+        internal
+        view
+        returns (address[] memory)
+    {
+        return defaultMidTokens;
+    }
+}
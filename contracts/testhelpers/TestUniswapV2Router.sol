@@ -0,0 +1,178 @@
+/**
+ * Copyright 2017-2021, bZeroX, LLC. All Rights Reserved.
+ * Licensed under the Apache License, Version 2.0.
+ */
+
+pragma solidity 0.6.12;
+
+import "@openzeppelin-3.4.0/token/ERC20/IERC20.sol";
+import "@openzeppelin-3.4.0/math/SafeMath.sol";
+
+
+// constant product pair with the PancakeSwap v2 fee (0.25%)
+contract TestUniswapV2Pair {
+    using SafeMath for uint256;
+
+    address public token0;
+    address public token1;
+
+    uint112 internal reserve0;
+    uint112 internal reserve1;
+
+    event Sync(uint112 reserve0, uint112 reserve1);
+
+    constructor(address _token0, address _token1) public {
+        token0 = _token0;
+        token1 = _token1;
+    }
+
+    function getReserves()
+        external
+        view
+        returns (uint112 _reserve0, uint112 _reserve1, uint32 _blockTimestampLast)
+    {
+        return (reserve0, reserve1, 0);
+    }
+
+    // balances sent to the pair become its reserves
+    function sync() public {
+        reserve0 = uint112(IERC20(token0).balanceOf(address(this)));
+        reserve1 = uint112(IERC20(token1).balanceOf(address(this)));
+        emit Sync(reserve0, reserve1);
+    }
+
+    function swap(
+        uint256 amount0Out,
+        uint256 amount1Out,
+        address to)
+        external
+    {
+        require(amount0Out < reserve0 && amount1Out < reserve1, "insufficient liquidity");
+        if (amount0Out != 0) IERC20(token0).transfer(to, amount0Out);
+        if (amount1Out != 0) IERC20(token1).transfer(to, amount1Out);
+
+        uint256 balance0 = IERC20(token0).balanceOf(address(this));
+        uint256 balance1 = IERC20(token1).balanceOf(address(this));
+        uint256 amount0In = balance0 > reserve0 - amount0Out ? balance0 - (reserve0 - amount0Out) : 0;
+        uint256 amount1In = balance1 > reserve1 - amount1Out ? balance1 - (reserve1 - amount1Out) : 0;
+        require(
+            balance0.mul(10000).sub(amount0In.mul(25)).mul(balance1.mul(10000).sub(amount1In.mul(25))) >=
+                uint256(reserve0).mul(reserve1).mul(10000**2),
+            "K"
+        );
+        sync();
+    }
+}
+
+
+// router subset used by the fee extractors and the UniswapV2 swap connectors, over TestUniswapV2Pair
+contract TestUniswapV2Router {
+    using SafeMath for uint256;
+
+    mapping(address => mapping(address => TestUniswapV2Pair)) public getPair;
+
+    function createPair(
+        address tokenA,
+        address tokenB,
+        uint256 amountA,
+        uint256 amountB)
+        external
+        returns (TestUniswapV2Pair pair)
+    {
+        (address token0, address token1) = tokenA < tokenB ? (tokenA, tokenB) : (tokenB, tokenA);
+        pair = getPair[token0][token1];
+        if (address(pair) == address(0)) {
+            pair = new TestUniswapV2Pair(token0, token1);
+            getPair[token0][token1] = pair;
+            getPair[token1][token0] = pair;
+        }
+        IERC20(tokenA).transferFrom(msg.sender, address(pair), amountA);
+        IERC20(tokenB).transferFrom(msg.sender, address(pair), amountB);
+        pair.sync();
+    }
+
+    function getAmountOut(
+        uint256 amountIn,
+        uint256 reserveIn,
+        uint256 reserveOut)
+        public
+        pure
+        returns (uint256)
+    {
+        require(amountIn != 0 && reserveIn != 0 && reserveOut != 0, "insufficient amount");
+        uint256 amountInWithFee = amountIn.mul(9975);
+        return amountInWithFee.mul(reserveOut) / reserveIn.mul(10000).add(amountInWithFee);
+    }
+
+    function getAmountIn(
+        uint256 amountOut,
+        uint256 reserveIn,
+        uint256 reserveOut)
+        public
+        pure
+        returns (uint256)
+    {
+        require(amountOut != 0 && reserveIn != 0 && reserveOut > amountOut, "insufficient amount");
+        return reserveIn.mul(amountOut).mul(10000) / reserveOut.sub(amountOut).mul(9975) + 1;
+    }
+
+    function getAmountsOut(
+        uint256 amountIn,
+        address[] memory path)
+        public
+        view
+        returns (uint256[] memory amounts)
+    {
+        amounts = new uint256[](path.length);
+        amounts[0] = amountIn;
+        for (uint256 i = 0; i < path.length - 1; i++) {
+            TestUniswapV2Pair pair = getPair[path[i]][path[i + 1]];
+            require(address(pair) != address(0), "no pair");
+            (uint256 reserve0, uint256 reserve1,) = pair.getReserves();
+            (uint256 reserveIn, uint256 reserveOut) = path[i] == pair.token0() ? (reserve0, reserve1) : (reserve1, reserve0);
+            amounts[i + 1] = getAmountOut(amounts[i], reserveIn, reserveOut);
+        }
+    }
+
+    function getAmountsIn(
+        uint256 amountOut,
+        address[] memory path)
+        public
+        view
+        returns (uint256[] memory amounts)
+    {
+        amounts = new uint256[](path.length);
+        amounts[amounts.length - 1] = amountOut;
+        for (uint256 i = path.length - 1; i > 0; i--) {
+            TestUniswapV2Pair pair = getPair[path[i - 1]][path[i]];
+            require(address(pair) != address(0), "no pair");
+            (uint256 reserve0, uint256 reserve1,) = pair.getReserves();
+            (uint256 reserveIn, uint256 reserveOut) = path[i - 1] == pair.token0() ? (reserve0, reserve1) : (reserve1, reserve0);
+            amounts[i - 1] = getAmountIn(amounts[i], reserveIn, reserveOut);
+        }
+    }
+
+    function swapExactTokensForTokens(
+        uint256 amountIn,
+        uint256 amountOutMin,
+        address[] calldata path,
+        address to,
+        uint256 deadline)
+        external
+        returns (uint256[] memory amounts)
+    {
+        require(deadline >= block.timestamp, "expired");
+        amounts = getAmountsOut(amountIn, path);
+        require(amounts[amounts.length - 1] >= amountOutMin, "insufficient output amount");
+
+        IERC20(path[0]).transferFrom(msg.sender, address(getPair[path[0]][path[1]]), amountIn);
+        for (uint256 i = 0; i < path.length - 1; i++) {
+            TestUniswapV2Pair pair = getPair[path[i]][path[i + 1]];
+            address recipient = i < path.length - 2 ? address(getPair[path[i + 1]][path[i + 2]]) : to;
+            (uint256 amount0Out, uint256 amount1Out) = path[i] == pair.token0()
+                ? (uint256(0), amounts[i + 1])
+                : (amounts[i + 1], uint256(0));
+            pair.swap(amount0Out, amount1Out, recipient);
+        }
+    }
+}
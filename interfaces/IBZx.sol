@@ -364,6 +364,23 @@ interface IBZx {
             address seizedToken
         );
 
+    /// @dev liquidates a batch of unhealty loans, skipping loans that are closed or healthy
+    /// @param loanIds ids of the loans
+    /// @param receiver address receiving liquidated loan collateral
+    /// @param closeAmounts amounts to close denominated in each loan's loanToken
+    /// @return loanCloseAmounts amounts closed per loan, 0 for skipped loans
+    /// @return seizedAmounts seized collateral amounts per loan
+    function liquidateBatch(
+        bytes32[] calldata loanIds,
+        address receiver,
+        uint256[] calldata closeAmounts
+    )
+        external
+        returns (
+            uint256[] memory loanCloseAmounts,
+            uint256[] memory seizedAmounts
+        );
+
     /// @dev rollover loan
     /// @param loanId id of the loan
     /// @param loanDataBytes reserved for future use.
@@ -648,6 +665,19 @@ interface IBZx {
 
     function getActiveLoansCount() external view returns (uint256);
 
+    /// @dev get liquidatable loans, walking the active loans from a resumable cursor
+    /// @param cursor index in the active loans set to start from
+    /// @param count maximum number of loans to scan
+    /// @return loansData LiquidatableLoanData array of loans at or below maintenance margin
+    /// @return nextCursor index to resume from, equal to getActiveLoansCount() when the scan is complete
+    function getLiquidatableLoans(uint256 cursor, uint256 count)
+        external
+        view
+        returns (
+            LiquidatableLoanData[] memory loansData,
+            uint256 nextCursor
+        );
+
     ////// Swap External //////
 
     /// @dev swap thru external integration
@@ -758,6 +788,13 @@ interface IBZx {
         uint256 depositValueAsCollateralToken;
     }
 
+    struct LiquidatableLoanData {
+        bytes32 loanId;
+        uint256 currentMargin;
+        uint256 maxLiquidatable;
+        uint256 maxSeizable;
+    }
+
     enum FeeClaimType {
         All,
         Lending,
@@ -786,6 +823,7 @@ interface IBZx {
         uint256 owedTotal; // total interest owed for all loans of asset (assuming they go to full term)
         uint256 paidTotal; // total interest paid so far for asset
         uint256 updatedTimestamp; // last update
+        uint256 pendingTotal; // interest paid so far and not yet transferred to the lender, before the lending fee
     }
 
     struct LoanInterest {
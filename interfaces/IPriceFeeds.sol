@@ -14,6 +14,13 @@ interface IPriceFeeds {
         view
         returns (uint256 rate, uint256 precision);
 
+    function queryRates(
+        address[] calldata sourceTokens,
+        address[] calldata destTokens)
+        external
+        view
+        returns (uint256[] memory rates, uint256[] memory precisions);
+
     function queryPrecision(
         address sourceToken,
         address destToken)
@@ -29,6 +36,14 @@ interface IPriceFeeds {
         view
         returns (uint256 destAmount);
 
+    function queryReturns(
+        address[] calldata sourceTokens,
+        address[] calldata destTokens,
+        uint256[] calldata sourceAmounts)
+        external
+        view
+        returns (uint256[] memory destAmounts);
+
     function checkPriceDisagreement(
         address sourceToken,
         address destToken,
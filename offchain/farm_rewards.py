@@ -0,0 +1,298 @@
+#!/usr/bin/python3
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from brownie import web3
+from brownie.exceptions import VirtualMachineError
+from brownie.network.event import decode_logs
+from munch import Munch
+
+WEI_PRECISION = 10**18
+
+# MasterChef_Polygon declining multiplier: 10e18 at startBlock down to 1e18 over the bonus period
+BONUS_PERIOD_BLOCKS = 1296000
+BONUS_START_MULTIPLIER = 10 * 10**18
+DECLINE_PER_BLOCK = 6944444444444
+BONUS_PERIOD_MULTIPLIER = 7128000000000373248000000
+
+# MasterChef_BSC emits a flat 1e18 per block
+SCHEDULES = ["polygon", "bsc"]
+GOV_POOL_IDS = {"polygon": 0, "bsc": 7}
+
+# per pool MasterChef state read by _pendingGOV
+POOL_FIELDS = [
+    "allocPoint",
+    "lastRewardBlock",
+    "accGOVPerShare",
+    "balanceOf",
+    "isLocked",
+    "poolGOVPerAllocPointPaid",
+]
+
+# events emitted by calls that change userInfo
+USER_EVENTS = ["Deposit", "Withdraw", "EmergencyWithdraw"]
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+
+def toArray(values):
+    return np.array([int(v) for v in values], dtype=object)
+
+
+def cumulativeMultiplier(block, startBlock, schedule="polygon"):
+    '''
+    MasterChef _getCumulativeMultiplier: the sum of the per block multipliers from
+    startBlock to block, times 1e18. block can be an object array of python ints,
+    the result is one.
+    '''
+    block = toArray(np.atleast_1d(block))
+    if schedule == "bsc":
+        return block * WEI_PRECISION
+    if schedule != "polygon":
+        raise ValueError("unknown schedule")
+
+    blocks = block - int(startBlock)
+    assert (blocks >= 0).all(), "block before startBlock"
+    declining = blocks * BONUS_START_MULTIPLIER - blocks * blocks * (DECLINE_PER_BLOCK // 2)
+    flat = (blocks - BONUS_PERIOD_BLOCKS) * WEI_PRECISION + BONUS_PERIOD_MULTIPLIER
+    return np.where(blocks >= BONUS_PERIOD_BLOCKS, flat, declining).astype(object)
+
+
+def getMultiplierPrecise(fromBlock, toBlock, startBlock, schedule="polygon"):
+    # MasterChef.getMultiplierPrecise, two prefix sums and a subtraction
+    return cumulativeMultiplier(toBlock, startBlock, schedule) - cumulativeMultiplier(fromBlock, startBlock, schedule)
+
+
+def projectGOV(fromBlock, toBlock, startBlock, GOVPerBlock, allocPoint, totalAllocPoint, schedule="polygon"):
+    '''
+    GOV minted to the farm for a pool updated at fromBlock and again at toBlock
+    (updatePool's GOVReward / 1e18), the dev share excluded. Any argument can be
+    an object array, ex: toBlock for a projection over time.
+    '''
+    GOVReward = getMultiplierPrecise(fromBlock, toBlock, startBlock, schedule) * int(GOVPerBlock) * toArray(np.atleast_1d(allocPoint)) // int(totalAllocPoint)
+    return (GOVReward // WEI_PRECISION).astype(object)
+
+
+class FarmRewardsCalculator(object):
+    '''
+    Computes MasterChef pendingGOV for every (user, pool) pair, and MasterChef_BSC
+    pendingAltRewards for every user, from one snapshot of the farm in a
+    vectorized pass with the contract's integer math.
+
+    The snapshot is taken once with bootstrap and then kept current by sync:
+    pool state is re-read on every sync, users only after one of their Deposit,
+    Withdraw or EmergencyWithdraw events or a GOV transfer from the farm (claims).
+    '''
+
+    def __init__(self, masterChef, schedule="polygon", workers=8):
+        assert schedule in SCHEDULES, "unknown schedule"
+        self.masterChef = masterChef
+        self.schedule = schedule
+        self.govPoolId = GOV_POOL_IDS[schedule]
+        self.workers = workers
+        self.lastBlock = None
+        self.GOV = None
+        self.users = []
+        self.pools = []
+        self.poolState = Munch({field: np.zeros(0, dtype=object) for field in POOL_FIELDS})
+        self.userState = Munch({
+            "amount": np.zeros((0, 0), dtype=object),
+            "rewardDebt": np.zeros((0, 0), dtype=object),
+            "altRewardsDebt": np.zeros(0, dtype=object),
+        })
+        self.totalAllocPoint = 0
+        self.GOVPerBlock = 0
+        self.startBlock = 0
+        self.lazyRewardsEnabled = False
+        self.accGOVPerAllocPoint = 0
+        self.lastGlobalRewardBlock = 0
+        self.altRewardsPerShare = 0
+        self._indexes = {}
+        self._dirty = set()
+
+    def __len__(self):
+        return len(self.users)
+
+    def findUsers(self, fromBlock=0, toBlock=None):
+        if toBlock is None:
+            toBlock = web3.eth.blockNumber
+        logs = web3.eth.getLogs({
+            "address": self.masterChef.address,
+            "fromBlock": fromBlock,
+            "toBlock": toBlock
+        })
+        return list(dict.fromkeys(str(event["user"]) for event in decode_logs(logs) if event.name == "Deposit"))
+
+    def bootstrap(self, users=None, block=None):
+        # users defaults to every address that ever deposited
+        if block is None:
+            block = web3.eth.blockNumber
+        if users is None:
+            users = self.findUsers(0, block)
+
+        self.refreshPools(block)
+        self.refreshUsers(users, block)
+        self.lastBlock = block
+        return len(self.users)
+
+    def sync(self, toBlock=None):
+        assert self.lastBlock is not None, "not bootstrapped"
+        if toBlock is None:
+            toBlock = web3.eth.blockNumber
+        if toBlock <= self.lastBlock:
+            return 0
+
+        logs = web3.eth.getLogs({
+            "address": self.masterChef.address,
+            "fromBlock": self.lastBlock + 1,
+            "toBlock": toBlock
+        })
+        for event in decode_logs(logs):
+            if event.name in USER_EVENTS:
+                self._dirty.add(str(event["user"]))
+
+        # claimReward of an unlocked pool emits no farm event, only the GOV transfer
+        logs = web3.eth.getLogs({
+            "address": self.GOV,
+            "fromBlock": self.lastBlock + 1,
+            "toBlock": toBlock,
+            "topics": [TRANSFER_TOPIC, "0x" + self.masterChef.address[2:].lower().rjust(64, "0")]
+        })
+        for log in logs:
+            user = web3.toChecksumAddress("0x" + bytes(log["topics"][2]).hex()[-40:])
+            if user in self._indexes:
+                self._dirty.add(user)
+
+        self.refreshPools(toBlock)
+        dirty = list(self._dirty)
+        self._dirty = set()
+        self.refreshUsers(dirty, toBlock)
+        self.lastBlock = toBlock
+        return len(dirty)
+
+    def refreshPools(self, block=None):
+        masterChef = self.masterChef
+        infos = masterChef.getPoolInfos(block_identifier=block)
+        self.pools = [str(info[0]) for info in infos]
+        self.GOV = str(masterChef.GOV(block_identifier=block))
+        self.totalAllocPoint = int(masterChef.totalAllocPoint(block_identifier=block))
+        self.GOVPerBlock = int(masterChef.GOVPerBlock(block_identifier=block))
+        self.startBlock = int(masterChef.startBlock(block_identifier=block))
+        try:
+            self.lazyRewardsEnabled = masterChef.lazyRewardsEnabled(block_identifier=block)
+        except VirtualMachineError:
+            self.lazyRewardsEnabled = False # deployed before lazy reward accounting
+        if self.lazyRewardsEnabled:
+            self.accGOVPerAllocPoint = int(masterChef.accGOVPerAllocPoint(block_identifier=block))
+            self.lastGlobalRewardBlock = int(masterChef.lastGlobalRewardBlock(block_identifier=block))
+        if self.schedule == "bsc" and len(self.pools) > self.govPoolId:
+            self.altRewardsPerShare = int(masterChef.altRewardsPerShare(self.govPoolId, block_identifier=block))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            rows = list(executor.map(lambda pid: self._readPool(pid, block), range(len(self.pools))))
+
+        state = Munch({
+            "allocPoint": toArray(info[1] for info in infos),
+            "lastRewardBlock": toArray(info[2] for info in infos),
+            "accGOVPerShare": toArray(info[3] for info in infos),
+        })
+        for i, field in enumerate(POOL_FIELDS[3:]):
+            state[field] = toArray(row[i] for row in rows)
+        self.poolState = state
+
+        # pools added since the users were read have no deposits from them
+        missing = len(self.pools) - self.userState.amount.shape[1]
+        if missing > 0:
+            for field in ["amount", "rewardDebt"]:
+                self.userState[field] = np.concatenate(
+                    [self.userState[field], np.zeros((len(self.users), missing), dtype=object)], axis=1
+                )
+
+    def refreshUsers(self, users, block=None):
+        users = [str(u) for u in users]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            rows = list(executor.map(lambda user: self._readUser(user, block), users))
+
+        poolCount = len(self.pools)
+        newUsers = [u for u in dict.fromkeys(users) if u not in self._indexes]
+        if len(newUsers) != 0:
+            for user in newUsers:
+                self._indexes[user] = len(self.users)
+                self.users.append(user)
+            for field in ["amount", "rewardDebt"]:
+                self.userState[field] = np.concatenate(
+                    [self.userState[field], np.zeros((len(newUsers), poolCount), dtype=object)]
+                )
+            self.userState.altRewardsDebt = np.concatenate([self.userState.altRewardsDebt, np.zeros(len(newUsers), dtype=object)])
+
+        for user, (userInfos, altRewardsDebt) in zip(users, rows):
+            i = self._indexes[user]
+            self.userState.amount[i, :] = toArray(info[0] for info in userInfos)
+            self.userState.rewardDebt[i, :] = toArray(info[1] for info in userInfos)
+            self.userState.altRewardsDebt[i] = int(altRewardsDebt)
+        return len(users)
+
+    def accGOVPerShare(self, block):
+        # accGOVPerShare of every pool, times 1e30, as _pendingGOV sees it at block.number == block
+        p = self.poolState
+        acc = p.accGOVPerShare * 10**18
+        accruing = (p.lastRewardBlock < block) & (p.balanceOf != 0)
+        if not accruing.any():
+            return acc.astype(object)
+
+        if self.lazyRewardsEnabled:
+            accNow = self.accGOVPerAllocPoint
+            if block > self.lastGlobalRewardBlock and self.totalAllocPoint != 0:
+                multiplier = int(getMultiplierPrecise(self.lastGlobalRewardBlock, block, self.startBlock, self.schedule)[0])
+                accNow += multiplier * self.GOVPerBlock * 10**12 // self.totalAllocPoint
+            GOVReward = p.allocPoint * (accNow - p.poolGOVPerAllocPointPaid) // 10**12
+        else:
+            fromBlock = np.where(accruing, p.lastRewardBlock, block)
+            GOVReward = getMultiplierPrecise(fromBlock, block, self.startBlock, self.schedule) * self.GOVPerBlock * p.allocPoint // self.totalAllocPoint
+
+        lpSupply = np.where(accruing, p.balanceOf, 1)
+        return (acc + np.where(accruing, GOVReward * 10**12 // lpSupply, 0)).astype(object)
+
+    def pendingGOV(self, block=None):
+        '''
+        MasterChef.pendingGOV for every (user, pool) pair at block.number == block
+        (the latest block's number by default): an object array of shape
+        (len(self.users), len(self.pools)).
+        '''
+        if block is None:
+            block = web3.eth.blockNumber
+        s = self.userState
+        return (s.amount * self.accGOVPerShare(block) // 10**30 - s.rewardDebt).astype(object)
+
+    def pendingAltRewards(self):
+        # MasterChef_BSC.pendingAltRewards for every user
+        s = self.userState
+        if self.schedule != "bsc" or len(self.pools) <= self.govPoolId:
+            return np.zeros(len(self.users), dtype=object)
+        return (s.amount[:, self.govPoolId] * self.altRewardsPerShare // 10**12 - s.altRewardsDebt).astype(object)
+
+    def userInfos(self, block=None):
+        # the getOptimisedUserInfos columns for every user, as arrays
+        return Munch({
+            "amount": self.userState.amount,
+            "pendingGOV": self.pendingGOV(block),
+            "isLocked": self.poolState.isLocked,
+            "pendingAltRewards": self.pendingAltRewards(),
+        })
+
+    def pendingGOVOf(self, user, block=None):
+        # same list as MasterChef.getPendingGOV(user)
+        return list(self.pendingGOV(block)[self._indexes[str(user)]])
+
+    def _readPool(self, pid, block):
+        masterChef = self.masterChef
+        return [
+            masterChef.balanceOf(pid, block_identifier=block),
+            masterChef.isLocked(pid, block_identifier=block),
+            masterChef.poolGOVPerAllocPointPaid(pid, block_identifier=block) if self.lazyRewardsEnabled else 0,
+        ]
+
+    def _readUser(self, user, block):
+        masterChef = self.masterChef
+        altRewardsDebt = masterChef.altRewardsDebt(user, block_identifier=block) if self.schedule == "bsc" else 0
+        return masterChef.getUserInfos(user, block_identifier=block), altRewardsDebt
@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+
+import numpy as np
+from brownie.exceptions import VirtualMachineError
+from munch import Munch
+
+BZRX = "0x56d811088235F11C8920698a204A5010a788f4b3"
+CURVE_ASSETS = [
+    "0x6B175474E89094C44Da98b954EedeAC495271d0F", # DAI
+    "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", # USDC
+    "0xdAC17F958D2ee523a2206206994597C13D831ec7", # USDT
+]
+
+# StakingConstants gas estimates used by StakingV1.getSweepPlan
+SWEEP_GAS = Munch({
+    "withdrawFee": 30000,           # per asset, bZx.withdrawFees
+    "uniswapConversion": 150000,    # per asset, _convertFeeWithUniswap
+    "curveConversion": 250000,      # once for DAI, USDC and USDT, _convertFeesWithCurve
+})
+
+FEE_CLAIM_TYPE_ALL = 0
+
+
+def sweepGas(asset):
+    # gas to withdraw and convert one asset's fees, the Curve deposit excluded
+    if str(asset) == BZRX or str(asset) in CURVE_ASSETS:
+        return SWEEP_GAS.withdrawFee
+    return SWEEP_GAS.withdrawFee + SWEEP_GAS.uniswapConversion
+
+
+def planSweep(assets, valuesInEth, gasPrice):
+    '''
+    StakingV1.getSweepPlan from the fee values (in wei) of each asset: the assets
+    worth at least the gas to sweep them at gasPrice. DAI, USDC and USDT share one
+    Curve deposit and are swept together or not at all.
+    Returns a Munch with the swept assets, their value, the estimated gas and the
+    net value (value - gas * gasPrice).
+    '''
+    assets = [str(a) for a in assets]
+    valuesInEth = [int(v) for v in valuesInEth]
+    gasPrice = int(gasPrice)
+
+    swept = [False] * len(assets)
+    stableCoinValue = 0
+    stableCoinCount = 0
+    for i, asset in enumerate(assets):
+        if valuesInEth[i] == 0:
+            continue
+        if asset in CURVE_ASSETS:
+            stableCoinValue += valuesInEth[i]
+            stableCoinCount += 1
+        elif valuesInEth[i] >= sweepGas(asset) * gasPrice:
+            swept[i] = True
+
+    curveGas = stableCoinCount * SWEEP_GAS.withdrawFee + SWEEP_GAS.curveConversion
+    if stableCoinCount != 0 and stableCoinValue >= curveGas * gasPrice:
+        for i, asset in enumerate(assets):
+            if valuesInEth[i] != 0 and asset in CURVE_ASSETS:
+                swept[i] = True
+
+    return sweepResult(assets, valuesInEth, swept, gasPrice)
+
+
+def sweepResult(assets, valuesInEth, swept, gasPrice):
+    sweepAssets = [a for a, s in zip(assets, swept) if s]
+    value = sum(v for v, s in zip(valuesInEth, swept) if s)
+    gas = sum(sweepGas(a) for a in sweepAssets)
+    if any(a in CURVE_ASSETS for a in sweepAssets):
+        gas += SWEEP_GAS.curveConversion
+    return Munch({
+        "assets": sweepAssets,
+        "value": value,
+        "gas": gas,
+        "netValue": value - gas * int(gasPrice),
+    })
+
+
+def sweepAll(assets, valuesInEth, gasPrice):
+    # what sweepFeesByAsset does: every asset with fees
+    assets = [str(a) for a in assets]
+    valuesInEth = [int(v) for v in valuesInEth]
+    return sweepResult(assets, valuesInEth, [v != 0 for v in valuesInEth], gasPrice)
+
+
+def getSweepPlan(bzx, priceFeeds, assets, gasPrice):
+    # reads the held fees with queryFees and prices them with amountInEth, as the contract does
+    amountsHeld, _ = bzx.queryFees(assets, FEE_CLAIM_TYPE_ALL)
+    valuesInEth = []
+    for asset, amount in zip(assets, amountsHeld):
+        value = 0
+        if amount != 0:
+            try:
+                value = priceFeeds.amountInEth(asset, amount)
+            except VirtualMachineError:
+                pass # no price feed, or the feed has no price
+        valuesInEth.append(value)
+    return planSweep(assets, valuesInEth, gasPrice)
+
+
+def simulateSweeps(assets, accruals, gasPrices, sweepEvery=1):
+    '''
+    Replays fee accrual and periodic sweeps for each gas price.
+    accruals is a (periods, assets) array of new fees per period, in wei of ETH.
+    Every sweepEvery periods, "all" sweeps every asset with fees and "aboveDust"
+    only sweeps what planSweep selects; fees left behind keep accruing.
+    Returns {gasPrice: {strategy: Munch(value, gas, netValue, netValuePerGas, sweeps)}}.
+    '''
+    assets = [str(a) for a in assets]
+    accruals = np.asarray(accruals, dtype=object)
+    reports = {}
+    for gasPrice in gasPrices:
+        gasPrice = int(gasPrice)
+        reports[gasPrice] = {}
+        for strategy, sweep in [("all", sweepAll), ("aboveDust", planSweep)]:
+            held = [0] * len(assets)
+            report = Munch({"value": 0, "gas": 0, "netValue": 0, "netValuePerGas": 0, "sweeps": 0})
+            for period in range(accruals.shape[0]):
+                held = [h + int(a) for h, a in zip(held, accruals[period])]
+                if (period + 1) % sweepEvery != 0:
+                    continue
+
+                result = sweep(assets, held, gasPrice)
+                if len(result.assets) == 0:
+                    continue
+                report.value += result.value
+                report.gas += result.gas
+                report.netValue += result.netValue
+                report.sweeps += 1
+                held = [0 if a in result.assets else h for a, h in zip(assets, held)]
+
+            if report.gas != 0:
+                report.netValuePerGas = report.netValue / report.gas
+            reports[gasPrice][strategy] = report
+    return reports
+
+
+def feeDistribution(name, assetCount, periods, meanValue, seed=0):
+    '''
+    (periods, assetCount) per period fee accruals in wei of ETH, meanValue per asset on average:
+    "uniform" spreads fees evenly, "longTail" is Pareto distributed across assets and
+    "concentrated" puts 90% of the fees in the first asset.
+    '''
+    rng = np.random.default_rng(seed)
+    if name == "uniform":
+        weights = np.ones(assetCount)
+    elif name == "longTail":
+        weights = np.sort(rng.pareto(1.2, assetCount) + 0.01)[::-1]
+    elif name == "concentrated":
+        weights = np.full(assetCount, 0.1 / max(assetCount - 1, 1))
+        weights[0] = 0.9
+    else:
+        raise ValueError("unknown distribution")
+    weights = weights / weights.sum() * assetCount
+
+    noise = rng.exponential(1.0, (periods, assetCount))
+    return np.array([[int(meanValue * w * n) for w, n in zip(weights, row)] for row in noise], dtype=object)
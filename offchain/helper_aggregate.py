@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+
+from concurrent.futures import ThreadPoolExecutor
+
+from brownie.exceptions import VirtualMachineError
+from munch import Munch
+
+# default gas budget of one aggregate eth_call, under the usual node caps
+MAX_GAS = 20000000
+# default gas estimate of one read, ex: tokenPrice is about 30k with the protocol call
+CALL_GAS = 100000
+
+
+class HelperAggregator(object):
+    '''
+    Batches brownie view calls into HelperImpl.aggregate. Calls are added as
+    the brownie method and its arguments, ex: add(iToken.tokenPrice) or
+    add(iToken.balanceOf, wallet), and are returned by execute in the same
+    order, decoded like the direct call would be.
+
+    Calls are packed into chunks of up to maxGas by their gas estimate, and
+    each aggregate eth_call is sent with maxGas as its gas limit. A chunk the
+    node rejects, ex: out of gas or over its eth_call gas cap, is split in two
+    and retried, so estimates only need to be rough.
+    '''
+
+    def __init__(self, helper, maxGas=MAX_GAS, callGas=CALL_GAS, workers=4):
+        self.helper = helper
+        self.maxGas = maxGas
+        self.callGas = callGas
+        self.workers = workers
+        self.calls = []
+
+    def __len__(self):
+        return len(self.calls)
+
+    def add(self, method, *args, gas=None):
+        self.calls.append(Munch(
+            method=method,
+            target=method._address,
+            data=method.encode_input(*args),
+            gas=gas or self.callGas,
+        ))
+        return len(self.calls) - 1
+
+    def clear(self):
+        self.calls = []
+
+    def chunks(self):
+        chunks = []
+        chunk = []
+        chunkGas = 0
+        for call in self.calls:
+            if chunk and chunkGas + call.gas > self.maxGas:
+                chunks.append(chunk)
+                chunk = []
+                chunkGas = 0
+            chunk.append(call)
+            chunkGas += call.gas
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def execute(self, block=None, allowFailure=True):
+        '''
+        Results of every added call at block, None for the calls that reverted
+        when allowFailure is set. Otherwise the first failure raises.
+        '''
+        with ThreadPoolExecutor(self.workers) as executor:
+            results = executor.map(lambda chunk: self._execute(chunk, block, allowFailure), self.chunks())
+        return [result for chunk in results for result in chunk]
+
+    def _execute(self, chunk, block, allowFailure):
+        try:
+            results = self.helper.aggregate(
+                [(call.target, call.data) for call in chunk],
+                allowFailure,
+                {"gas": self.maxGas},
+                block_identifier=block
+            )
+        except VirtualMachineError:
+            if len(chunk) == 1:
+                raise
+            middle = len(chunk) // 2
+            return self._execute(chunk[:middle], block, allowFailure) + self._execute(chunk[middle:], block, allowFailure)
+
+        decoded = []
+        for call, (success, returnData) in zip(chunk, results):
+            # a call to an address without code succeeds with no data
+            if success and (len(returnData) != 0 or len(call.method.abi["outputs"]) == 0):
+                decoded.append(call.method.decode_output(returnData))
+            elif allowFailure:
+                decoded.append(None)
+            else:
+                raise ValueError("call failed: {} at {}".format(call.method._name, call.target))
+        return decoded
@@ -0,0 +1,174 @@
+#!/usr/bin/python3
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from brownie import web3
+from brownie.network.event import decode_logs
+from munch import Munch
+
+WEI_PRECISION = 10**18
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# per user state, as stored by LoanTokenLogicStandard._updateCheckpoints
+BALANCE = 0
+PROFIT_SO_FAR = 1       # the iToken_ProfitSoFar slot
+CHECKPOINT_PRICE = 2    # checkpointPrices_
+
+
+def divTrunc(a, b):
+    # SignedSafeMath.div, rounds toward zero
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+
+def profitOf(state, currentPrice):
+    # mirrors LoanTokenLogicStandard._profitOf
+    if state[CHECKPOINT_PRICE] == 0:
+        return 0
+    return divTrunc((currentPrice - state[CHECKPOINT_PRICE]) * state[BALANCE], WEI_PRECISION) + state[PROFIT_SO_FAR]
+
+
+def updateCheckpoints(state, newBalance, currentPrice):
+    # mirrors LoanTokenLogicStandard._updateCheckpoints, state is [balance, profitSoFar, checkpointPrice]
+    currentProfit = 0
+    if newBalance == 0:
+        currentPrice = 0
+    elif state[BALANCE] != 0:
+        currentProfit = profitOf(state, currentPrice)
+
+    state[BALANCE] = int(newBalance)
+    state[PROFIT_SO_FAR] = int(currentProfit)
+    state[CHECKPOINT_PRICE] = int(currentPrice)
+
+
+class ProfitTracker(object):
+    '''
+    Rebuilds the profit checkpoints of every holder of a set of iTokens from
+    their Mint, Burn and Transfer events, so profitOf can be evaluated for all
+    users at once at any synced block.
+
+    Mint and Burn carry the price used for the checkpoint. Transfer doesn't,
+    its price is read back as checkpointPrice of the receiver (or the sender)
+    at the end of the block, when that user has no later event in the block.
+    Otherwise tokenPrice at the block is used, which only differs by the
+    interest settled between the transactions of that block.
+
+    State is kept per iToken as {user: [balance, profitSoFar, checkpointPrice]}
+    and can be saved and loaded, so later syncs only read the new blocks.
+    '''
+
+    def __init__(self, iTokens, workers=8, blockRange=10000):
+        self.iTokens = {str(iToken.address): iToken for iToken in iTokens}
+        self.workers = workers
+        self.blockRange = blockRange
+        self.lastBlock = None
+        self.users = {address: {} for address in self.iTokens}
+
+    def sync(self, toBlock=None, fromBlock=0):
+        if toBlock is None:
+            toBlock = web3.eth.blockNumber
+        if self.lastBlock is not None:
+            fromBlock = self.lastBlock + 1
+
+        count = 0
+        for start in range(fromBlock, toBlock + 1, self.blockRange):
+            end = min(start + self.blockRange - 1, toBlock)
+            logs = web3.eth.getLogs({
+                "address": list(self.iTokens),
+                "fromBlock": start,
+                "toBlock": end
+            })
+            count += self.applyLogs(logs)
+
+        self.lastBlock = toBlock
+        return count
+
+    def applyLogs(self, logs):
+        # logs of whole blocks, in any order
+        events = []
+        for log in logs:
+            event = decode_logs([log])
+            if len(event) == 0 or event[0].name not in ("Mint", "Burn", "Transfer"):
+                continue
+            events.append(Munch(
+                name=event[0].name,
+                args=event[0],
+                token=web3.toChecksumAddress(log["address"]),
+                block=log["blockNumber"],
+                logIndex=log["logIndex"],
+            ))
+        events.sort(key=lambda e: (e.block, e.logIndex))
+
+        # last event of each user per token and block, ex: a transfer followed by a burn
+        lastTouch = {}
+        for i, e in enumerate(events):
+            for user in self._eventUsers(e):
+                lastTouch[(e.token, e.block, user)] = i
+
+        transfers = [(i, e) for i, e in enumerate(events) if e.name == "Transfer" and ZERO_ADDRESS not in self._eventUsers(e)]
+        with ThreadPoolExecutor(self.workers) as executor:
+            prices = dict(executor.map(lambda t: (t[0], self._transferPrice(t[0], t[1], lastTouch)), transfers))
+
+        for i, e in enumerate(events):
+            users = self.users[e.token]
+            if e.name == "Mint":
+                state = users.setdefault(str(e.args["minter"]), [0, 0, 0])
+                updateCheckpoints(state, state[BALANCE] + e.args["tokenAmount"], e.args["price"])
+            elif e.name == "Burn":
+                state = users.setdefault(str(e.args["burner"]), [0, 0, 0])
+                updateCheckpoints(state, state[BALANCE] - e.args["tokenAmount"], e.args["price"])
+            elif i in prices:
+                # _internalTransferFrom, the sender's balance is written before the receiver's is read
+                sender = users.setdefault(str(e.args["from"]), [0, 0, 0])
+                updateCheckpoints(sender, sender[BALANCE] - e.args["value"], prices[i])
+                receiver = users.setdefault(str(e.args["to"]), [0, 0, 0])
+                updateCheckpoints(receiver, receiver[BALANCE] + e.args["value"], prices[i])
+
+        return len(events)
+
+    def profitOf(self, iToken, user, currentPrice):
+        return profitOf(self.users[str(iToken)].get(str(user), [0, 0, 0]), currentPrice)
+
+    def profits(self, iToken, currentPrice=None):
+        '''
+        {user: (realized, unrealized)} for every user of iToken. realized is the
+        profit stored at the last checkpoint, realized + unrealized is profitOf.
+        currentPrice defaults to tokenPrice at the last synced block.
+        '''
+        iToken = str(iToken)
+        if currentPrice is None:
+            currentPrice = self.iTokens[iToken].tokenPrice(block_identifier=self.lastBlock)
+        return {
+            user: (state[PROFIT_SO_FAR], profitOf(state, currentPrice) - state[PROFIT_SO_FAR])
+            for user, state in self.users[iToken].items()
+        }
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump({"lastBlock": self.lastBlock, "users": self.users}, f, separators=(",", ":"))
+
+    def load(self, path):
+        with open(path) as f:
+            saved = json.load(f)
+        self.lastBlock = saved["lastBlock"]
+        for address in self.iTokens:
+            self.users[address] = saved["users"].get(address, {})
+        return self
+
+    def _eventUsers(self, e):
+        if e.name == "Mint":
+            return (str(e.args["minter"]),)
+        if e.name == "Burn":
+            return (str(e.args["burner"]),)
+        return (str(e.args["from"]), str(e.args["to"]))
+
+    def _transferPrice(self, i, e, lastTouch):
+        iToken = self.iTokens[e.token]
+        sender, receiver = self._eventUsers(e)
+        for user in (receiver, sender):
+            if lastTouch[(e.token, e.block, user)] == i:
+                price = iToken.checkpointPrice(user, block_identifier=e.block)
+                if price != 0:
+                    return price
+        return iToken.tokenPrice(block_identifier=e.block)
@@ -0,0 +1,225 @@
+#!/usr/bin/python3
+
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from brownie import Contract, interface
+from munch import Munch
+
+WEI_PRECISION = 10**18
+WEI_PERCENT_PRECISION = 10**20
+SECONDS_PER_YEAR = 31536000 # 86400 * 365
+MARGIN_TRADE_DURATION = 2419200 # 28 days, _getPreMarginData
+
+# LoanTokenBase demand curve read by _nextBorrowInterestRate2
+CURVE_FIELDS = [
+    "baseRate",
+    "rateMultiplier",
+    "targetLevel",
+    "kinkLevel",
+    "maxScaleRate",
+]
+
+# all values are object arrays of python ints so the EVM's uint256 math is reproduced exactly
+
+
+def uintArray(values):
+    # any shape, ex: a (iTokens, 1) column against a (points,) grid. Never 0-d, numpy
+    # turns those into python ints and np.where would cast them to int64
+    if isinstance(values, np.ndarray) and values.dtype == object:
+        return np.atleast_1d(values)
+    return np.vectorize(int, otypes=[object])(np.atleast_1d(np.asarray(values, dtype=object)))
+
+
+def utilizationRate(assetBorrow, assetSupply):
+    # mirrors LoanTokenLogicStandard._utilizationRate
+    assetBorrow, assetSupply = uintArray(assetBorrow), uintArray(assetSupply)
+    nonZero = (assetBorrow != 0) & (assetSupply != 0)
+    return np.where(nonZero, assetBorrow * WEI_PERCENT_PRECISION // np.where(nonZero, assetSupply, 1), 0).astype(object)
+
+
+def borrowInterestRate(utilRate, curve):
+    '''
+    LoanTokenLogicStandard._nextBorrowInterestRate2 at a given utilization. The
+    curve fields broadcast against utilRate, ex: one curve per iToken or a sweep.
+    '''
+    utilRate = uintArray(utilRate)
+    baseRate, rateMultiplier, targetLevel, kinkLevel, maxScaleRate = [uintArray(curve[field]) for field in CURVE_FIELDS]
+
+    utilRate = np.maximum(utilRate, targetLevel)
+    aboveKink = utilRate > kinkLevel
+
+    # scale rate proportionally up to 100%
+    maxRange = WEI_PERCENT_PRECISION - kinkLevel
+    kinkRate = (rateMultiplier + baseRate) * kinkLevel // WEI_PERCENT_PRECISION
+    if (aboveKink & (maxScaleRate < kinkRate)).any():
+        # the contract reverts on these, maxScaleRate is below the rate at the kink
+        raise ValueError("SafeMath: subtraction overflow")
+    if (aboveKink & (maxRange == 0)).any():
+        raise ValueError("SafeMath: division by zero")
+    scaled = np.minimum(utilRate - kinkLevel, maxRange) * (maxScaleRate - kinkRate) // np.where(maxRange != 0, maxRange, 1) + kinkRate
+
+    linear = utilRate * rateMultiplier // WEI_PERCENT_PRECISION + baseRate
+    linear = np.minimum(np.maximum(linear, baseRate), rateMultiplier + baseRate)
+
+    return np.where(aboveKink, scaled, linear).astype(object)
+
+
+def avgBorrowInterestRate(assetBorrow, interestOwedPerDay):
+    # mirrors LoanTokenLogicStandard._avgBorrowInterestRate
+    assetBorrow = uintArray(assetBorrow)
+    nonZero = assetBorrow != 0
+    return np.where(nonZero, uintArray(interestOwedPerDay) * (365 * WEI_PERCENT_PRECISION) // np.where(nonZero, assetBorrow, 1), 0).astype(object)
+
+
+def supplyInterestRate(assetBorrow, assetSupply, interestOwedPerDay, lendingFeePercent):
+    # mirrors LoanTokenLogicStandard._supplyInterestRate, iDAI's logic adds the DSR on top
+    assetBorrow, assetSupply = uintArray(assetBorrow), uintArray(assetSupply)
+    rate = avgBorrowInterestRate(assetBorrow, interestOwedPerDay) \
+        * utilizationRate(assetBorrow, assetSupply) \
+        * (WEI_PERCENT_PRECISION - uintArray(lendingFeePercent)) \
+        // (WEI_PERCENT_PRECISION * WEI_PERCENT_PRECISION)
+    return np.where((assetBorrow != 0) & (assetSupply >= assetBorrow), rate, 0).astype(object)
+
+
+def adjustValue(interestRate, maxDuration, marginAmount):
+    # mirrors LoanTokenLogicStandard._adjustValue
+    interestRate, maxDuration, marginAmount = uintArray(interestRate), uintArray(maxDuration), uintArray(marginAmount)
+    if ((maxDuration != 0) & (marginAmount == 0)).any():
+        raise ValueError("SafeMath: division by zero")
+    adjusted = interestRate * WEI_PERCENT_PRECISION * maxDuration // SECONDS_PER_YEAR // np.where(marginAmount != 0, marginAmount, 1) + WEI_PERCENT_PRECISION
+    return np.where(maxDuration != 0, adjusted, WEI_PERCENT_PRECISION).astype(object)
+
+
+def marginTradeBorrowAmount(totalDeposit, leverageAmount, assetBorrow, assetSupply, curve):
+    '''
+    LoanTokenLogicStandard._getPreMarginData for a deposit valued in the loan
+    token. assetSupply is _totalAssetSupply(0). Returns (borrowAmount, interestRate).
+    '''
+    totalDeposit, leverageAmount = uintArray(totalDeposit), uintArray(leverageAmount)
+    if (leverageAmount == 0).any():
+        raise ValueError("SafeMath: division by zero")
+    initialMargin = (WEI_PRECISION * WEI_PERCENT_PRECISION) // leverageAmount
+    if (initialMargin == 0).any():
+        raise ValueError("SafeMath: division by zero")
+
+    interestRate = borrowInterestRate(
+        utilizationRate(uintArray(assetBorrow) + totalDeposit * WEI_PERCENT_PRECISION // initialMargin, assetSupply),
+        curve
+    )
+    borrowAmount = totalDeposit * (WEI_PERCENT_PRECISION * WEI_PERCENT_PRECISION) \
+        // adjustValue(interestRate, MARGIN_TRADE_DURATION, initialMargin) \
+        // initialMargin
+    return borrowAmount.astype(object), interestRate
+
+
+class InterestRateSimulator(object):
+    '''
+    Evaluates the iToken rate functions for many iTokens, amounts and demand
+    curves at once, from one read of each iToken's state. Results are (iTokens,
+    points) arrays matching the contract's integer results, or (parameter sets,
+    iTokens, points) for the curves returned by sweepCurves.
+
+    Supply rates don't depend on the curve, they follow the interest owed on the
+    open loans. Deposits for marginTrade are valued in the loan token.
+    '''
+
+    def __init__(self, iTokens, bzx=None, workers=8):
+        self.iTokens = list(iTokens)
+        self.bzx = bzx
+        self.workers = workers
+        self.block = None
+        self.curve = Munch({field: np.zeros((0, 1), dtype=object) for field in CURVE_FIELDS})
+        self.totalAssetBorrow = np.zeros((0, 1), dtype=object)
+        self.totalAssetSupply = np.zeros((0, 1), dtype=object)
+        self.assetSupply = np.zeros((0, 1), dtype=object)
+        self.marketLiquidity = np.zeros((0, 1), dtype=object)
+        self.interestUnPaid = np.zeros((0, 1), dtype=object)
+        self.interestOwedPerDay = np.zeros((0, 1), dtype=object)
+        self.lendingFeePercent = 0
+
+    def __len__(self):
+        return len(self.iTokens)
+
+    def refresh(self, block=None):
+        '''
+        Reads every iToken once, at block or the latest block.
+        '''
+        if self.bzx is None:
+            self.bzx = Contract.from_abi("bzx", address=self.iTokens[0].bZxContract(), abi=interface.IBZx.abi)
+        self.lendingFeePercent = self.bzx.lendingFeePercent(block_identifier=block)
+        with ThreadPoolExecutor(self.workers) as executor:
+            rows = list(executor.map(lambda iToken: self._readIToken(iToken, block), self.iTokens))
+
+        def column(i):
+            return uintArray([row[i] for row in rows]).reshape(-1, 1)
+
+        for i, field in enumerate(CURVE_FIELDS):
+            self.curve[field] = column(i)
+        totalSupply = column(5)
+        self.totalAssetBorrow = column(6)
+        self.totalAssetSupply = column(7)
+        self.marketLiquidity = column(8)
+        self.interestOwedPerDay = column(9)
+
+        # _totalAssetSupply(0), the underlying balance is all of marketLiquidity
+        self.assetSupply = np.where(totalSupply != 0, self.marketLiquidity + self.totalAssetBorrow, 0).astype(object)
+        self.interestUnPaid = (self.totalAssetSupply - self.assetSupply).astype(object)
+        self.block = block
+        return self
+
+    def sweepCurves(self, **values):
+        '''
+        Curves for every combination of the given field values, ex:
+        sweepCurves(kinkLevel=[80e18, 90e18], maxScaleRate=[100e18, 120e18])
+        is 4 parameter sets. Fields not given keep each iToken's current value.
+        Returns the parameter sets and a curve for the rate functions.
+        '''
+        fields = list(values)
+        for field in fields:
+            assert field in CURVE_FIELDS, "unknown curve field"
+        combinations = list(itertools.product(*[values[field] for field in fields]))
+
+        curve = Munch({field: self.curve[field] for field in CURVE_FIELDS})
+        for i, field in enumerate(fields):
+            curve[field] = uintArray([c[i] for c in combinations]).reshape(-1, 1, 1)
+        return [dict(zip(fields, c)) for c in combinations], curve
+
+    def utilizationRate(self, borrowAmounts=0):
+        # utilization seen by nextBorrowInterestRate, amounts above the liquidity are capped at it
+        borrowAmounts = np.minimum(uintArray(borrowAmounts), self.marketLiquidity + self.interestUnPaid)
+        # the unpaid interest is only added for a non zero amount
+        assetSupply = np.where(borrowAmounts != 0, self.totalAssetSupply, self.assetSupply)
+        return utilizationRate(self.totalAssetBorrow + borrowAmounts, assetSupply)
+
+    def borrowInterestRateAt(self, utilRates, curve=None):
+        # the curves alone, over a grid of utilizations
+        return borrowInterestRate(utilRates, curve or self.curve)
+
+    def nextBorrowInterestRate(self, borrowAmounts, curve=None):
+        # mirrors nextBorrowInterestRate
+        return borrowInterestRate(self.utilizationRate(borrowAmounts), curve or self.curve)
+
+    def nextSupplyInterestRate(self, supplyAmounts=0):
+        # mirrors nextSupplyInterestRate
+        return supplyInterestRate(
+            self.totalAssetBorrow,
+            self.assetSupply + uintArray(supplyAmounts),
+            self.interestOwedPerDay,
+            self.lendingFeePercent
+        )
+
+    def marginTradeBorrowAmount(self, totalDeposits, leverageAmount, curve=None):
+        return marginTradeBorrowAmount(totalDeposits, leverageAmount, self.totalAssetBorrow, self.assetSupply, curve or self.curve)
+
+    def _readIToken(self, iToken, block):
+        curve = [getattr(iToken, field)(block_identifier=block) for field in CURVE_FIELDS]
+        interestData = self.bzx.getLenderInterestData(iToken, iToken.loanTokenAddress(), block_identifier=block)
+        return curve + [
+            iToken.totalSupply(block_identifier=block),
+            iToken.totalAssetBorrow(block_identifier=block),
+            iToken.totalAssetSupply(block_identifier=block),
+            iToken.marketLiquidity(block_identifier=block),
+            interestData[2], # interestOwedPerDay
+        ]
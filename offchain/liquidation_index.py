@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+
+from bisect import bisect_left, insort
+
+WEI_PRECISION = 10**18
+WEI_PERCENT_PRECISION = 10**20
+
+# a loan with no collateral (or no principal) is liquidatable at any rate
+MAX_RATE = 2**256 - 1
+
+
+def getLiquidationRate(principal, collateral, maintenanceMargin):
+    '''
+    Highest normalized collateralToLoanRate (1e18 precision, as used by
+    PriceFeeds.getCurrentMargin) at which getCurrentMargin(...) <= maintenanceMargin.
+    The loan is liquidatable at a rate if and only if rate <= liquidation rate.
+    '''
+    principal, collateral, maintenanceMargin = int(principal), int(collateral), int(maintenanceMargin)
+    if principal == 0 or collateral == 0:
+        return MAX_RATE
+
+    # largest collateralToLoanAmount that still rounds down to a margin <= maintenanceMargin
+    maxCollateralToLoanAmount = principal + ((maintenanceMargin + 1) * principal - 1) // WEI_PERCENT_PRECISION
+
+    # largest rate where collateral * rate // WEI_PRECISION <= maxCollateralToLoanAmount
+    return ((maxCollateralToLoanAmount + 1) * WEI_PRECISION - 1) // collateral
+
+
+def normalizeRate(rate, precision):
+    # converts PriceFeeds.queryRate(collateralToken, loanToken) output to getCurrentMargin's rate
+    return int(rate) * WEI_PRECISION // int(precision)
+
+
+class LiquidationPriceIndex(object):
+    '''
+    Per (loanToken, collateralToken) sorted index of each loan's liquidation rate.
+
+    All loans liquidatable at a given rate are found with one bisect, and loans
+    crossing maintenance margin between two rates with two.
+    '''
+
+    def __init__(self):
+        self._pairs = {}    # (loanToken, collateralToken) => sorted [(liquidationRate, loanId)]
+        self._entries = {}  # loanId => ((loanToken, collateralToken), liquidationRate)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, loanId):
+        return loanId in self._entries
+
+    @classmethod
+    def fromLoans(cls, loans):
+        index = cls()
+        for loan in loans:
+            index.onLoanUpdated(loan)
+        return index
+
+    def update(self, loanId, loanToken, collateralToken, principal, collateral, maintenanceMargin):
+        pair = (str(loanToken), str(collateralToken))
+        liquidationRate = getLiquidationRate(principal, collateral, maintenanceMargin)
+
+        entry = self._entries.get(loanId)
+        if entry is not None:
+            if entry == (pair, liquidationRate):
+                return
+            self.remove(loanId)
+
+        insort(self._pairs.setdefault(pair, []), (liquidationRate, loanId))
+        self._entries[loanId] = (pair, liquidationRate)
+
+    def remove(self, loanId):
+        entry = self._entries.pop(loanId, None)
+        if entry is None:
+            return
+        pair, liquidationRate = entry
+        keys = self._pairs[pair]
+        del keys[bisect_left(keys, (liquidationRate, loanId))]
+        if not keys:
+            del self._pairs[pair]
+
+    def getLiquidationRate(self, loanId):
+        entry = self._entries.get(loanId)
+        return entry[1] if entry is not None else None
+
+    def getLiquidatable(self, loanToken, collateralToken, rate):
+        keys = self._pairs.get((str(loanToken), str(collateralToken)), [])
+        return [loanId for _, loanId in keys[bisect_left(keys, (int(rate),)):]]
+
+    def getNewlyLiquidatable(self, loanToken, collateralToken, oldRate, newRate):
+        # loans that are liquidatable at newRate but were not at oldRate
+        keys = self._pairs.get((str(loanToken), str(collateralToken)), [])
+        oldRate, newRate = int(oldRate), int(newRate)
+        if newRate >= oldRate:
+            return []
+        return [loanId for _, loanId in keys[bisect_left(keys, (newRate,)):bisect_left(keys, (oldRate,))]]
+
+    # offchain.loan_indexer.ActiveLoanIndexer listener interface
+
+    def onLoanUpdated(self, loan):
+        self.update(
+            loan.loanId,
+            loan.loanToken,
+            loan.collateralToken,
+            loan.principal,
+            loan.collateral,
+            loan.maintenanceMargin
+        )
+
+    def onLoanRemoved(self, loanId):
+        self.remove(loanId)
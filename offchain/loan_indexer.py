@@ -0,0 +1,217 @@
+#!/usr/bin/python3
+
+from brownie import web3
+from brownie.network.event import decode_logs
+from munch import Munch
+
+# field order of LoanMaintenanceEvents.LoanReturnData
+LOAN_RETURN_FIELDS = [
+    "loanId",
+    "endTimestamp",
+    "loanToken",
+    "collateralToken",
+    "principal",
+    "collateral",
+    "interestOwedPerDay",
+    "interestDepositRemaining",
+    "startRate",
+    "startMargin",
+    "maintenanceMargin",
+    "currentMargin",
+    "maxLoanTerm",
+    "maxLiquidatable",
+    "maxSeizable",
+    "depositValueAsLoanToken",
+    "depositValueAsCollateralToken",
+]
+
+# events that touch an active loan and the argument names of the parties involved
+LOAN_EVENTS = {
+    "Borrow": ("user", "lender"),
+    "Trade": ("user", "lender"),
+    "CloseWithSwap": ("user", "lender"),
+    "CloseWithDeposit": ("user", "lender"),
+    "Liquidate": ("user", "lender"),
+    "Rollover": ("user", "lender"),
+    "DepositCollateral": ("user", None),
+    "WithdrawCollateral": ("user", None),
+    "ExtendLoanDuration": ("user", None),
+    "ReduceLoanDuration": ("user", None),
+    "LoanDeposit": (None, None),
+    "TransferLoan": ("newOwner", None),
+}
+
+
+def toLoanKey(loanId):
+    if isinstance(loanId, bytes):
+        return web3.toHex(loanId)
+    return str(loanId).lower()
+
+
+def toLoan(loanData):
+    loan = Munch(zip(LOAN_RETURN_FIELDS, loanData))
+    loan.loanId = toLoanKey(loan.loanId)
+    return loan
+
+
+class ActiveLoanIndexer(object):
+    '''
+    Keeps an in-memory copy of the protocol's active loan set.
+
+    The table is bootstrapped once from getActiveLoans and then kept current
+    from the protocol's loan events: only loans touched by an event are read
+    back with getLoan, instead of re-scanning every page of the active set.
+    '''
+
+    def __init__(self, bzx, pageSize=100):
+        self.bzx = bzx
+        self.pageSize = pageSize
+        self.lastBlock = None
+        self.loans = {}
+        self.borrowers = {}
+        self.lenders = {}
+        self._byBorrower = {}
+        self._byLender = {}
+        self._byLoanToken = {}
+        self._byCollateralToken = {}
+        self._dirty = set()
+        self._listeners = []
+
+    def addListener(self, listener):
+        # listener.onLoanUpdated(loan) / listener.onLoanRemoved(loanId) are called as the table changes
+        self._listeners.append(listener)
+        for loan in self.loans.values():
+            listener.onLoanUpdated(loan)
+
+    def bootstrap(self, block=None):
+        if block is None:
+            block = web3.eth.blockNumber
+
+        count = self.bzx.getActiveLoansCount(block_identifier=block)
+        for start in range(0, count, self.pageSize):
+            for loanData in self.bzx.getActiveLoans(start, self.pageSize, False, block_identifier=block):
+                loan = toLoan(loanData)
+                if loan.principal == 0:
+                    continue
+                loanStruct = self.bzx.loans(loan.loanId, block_identifier=block)
+                self._setParties(loan.loanId, loanStruct[9], loanStruct[10]) # borrower, lender
+                self._setLoan(loan)
+
+        self.lastBlock = block
+        return len(self.loans)
+
+    def sync(self, toBlock=None):
+        assert self.lastBlock is not None, "not bootstrapped"
+        if toBlock is None:
+            toBlock = web3.eth.blockNumber
+        if toBlock <= self.lastBlock:
+            return 0
+
+        logs = web3.eth.getLogs({
+            "address": self.bzx.address,
+            "fromBlock": self.lastBlock + 1,
+            "toBlock": toBlock
+        })
+        for event in decode_logs(logs):
+            self.applyEvent(event.name, event)
+
+        self.lastBlock = toBlock
+        return self.refresh(toBlock)
+
+    def processTransaction(self, tx):
+        for event in tx.events:
+            self.applyEvent(event.name, event)
+        if tx.block_number > self.lastBlock:
+            self.lastBlock = tx.block_number
+        return self.refresh(tx.block_number)
+
+    def applyEvent(self, name, args):
+        if name not in LOAN_EVENTS:
+            return
+
+        loanId = toLoanKey(args["loanId"])
+        borrowerKey, lenderKey = LOAN_EVENTS[name]
+        self._setParties(
+            loanId,
+            args[borrowerKey] if borrowerKey is not None else self.borrowers.get(loanId),
+            args[lenderKey] if lenderKey is not None else self.lenders.get(loanId)
+        )
+        self._dirty.add(loanId)
+
+    def refresh(self, block=None):
+        dirty = self._dirty
+        self._dirty = set()
+        for loanId in dirty:
+            loan = toLoan(self.bzx.getLoan(loanId, block_identifier=block))
+            if loan.principal == 0:
+                self._removeLoan(loanId)
+            else:
+                self._setLoan(loan)
+        return len(dirty)
+
+    def getLoan(self, loanId):
+        return self.loans.get(toLoanKey(loanId))
+
+    def getLoansByBorrower(self, borrower):
+        return self._lookup(self._byBorrower, borrower)
+
+    def getLoansByLender(self, lender):
+        return self._lookup(self._byLender, lender)
+
+    def getLoansByLoanToken(self, loanToken):
+        return self._lookup(self._byLoanToken, loanToken)
+
+    def getLoansByCollateralToken(self, collateralToken):
+        return self._lookup(self._byCollateralToken, collateralToken)
+
+    def _lookup(self, index, key):
+        return [self.loans[loanId] for loanId in index.get(str(key), ())]
+
+    def _setParties(self, loanId, borrower, lender):
+        if borrower is not None:
+            borrower = str(borrower)
+            currentBorrower = self.borrowers.get(loanId)
+            if currentBorrower is not None and currentBorrower != borrower:
+                self._unindex(self._byBorrower, currentBorrower, loanId)
+            self.borrowers[loanId] = borrower
+
+            if loanId in self.loans:
+                self._index(self._byBorrower, borrower, loanId)
+
+        if lender is not None:
+            self.lenders[loanId] = str(lender)
+
+    def _setLoan(self, loan):
+        loanId = loan.loanId
+        self.loans[loanId] = loan
+        self._index(self._byBorrower, self.borrowers.get(loanId), loanId)
+        self._index(self._byLender, self.lenders.get(loanId), loanId)
+        self._index(self._byLoanToken, str(loan.loanToken), loanId)
+        self._index(self._byCollateralToken, str(loan.collateralToken), loanId)
+        for listener in self._listeners:
+            listener.onLoanUpdated(loan)
+
+    def _removeLoan(self, loanId):
+        loan = self.loans.pop(loanId, None)
+        if loan is not None:
+            self._unindex(self._byLoanToken, str(loan.loanToken), loanId)
+            self._unindex(self._byCollateralToken, str(loan.collateralToken), loanId)
+            for listener in self._listeners:
+                listener.onLoanRemoved(loanId)
+        borrower = self.borrowers.pop(loanId, None)
+        if borrower is not None:
+            self._unindex(self._byBorrower, borrower, loanId)
+        lender = self.lenders.pop(loanId, None)
+        if lender is not None:
+            self._unindex(self._byLender, lender, loanId)
+
+    def _index(self, index, key, loanId):
+        if key is not None:
+            index.setdefault(key, set()).add(loanId)
+
+    def _unindex(self, index, key, loanId):
+        loanIds = index.get(key)
+        if loanIds is not None:
+            loanIds.discard(loanId)
+            if not loanIds:
+                del index[key]
@@ -0,0 +1,208 @@
+#!/usr/bin/python3
+
+import numpy as np
+from munch import Munch
+
+WEI_PRECISION = 10**18
+WEI_PERCENT_PRECISION = 10**20
+
+# all columns are object arrays of python ints so the EVM's uint256 math is reproduced exactly
+
+
+def uintArray(values):
+    return np.array([int(v) for v in values], dtype=object)
+
+
+def getDecimalPrecision(sourceDecimals, destDecimals):
+    # mirrors PriceFeeds._getDecimalPrecision for sourceToken != destToken
+    if destDecimals >= sourceDecimals:
+        exponent = 18 - (destDecimals - sourceDecimals)
+        if exponent < 0:
+            raise ValueError("SafeMath: subtraction overflow")
+        return 10**exponent
+    else:
+        return 10**(18 + (sourceDecimals - destDecimals))
+
+
+class RateTable(object):
+    '''
+    (sourceToken, destToken) => (rate, precision) as returned by PriceFeeds.queryRate.
+    '''
+
+    def __init__(self, rates=None):
+        self.rates = {}
+        for (sourceToken, destToken), (rate, precision) in (rates or {}).items():
+            self.setRate(sourceToken, destToken, rate, precision)
+
+    @classmethod
+    def fromPriceFeeds(cls, priceFeeds, pairs, block=None):
+        table = cls()
+        for sourceToken, destToken in set((str(s), str(d)) for s, d in pairs):
+            rate, precision = priceFeeds.queryRate(sourceToken, destToken, block_identifier=block)
+            table.setRate(sourceToken, destToken, rate, precision)
+        return table
+
+    @classmethod
+    def fromFeedAnswers(cls, answers, decimals, pairs):
+        # mirrors PriceFeeds._queryRate given each token's latestAnswer() (1e18 for weth) and decimals
+        table = cls()
+        for sourceToken, destToken in pairs:
+            sourceToken, destToken = str(sourceToken), str(destToken)
+            if sourceToken == destToken:
+                continue
+            rate = int(answers[sourceToken]) * WEI_PRECISION // int(answers[destToken])
+            precision = getDecimalPrecision(int(decimals[sourceToken]), int(decimals[destToken]))
+            table.setRate(sourceToken, destToken, rate, precision)
+        return table
+
+    def setRate(self, sourceToken, destToken, rate, precision):
+        self.rates[(str(sourceToken), str(destToken))] = (int(rate), int(precision))
+
+    def queryRate(self, sourceToken, destToken):
+        sourceToken, destToken = str(sourceToken), str(destToken)
+        if sourceToken == destToken:
+            return (WEI_PRECISION, WEI_PRECISION)
+        return self.rates[(sourceToken, destToken)]
+
+    def collateralToLoanRate(self, loanToken, collateralToken):
+        # normalized rate used by PriceFeeds.getCurrentMargin
+        if str(loanToken) == str(collateralToken):
+            return WEI_PRECISION
+        rate, precision = self.queryRate(collateralToken, loanToken)
+        return rate * WEI_PRECISION // precision
+
+
+class LoanBook(object):
+    '''
+    Columnar snapshot of loans. Each column is an array with one entry per loan.
+    '''
+
+    def __init__(self, loanIds, loanTokens, collateralTokens, principal, collateral, maintenanceMargin, incentivePercent):
+        self.loanIds = list(loanIds)
+        self.loanTokens = np.array([str(t) for t in loanTokens], dtype=object)
+        self.collateralTokens = np.array([str(t) for t in collateralTokens], dtype=object)
+        self.principal = uintArray(principal)
+        self.collateral = uintArray(collateral)
+        self.maintenanceMargin = uintArray(maintenanceMargin)
+        self.incentivePercent = uintArray(incentivePercent)
+
+    def __len__(self):
+        return len(self.loanIds)
+
+    @classmethod
+    def fromLoans(cls, loans, incentivePercents):
+        '''
+        Builds a book from LoanReturnData records (see offchain.loan_indexer.toLoan)
+        and a (loanToken, collateralToken) => liquidationIncentivePercent mapping.
+        '''
+        loans = list(loans)
+        return cls(
+            [l.loanId for l in loans],
+            [l.loanToken for l in loans],
+            [l.collateralToken for l in loans],
+            [l.principal for l in loans],
+            [l.collateral for l in loans],
+            [l.maintenanceMargin for l in loans],
+            [incentivePercents[(str(l.loanToken), str(l.collateralToken))] for l in loans]
+        )
+
+    def ratePairs(self):
+        # (sourceToken, destToken) pairs queried by getCurrentMargin
+        return set(zip(self.collateralTokens, self.loanTokens))
+
+    def collateralToLoanRates(self, rates):
+        # one rate lookup per distinct pair, broadcast to every loan using it
+        result = np.zeros(len(self), dtype=object)
+        for collateralToken, loanToken in self.ratePairs():
+            mask = (self.loanTokens == loanToken) & (self.collateralTokens == collateralToken)
+            result[mask] = rates.collateralToLoanRate(loanToken, collateralToken)
+        return result
+
+
+def getCurrentMargin(principal, collateral, collateralToLoanRate):
+    # mirrors PriceFeeds.getCurrentMargin
+    collateralToLoanAmount = collateral * collateralToLoanRate // WEI_PRECISION
+
+    healthy = (principal != 0) & (collateralToLoanAmount >= principal)
+    safePrincipal = np.where(principal != 0, principal, 1)
+    currentMargin = np.where(
+        healthy,
+        (collateralToLoanAmount - principal) * WEI_PERCENT_PRECISION // safePrincipal,
+        0
+    )
+    return currentMargin.astype(object)
+
+
+def getLiquidationAmounts(principal, collateral, currentMargin, maintenanceMargin, collateralToLoanRate, incentivePercent):
+    # mirrors LiquidationHelper._getLiquidationAmounts
+    zero = np.zeros(len(principal), dtype=object)
+
+    skip = (currentMargin > maintenanceMargin) | (collateralToLoanRate == 0)
+    seizeAll = ~skip & (currentMargin <= incentivePercent)
+    partial = ~skip & ~seizeAll
+
+    desiredMargin = maintenanceMargin + 5 * WEI_PRECISION # 5 percentage points above maintenance
+
+    maxLiquidatable = (desiredMargin + WEI_PERCENT_PRECISION) * principal // WEI_PERCENT_PRECISION
+    maxLiquidatable = maxLiquidatable - collateral * collateralToLoanRate // WEI_PRECISION
+    divisor = desiredMargin - incentivePercent
+    if (partial & ((maxLiquidatable < 0) | (divisor <= 0))).any():
+        # the contract reverts on these (SafeMath sub underflow / division by zero)
+        raise ValueError("SafeMath: subtraction overflow")
+    maxLiquidatable = np.where(partial, maxLiquidatable, 0) * WEI_PERCENT_PRECISION // np.where(partial, divisor, 1)
+    maxLiquidatable = np.minimum(maxLiquidatable, principal)
+
+    maxSeizable = maxLiquidatable * (incentivePercent + WEI_PERCENT_PRECISION)
+    maxSeizable = maxSeizable // np.where(partial, collateralToLoanRate, 1) // 100
+    maxSeizable = np.minimum(maxSeizable, collateral)
+
+    maxLiquidatable = np.where(partial, maxLiquidatable, np.where(seizeAll, principal, zero))
+    maxSeizable = np.where(partial, maxSeizable, np.where(seizeAll, collateral, zero))
+    return maxLiquidatable.astype(object), maxSeizable.astype(object)
+
+
+def computeMargins(book, rates):
+    '''
+    Evaluates getCurrentMargin, shouldLiquidate and the liquidation amounts for
+    every loan in the book in one pass. Values match the contract's integer results.
+    '''
+    collateralToLoanRate = book.collateralToLoanRates(rates)
+
+    currentMargin = getCurrentMargin(
+        book.principal,
+        book.collateral,
+        collateralToLoanRate
+    )
+    shouldLiquidate = currentMargin <= book.maintenanceMargin
+
+    maxLiquidatable, maxSeizable = getLiquidationAmounts(
+        book.principal,
+        book.collateral,
+        currentMargin,
+        book.maintenanceMargin,
+        collateralToLoanRate,
+        book.incentivePercent
+    )
+
+    return Munch({
+        "loanIds": book.loanIds,
+        "collateralToLoanRate": collateralToLoanRate,
+        "currentMargin": currentMargin,
+        "shouldLiquidate": shouldLiquidate.astype(bool),
+        "maxLiquidatable": maxLiquidatable,
+        "maxSeizable": maxSeizable,
+    })
+
+
+def amountsInEth(tokens, amounts, rates, wethToken):
+    # mirrors PriceFeeds.amountInEth, as used by getCurrentMarginAndCollateralSize
+    tokens = np.array([str(t) for t in tokens], dtype=object)
+    amounts = uintArray(amounts)
+    result = amounts.copy()
+    for token in set(tokens):
+        if token == str(wethToken):
+            continue
+        mask = tokens == token
+        rate, precision = rates.queryRate(token, wethToken)
+        result[mask] = amounts[mask] * rate // precision
+    return result
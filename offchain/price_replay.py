@@ -0,0 +1,158 @@
+#!/usr/bin/python3
+
+import csv
+import time
+from decimal import Decimal
+
+import numpy as np
+from brownie import chain
+from munch import Munch
+
+WEI_PRECISION = 10**18
+
+
+def toWei(price):
+    return int(Decimal(str(price)) * WEI_PRECISION)
+
+
+def loadPriceSeries(path, labels=None):
+    '''
+    Reads a price path as {label: [answer per step]} with answers in wei (1e18 = 1 ETH).
+
+    CSV files have one column per token with the token label in the header row and
+    one row per step, prices in ETH. NumPy files (.npy) hold a (steps, tokens) array
+    of the same prices and need the column labels passed in.
+    '''
+    if str(path).endswith(".npy"):
+        prices = np.load(path, allow_pickle=False)
+        assert labels is not None and len(labels) == prices.shape[1], "labels required"
+        return {label: [toWei(p) for p in prices[:, i]] for i, label in enumerate(labels)}
+
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+    header = [h.strip() for h in rows[0]]
+    return {label: [toWei(row[i]) for row in rows[1:]] for i, label in enumerate(header)}
+
+
+def crashSeries(startPrice, drop, crashSteps, steps):
+    # flat, then a geometric fall of `drop` (0.3 = -30%) over crashSteps, then flat again
+    startPrice = Decimal(str(startPrice))
+    factor = (1 - Decimal(str(drop))) ** (Decimal(1) / crashSteps)
+    series = []
+    price = startPrice
+    crashStart = (steps - crashSteps) // 2
+    for step in range(steps):
+        if crashStart <= step < crashStart + crashSteps:
+            price *= factor
+        series.append(int(price * WEI_PRECISION))
+    return series
+
+
+class PriceReplay(object):
+    '''
+    Drives one PriceFeedReplayMock per token, registered on a PriceFeedsLocal
+    (or PriceFeeds) contract. Every step moves all feeds to the next round and
+    advances chain time by `interval` seconds and `blocksPerStep` blocks.
+    '''
+
+    def __init__(self, priceFeeds, feeds, acct, steps, interval=60, blocksPerStep=1):
+        self.priceFeeds = priceFeeds
+        self.acct = acct
+        self.feeds = feeds  # token address => PriceFeedReplayMock
+        self.steps = steps
+        self.interval = interval
+        self.blocksPerStep = blocksPerStep
+        self.round = 0
+
+    @classmethod
+    def deploy(cls, priceFeeds, PriceFeedReplayMock, series, acct, interval=60, blocksPerStep=1):
+        '''
+        series maps token address => answers in wei. Every token is priced through
+        its replay feed, so the local WETH token needs a series too (ex: a flat 1e18).
+        '''
+        steps = set(len(answers) for answers in series.values())
+        assert len(steps) == 1, "series lengths differ"
+
+        feeds = {}
+        for token, answers in series.items():
+            feed = acct.deploy(PriceFeedReplayMock)
+            feed.pushAnswers([int(a) for a in answers], {"from": acct})
+            feed.setRound(0, {"from": acct})
+            feeds[str(token)] = feed
+
+        tokens = list(feeds.keys())
+        priceFeeds.setPriceFeed(tokens, [feeds[t] for t in tokens], {"from": acct})
+        return cls(priceFeeds, feeds, acct, steps.pop(), interval, blocksPerStep)
+
+    def __len__(self):
+        return self.steps
+
+    def prices(self):
+        return {token: feed.latestAnswer() for token, feed in self.feeds.items()}
+
+    def step(self):
+        if self.round + 1 >= self.steps:
+            return False
+        self.round += 1
+
+        chain.sleep(self.interval)
+        for feed in self.feeds.values():
+            feed.setRound(self.round, {"from": self.acct})
+        if self.blocksPerStep > 1:
+            chain.mine(self.blocksPerStep - 1)
+        return True
+
+
+def findLiquidatable(bzx, pageSize=100):
+    # sweeps the active loan set with LoanMaintenance_2.getLiquidatableLoans
+    loans = []
+    cursor = 0
+    total = bzx.getActiveLoansCount()
+    while cursor < total:
+        page, cursor = bzx.getLiquidatableLoans(cursor, pageSize)
+        loans += page
+    return loans
+
+
+def replayLiquidations(replay, bzx, liquidator, pageSize=100, batchSize=20):
+    '''
+    Steps through the whole replay and, after every step, runs the local liquidation
+    pipeline: find the liquidatable loans, then liquidate them with liquidateBatch.
+    The liquidator must hold and have approved enough of each loan token.
+    Returns one report per step.
+    '''
+    reports = []
+    while True:
+        start = time.perf_counter()
+        loans = findLiquidatable(bzx, pageSize)
+        scanSeconds = time.perf_counter() - start
+
+        liquidated = 0
+        gasUsed = 0
+        start = time.perf_counter()
+        for i in range(0, len(loans), batchSize):
+            batch = loans[i:i + batchSize]
+            tx = bzx.liquidateBatch(
+                [l[0] for l in batch], # loanId
+                liquidator,
+                [l[2] for l in batch], # maxLiquidatable
+                {"from": liquidator}
+            )
+            liquidated += len(tx.events["Liquidate"]) if "Liquidate" in tx.events else 0
+            gasUsed += tx.gas_used
+        liquidateSeconds = time.perf_counter() - start
+
+        reports.append(Munch({
+            "step": replay.round,
+            "timestamp": chain[-1].timestamp,
+            "block": chain.height,
+            "liquidatable": len(loans),
+            "liquidated": liquidated,
+            "scanSeconds": scanSeconds,
+            "liquidateSeconds": liquidateSeconds,
+            "gasUsed": gasUsed,
+        }))
+
+        if not replay.step():
+            break
+    return reports
@@ -0,0 +1,273 @@
+#!/usr/bin/python3
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+from brownie import chain, web3
+from brownie.network.event import decode_logs
+from munch import Munch
+
+WEI_PRECISION = 10**18
+REWARDS_PRECISION = 10**36
+
+# StakingConstants vesting schedule
+VESTING_START_TIMESTAMP = 1594648800
+CLIFF_DURATION = 15768000
+VESTING_DURATION = 126144000
+VESTING_DURATION_AFTER_CLIFF = 110376000
+VESTING_CLIFF_TIMESTAMP = VESTING_START_TIMESTAMP + CLIFF_DURATION
+VESTING_END_TIMESTAMP = VESTING_START_TIMESTAMP + VESTING_DURATION
+
+# per account StakingV1 state read by _earned / _syncVesting
+ACCOUNT_FIELDS = [
+    "bzrxRewardsPerTokenPaid",
+    "stableCoinRewardsPerTokenPaid",
+    "bzrxRewards",
+    "stableCoinRewards",
+    "bzrxVesting",
+    "stableCoinVesting",
+    "vestingLastSync",
+    "bzrxBalance",
+    "iBZRXBalance",
+    "vBZRXBalance",
+    "LPTokenBalance",
+]
+
+# events emitted by calls that run updateRewards(user)
+ACCOUNT_EVENTS = ["Stake", "Unstake", "Claim"]
+
+
+def toArray(values):
+    return np.array([int(v) for v in values], dtype=object)
+
+
+def vestedBalanceForAmount(tokenBalance, lastUpdate, vestingEndTime, timestamp):
+    '''
+    StakingV1.vestedBalanceForAmount evaluated at block.timestamp == timestamp.
+    Any argument can be an object array of python ints, the result is one.
+    '''
+    lastUpdate = toArray(np.atleast_1d(lastUpdate))
+    vestingEndTime = toArray(np.atleast_1d(vestingEndTime))
+    vestingEndTime = np.where(vestingEndTime < timestamp, vestingEndTime, timestamp)
+
+    # vesting runs from the cliff to the end timestamp
+    vesting = (vestingEndTime > lastUpdate) & (vestingEndTime > VESTING_CLIFF_TIMESTAMP) & (lastUpdate < VESTING_END_TIMESTAMP)
+    lastUpdate = np.where(lastUpdate < VESTING_CLIFF_TIMESTAMP, VESTING_CLIFF_TIMESTAMP, lastUpdate)
+    vestingEndTime = np.where(vestingEndTime > VESTING_END_TIMESTAMP, VESTING_END_TIMESTAMP, vestingEndTime)
+
+    timeSinceClaim = np.where(vesting, vestingEndTime - lastUpdate, 0)
+    return (tokenBalance * timeSinceClaim // VESTING_DURATION_AFTER_CLIFF).astype(object)
+
+
+@lru_cache(maxsize=1024)
+def vestingMultiplier(lastUpdate, vestingEndTime, timestamp):
+    # StakingV1._vestingMultiplier: vestedBalanceForAmount(1e36, lastUpdate, vestingEndTime) for one pair of times
+    vestingEndTime = min(vestingEndTime, timestamp)
+    if vestingEndTime <= lastUpdate or vestingEndTime <= VESTING_CLIFF_TIMESTAMP or lastUpdate >= VESTING_END_TIMESTAMP:
+        return 0
+    if lastUpdate <= VESTING_CLIFF_TIMESTAMP and vestingEndTime >= VESTING_END_TIMESTAMP:
+        return REWARDS_PRECISION
+    lastUpdate = max(lastUpdate, VESTING_CLIFF_TIMESTAMP)
+    vestingEndTime = min(vestingEndTime, VESTING_END_TIMESTAMP)
+    return (vestingEndTime - lastUpdate) * REWARDS_PRECISION // VESTING_DURATION_AFTER_CLIFF
+
+
+class StakerRewardsCalculator(object):
+    '''
+    Computes StakingV1.earned for every staker from a snapshot of the staking
+    contract's state, in one vectorized pass with the contract's integer math.
+
+    The snapshot is taken once with bootstrap and then kept current by sync:
+    stakers are only read again after one of their Stake, Unstake or Claim
+    events. addDirectRewards emits no event, so accounts credited with it
+    have to be passed to refreshAccounts.
+    '''
+
+    def __init__(self, staking, workers=8):
+        self.staking = staking
+        self.workers = workers
+        self.lastBlock = None
+        self.accounts = []
+        self.state = Munch({field: np.zeros(0, dtype=object) for field in ACCOUNT_FIELDS})
+        self.bzrxPerTokenStored = 0
+        self.stableCoinPerTokenStored = 0
+        self.vBZRXWeightStored = 0
+        self.iBZRXWeightStored = 0
+        self.LPTokenWeightStored = 0
+        self._indexes = {}
+        self._dirty = set()
+        self._lastSyncMultipliers = None # vestingMultiplier(0, vestingLastSync) per account
+
+    def __len__(self):
+        return len(self.accounts)
+
+    def findStakers(self, fromBlock=0, toBlock=None):
+        if toBlock is None:
+            toBlock = web3.eth.blockNumber
+        logs = web3.eth.getLogs({
+            "address": self.staking.address,
+            "fromBlock": fromBlock,
+            "toBlock": toBlock
+        })
+        return list(dict.fromkeys(str(event["user"]) for event in decode_logs(logs) if event.name == "Stake"))
+
+    def bootstrap(self, accounts=None, block=None):
+        # accounts defaults to every address that ever staked
+        if block is None:
+            block = web3.eth.blockNumber
+        if accounts is None:
+            accounts = self.findStakers(0, block)
+
+        self.refreshGlobals(block)
+        self.refreshAccounts(accounts, block)
+        self.lastBlock = block
+        return len(self.accounts)
+
+    def sync(self, toBlock=None):
+        assert self.lastBlock is not None, "not bootstrapped"
+        if toBlock is None:
+            toBlock = web3.eth.blockNumber
+        if toBlock <= self.lastBlock:
+            return 0
+
+        logs = web3.eth.getLogs({
+            "address": self.staking.address,
+            "fromBlock": self.lastBlock + 1,
+            "toBlock": toBlock
+        })
+        for event in decode_logs(logs):
+            if event.name in ACCOUNT_EVENTS:
+                self._dirty.add(str(event["user"]))
+
+        # per token values and weights move with AddRewards / DistributeFees, they are cheap to re-read
+        self.refreshGlobals(toBlock)
+        dirty = list(self._dirty)
+        self._dirty = set()
+        self.refreshAccounts(dirty, toBlock)
+        self.lastBlock = toBlock
+        return len(dirty)
+
+    def refreshGlobals(self, block=None):
+        staking = self.staking
+        self.bzrxPerTokenStored = int(staking.bzrxPerTokenStored(block_identifier=block))
+        self.stableCoinPerTokenStored = int(staking.stableCoinPerTokenStored(block_identifier=block))
+        self.vBZRXWeightStored = int(staking.vBZRXWeightStored(block_identifier=block))
+        self.iBZRXWeightStored = int(staking.iBZRXWeightStored(block_identifier=block))
+        self.LPTokenWeightStored = int(staking.LPTokenWeightStored(block_identifier=block))
+
+    def refreshAccounts(self, accounts, block=None):
+        accounts = [str(a) for a in accounts]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            rows = list(executor.map(lambda account: self._readAccount(account, block), accounts))
+
+        newAccounts = [a for a in dict.fromkeys(accounts) if a not in self._indexes]
+        if len(newAccounts) != 0:
+            for account in newAccounts:
+                self._indexes[account] = len(self.accounts)
+                self.accounts.append(account)
+            for field in ACCOUNT_FIELDS:
+                self.state[field] = np.concatenate([self.state[field], np.zeros(len(newAccounts), dtype=object)])
+
+        for account, row in zip(accounts, rows):
+            i = self._indexes[account]
+            for field, value in zip(ACCOUNT_FIELDS, row):
+                self.state[field][i] = int(value)
+        self._lastSyncMultipliers = None
+        return len(accounts)
+
+    def lastSyncMultipliers(self, timestamp):
+        # only depends on vestingLastSync once timestamp is past every account's last sync, so it is cached
+        lastSync = self.state.vestingLastSync
+        if len(lastSync) != 0 and timestamp < max(lastSync):
+            return vestedBalanceForAmount(REWARDS_PRECISION, 0, lastSync, timestamp)
+        if self._lastSyncMultipliers is None:
+            self._lastSyncMultipliers = toArray(vestingMultiplier(0, t, t) for t in lastSync)
+        return self._lastSyncMultipliers
+
+    def balanceOfStored(self):
+        # StakingV1.balanceOfStored for every account: (vestedBalance, vestingBalance)
+        s = self.state
+        vestingBalance = s.vBZRXBalance * self.vBZRXWeightStored // WEI_PRECISION
+        vestedBalance = (
+            s.bzrxBalance
+            + s.iBZRXBalance * self.iBZRXWeightStored // WEI_PRECISION
+            + s.LPTokenBalance * self.LPTokenWeightStored // WEI_PRECISION
+        )
+        return vestedBalance.astype(object), vestingBalance.astype(object)
+
+    def earned(self, timestamp=None):
+        '''
+        StakingV1.earned for every account at block.timestamp == timestamp (the
+        latest block's by default). Returns a Munch of object arrays aligned with
+        self.accounts: bzrxRewardsEarned, stableCoinRewardsEarned, bzrxRewardsVesting
+        and stableCoinRewardsVesting.
+        '''
+        if timestamp is None:
+            timestamp = chain[-1].timestamp
+        s = self.state
+
+        # _earned
+        bzrxPerTokenUnpaid = self.bzrxPerTokenStored - s.bzrxRewardsPerTokenPaid
+        stableCoinPerTokenUnpaid = self.stableCoinPerTokenStored - s.stableCoinRewardsPerTokenPaid
+        assert (bzrxPerTokenUnpaid >= 0).all() and (stableCoinPerTokenUnpaid >= 0).all(), "stale snapshot"
+
+        vestedBalance, vestingBalance = self.balanceOfStored()
+        bzrxRewardsEarned = s.bzrxRewards + vestedBalance * bzrxPerTokenUnpaid // REWARDS_PRECISION
+        stableCoinRewardsEarned = s.stableCoinRewards + vestedBalance * stableCoinPerTokenUnpaid // REWARDS_PRECISION
+
+        # new vesting rewards, trued up to the vBZRX schedule since the last sync
+        multiplier = self.lastSyncMultipliers(timestamp)
+        value = vestingBalance * bzrxPerTokenUnpaid // REWARDS_PRECISION
+        bzrxRewardsVesting = s.bzrxVesting + value
+        bzrxRewardsEarned = bzrxRewardsEarned + value * multiplier // REWARDS_PRECISION
+
+        value = vestingBalance * stableCoinPerTokenUnpaid // REWARDS_PRECISION
+        stableCoinRewardsVesting = s.stableCoinVesting + value
+        stableCoinRewardsEarned = stableCoinRewardsEarned + value * multiplier // REWARDS_PRECISION
+
+        # _syncVesting
+        multiplier = vestedBalanceForAmount(REWARDS_PRECISION, s.vestingLastSync, timestamp, timestamp)
+        bzrxRewardsEarned = bzrxRewardsEarned + bzrxRewardsVesting * multiplier // REWARDS_PRECISION
+        stableCoinRewardsEarned = stableCoinRewardsEarned + stableCoinRewardsVesting * multiplier // REWARDS_PRECISION
+        bzrxRewardsEarned = bzrxRewardsEarned + s.vBZRXBalance * multiplier // REWARDS_PRECISION
+
+        # discount vesting amounts for vesting time
+        multiplier = vestingMultiplier(0, timestamp, timestamp)
+        bzrxRewardsVesting = bzrxRewardsVesting - bzrxRewardsVesting * multiplier // REWARDS_PRECISION
+        stableCoinRewardsVesting = stableCoinRewardsVesting - stableCoinRewardsVesting * multiplier // REWARDS_PRECISION
+
+        return Munch({
+            "bzrxRewardsEarned": bzrxRewardsEarned.astype(object),
+            "stableCoinRewardsEarned": stableCoinRewardsEarned.astype(object),
+            "bzrxRewardsVesting": bzrxRewardsVesting.astype(object),
+            "stableCoinRewardsVesting": stableCoinRewardsVesting.astype(object),
+        })
+
+    def earnedOf(self, account, timestamp=None):
+        # same tuple as StakingV1.earned(account)
+        i = self._indexes[str(account)]
+        earned = self.earned(timestamp)
+        return (
+            earned.bzrxRewardsEarned[i],
+            earned.stableCoinRewardsEarned[i],
+            earned.bzrxRewardsVesting[i],
+            earned.stableCoinRewardsVesting[i],
+        )
+
+    def _readAccount(self, account, block):
+        staking = self.staking
+        bzrxBalance, iBZRXBalance, vBZRXBalance, LPTokenBalance = staking.balanceOfByAssets(account, block_identifier=block)
+        return [
+            staking.bzrxRewardsPerTokenPaid(account, block_identifier=block),
+            staking.stableCoinRewardsPerTokenPaid(account, block_identifier=block),
+            staking.bzrxRewards(account, block_identifier=block),
+            staking.stableCoinRewards(account, block_identifier=block),
+            staking.bzrxVesting(account, block_identifier=block),
+            staking.stableCoinVesting(account, block_identifier=block),
+            staking.vestingLastSync(account, block_identifier=block),
+            bzrxBalance,
+            iBZRXBalance,
+            vBZRXBalance,
+            LPTokenBalance,
+        ]
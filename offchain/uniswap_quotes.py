@@ -0,0 +1,327 @@
+#!/usr/bin/python3
+
+import numpy as np
+from brownie import Contract, interface, web3
+from brownie.convert import to_address
+from hexbytes import HexBytes
+from munch import Munch
+
+MAX_UINT = 2**256 - 1
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+SYNC_TOPIC = "0x" + bytes(web3.keccak(text="Sync(uint112,uint112)")).hex()
+FACTORY_SELECTOR = "0xc45a0155" # keccak("factory()")
+
+# SwapsImplUniswapV2_* connectors: router, swap fee and the mid tokens tried by
+# dexAmountOut / dexAmountIn, in the order the contract tries them (wethToken first)
+CONNECTORS = Munch.fromDict({
+    "ETH": {
+        "router": "0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F", # sushiswap
+        "factory": "0xC0AEe478e3658e2610c5F7A4A2E1777cE9e4f2Ac",
+        "feeNumerator": 997,
+        "feeDenominator": 1000,
+        "midTokens": [
+            "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", # WETH
+            "0x6B175474E89094C44Da98b954EedeAC495271d0F", # DAI
+            "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", # USDC
+            "0xdAC17F958D2ee523a2206206994597C13D831ec7", # USDT
+        ],
+    },
+    "BSC": {
+        "router": "0x10ED43C718714eb63d5aA57B78B54704E256024E", # PancakeSwap v2
+        "factory": "0xcA143Ce32Fe78f1f7019d7d551a6402fC5350c73",
+        "feeNumerator": 9975,
+        "feeDenominator": 10000,
+        "midTokens": [
+            "0xbb4CdB9CBd36B01bD1cBaEBF2De08d9173bc095c", # WBNB
+            "0xe9e7CEA3DedcA5984780Bafc599bD69ADd087D56", # BUSD
+            "0x55d398326f99059fF775485246999027B3197955", # USDT
+        ],
+    },
+    "POLYGON": {
+        "router": "0x1b02dA8Cb0d097eB8D57A175b88c7D8b47997506", # sushiswap
+        "factory": "0xc35DADB65012eC5796536bD9864eD8773aBc74C4",
+        "feeNumerator": 997,
+        "feeDenominator": 1000,
+        "midTokens": [
+            "0x0d500B1d8E8eF31E21C99d1Db9A6444d3ADf1270", # WMATIC
+            "0x7ceB23fD6bC0adD59E62ac25578270cFf1b9f619", # ETH
+            "0x8f3Cf7ad23Cd3CaDbD9735AFf958023239c6A063", # DAI
+            "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174", # USDC
+            "0xc2132D05D31c914a87C6611C10748AEb04B58e8F", # USDT
+        ],
+    },
+})
+
+# public constants holding each connector's stablecoin / bridge mid tokens
+CONNECTOR_MID_TOKENS = {
+    "ETH": ["dai", "usdc", "usdt"],
+    "BSC": ["busd", "usdt"],
+    "POLYGON": ["eth", "dai", "usdc", "usdt"],
+}
+
+
+def toAddress(token):
+    # accepts addresses and brownie contracts
+    return to_address(str(getattr(token, "address", token)))
+
+
+def getConnector(variant, swapsImpl=None):
+    '''
+    Connector settings for "ETH", "BSC" or "POLYGON". When a deployed
+    SwapsImplUniswapV2_* contract is given, the router, factory, mid tokens and
+    route table are read from it (its wethToken depends on how Constants.sol was compiled).
+    '''
+    connector = Munch(CONNECTORS[variant].copy())
+    if swapsImpl is not None:
+        connector.router = swapsImpl.uniswapRouter()
+        connector.factory = toAddress("0x" + bytes(web3.eth.call({"to": connector.router, "data": FACTORY_SELECTOR}))[-20:].hex())
+        connector.midTokens = [swapsImpl.wethToken()] + [getattr(swapsImpl, name)() for name in CONNECTOR_MID_TOKENS[variant]]
+        connector.swapsImpl = swapsImpl # per pair routes are read with getSwapRoute
+        connector.splitRoutingEnabled = swapsImpl.splitRoutingEnabled()
+    connector.midTokens = [toAddress(t) for t in connector.midTokens]
+    return connector
+
+
+def sortTokens(tokenA, tokenB):
+    return (tokenA, tokenB) if int(tokenA, 16) < int(tokenB, 16) else (tokenB, tokenA)
+
+
+class PairReserves(object):
+    '''
+    Reserve cache for the pairs of one UniswapV2 factory. Pairs are looked up once
+    with getPair, read once with getReserves and then kept current from their Sync events.
+    Reserves can also be set directly to quote offline.
+    '''
+
+    def __init__(self, factory=None):
+        self.factory = factory
+        self.pairs = {}     # (token0, token1) => pair address, or None if the pair doesn't exist
+        self.reserves = {}  # pair address => (reserve0, reserve1)
+        self.tokens = {}    # pair address => (token0, token1)
+        self.lastBlock = None
+
+    @classmethod
+    def fromConnector(cls, connector):
+        return cls(Contract.from_abi("factory", address=connector.factory, abi=interface.IPancakeFactory.abi))
+
+    def getPair(self, tokenA, tokenB):
+        key = sortTokens(toAddress(tokenA), toAddress(tokenB))
+        if key not in self.pairs:
+            pair = None
+            if self.factory is not None:
+                pair = self.factory.getPair(key[0], key[1], block_identifier=self.lastBlock)
+                if pair == ZERO_ADDRESS:
+                    pair = None
+            self.pairs[key] = pair
+            if pair is not None:
+                self.tokens[pair] = key
+                reserve0, reserve1, _ = Contract.from_abi("pair", address=pair, abi=interface.IPancakePair.abi).getReserves(
+                    block_identifier=self.lastBlock
+                )
+                self.reserves[pair] = (int(reserve0), int(reserve1))
+        return self.pairs[key]
+
+    def setReserves(self, tokenA, tokenB, reserveA, reserveB, pair=None):
+        tokenA, tokenB = toAddress(tokenA), toAddress(tokenB)
+        key = sortTokens(tokenA, tokenB)
+        if pair is None:
+            pair = self.pairs.get(key) or "{}:{}".format(*key)
+        self.pairs[key] = pair
+        self.tokens[pair] = key
+        self.reserves[pair] = (int(reserveA), int(reserveB)) if key[0] == tokenA else (int(reserveB), int(reserveA))
+
+    def getReserves(self, tokenIn, tokenOut):
+        # (reserveIn, reserveOut), or None if there is no pair
+        pair = self.getPair(tokenIn, tokenOut)
+        if pair is None:
+            return None
+        reserve0, reserve1 = self.reserves[pair]
+        return (reserve0, reserve1) if self.tokens[pair][0] == toAddress(tokenIn) else (reserve1, reserve0)
+
+    def applySync(self, pair, reserve0, reserve1):
+        if pair in self.reserves:
+            self.reserves[pair] = (int(reserve0), int(reserve1))
+
+    def sync(self, toBlock=None):
+        # applies the Sync events of every cached pair since the last sync
+        if toBlock is None:
+            toBlock = web3.eth.blockNumber
+        pairs = list(self.reserves.keys())
+        if self.lastBlock is not None and toBlock > self.lastBlock and len(pairs) != 0:
+            logs = web3.eth.getLogs({
+                "address": pairs,
+                "fromBlock": self.lastBlock + 1,
+                "toBlock": toBlock,
+                "topics": [SYNC_TOPIC]
+            })
+            for log in logs:
+                data = HexBytes(log["data"])
+                self.applySync(toAddress(log["address"]), int.from_bytes(data[:32], "big"), int.from_bytes(data[32:64], "big"))
+        self.lastBlock = toBlock
+
+
+class UniswapV2QuoteEngine(object):
+    '''
+    Reproduces SwapsImplUniswapV2_*.dexAmountOut / dexAmountIn (and the router's
+    getAmountsOut / getAmountsIn behind _getAmountOut / _getAmountIn) from cached
+    reserves. Amounts are object arrays of python ints so results match exactly,
+    and every method quotes a whole array of amounts at once.
+    '''
+
+    def __init__(self, connector, reserves):
+        self.connector = connector
+        self.reserves = reserves
+
+    def getAmountsOut(self, amountsIn, path):
+        # last amount of router.getAmountsOut(amountIn, path); 0 where the router call reverts, as _getAmountOut
+        amounts = np.array([int(a) for a in amountsIn], dtype=object)
+        failed = amounts == 0
+        for tokenIn, tokenOut in zip(path[:-1], path[1:]):
+            reserves = self.reserves.getReserves(tokenIn, tokenOut)
+            if reserves is None or reserves[0] == 0 or reserves[1] == 0:
+                return np.zeros(len(amounts), dtype=object)
+            amounts, hopFailed = self._getAmountOut(amounts, reserves[0], reserves[1])
+            failed |= hopFailed
+        return np.where(failed, 0, amounts).astype(object)
+
+    def getAmountsIn(self, amountsOut, path):
+        # first amount of router.getAmountsIn(amountOut, path); MAX_UINT where the router call reverts, as _getAmountIn
+        amounts = np.array([int(a) for a in amountsOut], dtype=object)
+        failed = amounts == 0
+        for tokenIn, tokenOut in reversed(list(zip(path[:-1], path[1:]))):
+            reserves = self.reserves.getReserves(tokenIn, tokenOut)
+            if reserves is None or reserves[0] == 0 or reserves[1] == 0:
+                return np.full(len(amounts), MAX_UINT, dtype=object)
+            amounts, hopFailed = self._getAmountIn(amounts, reserves[0], reserves[1])
+            failed |= hopFailed
+        return np.where(failed, MAX_UINT, amounts).astype(object)
+
+    def getRoute(self, sourceToken, destToken):
+        # SwapsImplUniswapV2Base.getSwapRoute: mid tokens tried for the pair, ZERO_ADDRESS for the direct path
+        sourceToken, destToken = toAddress(sourceToken), toAddress(destToken)
+        routes = self.connector.setdefault("routes", {})
+        if (sourceToken, destToken) not in routes:
+            swapsImpl = self.connector.get("swapsImpl")
+            if swapsImpl is not None:
+                route = [toAddress(t) for t in swapsImpl.getSwapRoute(sourceToken, destToken)]
+            else:
+                route = [ZERO_ADDRESS] + self.connector.midTokens
+            routes[(sourceToken, destToken)] = route
+        return routes[(sourceToken, destToken)]
+
+    def candidatePaths(self, sourceToken, destToken):
+        # paths tried by dexAmountOut / dexAmountIn, in order, with their mid token
+        sourceToken, destToken = toAddress(sourceToken), toAddress(destToken)
+        paths = []
+        for midToken in self.getRoute(sourceToken, destToken):
+            if sourceToken != midToken and destToken != midToken:
+                paths.append((midToken, self._getPath(sourceToken, midToken, destToken)))
+        return paths
+
+    def dexAmountsOut(self, sourceToken, destToken, amountsIn):
+        # with split routing enabled, amountsOut include the second leg (see dexAmountsOutWithSplit)
+        amountsOut, midTokens, _, _ = self.dexAmountsOutWithSplit(sourceToken, destToken, amountsIn)
+        return amountsOut, midTokens
+
+    def dexAmountsOutWithSplit(self, sourceToken, destToken, amountsIn):
+        amountsIn = np.array([int(a) for a in amountsIn], dtype=object)
+        zeroAddresses = np.full(len(amountsIn), ZERO_ADDRESS, dtype=object)
+        if toAddress(sourceToken) == toAddress(destToken):
+            return amountsIn, zeroAddresses, zeroAddresses.copy(), np.zeros(len(amountsIn), dtype=object)
+
+        # best and second best path per amount, in one pass over the candidates
+        amountsOut = np.zeros(len(amountsIn), dtype=object)
+        midTokens = zeroAddresses.copy()
+        runnerUpAmountsOut = np.zeros(len(amountsIn), dtype=object)
+        runnerUpMidTokens = zeroAddresses.copy()
+        for midToken, path in self.candidatePaths(sourceToken, destToken):
+            quotes = self.getAmountsOut(amountsIn, path)
+            better = quotes > amountsOut
+            second = ~better & (quotes > runnerUpAmountsOut)
+            runnerUpAmountsOut = np.where(better, amountsOut, np.where(second, quotes, runnerUpAmountsOut)).astype(object)
+            runnerUpMidTokens = np.where(better, midTokens, np.where(second, midToken, runnerUpMidTokens)).astype(object)
+            amountsOut = np.where(better, quotes, amountsOut).astype(object)
+            midTokens = np.where(better, midToken, midTokens).astype(object)
+
+        splitMidTokens = zeroAddresses.copy()
+        splitAmountsIn = np.zeros(len(amountsIn), dtype=object)
+        if self.connector.get("splitRoutingEnabled"):
+            for i in np.nonzero(runnerUpAmountsOut != 0)[0]:
+                amountsOut[i], splitAmountsIn[i] = self._getSplit(
+                    toAddress(sourceToken),
+                    toAddress(destToken),
+                    amountsIn[i],
+                    midTokens[i],
+                    amountsOut[i],
+                    runnerUpMidTokens[i]
+                )
+                if splitAmountsIn[i] != 0:
+                    splitMidTokens[i] = runnerUpMidTokens[i]
+        return amountsOut, midTokens, splitMidTokens, splitAmountsIn
+
+    def dexAmountsIn(self, sourceToken, destToken, amountsOut):
+        amountsOut = np.array([int(a) for a in amountsOut], dtype=object)
+        if toAddress(sourceToken) == toAddress(destToken):
+            return amountsOut, np.full(len(amountsOut), ZERO_ADDRESS, dtype=object)
+
+        amountsIn = np.full(len(amountsOut), MAX_UINT, dtype=object)
+        midTokens = np.full(len(amountsOut), ZERO_ADDRESS, dtype=object)
+        for midToken, path in self.candidatePaths(sourceToken, destToken):
+            quotes = self.getAmountsIn(amountsOut, path)
+            better = quotes < amountsIn
+            amountsIn = np.where(better, quotes, amountsIn).astype(object)
+            midTokens[better] = midToken
+
+        # amountOut == 0 returns 0 without quoting, a failed quote returns 0 as well
+        amountsIn = np.where((amountsIn == MAX_UINT) | (amountsOut == 0), 0, amountsIn).astype(object)
+        return amountsIn, midTokens
+
+    def dexAmountOut(self, sourceToken, destToken, amountIn):
+        amountsOut, midTokens = self.dexAmountsOut(sourceToken, destToken, [amountIn])
+        return (amountsOut[0], midTokens[0])
+
+    def dexAmountIn(self, sourceToken, destToken, amountOut):
+        amountsIn, midTokens = self.dexAmountsIn(sourceToken, destToken, [amountOut])
+        return (amountsIn[0], midTokens[0])
+
+    def _getPath(self, sourceToken, midToken, destToken):
+        if midToken == ZERO_ADDRESS:
+            return [sourceToken, destToken]
+        return [sourceToken, midToken, destToken]
+
+    def _getSplit(self, sourceToken, destToken, amountIn, midToken, amountOut, splitMidToken):
+        # SwapsImplUniswapV2Base._setSplit: 25%, 50% and 75% of amountIn through the second best path
+        path = self._getPath(sourceToken, midToken, destToken)
+        splitPath = self._getPath(sourceToken, splitMidToken, destToken)
+        bestSplitAmountIn = 0
+        for share in (25, 50, 75):
+            splitAmountIn = amountIn * share // 100
+            if splitAmountIn == 0:
+                continue
+            mainAmountOut = self.getAmountsOut([amountIn - splitAmountIn], path)[0]
+            splitAmountOut = self.getAmountsOut([splitAmountIn], splitPath)[0]
+            if mainAmountOut == 0 or splitAmountOut == 0:
+                continue
+            if mainAmountOut + splitAmountOut > amountOut:
+                amountOut = mainAmountOut + splitAmountOut
+                bestSplitAmountIn = splitAmountIn
+        return amountOut, bestSplitAmountIn
+
+    def _getAmountOut(self, amountIn, reserveIn, reserveOut):
+        # UniswapV2Library.getAmountOut; reverts (reported as failed) on overflow
+        feeNumerator, feeDenominator = self.connector.feeNumerator, self.connector.feeDenominator
+        amountInWithFee = amountIn * feeNumerator
+        numerator = amountInWithFee * reserveOut
+        denominator = reserveIn * feeDenominator + amountInWithFee
+        failed = (numerator > MAX_UINT) | (denominator > MAX_UINT) | (amountIn == 0)
+        return np.where(failed, 0, numerator // np.where(failed, 1, denominator)).astype(object), failed
+
+    def _getAmountIn(self, amountOut, reserveIn, reserveOut):
+        # UniswapV2Library.getAmountIn; reverts (reported as failed) on underflow, overflow or division by zero
+        feeNumerator, feeDenominator = self.connector.feeNumerator, self.connector.feeDenominator
+        failed = (amountOut == 0) | (amountOut >= reserveOut)
+        numerator = reserveIn * amountOut * feeDenominator
+        denominator = np.where(failed, 1, reserveOut - amountOut) * feeNumerator
+        failed |= (numerator > MAX_UINT) | (denominator > MAX_UINT)
+        return np.where(failed, 0, numerator // denominator + 1).astype(object), failed
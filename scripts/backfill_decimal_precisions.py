@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+
+# brownie run backfill_decimal_precisions main <bzxAddress> <extraTokens> --network mainnet
+#
+# Fills PriceFeeds.decimalPrecisions for every token that has a price feed set.
+# setDecimals caches the pair precisions of each token it is given against all
+# tokens set before it, so re-running it once over the registered tokens covers
+# every pair. Tokens are found among the protocol's loan pool underlyings plus
+# any extra token addresses passed in (comma separated), e.g. collateral-only tokens.
+
+from brownie import *
+
+BATCH_SIZE = 5  # each token writes 2 slots per registered token
+
+def getRegisteredTokens(bzx, feeds, extraTokens):
+    candidates = []
+    start = 0
+    while True:
+        pools = bzx.getLoanPoolsList(start, 50)
+        if len(pools) == 0:
+            break
+        candidates += [bzx.loanPoolToUnderlying(pool) for pool in pools]
+        start += len(pools)
+    candidates += extraTokens
+
+    tokens = []
+    for token in candidates:
+        token = web3.toChecksumAddress(token)
+        if token in tokens:
+            continue
+        if feeds.pricesFeeds(token) != "0x0000000000000000000000000000000000000000" or token == feeds.wethToken():
+            tokens.append(token)
+    return tokens
+
+def main(bzxAddress="0xD8Ee69652E4e4838f2531732a46d1f7F584F0b7f", extraTokens="", acct=None):
+    if acct is None:
+        acct = accounts[0]
+
+    bzx = Contract.from_abi("bzx", address=bzxAddress, abi=interface.IBZx.abi, owner=acct)
+    feeds = Contract.from_abi("feeds", address=bzx.priceFeeds(), abi=PriceFeeds.abi, owner=acct)
+
+    extraTokens = [t.strip() for t in extraTokens.split(",") if t.strip() != ""]
+    tokens = getRegisteredTokens(bzx, feeds, extraTokens)
+    print("Registered tokens:", len(tokens))
+
+    for i in range(0, len(tokens), BATCH_SIZE):
+        batch = tokens[i:i + BATCH_SIZE]
+        print("Calling setDecimals.", batch)
+        feeds.setDecimals(batch, {"from": acct})
+
+    missing = []
+    for source in tokens:
+        for dest in tokens:
+            if source != dest and feeds.decimalPrecisions(source, dest) == 0:
+                missing.append((source, dest))
+    print("Pairs cached:", len(tokens) * (len(tokens) - 1) - len(missing))
+    for source, dest in missing:
+        print("  not cached (decimals too far apart):", source, dest)
@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/decimal_precision
+#
+# Gas of the PriceFeeds hot path (queryRate, queryReturn, getCurrentMargin,
+# checkPriceDisagreement) before and after the pair precision table is filled.
+# "before" is a feed whose tokens only went through setPriceFeed, so every
+# query falls back to reading decimals() from both tokens.
+
+from brownie import *
+
+def estimate(contract, method, *args):
+    return web3.eth.estimateGas({ "to": contract.address, "data": getattr(contract, method).encode_input(*args) })
+
+def measure(feeds, usdc, link):
+    return [
+        ("queryRate", estimate(feeds, "queryRate", link, usdc)),
+        ("queryReturn", estimate(feeds, "queryReturn", link, usdc, 1e18)),
+        ("getCurrentMargin", estimate(feeds, "getCurrentMargin", usdc, link, 100e6, 20e18)),
+        ("checkPriceDisagreement", estimate(feeds, "checkPriceDisagreement", link, usdc, 1e18, 20e6, 5e18)),
+    ]
+
+def main():
+    acct = accounts[0]
+    usdc = acct.deploy(TestToken, "USDC", "USDC", 6, 1e50)
+    link = acct.deploy(TestToken, "LINK", "LINK", 18, 1e50)
+
+    feeds = acct.deploy(PriceFeeds)
+    oracles = []
+    for answer in [4e14, 8e15]:
+        oracle = acct.deploy(FixedPriceFeed)
+        oracle.setLatestAnswer(answer)
+        oracles.append(oracle)
+    feeds.setPriceFeed([usdc, link], oracles)
+
+    before = measure(feeds, usdc, link)
+    feeds.setDecimals([usdc, link])
+    after = measure(feeds, usdc, link)
+
+    for (name, gasBefore), (_, gasAfter) in zip(before, after):
+        print(name)
+        print("  decimals() calls    ", gasBefore)
+        print("  precision table     ", gasAfter)
+        print("  saved               ", gasBefore - gasAfter)
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/fee_extract_bsc --network bsc-main-fork
+#
+# Gas per BGOV bought back and per BNB of fees converted by
+# FeeExtractAndDistribute_BSC sweeps: sweepFees swapping every fee token to BNB
+# one by one, and sweepFeesAboveThreshold skipping assets worth less than
+# minSwapValue and pooling the stablecoins into BUSD before one BUSD -> BNB swap.
+# Every strategy starts from the same fork state.
+
+from brownie import *
+
+BZX = "0xC47812857A74425e2039b57891a3DFcF51602d5d"
+BNB = "0xbb4CdB9CBd36B01bD1cBaEBF2De08d9173bc095c"
+BGOV = "0xf8E026dC4C0860771f691EcFFBbdfe2fa51c77CF"
+BUSD = "0xe9e7CEA3DedcA5984780Bafc599bD69ADd087D56"
+TOKENS = [
+    "0xa184088a740c695E156F91f5cC086a06bb78b827", # AUTO
+    BNB,
+    "0x7130d2A12B9BCbFAe4f2634d864A1Ee1Ce3Ead9c", # BTC
+    BUSD,
+    "0x4b87642AEDF10b642BE4663Db842Ecc5A88bf5ba", # BZRX
+    "0x0E09FaBB73Bd3Ade0a17ECC321fD13a19e81cE82", # CAKE
+    "0xbA2aE424d960c26247Dd6c32edC70B295c744C43", # DOGE
+    "0x250632378E573c6Be1AC2f97Fcdf00515d0Aa91B", # ETH
+    "0xF8A0BF9cF54Bb92F17374d9e9A321E6a111a51bD", # LINK
+    "0x55d398326f99059fF775485246999027B3197955", # USDT
+    "0x8AC76a51cc950d9822D68b83fE1Ad97B32Cd580d", # USDC
+    "0x1AF3F329e8BE154074D8769D1FFa4eE058B1DBc3", # DAI
+]
+STABLECOINS = TOKENS[-3:]
+
+def deployFeeExtractor():
+    owner = accounts[0]
+    proxy = owner.deploy(Proxy, owner.deploy(FeeExtractAndDistribute_BSC))
+    feeExtractor = Contract.from_abi("feeExtractor", address=proxy, abi=FeeExtractAndDistribute_BSC.abi, owner=owner)
+    feeExtractor.setFundsWallet(owner)
+    feeExtractor.setFeeTokens(TOKENS)
+    bZx = Contract.from_abi("bZx", address=BZX, abi=interface.IBZx.abi)
+    bZx.setFeesController(feeExtractor, {"from": bZx.owner()})
+    return feeExtractor
+
+def bought(tx):
+    # the BGOV buy back is 15% of the BNB output
+    for swap in tx.events["AssetSwap"] if "AssetSwap" in tx.events else []:
+        if swap["dstAsset"] == BGOV:
+            return swap["dstAmount"], swap["srcAmount"] * 100 // 15
+    return 0, 0
+
+def main(minSwapValue=1e17):
+    minSwapValue = int(float(minSwapValue))
+    feeExtractor = deployFeeExtractor()
+    strategies = [
+        ("sweepFees", 0, False),
+        ("threshold", minSwapValue, False),
+        ("threshold+hops", minSwapValue, True),
+    ]
+
+    print("{:<16} {:>7} {:>10} {:>16} {:>12} {:>14} {:>14}".format(
+        "strategy", "assets", "gas used", "BGOV bought", "BNB output", "gas / BGOV", "gas / BNB"
+    ))
+    for name, threshold, withHops in strategies:
+        chain.snapshot()
+        feeExtractor.setMinSwapValue(threshold)
+        if withHops:
+            feeExtractor.setSwapHops(STABLECOINS, [BUSD] * len(STABLECOINS))
+        if name == "sweepFees":
+            assetCount = len(TOKENS)
+            tx = feeExtractor.sweepFees({"from": accounts[0]})
+        else:
+            assetCount = len(feeExtractor.getSweepPlan(TOKENS)[0])
+            tx = feeExtractor.sweepFeesAboveThreshold({"from": accounts[0]})
+        bgovBought, bnbOutput = bought(tx)
+        print("{:<16} {:>7} {:>10} {:>16.4f} {:>12.4f} {:>14.0f} {:>14.0f}".format(
+            name, assetCount, tx.gas_used, bgovBought / 1e18, bnbOutput / 1e18,
+            tx.gas_used / (bgovBought / 1e18) if bgovBought else 0,
+            tx.gas_used / (bnbOutput / 1e18) if bnbOutput else 0,
+        ))
+        chain.revert()
@@ -0,0 +1,37 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/fee_sweep
+#
+# Net value captured per gas unit by fee sweeps that convert every asset
+# (sweepFeesByAsset) and by sweeps that skip dust (sweepFeesByAssetAboveDust),
+# replayed over simulated fee distributions and gas prices. No chain needed.
+
+from offchain.fee_sweep import CURVE_ASSETS, BZRX, feeDistribution, simulateSweeps
+
+ASSETS = [
+    "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", # WETH
+    BZRX,
+    *CURVE_ASSETS,
+    "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599", # WBTC
+    "0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9", # AAVE
+    "0xdd974D5C2e2928deA5F71b9825b8b646686BD200", # KNC
+    "0x9f8F72aA9304c8B593d555F12eF6589cC3A579A2", # MKR
+    "0x514910771AF9Ca656af840dff83E8264EcF986CA", # LINK
+    "0x0bc529c00C6401aEF6D220BE8C6Ea1667F6Ad93e", # YFI
+]
+
+def main(periods=90, sweepEvery=1, meanValue=5e15):
+    periods, sweepEvery, meanValue = int(periods), int(sweepEvery), int(float(meanValue))
+    gasPrices = [10 * 10**9, 50 * 10**9, 150 * 10**9]
+
+    print("{:<13} {:>10} {:<10} {:>7} {:>12} {:>14} {:>16}".format(
+        "distribution", "gas (gwei)", "strategy", "sweeps", "gas used", "net (ETH)", "net wei / gas"
+    ))
+    for name in ["uniform", "longTail", "concentrated"]:
+        accruals = feeDistribution(name, len(ASSETS), periods, meanValue, seed=1)
+        reports = simulateSweeps(ASSETS, accruals, gasPrices, sweepEvery)
+        for gasPrice in gasPrices:
+            for strategy, report in reports[gasPrice].items():
+                print("{:<13} {:>10} {:<10} {:>7} {:>12} {:>14.4f} {:>16.0f}".format(
+                    name, gasPrice // 10**9, strategy, report.sweeps, report.gas, report.netValue / 1e18, report.netValuePerGas
+                ))
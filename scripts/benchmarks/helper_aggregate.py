@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/helper_aggregate --network mainnet-fork
+#
+# A dashboard refresh of mixed reads (iToken rates and balances, lender
+# interest, price feed rates) with one eth_call per read, then through
+# HelperImpl.aggregate. The deployed helper has no aggregate yet, so this one
+# is deployed on the fork.
+
+import time
+from brownie import *
+from offchain.helper_aggregate import HelperAggregator
+from scripts.setup_pool_params2 import MAINNET_ITOKENS
+
+READS = 500
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+
+def dashboardReads(bzx, feeds, iTokens, wallets):
+    reads = []
+    for wallet in wallets:
+        for iToken in iTokens:
+            reads += [
+                (iToken.balanceOf, [wallet]),
+                (iToken.assetBalanceOf, [wallet]),
+                (iToken.profitOf, [wallet]),
+                (iToken.tokenPrice, []),
+                (iToken.supplyInterestRate, []),
+                (iToken.borrowInterestRate, []),
+                (iToken.marketLiquidity, []),
+                (bzx.getLenderInterestData, [iToken, iToken.loanTokenAddress()]),
+                (feeds.queryRate, [iToken.loanTokenAddress(), USDC]),
+            ]
+            if len(reads) >= READS:
+                return reads[:READS]
+    return reads
+
+def main(wallets="0x0000000000000000000000000000000000000001,0x0000000000000000000000000000000000000002,0x0000000000000000000000000000000000000003,0x0000000000000000000000000000000000000004"):
+    iTokens = [Contract.from_abi("i" + symbol, address=address, abi=LoanTokenLogicStandard.abi) for symbol, address in MAINNET_ITOKENS.items()]
+    bzx = Contract.from_abi("bzx", address=iTokens[0].bZxContract(), abi=interface.IBZx.abi)
+    feeds = Contract.from_abi("feeds", address=bzx.priceFeeds(), abi=PriceFeeds.abi)
+    helper = accounts[0].deploy(HelperImpl)
+    block = chain.height
+
+    reads = dashboardReads(bzx, feeds, iTokens, wallets.split(","))
+
+    start = time.perf_counter()
+    direct = []
+    for method, args in reads:
+        try:
+            direct.append(method(*args, block_identifier=block))
+        except Exception:
+            direct.append(None)
+    directSeconds = time.perf_counter() - start
+
+    aggregator = HelperAggregator(helper)
+    for method, args in reads:
+        aggregator.add(method, *args)
+    start = time.perf_counter()
+    aggregated = aggregator.execute(block)
+    aggregateSeconds = time.perf_counter() - start
+
+    print("reads                      ", len(reads))
+    print("aggregate eth_calls        ", len(aggregator.chunks()))
+    print("per-call eth_call (s)      ", round(directSeconds, 3))
+    print("aggregate (s)              ", round(aggregateSeconds, 3))
+    print("mismatches                 ", sum(a != b for a, b in zip(direct, aggregated)))
@@ -0,0 +1,37 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/interest_settlement
+#
+# Gas of the loan paths that settle lender interest: opening, extending,
+# reducing and partially closing torque loans of one lender, a day apart, and
+# the lender's withdrawAccruedInterest. Run it again with the previous
+# InterestUser.sol for the before numbers. For the tests/loan-* suites as a
+# whole, brownie test tests/loan-* --gas reports gas per protocol function.
+
+from brownie import *
+from scripts.benchmarks.loan_book import deployLocalProtocol, setupLoanParams, openLoans
+
+def main(samples=10):
+    samples = int(samples)
+    local = deployLocalProtocol()
+    bzx, dai, link = local.bzx, local.tokens.dai, local.tokens.link
+    borrower = accounts[1]
+    lender = accounts[2]
+
+    loanParamsId = setupLoanParams(bzx, dai, link)
+    loanIds = openLoans(bzx, dai, link, loanParamsId, samples)
+    dai.mint(borrower, 1e30, {"from": accounts[0]})
+    dai.approve(bzx, 2**256 - 1, {"from": borrower})
+
+    gas = {"open": [], "extend": [], "reduce": [], "close": [], "withdrawAccruedInterest": []}
+    for loanId in loanIds:
+        chain.sleep(86400)
+        openLoans(bzx, dai, link, loanParamsId, 1)
+        gas["open"].append(history[-1].gas_used) # borrowOrTradeFromPool
+        gas["extend"].append(bzx.extendLoanDuration(loanId, 1e16, False, b"", {"from": borrower}).gas_used)
+        gas["reduce"].append(bzx.reduceLoanDuration(loanId, borrower, 1e15, {"from": borrower}).gas_used)
+        gas["close"].append(bzx.closeWithDeposit(loanId, borrower, 10e18, {"from": borrower}).gas_used)
+        gas["withdrawAccruedInterest"].append(bzx.withdrawAccruedInterest(dai, {"from": lender}).gas_used)
+
+    for name, values in gas.items():
+        print("{:<24} avg gas {:>8}  min {:>8}  max {:>8}".format(name, sum(values) // len(values), min(values), max(values)))
@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/itoken_gas --network mainnet-fork
+#
+# Gas of mint, burn, borrow and marginTrade with the deployed iToken logic, then
+# the same transactions from the same state with the logic of this tree. The
+# local test deployment has no iToken, the iToken logic calls the protocol at its
+# mainnet address, so this runs on a fork: mint and burn on iETH, borrow and
+# marginTrade on iUSDC with ETH collateral.
+
+from brownie import *
+from scripts.setup_pool_params2 import MAINNET_ITOKENS
+
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+def transactions(iETH, iUSDC, account):
+    gas = {}
+    gas["mint"] = iETH.mintWithEther(account, {"from": account, "value": 10e18}).gas_used
+    gas["burn"] = iETH.burnToEther(account, iETH.balanceOf(account) // 2, {"from": account}).gas_used
+    gas["borrow"] = iUSDC.borrow(0, 1000e6, 7884000, 2e18, ZERO_ADDRESS, account, account, b"", {"from": account, "value": 2e18}).gas_used
+    gas["marginTrade"] = iUSDC.marginTrade(0, 2e18, 0, 1e18, WETH, account, b"", {"from": account, "value": 1e18}).gas_used
+    return gas
+
+def upgrade(iToken, logic):
+    proxy = Contract.from_abi("proxy", address=iToken.address, abi=LoanToken.abi)
+    owner = accounts.at(proxy.owner(), force=True)
+    proxy.setTarget(owner.deploy(logic, owner), {"from": owner})
+
+def main():
+    iETH = Contract.from_abi("iETH", address=MAINNET_ITOKENS["ETH"], abi=LoanTokenLogicWeth.abi)
+    iUSDC = Contract.from_abi("iUSDC", address=MAINNET_ITOKENS["USDC"], abi=LoanTokenLogicStandard.abi)
+    account = accounts[0]
+
+    chain.snapshot()
+    before = transactions(iETH, iUSDC, account)
+    chain.revert()
+
+    upgrade(iETH, LoanTokenLogicWeth)
+    upgrade(iUSDC, LoanTokenLogicStandard)
+    after = transactions(iETH, iUSDC, account)
+
+    for name in before:
+        print("{:<12} before {:>8}  after {:>8}  saved {:>6}".format(name, before[name], after[name], before[name] - after[name]))
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/itoken_rates --network mainnet-fork
+#
+# What-if sweeps of the iToken demand curves with the offline simulator, for every
+# iToken of setup_pool_params2, against nextBorrowInterestRate, nextSupplyInterestRate
+# and getEstimatedMarginDetails over RPC. The on-chain values are only checked on a
+# few points per iToken, the grids would take one eth_call per point.
+
+import time
+from brownie import *
+from offchain.itoken_rates import InterestRateSimulator, uintArray
+from scripts.setup_pool_params2 import MAINNET_ITOKENS
+
+UTILIZATION_POINTS = 1001
+AMOUNT_POINTS = 100
+RPC_POINTS = 5
+KINK_LEVELS = [70e18, 75e18, 80e18, 85e18, 90e18, 95e18]
+MAX_SCALE_RATES = [80e18, 100e18, 120e18, 150e18]
+
+def main():
+    iTokens = [Contract.from_abi("i" + symbol, address=address, abi=LoanTokenLogicStandard.abi) for symbol, address in MAINNET_ITOKENS.items()]
+    simulator = InterestRateSimulator(iTokens)
+
+    start = time.perf_counter()
+    simulator.refresh(chain.height)
+    readSeconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    utilRates = [i * 10**20 // (UTILIZATION_POINTS - 1) for i in range(UTILIZATION_POINTS)]
+    curveRates = simulator.borrowInterestRateAt(utilRates)
+    # borrow amounts up to the liquidity of each iToken
+    amounts = simulator.marketLiquidity * uintArray(range(AMOUNT_POINTS)) // (AMOUNT_POINTS - 1)
+    borrowRates = simulator.nextBorrowInterestRate(amounts)
+    supplyRates = simulator.nextSupplyInterestRate(amounts)
+    params, curve = simulator.sweepCurves(kinkLevel=KINK_LEVELS, maxScaleRate=MAX_SCALE_RATES)
+    sweptRates = simulator.nextBorrowInterestRate(amounts, curve)
+    sweepSeconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mismatches = 0
+    rpcCalls = 0
+    for i, iToken in enumerate(iTokens):
+        for j in range(0, AMOUNT_POINTS, AMOUNT_POINTS // RPC_POINTS):
+            amount = amounts[i][j]
+            mismatches += iToken.nextBorrowInterestRate(amount, block_identifier=chain.height) != borrowRates[i][j]
+            # iDAI's supply rate includes the DSR
+            if iToken.address != MAINNET_ITOKENS["DAI"]:
+                mismatches += iToken.nextSupplyInterestRate(amount, block_identifier=chain.height) != supplyRates[i][j]
+                rpcCalls += 1
+            rpcCalls += 1
+    rpcSeconds = time.perf_counter() - start
+
+    deposit = simulator.marketLiquidity // 100
+    borrowAmounts, interestRates = simulator.marginTradeBorrowAmount(deposit, 3e18)
+    for i, iToken in enumerate(iTokens):
+        principal, collateral, interestRate, rate = iToken.getEstimatedMarginDetails(3e18, deposit[i][0], 0, iToken.loanTokenAddress(), block_identifier=chain.height)
+        mismatches += principal != 0 and (principal, interestRate) != (borrowAmounts[i][0], interestRates[i][0])
+
+    points = curveRates.size + borrowRates.size + supplyRates.size + sweptRates.size
+    print("iTokens                    ", len(iTokens))
+    print("parameter sets             ", len(params))
+    print("rates evaluated            ", points)
+    print("state read (s)             ", round(readSeconds, 3))
+    print("simulator sweep (s)        ", round(sweepSeconds, 3))
+    print("eth_call per rate (s)      ", round(rpcSeconds / rpcCalls, 4))
+    print("same rates over RPC (s)    ", round(rpcSeconds / rpcCalls * points, 1))
+    print("mismatches                 ", mismatches)
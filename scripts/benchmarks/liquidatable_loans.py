@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/liquidatable_loans
+#
+# Compares sweeping the active loan set for liquidatable loans with
+# getLiquidatableLoans (cursor, compact results) against getActiveLoansAdvanced,
+# on a freshly deployed local loan book where half of the loans are unhealthy.
+
+import time
+from brownie import *
+from scripts.benchmarks.loan_book import deployLocalProtocol, setupLoanParams, openLoans
+
+PAGE_SIZE = 100
+
+def estimate(bzx, method, *args):
+    return web3.eth.estimateGas({ "to": bzx.address, "data": getattr(bzx, method).encode_input(*args) })
+
+def sweepAdvanced(bzx, total):
+    gas = 0
+    found = 0
+    start = time.perf_counter()
+    for page in range(0, total, PAGE_SIZE):
+        found += len(bzx.getActiveLoansAdvanced(page, PAGE_SIZE, False, True))
+        gas += estimate(bzx, "getActiveLoansAdvanced", page, PAGE_SIZE, False, True)
+    return found, gas, time.perf_counter() - start
+
+def sweepCursor(bzx, total):
+    gas = 0
+    found = 0
+    cursor = 0
+    start = time.perf_counter()
+    while cursor < total:
+        gas += estimate(bzx, "getLiquidatableLoans", cursor, PAGE_SIZE)
+        loans, cursor = bzx.getLiquidatableLoans(cursor, PAGE_SIZE)
+        found += len(loans)
+    return found, gas, time.perf_counter() - start
+
+def main(loanCount=200):
+    loanCount = int(loanCount)
+    deployment = deployLocalProtocol()
+    bzx = deployment.bzx
+    tokens = deployment.tokens
+
+    loanParamsId = setupLoanParams(bzx, tokens.dai, tokens.link)
+    openLoans(bzx, tokens.dai, tokens.link, loanParamsId, loanCount // 2, initialMargin=50e18)
+    openLoans(bzx, tokens.dai, tokens.link, loanParamsId, loanCount - loanCount // 2, initialMargin=100e18)
+
+    # LINK drops 30%: loans opened at 50% margin fall below maintenance margin, those at 100% don't
+    deployment.priceFeeds.setRates(tokens.link, tokens.dai, 7e18)
+
+    total = bzx.getActiveLoansCount()
+    for name, sweep in [("getActiveLoansAdvanced", sweepAdvanced), ("getLiquidatableLoans", sweepCursor)]:
+        found, gas, elapsed = sweep(bzx, total)
+        print(name)
+        print("  loans scanned       ", total)
+        print("  liquidatable found  ", found)
+        print("  gas (all pages)     ", gas)
+        print("  gas per loan        ", gas // total)
+        print("  wall time (s)       ", round(elapsed, 3))
@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/liquidate_batch
+#
+# Gas per liquidated loan with liquidateBatch at batch sizes 1, 10 and 50,
+# compared with calling liquidate once per loan.
+# The batch of 50 needs the development network's block gas limit; raise
+# networks.development.cmd_settings.gas_limit in brownie-config.yaml if it doesn't fit.
+
+from brownie import *
+from scripts.benchmarks.loan_book import deployLocalProtocol, setupLoanParams, openLoans
+
+BATCH_SIZES = [1, 10, 50]
+
+def liquidationScenario(size):
+    chain.snapshot()
+    deployment = deployLocalProtocol()
+    bzx = deployment.bzx
+    tokens = deployment.tokens
+
+    loanParamsId = setupLoanParams(bzx, tokens.dai, tokens.link)
+    loanIds = openLoans(bzx, tokens.dai, tokens.link, loanParamsId, size)
+    deployment.priceFeeds.setRates(tokens.link, tokens.dai, 7e18)
+
+    liquidator = accounts[3]
+    tokens.dai.mint(liquidator, 1e30, { "from": accounts[0] })
+    tokens.dai.approve(bzx, 1e30, { "from": liquidator })
+    return bzx, loanIds, liquidator
+
+def main():
+    print("batch size, liquidate gas/loan, liquidateBatch gas/loan")
+    for size in BATCH_SIZES:
+        bzx, loanIds, liquidator = liquidationScenario(size)
+        singleGas = 0
+        for loanId in loanIds:
+            singleGas += bzx.liquidate(loanId, liquidator, 1e30, { "from": liquidator }).gas_used
+        chain.revert()
+
+        bzx, loanIds, liquidator = liquidationScenario(size)
+        tx = bzx.liquidateBatch(loanIds, liquidator, [1e30] * size, { "from": liquidator })
+        assert(len(tx.events["Liquidate"]) == size)
+        chain.revert()
+
+        print(size, singleGas // size, tx.gas_used // size)
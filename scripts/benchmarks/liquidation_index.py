@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/liquidation_index
+#
+# Compares finding liquidatable loans after a price move with the
+# LiquidationPriceIndex bisect against re-evaluating every loan, which is
+# what getActiveLoansAdvanced(..., isLiquidatable=true) does on-chain.
+# Pass the protocol address to also time the on-chain scan of a deployed loan book:
+#   brownie run benchmarks/liquidation_index main <bzxAddress>
+
+import random
+import time
+from brownie import Contract, interface
+from offchain.liquidation_index import LiquidationPriceIndex
+from offchain.margin_engine import LoanBook, RateTable, computeMargins
+
+LOAN_TOKEN = "0x0000000000000000000000000000000000000001"
+COLLATERAL_TOKEN = "0x0000000000000000000000000000000000000002"
+
+def syntheticBook(count, seed=0):
+    rng = random.Random(seed)
+    principal = [rng.randint(10**18, 10**24) for i in range(count)]
+    # collateral worth 115% - 300% of principal at a rate of 10
+    collateral = [p * rng.randint(115, 300) // 1000 for p in principal]
+    return LoanBook(
+        ["0x%064x" % i for i in range(count)],
+        [LOAN_TOKEN] * count,
+        [COLLATERAL_TOKEN] * count,
+        principal,
+        collateral,
+        [15 * 10**18] * count,
+        [7 * 10**18] * count
+    )
+
+def timeit(fn, repeat=5):
+    start = time.perf_counter()
+    for i in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+def benchmark(count):
+    book = syntheticBook(count)
+    oldRate = 10 * 10**18
+    newRate = 9 * 10**18
+    rates = RateTable({ (COLLATERAL_TOKEN, LOAN_TOKEN): (newRate, 10**18) })
+
+    start = time.perf_counter()
+    index = LiquidationPriceIndex()
+    for i in range(count):
+        index.update(book.loanIds[i], LOAN_TOKEN, COLLATERAL_TOKEN, book.principal[i], book.collateral[i], book.maintenanceMargin[i])
+    buildTime = time.perf_counter() - start
+
+    scanTime, result = timeit(lambda: computeMargins(book, rates), repeat=1)
+    bisectTime, liquidatable = timeit(lambda: index.getLiquidatable(LOAN_TOKEN, COLLATERAL_TOKEN, newRate))
+    deltaTime, newlyLiquidatable = timeit(lambda: index.getNewlyLiquidatable(LOAN_TOKEN, COLLATERAL_TOKEN, oldRate, newRate))
+    assert(sorted(liquidatable) == sorted(l for l, s in zip(book.loanIds, result.shouldLiquidate) if s))
+
+    updateTime, _ = timeit(lambda: index.update(book.loanIds[0], LOAN_TOKEN, COLLATERAL_TOKEN, book.principal[0], book.collateral[0] + 1, book.maintenanceMargin[0]), repeat=1)
+
+    print("loans:", count)
+    print("  index build (s)           ", round(buildTime, 4))
+    print("  full margin scan (s)      ", round(scanTime, 4))
+    print("  bisect liquidatable (s)   ", round(bisectTime, 6), len(liquidatable))
+    print("  bisect newly liq. (s)     ", round(deltaTime, 6), len(newlyLiquidatable))
+    print("  incremental update (s)    ", round(updateTime, 6))
+
+def benchmarkChain(bzxAddress):
+    bzx = Contract.from_abi("bzx", address=bzxAddress, abi=interface.IBZx.abi)
+    count = bzx.getActiveLoansCount()
+    start = time.perf_counter()
+    for page in range(0, count, 100):
+        bzx.getActiveLoansAdvanced(page, 100, False, True)
+    print("on-chain getActiveLoansAdvanced scan of", count, "loans (s)", round(time.perf_counter() - start, 4))
+
+def main(bzxAddress=None):
+    for count in [10000, 100000]:
+        benchmark(count)
+    if bzxAddress is not None:
+        benchmarkChain(bzxAddress)
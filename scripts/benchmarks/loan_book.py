@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+
+# Local protocol deployment and loan book used by the benchmark scripts.
+# The deployment mirrors the fixtures in tests/conftest.py.
+
+from brownie import *
+from brownie.network.state import _add_contract
+from munch import Munch
+
+import shared
+
+def deployLocalProtocol(acct=None):
+    if acct is None:
+        acct = accounts[0]
+
+    tokens = Munch()
+    tokens.weth = acct.deploy(TestWeth)
+    tokens.dai = acct.deploy(TestToken, "DAI", "DAI", 18, 1e50)
+    tokens.link = acct.deploy(TestToken, "LINK", "LINK", 18, 1e50)
+
+    feeds = acct.deploy(PriceFeedsLocal)
+    feeds.setRates(tokens.weth, tokens.link, 50e18)
+    feeds.setRates(tokens.weth, tokens.dai, 150e18)
+    feeds.setRates(tokens.link, tokens.dai, 10e18)
+
+    bzxproxy = acct.deploy(bZxProtocol)
+    bzx = Contract.from_abi("bzx", address=bzxproxy.address, abi=interface.IBZx.abi, owner=acct)
+    _add_contract(bzx)
+
+    bzx.replaceContract(acct.deploy(ProtocolSettings).address)
+    bzx.replaceContract(acct.deploy(LoanSettings).address)
+    bzx.replaceContract(acct.deploy(LoanMaintenance).address)
+    bzx.replaceContract(acct.deploy(LoanMaintenance_2).address)
+    bzx.replaceContract(acct.deploy(LoanOpenings).address)
+    bzx.replaceContract(acct.deploy(LoanClosings).address)
+
+    bzx.setPriceFeedContract(feeds.address)
+    bzx.setSwapsImplContract(acct.deploy(SwapsImplTestnets).address)
+
+    return Munch({
+        "bzx": bzx,
+        "priceFeeds": feeds,
+        "tokens": tokens,
+    })
+
+def setupLoanParams(bzx, loanToken, collateralToken, maintenanceMargin=15e18):
+    loanParams = {
+        "id": "0x0",
+        "active": False,
+        "owner": shared.Constants().ZERO_ADDRESS,
+        "loanToken": loanToken.address,
+        "collateralToken": collateralToken.address,
+        "minInitialMargin": 20e18,
+        "maintenanceMargin": maintenanceMargin,
+        "fixedLoanTerm": "0", # torque loan
+    }
+    tx = bzx.setupLoanParams([list(loanParams.values())])
+    return tx.events["LoanParamsIdSetup"][0]["id"]
+
+def openLoans(bzx, loanToken, collateralToken, loanParamsId, count, principal=101e18, initialMargin=50e18):
+    # simulated loan pool, as in tests/helpers.py
+    pool = accounts[1]
+    lender = accounts[2]
+    if bzx.loanPoolToUnderlying(pool) != lender.address:
+        bzx.setLoanPool([pool], [lender])
+
+    collateralTokenSent = bzx.getRequiredCollateral(
+        loanToken,
+        collateralToken,
+        principal,
+        initialMargin,
+        True
+    )
+
+    loanIds = []
+    for i in range(count):
+        loanToken.mint(bzx, 1e18, { "from": accounts[0] }) # escrowed torque interest
+        collateralToken.mint(bzx, collateralTokenSent, { "from": accounts[0] })
+        tx = bzx.borrowOrTradeFromPool(
+            loanParamsId,
+            "0", # loanId - starts a new loan
+            True, # isTorqueLoan
+            initialMargin,
+            [
+                lender, # lender
+                pool, # borrower
+                pool, # receiver
+                shared.Constants().ZERO_ADDRESS, # manager
+            ],
+            [
+                5e18, # newRate (5%)
+                principal, # newPrincipal
+                1e18, # torqueInterest
+                1e18, # loanTokenSent
+                collateralTokenSent # collateralTokenSent
+            ],
+            b'', # loanDataBytes
+            { "from": pool }
+        )
+        loanIds.append(tx.events["Borrow"][0]["loanId"])
+    return loanIds
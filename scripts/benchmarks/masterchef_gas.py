@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/masterchef_gas --network bsc-main-fork
+#
+# Gas of MasterChef_BSC deposit, withdraw and set(_withUpdate = true) with 10,
+# 50 and 200 pools, before and after migrateToLazyRewards. Every pool is a
+# fresh TestToken with deposits so each update mints through the coordinator.
+
+from brownie import *
+
+BGOV = "0xf8E026dC4C0860771f691EcFFBbdfe2fa51c77CF"
+COORDINATOR = "0x68d57B33Fe3B691Ef96dFAf19EC8FA794899f2ac"
+AMOUNT = 10**18
+
+def deployMasterChef(poolCount, user):
+    masterChefImpl = accounts[0].deploy(MasterChef_BSC)
+    masterChefProxy = accounts[0].deploy(Proxy, masterChefImpl)
+    masterChef = Contract.from_abi("masterChef", address=masterChefProxy, abi=MasterChef_BSC.abi, owner=accounts[0])
+    masterChef.initialize(BGOV, accounts[0], 25 * 10**18, chain.height, chain.height)
+    masterChef.togglePause(False)
+
+    coordinator = Contract.from_abi("coordinator", address=COORDINATOR, abi=MintCoordinator.abi)
+    coordinator.addMinter(masterChef, {"from": coordinator.owner()})
+
+    for i in range(poolCount):
+        lpToken = accounts[0].deploy(TestToken, "LP" + str(i), "LP" + str(i), 18, 0)
+        lpToken.mint(user, AMOUNT * 10)
+        lpToken.approve(masterChef, 2**256-1, {"from": user})
+        masterChef.add(100, lpToken, False)
+        masterChef.deposit(i, AMOUNT, {"from": user})
+    return masterChef
+
+def measure(masterChef, user, pid):
+    chain.mine(10)
+    deposit = masterChef.deposit(pid, AMOUNT, {"from": user}).gas_used
+    chain.mine(10)
+    withdraw = masterChef.withdraw(pid, AMOUNT, {"from": user}).gas_used
+    chain.mine(10)
+    setGas = masterChef.set(pid, 200, True).gas_used
+    return deposit, withdraw, setGas
+
+def main():
+    user = accounts[1]
+    print("{:>6} {:>8} {:>10} {:>10} {:>10}".format("pools", "mode", "deposit", "withdraw", "set"))
+    for poolCount in [10, 50, 200]:
+        masterChef = deployMasterChef(poolCount, user)
+        pid = poolCount // 2
+        print("{:>6} {:>8} {:>10} {:>10} {:>10}".format(poolCount, "legacy", *measure(masterChef, user, pid)))
+
+        masterChef.migrateToLazyRewards()
+        print("{:>6} {:>8} {:>10} {:>10} {:>10}".format(poolCount, "lazy", *measure(masterChef, user, pid + 1)))
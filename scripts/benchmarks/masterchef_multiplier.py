@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/masterchef_multiplier
+# brownie run benchmarks/masterchef_multiplier --network polygon-main-fork
+#
+# Gas of MasterChef_Polygon getMultiplierPrecise and getPendingGOV for block
+# ranges inside the bonus period, across its end and after it (the last two need
+# a chain longer than the bonus period, ex: a fork). On a polygon fork
+# the live proxy is upgraded and updatePool is measured too, since it mints
+# through the coordinator. Run it again with the previous MasterChef_Polygon.sol
+# for the before numbers.
+
+from brownie import *
+
+BONUS_PERIOD_BLOCKS = 1296000
+MASTERCHEF_PROXY = "0xd39Ff512C3e55373a30E94BB1398651420Ae1D43"
+
+def deployLocal(poolCount):
+    masterChef = accounts[0].deploy(MasterChef_Polygon)
+    masterChef.initialize(accounts[9], accounts[0], 10**18, 0)
+    user = accounts[1]
+    for i in range(poolCount):
+        lpToken = accounts[0].deploy(TestToken, "LP" + str(i), "LP" + str(i), 18, 0)
+        lpToken.mint(user, 10**18)
+        lpToken.approve(masterChef, 2**256-1, {"from": user})
+        masterChef.add(100, lpToken, False)
+        # the first deposit of a pool mints nothing
+        masterChef.deposit(i, 10**18, {"from": user})
+    return masterChef, user
+
+def scenarios(lastRewardBlock):
+    # startBlock per scenario, so that [lastRewardBlock, now] falls in that part of the schedule
+    return [
+        ("bonus", lastRewardBlock - 10),
+        ("crossing", lastRewardBlock - BONUS_PERIOD_BLOCKS + 5),
+        ("after", lastRewardBlock - 2 * BONUS_PERIOD_BLOCKS),
+    ]
+
+def main(poolCount=20, blocks=1000):
+    poolCount = int(poolCount)
+    blocks = int(blocks)
+
+    masterChef, user = deployLocal(poolCount)
+    chain.mine(blocks)
+    lastRewardBlock = min(masterChef.poolInfo(i)[2] for i in range(poolCount))
+    print("{:>10} {:>22} {:>14}".format("range", "getMultiplierPrecise", "getPendingGOV"))
+    for name, startBlock in scenarios(lastRewardBlock):
+        if startBlock < 0:
+            # a fresh local chain is too short, run on a fork
+            print("{:>10} {:>22}".format(name, "n/a"))
+            continue
+        masterChef.setStartBlock(startBlock)
+        multiplierGas = masterChef.getMultiplierPrecise.estimate_gas(lastRewardBlock, chain.height)
+        pendingGas = masterChef.getPendingGOV.estimate_gas(user)
+        print("{:>10} {:>22} {:>14}".format(name, multiplierGas, pendingGas))
+
+    if network.show_active().find("-fork") >= 0:
+        updatePoolGas(blocks)
+
+def updatePoolGas(blocks):
+    masterChefProxy = Contract.from_abi("masterChefProxy", address=MASTERCHEF_PROXY, abi=Proxy.abi)
+    owner = masterChefProxy.owner()
+    masterChefProxy.replaceImplementation(MasterChef_Polygon.deploy({"from": owner}), {"from": owner})
+    masterChef = Contract.from_abi("masterChef", address=MASTERCHEF_PROXY, abi=MasterChef_Polygon.abi)
+
+    gas = []
+    for pid in range(masterChef.poolLength()):
+        if masterChef.balanceOf(pid) == 0:
+            continue
+        masterChef.updatePool(pid, {"from": owner})
+        chain.mine(blocks)
+        gas.append(masterChef.updatePool(pid, {"from": owner}).gas_used)
+    print("updatePool after {} blocks: avg gas {}  min {}  max {}".format(blocks, sum(gas) // len(gas), min(gas), max(gas)))
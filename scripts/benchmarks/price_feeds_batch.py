@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/price_feeds_batch
+#
+# Gas of pricing N pairs with one queryRate call per pair, compared with a
+# single queryRates call, on a PriceFeeds reading FixedPriceFeed oracles.
+# Pairs are drawn from a small token set, as in a loan book where many loans
+# share the same loan and collateral tokens.
+
+import random
+from brownie import *
+
+PAIR_COUNTS = [10, 50, 200]
+TOKEN_COUNT = 8
+
+def estimate(contract, method, *args):
+    return web3.eth.estimateGas({ "to": contract.address, "data": getattr(contract, method).encode_input(*args) })
+
+def deployFeeds(acct):
+    feeds = acct.deploy(PriceFeeds)
+    tokens = []
+    oracles = []
+    for i in range(TOKEN_COUNT):
+        token = acct.deploy(TestToken, "TKN" + str(i), "TKN" + str(i), 18, 1e50)
+        oracle = acct.deploy(FixedPriceFeed)
+        oracle.setLatestAnswer((i + 1) * 1e16)
+        tokens.append(token.address)
+        oracles.append(oracle.address)
+    feeds.setPriceFeed(tokens, oracles)
+    feeds.setDecimals(tokens)
+    return feeds, tokens
+
+def main():
+    feeds, tokens = deployFeeds(accounts[0])
+    random.seed(0)
+
+    for count in PAIR_COUNTS:
+        pairs = [random.sample(tokens, 2) for i in range(count)]
+        sourceTokens = [p[0] for p in pairs]
+        destTokens = [p[1] for p in pairs]
+
+        singleGas = sum(estimate(feeds, "queryRate", s, d) for s, d in pairs)
+        batchGas = estimate(feeds, "queryRates", sourceTokens, destTokens)
+
+        print("pairs", count)
+        print("  queryRate x N  ", singleGas)
+        print("  queryRates     ", batchGas)
+        print("  saved          ", "{:.1%}".format(1 - batchGas / singleGas))
@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/price_replay
+# brownie run benchmarks/price_replay main 200 prices.csv
+#
+# Replays a LINK price path against a local loan book and reports, per step,
+# how many loans became liquidatable and how long the local pipeline
+# (getLiquidatableLoans sweep + liquidateBatch) took to clear them.
+# The default path is a 40% crash over 5 steps. A CSV with LINK, DAI and WETH
+# columns (prices in ETH, one row per step) can be passed instead.
+
+from brownie import *
+from scripts.benchmarks.loan_book import deployLocalProtocol, setupLoanParams, openLoans
+from offchain.price_replay import PriceReplay, crashSeries, loadPriceSeries, replayLiquidations, toWei
+
+STEPS = 15
+INITIAL_MARGINS = [30e18, 50e18, 70e18, 100e18]
+
+def main(loanCount=100, pricesPath=None):
+    loanCount = int(loanCount)
+    deployment = deployLocalProtocol()
+    bzx = deployment.bzx
+    tokens = deployment.tokens
+
+    if pricesPath is None:
+        series = {
+            "LINK": crashSeries("0.1", "0.4", 5, STEPS),
+            "DAI": [toWei("0.01")] * STEPS,
+            "WETH": [toWei(1)] * STEPS,
+        }
+    else:
+        series = loadPriceSeries(pricesPath)
+
+    replay = PriceReplay.deploy(
+        deployment.priceFeeds,
+        PriceFeedReplayMock,
+        {
+            tokens.link.address: series["LINK"],
+            tokens.dai.address: series["DAI"],
+            tokens.weth.address: series["WETH"],
+        },
+        accounts[0]
+    )
+
+    loanParamsId = setupLoanParams(bzx, tokens.dai, tokens.link)
+    for i, initialMargin in enumerate(INITIAL_MARGINS):
+        count = loanCount // len(INITIAL_MARGINS) + (1 if i < loanCount % len(INITIAL_MARGINS) else 0)
+        openLoans(bzx, tokens.dai, tokens.link, loanParamsId, count, initialMargin=initialMargin)
+
+    liquidator = accounts[3]
+    tokens.dai.mint(liquidator, 1e30, { "from": accounts[0] })
+    tokens.dai.approve(bzx, 1e30, { "from": liquidator })
+
+    reports = replayLiquidations(replay, bzx, liquidator)
+
+    print("step  LINK/DAI  liquidatable  liquidated  scan (s)  liquidate (s)  gas")
+    for report, linkPrice, daiPrice in zip(reports, series["LINK"], series["DAI"]):
+        print("{:>4}  {:>8.3f}  {:>12}  {:>10}  {:>8.3f}  {:>13.3f}  {}".format(
+            report.step,
+            linkPrice / daiPrice,
+            report.liquidatable,
+            report.liquidated,
+            report.scanSeconds,
+            report.liquidateSeconds,
+            report.gasUsed
+        ))
+    print("total liquidated", sum(r.liquidated for r in reports), "of", loanCount)
@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/staking_batch_views
+#
+# Time to read balanceOfByAssets, balanceOfStored and earned for 100 and 1000
+# stakers of a local StakingV1 proxy, one eth_call per account and view,
+# compared with the batched views paged by batchSize accounts.
+
+import random
+import time
+from brownie import *
+
+SETUP_BATCH = 100
+
+def deployStaking(stakers, rng):
+    proxy = accounts[0].deploy(StakingProxy, accounts[0].deploy(StakingV1Mock))
+    staking = Contract.from_abi("staking", address=proxy.address, abi=StakingV1Mock.abi, owner=accounts[0])
+    staking.setPerTokenStored(10**36, 10**35)
+    staking.setWeightsStored(2 * 10**17, 12 * 10**17, 3 * 10**18)
+    for i in range(0, len(stakers), SETUP_BATCH):
+        batch = stakers[i:i + SETUP_BATCH]
+        for token in [staking.BZRX(), staking.iBZRX(), staking.vBZRX(), staking.LPToken()]:
+            staking.setBalances(token, batch, [rng.randrange(10**24) for a in batch])
+        staking.setRewardsPerTokenPaid(batch, [rng.randrange(10**36) for a in batch], [rng.randrange(10**35) for a in batch])
+        staking.setVesting(batch, [rng.randrange(10**22) for a in batch], [rng.randrange(10**22) for a in batch], [rng.randrange(1610416800, 1720792800) for a in batch])
+    return staking
+
+def main(batchSize=200):
+    batchSize = int(batchSize)
+    rng = random.Random(1)
+    allStakers = [web3.toChecksumAddress("0x" + "%040x" % rng.getrandbits(160)) for i in range(1000)]
+    staking = deployStaking(allStakers, rng)
+
+    for count in [100, 1000]:
+        stakers = allStakers[:count]
+
+        start = time.perf_counter()
+        for account in stakers:
+            staking.balanceOfByAssets(account)
+            staking.balanceOfStored(account)
+            staking.earned(account)
+        singleSeconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        calls = 0
+        for i in range(0, count, batchSize):
+            batch = stakers[i:i + batchSize]
+            staking.balanceOfByAssetsBatch(batch)
+            staking.balanceOfStoredBatch(batch)
+            staking.earnedBatch(batch)
+            calls += 3
+        batchSeconds = time.perf_counter() - start
+
+        print("accounts {:>5}  per-account {:>5} calls {:>8.3f}s  batched {:>3} calls {:>8.3f}s  speedup {:>6.1f}x".format(
+            count, 3 * count, singleSeconds, calls, batchSeconds, singleSeconds / batchSeconds
+        ))
+        print("  earnedBatch gas for {} accounts: {}".format(
+            min(batchSize, count), staking.earnedBatch.estimate_gas(stakers[:batchSize])
+        ))
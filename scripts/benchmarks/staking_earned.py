@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/staking_earned
+#
+# Time to refresh StakingV1.earned for every staker with one eth_call per account,
+# compared with the offline calculator: one snapshot, then a vectorized pass per refresh.
+
+import random
+import time
+from brownie import *
+from offchain.staking_rewards import StakerRewardsCalculator
+
+BATCH_SIZE = 100
+
+def main(stakerCount=1000, refreshes=5):
+    stakerCount, refreshes = int(stakerCount), int(refreshes)
+    rng = random.Random(1)
+    staking = accounts[0].deploy(StakingV1Mock)
+    stakers = [web3.toChecksumAddress("0x" + "%040x" % rng.getrandbits(160)) for i in range(stakerCount)]
+
+    staking.setPerTokenStored(10**36, 10**35)
+    staking.setWeightsStored(2 * 10**17, 12 * 10**17, 3 * 10**18)
+    for i in range(0, stakerCount, BATCH_SIZE):
+        batch = stakers[i:i + BATCH_SIZE]
+        for token in [staking.BZRX(), staking.iBZRX(), staking.vBZRX(), staking.LPToken()]:
+            staking.setBalances(token, batch, [rng.randrange(10**24) for a in batch])
+        staking.setRewardsPerTokenPaid(batch, [rng.randrange(10**36) for a in batch], [rng.randrange(10**35) for a in batch])
+        staking.setVesting(batch, [rng.randrange(10**22) for a in batch], [rng.randrange(10**22) for a in batch], [rng.randrange(1610416800, 1720792800) for a in batch])
+
+    start = time.perf_counter()
+    onChain = [staking.earned(account) for account in stakers]
+    rpcSeconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    calculator = StakerRewardsCalculator(staking)
+    calculator.bootstrap(stakers)
+    snapshotSeconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(refreshes):
+        calculator.sync()
+        earned = calculator.earned(chain.time())
+    refreshSeconds = (time.perf_counter() - start) / refreshes
+
+    mismatches = sum(1 for i, e in enumerate(onChain) if e != (
+        earned.bzrxRewardsEarned[i],
+        earned.stableCoinRewardsEarned[i],
+        earned.bzrxRewardsVesting[i],
+        earned.stableCoinRewardsVesting[i]
+    ))
+
+    print("stakers                   ", stakerCount)
+    print("earned eth_calls (s)      ", round(rpcSeconds, 3))
+    print("calculator snapshot (s)   ", round(snapshotSeconds, 3))
+    print("calculator refresh (s)    ", round(refreshSeconds, 4))
+    print("mismatches                ", mismatches)
@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/staking_gas
+#
+# Gas of the StakingV1 paths that run updateRewards: stake, unstake and claim,
+# on a local StakingV1Mock. The mainnet token addresses hold no code locally,
+# so stake and unstake move zero amounts and claim restakes, which skips the
+# token transfers and leaves the reward settlement. Run it again with the
+# previous StakingV1.sol for the before numbers.
+
+import random
+from brownie import *
+
+VESTING_CLIFF_TIMESTAMP = 1610416800
+VESTING_END_TIMESTAMP = 1720792800
+
+def setState(staking, account, rng, stableCoin=True):
+    staking.setBalances(staking.BZRX(), [account], [rng.randrange(10**24)])
+    staking.setBalances(staking.vBZRX(), [account], [rng.randrange(10**24)])
+    staking.setBalances(staking.iBZRX(), [account], [rng.randrange(10**24)])
+    staking.setRewardsPerTokenPaid([account], [rng.randrange(10**35)], [rng.randrange(10**34) if stableCoin else 10**34])
+    staking.setRewards([account], [rng.randrange(10**21)], [rng.randrange(10**21) if stableCoin else 0])
+    staking.setVesting(
+        [account],
+        [rng.randrange(10**21)],
+        [rng.randrange(10**21) if stableCoin else 0],
+        [rng.randrange(VESTING_CLIFF_TIMESTAMP, VESTING_END_TIMESTAMP)]
+    )
+
+def main(samples=5):
+    samples = int(samples)
+    rng = random.Random(1)
+    staking = accounts[0].deploy(StakingV1Mock)
+    staking.setPerTokenStored(10**35, 10**34)
+    staking.setWeightsStored(2 * 10**17, 12 * 10**17, 3 * 10**18)
+    BZRX = staking.BZRX()
+
+    gas = {"stake": [], "unstake": [], "claim": []}
+    for i in range(samples):
+        account = accounts[1 + i % 9]
+
+        setState(staking, account, rng)
+        gas["stake"].append(staking.stake([BZRX], [0], {"from": account}).gas_used)
+
+        setState(staking, account, rng)
+        gas["unstake"].append(staking.unstake([BZRX], [0], {"from": account}).gas_used)
+
+        # claim(true) restakes BZRX; no 3Crv rewards so nothing is transferred
+        setState(staking, account, rng, stableCoin=False)
+        gas["claim"].append(staking.claim(True, {"from": account}).gas_used)
+
+    for name, values in gas.items():
+        print("{:<8} avg gas {:>8}  min {:>8}  max {:>8}".format(name, sum(values) // len(values), min(values), max(values)))
@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/swap_routes --network mainnet-fork
+#
+# Output and gas of large exact-in swaps through SwapsImplUniswapV2_ETH with the
+# default single path, compared with split routing over the two best paths.
+
+from brownie import *
+
+PAIRS = [
+    ("0x514910771AF9Ca656af840dff83E8264EcF986CA", "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"), # LINK -> USDC
+    ("0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599", "0x6B175474E89094C44Da98b954EedeAC495271d0F"), # WBTC -> DAI
+]
+
+def quote(swaps, sourceToken, destToken, amounts):
+    results = []
+    for amount in amounts:
+        results.append(swaps.dexAmountOutWithSplit(sourceToken, destToken, amount))
+    gas = [swaps.dexAmountOutWithSplit.estimate_gas(sourceToken, destToken, amount) for amount in amounts]
+    return results, gas
+
+def main(steps=4):
+    steps = int(steps)
+    swaps = accounts[0].deploy(SwapsImplUniswapV2_ETH)
+
+    for sourceToken, destToken in PAIRS:
+        decimals = Contract.from_abi("token", sourceToken, TestToken.abi).decimals()
+        amounts = [10**(decimals + 2 + i) for i in range(steps)] # 100 units and up, x10 per step
+
+        swaps.setSplitRouting(False, {"from": accounts[0]})
+        single, singleGas = quote(swaps, sourceToken, destToken, amounts)
+        swaps.setSplitRouting(True, {"from": accounts[0]})
+        split, splitGas = quote(swaps, sourceToken, destToken, amounts)
+
+        print(sourceToken, "->", destToken)
+        for i, amount in enumerate(amounts):
+            gain = (split[i][0] - single[i][0]) * 10000 // single[i][0] if single[i][0] != 0 else 0
+            print("  amountIn {:>32}  single {:>32}  split {:>32}  gain (bps) {:>5}  quote gas {:>8} / {:>8}".format(
+                amount, single[i][0], split[i][0], gain, singleGas[i], splitGas[i]
+            ))
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+
+# brownie run benchmarks/uniswap_quotes --network mainnet-fork
+#
+# Time to quote a ladder of amounts for a few token pairs with
+# SwapsImplUniswapV2_ETH.dexAmountOut eth_calls, compared with the offline
+# quote engine (reserves loaded once, then one vectorized call per pair).
+
+import time
+from brownie import *
+from offchain.uniswap_quotes import PairReserves, UniswapV2QuoteEngine, getConnector
+
+PAIRS = [
+    ("0x514910771AF9Ca656af840dff83E8264EcF986CA", "0x6B175474E89094C44Da98b954EedeAC495271d0F"), # LINK -> DAI
+    ("0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599", "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"), # WBTC -> USDC
+    ("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", "0xdAC17F958D2ee523a2206206994597C13D831ec7"), # WETH -> USDT
+]
+
+def main(ladderSize=50):
+    ladderSize = int(ladderSize)
+    swaps = accounts[0].deploy(SwapsImplUniswapV2_ETH)
+
+    ladders = {}
+    for sourceToken, destToken in PAIRS:
+        decimals = Contract.from_abi("token", sourceToken, TestToken.abi).decimals()
+        ladders[(sourceToken, destToken)] = [(i + 1) * 10**decimals for i in range(ladderSize)]
+
+    start = time.perf_counter()
+    onChain = {}
+    for pair, amounts in ladders.items():
+        onChain[pair] = [swaps.dexAmountOut(pair[0], pair[1], amount) for amount in amounts]
+    rpcSeconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    connector = getConnector("ETH", swaps)
+    engine = UniswapV2QuoteEngine(connector, PairReserves.fromConnector(connector))
+    for pair in ladders:
+        engine.dexAmountsOut(pair[0], pair[1], [1])
+    loadSeconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    offline = {}
+    for pair, amounts in ladders.items():
+        offline[pair] = engine.dexAmountsOut(pair[0], pair[1], amounts)
+    engineSeconds = time.perf_counter() - start
+
+    mismatches = 0
+    for pair, quotes in onChain.items():
+        amountsOut, midTokens = offline[pair]
+        mismatches += sum(1 for i, q in enumerate(quotes) if q != (amountsOut[i], midTokens[i]))
+
+    quotes = ladderSize * len(PAIRS)
+    print("quotes                    ", quotes)
+    print("dexAmountOut eth_call (s) ", round(rpcSeconds, 3))
+    print("engine reserve load (s)   ", round(loadSeconds, 3))
+    print("engine quotes (s)         ", round(engineSeconds, 4))
+    print("mismatches                ", mismatches)
@@ -7,6 +7,24 @@ from brownie.network.state import _add_contract, _remove_contract
 import shared
 from munch import Munch
 
+MAINNET_ITOKENS = {
+    "DAI": "0x6b093998d36f2c7f0cc359441fbb24cc629d5ff0", # iDAI
+    "ETH": "0xb983e01458529665007ff7e0cddecdb74b967eb6", # iETH
+    "USDC": "0x32e4c68b3a4a813b710595aeba7f6b7604ab9c15", # iUSDC
+    "WBTC": "0x2ffa85f655752fb2acb210287c60b9ef335f5b6e", # iWBTC
+    "KNC": "0x687642347a9282be8fd809d8309910a3f984ac5a", # iKNC
+    "MKR": "0x9189c499727f88f8ecc7dc4eea22c828e6aac015", # iMKR
+    "BZRX": "0x18240bd9c07fa6156ce3f3f61921cc82b2619157", # iBZRX
+    "LINK": "0x463538705e7d22aa7f03ebf8ab09b067e1001b54", # iLINK
+    "YFI": "0x7f3fe9d492a9a60aebb06d82cba23c6f32cad10b", # iYFI
+    "USDT": "0x7e9997a38a439b2be7ed9c9c4628391d3e055d48", # iUSDT
+    "UNI": "0x0a625FceC657053Fe2D9FFFdeb1DBb4e412Cf8A8", # iUNI
+    "AAVE": "0x0cae8d91E0b1b7Bd00D906E990C3625b2c220db1", # iAAVE
+    "COMP": "0x6d29903BC2c4318b59B35d97Ab98ab9eC08Ed70D", # iCOMP
+    "LRC": "0x3dA0e01472Dee3746b4D324a65D7EdFaECa9Aa4f", # iLRC
+    "BNB": "0x88183Ec0054F40D344e40EC934D5a9E2749a61d4", # iBNB
+}
+
 '''deploys = Munch.fromDict({
     "bZxProtocol": True,
     "PriceFeeds": True,
@@ -74,23 +92,7 @@ def main():
 
     elif thisNetwork == "mainnet" or thisNetwork == "mainnet-fork":
 
-        itokens = {
-            "DAI": "0x6b093998d36f2c7f0cc359441fbb24cc629d5ff0", # iDAI
-            "ETH": "0xb983e01458529665007ff7e0cddecdb74b967eb6", # iETH
-            "USDC": "0x32e4c68b3a4a813b710595aeba7f6b7604ab9c15", # iUSDC
-            "WBTC": "0x2ffa85f655752fb2acb210287c60b9ef335f5b6e", # iWBTC
-            "KNC": "0x687642347a9282be8fd809d8309910a3f984ac5a", # iKNC
-            "MKR": "0x9189c499727f88f8ecc7dc4eea22c828e6aac015", # iMKR
-            "BZRX": "0x18240bd9c07fa6156ce3f3f61921cc82b2619157", # iBZRX
-            "LINK": "0x463538705e7d22aa7f03ebf8ab09b067e1001b54", # iLINK
-            "YFI": "0x7f3fe9d492a9a60aebb06d82cba23c6f32cad10b", # iYFI
-            "USDT": "0x7e9997a38a439b2be7ed9c9c4628391d3e055d48", # iUSDT
-            "UNI": "0x0a625FceC657053Fe2D9FFFdeb1DBb4e412Cf8A8", # iUNI
-            "AAVE": "0x0cae8d91E0b1b7Bd00D906E990C3625b2c220db1", # iAAVE
-            "COMP": "0x6d29903BC2c4318b59B35d97Ab98ab9eC08Ed70D", # iCOMP
-            "LRC": "0x3dA0e01472Dee3746b4D324a65D7EdFaECa9Aa4f", # iLRC
-            "BNB": "0x88183Ec0054F40D344e40EC934D5a9E2749a61d4", # iBNB
-        }
+        itokens = MAINNET_ITOKENS
 
         tokens = {
             "DAI": "0x6b175474e89094c44da98b954eedeac495271d0f", # DAI
@@ -0,0 +1,30 @@
+#!/usr/bin/python3
+
+# brownie run sync_itoken_profits main <statePath> <fromBlock> --network mainnet
+#
+# Syncs the profit checkpoints of every holder of the mainnet iTokens into
+# statePath, starting at fromBlock on the first run and at the last synced block
+# after that, and prints the realized and unrealized profit totals per iToken.
+
+import os
+from brownie import *
+from offchain.itoken_profits import ProfitTracker
+from scripts.setup_pool_params2 import MAINNET_ITOKENS
+
+def main(statePath="itoken_profits.json", fromBlock=0):
+    iTokens = [Contract.from_abi("i" + symbol, address=address, abi=LoanTokenLogicStandard.abi) for symbol, address in MAINNET_ITOKENS.items()]
+    tracker = ProfitTracker(iTokens)
+    if os.path.exists(statePath):
+        tracker.load(statePath)
+
+    print("Events applied:", tracker.sync(fromBlock=int(fromBlock)))
+    tracker.save(statePath)
+
+    for iToken in iTokens:
+        profits = tracker.profits(iToken)
+        print("{:<8} users {:>7}  realized {:>32}  unrealized {:>32}".format(
+            iToken._name,
+            len(profits),
+            sum(realized for realized, unrealized in profits.values()),
+            sum(unrealized for realized, unrealized in profits.values())
+        ))
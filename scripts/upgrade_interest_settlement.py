@@ -0,0 +1,42 @@
+#!/usr/bin/python3
+
+# brownie run upgrade_interest_settlement main <bzxAddress> --network mainnet-fork
+#
+# Replaces the modules that settle lender interest. Existing LenderInterest and
+# LoanInterest records keep their meaning, LenderInterest.pendingTotal starts at
+# zero and the first settlement after the upgrade pays from updatedTimestamp as
+# before, so no record is rewritten. LoanMaintenance goes first so that
+# withdrawAccruedInterest pays pendingTotal before any module can defer interest
+# into it. Every loan pool's getLenderInterestData is compared before and after.
+
+from brownie import *
+
+def getLenderInterest(bzx):
+    lenderInterest = {}
+    start = 0
+    while True:
+        pools = bzx.getLoanPoolsList(start, 50)
+        if len(pools) == 0:
+            break
+        for pool in pools:
+            lenderInterest[pool] = bzx.getLenderInterestData(pool, bzx.loanPoolToUnderlying(pool))
+        start += len(pools)
+    return lenderInterest
+
+def main(bzxAddress="0xD8Ee69652E4e4838f2531732a46d1f7F584F0b7f", acct=None):
+    if acct is None:
+        acct = accounts[0]
+
+    bzx = Contract.from_abi("bzx", address=bzxAddress, abi=interface.IBZx.abi, owner=acct)
+    before = getLenderInterest(bzx)
+
+    for module in [LoanMaintenance, LoanOpenings, LoanClosings, LoanClosingsWithGasToken]:
+        print("Calling replaceContract.", module._name)
+        bzx.replaceContract(acct.deploy(module).address, {"from": acct})
+
+    after = getLenderInterest(bzx)
+    for pool, data in before.items():
+        # interestPaid, interestPaidDate, interestOwedPerDay, interestUnPaid, interestFeePercent, principalTotal
+        if data[:3] != after[pool][:3] or data[4:] != after[pool][4:] or after[pool][3] < data[3]:
+            print("  changed:", pool, data, after[pool])
+    print("Loan pools checked:", len(before))
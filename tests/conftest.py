@@ -4,6 +4,41 @@ import pytest
 from brownie import Contract, network
 from brownie.network.contract import InterfaceContainer
 from brownie.network.state import _add_contract, _remove_contract
+from deploymentcache import loadOrDeploy
+from sharding import DurationRecorder, DurationScheduling, isMaster, isWorker, loadDurations, mergeGasProfiles, removeGasProfiles, saveGasProfile
+
+durations = DurationRecorder()
+
+# brownie test tests/ -n 4, see sharding.py
+@pytest.hookimpl(tryfirst=True)
+def pytest_xdist_make_scheduler(config, log):
+    return DurationScheduling(config, log, loadDurations())
+
+def pytest_sessionstart(session):
+    if isMaster(session.config):
+        removeGasProfiles()
+
+def pytest_runtest_logreport(report):
+    durations.add(report)
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if isWorker(config):
+        if config.getoption("gas", False):
+            saveGasProfile(config.workerinput["workerid"])
+    else:
+        durations.save()
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not isMaster(config):
+        return
+    if config.getoption("gas", False):
+        terminalreporter.section("Gas Profile")
+        for line in mergeGasProfiles():
+            terminalreporter.write_line(line)
+    terminalreporter.section("Sharding")
+    for line in durations.summary(config.option.numprocesses):
+        terminalreporter.write_line(line)
 
 @pytest.fixture(scope="module")
 def Constants():
@@ -13,74 +48,89 @@ def Constants():
         "MAX_UINT": "0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff"
     }
 
-@pytest.fixture(scope="module")
-def DAI(accounts, TestToken):
-    return accounts[0].deploy(TestToken, "DAI", "DAI", 18, 1e50)
+# deployed once per session, every module starts from this state, see deploymentcache.py
+@pytest.fixture(scope="session", autouse=True)
+def deployment(accounts,
+    interface,
+    TestToken,
+    TestWeth,
+    PriceFeedsLocal,
+    SwapsImplTestnets,
+    bZxProtocol,
+    ProtocolSettings,
+    LoanSettings,
+    LoanMaintenance,
+    LoanOpenings,
+    LoanClosings):
+    owner = accounts[0]
+    modules = [ProtocolSettings, LoanSettings, LoanMaintenance, LoanOpenings, LoanClosings]
+    # LoanClosingsWithGasToken disable for now so that coverage works
 
-@pytest.fixture(scope="module")
-def LINK(accounts, TestToken):
-    return accounts[0].deploy(TestToken, "LINK", "LINK", 18, 1e50)
+    def deployProtocol():
+        DAI = owner.deploy(TestToken, "DAI", "DAI", 18, 1e50)
+        LINK = owner.deploy(TestToken, "LINK", "LINK", 18, 1e50)
+        WETH = owner.deploy(TestWeth)
 
-@pytest.fixture(scope="module")
-def WETH(accounts, TestToken, TestWeth):
-    return accounts[0].deploy(TestWeth)
+        feeds = owner.deploy(PriceFeedsLocal)
+        feeds.setRates(
+            WETH.address,
+            LINK.address,
+            50e18 # this value so it can be easy in manual calculations
+        )
+        feeds.setRates(
+            WETH.address,
+            DAI.address,
+            150e18 # this value so it can be easy in manual calculations
+        )
+        feeds.setRates(
+            LINK.address,
+            DAI.address,
+            10e18 # this value so it can be easy in manual calculations
+        )
+        swapsImpl = owner.deploy(SwapsImplTestnets)
 
-@pytest.fixture(scope="module")
-def priceFeeds(accounts, WETH, DAI, LINK, PriceFeeds, PriceFeedsLocal):
-    feeds = accounts[0].deploy(PriceFeedsLocal)
-
-    feeds.setRates(
-        WETH.address,
-        LINK.address,
-        50e18 # this value so it can be easy in manual calculations
-    )
-    feeds.setRates(
-        WETH.address,
-        DAI.address,
-        150e18 # this value so it can be easy in manual calculations
-    )
-    feeds.setRates(
-        LINK.address,
-        DAI.address,
-        10e18 # this value so it can be easy in manual calculations
-    )
-    return feeds
+        bzxproxy = owner.deploy(bZxProtocol)
+        bzx = Contract.from_abi("bzx", address=bzxproxy.address, abi=interface.IBZx.abi, owner=owner)
+        deployed = {"DAI": DAI, "LINK": LINK, "WETH": WETH, "priceFeeds": feeds, "swapsImpl": swapsImpl, "bzxproxy": bzxproxy}
+        for module in modules:
+            deployed[module._name] = owner.deploy(module)
+            bzx.replaceContract(deployed[module._name].address)
 
-@pytest.fixture(scope="module")
-def swapsImpl(accounts, SwapsImplKyber, SwapsImplTestnets):
-    return accounts[0].deploy(SwapsImplTestnets)
-
-@pytest.fixture(scope="module", autouse=True)
-def bzx(accounts, 
-    interface, 
-    bZxProtocol, 
-    ProtocolSettings, 
-    LoanSettings, 
-    LoanMaintenance, 
-    LoanOpenings, 
-    LoanClosings,
-    LoanClosingsWithGasToken,
-    swapsImpl, 
-    priceFeeds):
-    bzxproxy = accounts[0].deploy(bZxProtocol)
-    bzx = Contract.from_abi("bzx", address=bzxproxy.address, abi=interface.IBZx.abi, owner=accounts[0])
+        bzx.setPriceFeedContract(
+            feeds.address # priceFeeds
+        )
+
+        bzx.setSwapsImplContract(
+            swapsImpl.address # swapsImpl
+        )
+        return deployed
+
+    return loadOrDeploy(deployProtocol, [TestToken, TestWeth, PriceFeedsLocal, SwapsImplTestnets, bZxProtocol] + modules, owner)
+
+@pytest.fixture(scope="session")
+def DAI(deployment):
+    return deployment["DAI"]
+
+@pytest.fixture(scope="session")
+def LINK(deployment):
+    return deployment["LINK"]
+
+@pytest.fixture(scope="session")
+def WETH(deployment):
+    return deployment["WETH"]
+
+@pytest.fixture(scope="session")
+def priceFeeds(deployment):
+    return deployment["priceFeeds"]
+
+@pytest.fixture(scope="session")
+def swapsImpl(deployment):
+    return deployment["swapsImpl"]
+
+@pytest.fixture(scope="session")
+def bzx(accounts, interface, deployment):
+    bzx = Contract.from_abi("bzx", address=deployment["bzxproxy"].address, abi=interface.IBZx.abi, owner=accounts[0])
     _add_contract(bzx)
-    
-    bzx.replaceContract(accounts[0].deploy(ProtocolSettings).address)
-    bzx.replaceContract(accounts[0].deploy(LoanSettings).address)
-    bzx.replaceContract(accounts[0].deploy(LoanMaintenance).address)
-    bzx.replaceContract(accounts[0].deploy(LoanOpenings).address)
-    bzx.replaceContract(accounts[0].deploy(LoanClosings).address)
-    # bzx.replaceContract(accounts[0].deploy(LoanClosingsWithGasToken).address) disable for now so that coverage works
-
-    bzx.setPriceFeedContract(
-        priceFeeds.address # priceFeeds
-    )
-
-    bzx.setSwapsImplContract(
-        swapsImpl.address # swapsImpl
-    )
-    
     return bzx
 
 @pytest.fixture(scope="function", autouse=True)
@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+
+# Deploys the tests/ protocol stack once per session instead of once per module.
+#
+# After the deployment chain.reset(), which module_isolation runs around every
+# module, is pinned to that state. The addresses are written to build/tests keyed
+# by a hash of the compiled bytecode, of the deploy function and of the node, so
+# a node that keeps its state between sessions can skip the deployment: when the
+# chain head is still the cached block, the contracts are loaded from their
+# addresses.
+#
+#   python tests/deploymentcache.py &   # ganache-cli on port 8555 with a --db
+#   brownie test tests/                 # attaches to it
+
+import hashlib
+import inspect
+import json
+import os
+import subprocess
+import sys
+import yaml
+from brownie import chain, web3
+from brownie.network.rpc import CLI_FLAGS
+
+CACHE_DIR = os.path.join("build", "tests")
+CHAIN_DB = os.path.join(CACHE_DIR, "chain")
+
+
+def cacheKey(deploy, containers, deployer):
+    key = hashlib.sha256()
+    for container in sorted(containers, key=lambda c: c._name):
+        key.update(container._name.encode())
+        key.update(container.bytecode.encode())
+    key.update(inspect.getsource(deploy).encode())
+    # one file per node, xdist workers run their own
+    key.update("{}:{}:{}".format(web3.provider.endpoint_uri, chain.id, deployer).encode())
+    return key.hexdigest()[:16]
+
+
+def codeHash(address):
+    return web3.keccak(web3.eth.getCode(str(address))).hex()
+
+
+def pinResetPoint():
+    # module_isolation's chain.reset() reverts here instead of to the state at connect
+    chain._reset_id = chain._current_id = chain._snap()
+
+
+def loadCached(path, containers, owner):
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if web3.eth.blockNumber != cached["block"] or web3.eth.getBlock(cached["block"]).hash.hex() != cached["blockHash"]:
+        return None
+    byName = {container._name: container for container in containers}
+    for entry in cached["contracts"].values():
+        if entry["contract"] not in byName or codeHash(entry["address"]) != entry["codeHash"]:
+            return None
+    return {name: byName[entry["contract"]].at(entry["address"], owner) for name, entry in cached["contracts"].items()}
+
+
+def save(path, deployed):
+    block = web3.eth.getBlock("latest")
+    cached = {
+        "block": block.number,
+        "blockHash": block.hash.hex(),
+        "contracts": {
+            name: {"contract": contract._name, "address": contract.address, "codeHash": codeHash(contract)}
+            for name, contract in deployed.items()
+        },
+    }
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(cached, f, indent=2)
+
+
+def loadOrDeploy(deploy, containers, deployer):
+    '''
+    Returns deploy(), a dict of contracts deployed from containers, or the same
+    contracts loaded from the cache. Either way chain.reset() returns to this state.
+    '''
+    path = os.path.join(CACHE_DIR, "deployment-{}.json".format(cacheKey(deploy, containers, deployer)))
+    deployed = loadCached(path, containers, deployer)
+    if deployed is None:
+        deployed = deploy()
+        save(path, deployed)
+    pinResetPoint()
+    return deployed
+
+
+def launchNode(port, dbPath=None, configPath="brownie-config.yaml"):
+    # ganache-cli with the development network settings of brownie-config.yaml
+    with open(configPath) as f:
+        settings = dict(yaml.safe_load(f)["networks"]["development"]["cmd_settings"])
+    settings["port"] = port
+    cmd = ["ganache-cli"]
+    for key, value in settings.items():
+        if value:
+            cmd += [CLI_FLAGS[key], str(value)]
+    if dbPath is not None:
+        os.makedirs(dbPath, exist_ok=True)
+        cmd += ["--db", dbPath]
+    return subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8555
+    sys.exit(launchNode(port, CHAIN_DB).wait())
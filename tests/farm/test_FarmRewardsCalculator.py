@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+
+import pytest
+import random
+from brownie import chain
+from offchain.farm_rewards import FarmRewardsCalculator
+
+POOL_COUNT = 4
+START_DELAY = 400
+
+# MasterChef mints through a mainnet coordinator, so the farms below are set up before
+# startBlock: no update mints before then and pending rewards accrue from startBlock
+def deployFarm(accounts, TestToken, masterChef, users, rng):
+    for pid in range(POOL_COUNT):
+        lpToken = accounts[0].deploy(TestToken, "LP" + str(pid), "LP" + str(pid), 18, 0)
+        masterChef.add(100 * (pid + 1), lpToken, False)
+        for user in users:
+            # everyone is in the first pool
+            if pid != 0 and rng.random() < 0.25:
+                continue
+            lpToken.mint(user, 10**21)
+            lpToken.approve(masterChef, 2**256-1, {"from": user})
+            masterChef.deposit(pid, rng.randrange(1, 10**21), {"from": user})
+
+    user = users[0]
+    for pid in range(POOL_COUNT):
+        amount = masterChef.userInfo(pid, user)[0]
+        if amount != 0:
+            masterChef.withdraw(pid, amount // 3, {"from": user})
+    masterChef.emergencyWithdraw(1, {"from": users[1]})
+    return masterChef
+
+@pytest.fixture(scope="module")
+def users(accounts):
+    return accounts[1:7]
+
+@pytest.fixture(scope="module")
+def farmPolygon(accounts, MasterChef_Polygon, TestToken, users):
+    masterChef = accounts[0].deploy(MasterChef_Polygon)
+    masterChef.initialize(accounts[9], accounts[0], 10**18, chain.height + START_DELAY)
+    return deployFarm(accounts, TestToken, masterChef, users, random.Random(5))
+
+@pytest.fixture(scope="module")
+def farmBSC(accounts, MasterChef_BSC, TestToken, users):
+    masterChef = accounts[0].deploy(MasterChef_BSC)
+    masterChef.initialize(accounts[9], accounts[0], 25 * 10**18, chain.height + START_DELAY, 0)
+    masterChef.togglePause(False)
+    return deployFarm(accounts, TestToken, masterChef, users, random.Random(6))
+
+def callBlock(masterChef, calculator, user):
+    # eth_call can run in the pending block, find the block.number getPendingGOV used
+    expected = list(masterChef.getPendingGOV(user))
+    blocks = [b for b in [chain.height, chain.height + 1] if calculator.pendingGOVOf(user, b) == expected]
+    assert(len(blocks) != 0)
+    return blocks[0]
+
+def assertMatchesFarm(masterChef, calculator, users):
+    block = callBlock(masterChef, calculator, users[2])
+    pending = calculator.pendingGOV(block)
+    altRewards = calculator.pendingAltRewards()
+    for user in users:
+        i = calculator.users.index(str(user))
+        assert(list(pending[i]) == list(masterChef.getPendingGOV(user)))
+        if calculator.schedule == "bsc":
+            assert(altRewards[i] == masterChef.pendingAltRewards(user))
+
+@pytest.mark.parametrize("schedule", ["polygon", "bsc"])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_pendingGOVMatchesFarm(farmPolygon, farmBSC, users, schedule, lazy):
+    masterChef = farmPolygon if schedule == "polygon" else farmBSC
+    if lazy:
+        masterChef.migrateToLazyRewards()
+    chain.mine(masterChef.startBlock() - chain.height + 20)
+
+    calculator = FarmRewardsCalculator(masterChef, schedule)
+    assert(calculator.bootstrap() == len(users))
+    assert(calculator.lazyRewardsEnabled == lazy)
+    assert(calculator.pendingGOV().shape == (len(users), POOL_COUNT))
+    assertMatchesFarm(masterChef, calculator, users)
+
+    # projections further out follow the same schedule
+    chain.mine(50)
+    assertMatchesFarm(masterChef, calculator, users)
+
+    infos = calculator.userInfos(callBlock(masterChef, calculator, users[2]))
+    for user in users[:2]:
+        i = calculator.users.index(str(user))
+        expected = masterChef.getOptimisedUserInfos(user)
+        assert([int(row[0]) for row in expected] == list(infos.amount[i]))
+        assert([int(row[1]) for row in expected] == list(infos.pendingGOV[i]))
+        assert([int(row[2]) for row in expected] == list(infos.isLocked))
+
+def test_sync(accounts, farmPolygon, users, TestToken):
+    masterChef = farmPolygon
+    calculator = FarmRewardsCalculator(masterChef, "polygon")
+    calculator.bootstrap(users[:4])
+
+    # a new depositor, a withdrawal and a new pool, still before startBlock
+    lpToken = accounts[0].deploy(TestToken, "LPX", "LPX", 18, 0)
+    masterChef.add(300, lpToken, False)
+    for user in [users[1], users[5]]:
+        lpToken.mint(user, 10**20)
+        lpToken.approve(masterChef, 2**256-1, {"from": user})
+        masterChef.deposit(POOL_COUNT, 10**20, {"from": user})
+    masterChef.withdraw(POOL_COUNT, 10**19, {"from": users[1]})
+
+    assert(calculator.sync() == 2)
+    assert(len(calculator) == 5)
+    assert(len(calculator.pools) == POOL_COUNT + 1)
+    assert(calculator.sync() == 0)
+
+    chain.mine(masterChef.startBlock() - chain.height + 20)
+    calculator.sync()
+    assertMatchesFarm(masterChef, calculator, [users[i] for i in [0, 1, 2, 3, 5]])
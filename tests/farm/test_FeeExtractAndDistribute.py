@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import reverts
+
+# reserves of the local pairs, priced so that 1 WBNB = 1000 BUSD/USDT/DAI = 0.1 ETH
+RESERVES = {
+    "BUSD": 10**24,
+    "USDT": 10**24,
+    "DAI": 10**24,
+    "ETH": 10**20,
+}
+BNB_RESERVE = 10**21
+
+@pytest.fixture(scope="module")
+def tokens(accounts, TestToken):
+    return {symbol: accounts[0].deploy(TestToken, symbol, symbol, 18, 10**30) for symbol in ["WBNB", "BUSD", "USDT", "DAI", "ETH", "DOGE"]}
+
+@pytest.fixture(scope="module")
+def router(accounts, TestUniswapV2Router, tokens):
+    router = accounts[0].deploy(TestUniswapV2Router)
+    for token in tokens.values():
+        token.approve(router, 2**256-1, {"from": accounts[0]})
+    for symbol, reserve in RESERVES.items():
+        router.createPair(tokens[symbol], tokens["WBNB"], reserve, BNB_RESERVE)
+    # stable pairs for the hops, DOGE has no pair
+    router.createPair(tokens["USDT"], tokens["BUSD"], 10**24, 10**24)
+    router.createPair(tokens["DAI"], tokens["BUSD"], 10**24, 10**24)
+    return router
+
+@pytest.fixture(scope="module")
+def feeExtractor(accounts, FeeExtractAndDistribute_BSCMock, router, tokens):
+    feeExtractor = accounts[0].deploy(FeeExtractAndDistribute_BSCMock)
+    feeExtractor.setRouter(router)
+    feeExtractor.approveRouter(list(tokens.values()))
+    return feeExtractor
+
+@pytest.fixture(autouse=True)
+def isolate(fn_isolation):
+    pass
+
+def test_sweepPlan(accounts, feeExtractor, router, tokens):
+    WBNB, BUSD, USDT, DAI, ETH, DOGE = [tokens[s] for s in ["WBNB", "BUSD", "USDT", "DAI", "ETH", "DOGE"]]
+    assets = [WBNB, BUSD, USDT, DAI, ETH, DOGE]
+    # ~0.1, ~0.001, 0, ~10 BNB and DOGE without a pair
+    feeExtractor.setFeesHeld([BUSD, USDT, ETH, DOGE], [10**20, 10**18, 10**18, 10**18])
+    feeExtractor.setExportedFees([WBNB], [5 * 10**15])
+
+    feeExtractor.setMinSwapValue(10**16, {"from": accounts[0]})
+    sweepAssets, values = feeExtractor.getSweepPlanTo(assets, WBNB)
+    assert(list(sweepAssets) == [BUSD, ETH])
+    assert(values[0] == router.getAmountsOut(10**20, [BUSD, WBNB])[1])
+    assert(values[1] == router.getAmountsOut(10**18, [ETH, WBNB])[1])
+
+    # assets routed through a hop are valued along it
+    feeExtractor.setSwapHops([USDT], [BUSD], {"from": accounts[0]})
+    feeExtractor.setMinSwapValue(0, {"from": accounts[0]})
+    sweepAssets, values = feeExtractor.getSweepPlanTo(assets, WBNB)
+    assert(list(sweepAssets) == [WBNB, BUSD, USDT, ETH, DOGE])
+    assert(values[0] == 5 * 10**15)
+    assert(values[2] == router.getAmountsOut(10**18, [USDT, BUSD, WBNB])[2])
+    assert(values[4] == 0)
+
+def test_swapFeesPoolsHops(accounts, feeExtractor, router, tokens):
+    WBNB, BUSD, USDT, DAI, ETH = [tokens[s] for s in ["WBNB", "BUSD", "USDT", "DAI", "ETH"]]
+    fees = {BUSD: 10**20, USDT: 3 * 10**20, DAI: 2 * 10**20, ETH: 10**18}
+    for token, amount in fees.items():
+        token.transfer(feeExtractor, amount, {"from": accounts[0]})
+    feeExtractor.setExportedFees(list(fees.keys()), list(fees.values()))
+    feeExtractor.setSwapHops([USDT, DAI], [BUSD, BUSD], {"from": accounts[0]})
+
+    busdTotal = fees[BUSD] + router.getAmountsOut(fees[USDT], [USDT, BUSD])[1] + router.getAmountsOut(fees[DAI], [DAI, BUSD])[1]
+    expected = router.getAmountsOut(busdTotal, [BUSD, WBNB])[1] + router.getAmountsOut(fees[ETH], [ETH, WBNB])[1]
+    busdPair = router.getPair(BUSD, WBNB)
+    busdReserve = BUSD.balanceOf(busdPair)
+
+    tx = feeExtractor.swapFeesTo([USDT, BUSD, DAI, ETH], WBNB)
+    assert(tx.return_value == expected)
+    assert(WBNB.balanceOf(feeExtractor) == expected)
+    # BUSD went to WBNB in a single swap, with the USDT and DAI output
+    assert(BUSD.balanceOf(busdPair) == busdReserve + busdTotal)
+    for token in fees.keys():
+        assert(feeExtractor.exportedFees(token) == 0)
+        assert(token.balanceOf(feeExtractor) == 0)
+
+def test_setSwapHops(Constants, accounts, feeExtractor, tokens):
+    BUSD, USDT, DAI = [tokens[s] for s in ["BUSD", "USDT", "DAI"]]
+    with reverts("Ownable: caller is not the owner"):
+        feeExtractor.setSwapHops([USDT], [BUSD], {"from": accounts[1]})
+    with reverts("Ownable: caller is not the owner"):
+        feeExtractor.setMinSwapValue(1, {"from": accounts[1]})
+    with reverts("invalid hop"):
+        feeExtractor.setSwapHops([USDT], [USDT], {"from": accounts[0]})
+    with reverts("count mismatch"):
+        feeExtractor.setSwapHops([USDT, DAI], [BUSD], {"from": accounts[0]})
+
+    feeExtractor.setSwapHops([USDT], [BUSD], {"from": accounts[0]})
+    with reverts("nested hop"):
+        feeExtractor.setSwapHops([DAI], [USDT], {"from": accounts[0]})
+    assert(feeExtractor.swapHops(USDT) == BUSD)
+
+    # BUSD is USDT's hop, so it can't get one of its own until USDT is unset
+    with reverts("nested hop"):
+        feeExtractor.setSwapHops([BUSD], [DAI], {"from": accounts[0]})
+    feeExtractor.setSwapHops([DAI], [BUSD], {"from": accounts[0]})
+    assert(feeExtractor.swapHopUsers(BUSD) == 2)
+    feeExtractor.setSwapHops([USDT, DAI], [Constants["ZERO_ADDRESS"]] * 2, {"from": accounts[0]})
+    assert(feeExtractor.swapHopUsers(BUSD) == 0)
+    feeExtractor.setSwapHops([BUSD], [DAI], {"from": accounts[0]})
+    assert(feeExtractor.swapHops(BUSD) == DAI)
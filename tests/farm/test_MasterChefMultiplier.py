@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+
+import random
+import pytest
+from offchain.farm_rewards import BONUS_PERIOD_BLOCKS, getMultiplierPrecise
+
+START_BLOCK = 1000
+BONUS_END_BLOCK = START_BLOCK + BONUS_PERIOD_BLOCKS
+
+@pytest.fixture(scope="module")
+def masterChefPolygon(accounts, MasterChef_Polygon):
+    masterChef = accounts[0].deploy(MasterChef_Polygon)
+    masterChef.initialize(accounts[9], accounts[0], 10**18, START_BLOCK)
+    return masterChef
+
+@pytest.fixture(scope="module")
+def masterChefBSC(accounts, MasterChef_BSC):
+    masterChef = accounts[0].deploy(MasterChef_BSC)
+    masterChef.initialize(accounts[9], accounts[0], 10**18, START_BLOCK, START_BLOCK)
+    return masterChef
+
+def legacyMultiplier(fromBlock, toBlock):
+    # the per range average of the previous _getDecliningMultipler
+    start = 10 * 10**18 - (fromBlock - START_BLOCK) * 6944444444444
+    if toBlock <= BONUS_END_BLOCK:
+        end = 10 * 10**18 - (toBlock - START_BLOCK) * 6944444444444
+        return (toBlock - fromBlock) * ((start + end) // 2)
+    if fromBlock >= BONUS_END_BLOCK:
+        return (toBlock - fromBlock) * 10**18
+    return (BONUS_END_BLOCK - fromBlock) * ((start + 10**18) // 2) + (toBlock - BONUS_END_BLOCK) * 10**18
+
+def test_decliningMultiplier(masterChefPolygon):
+    rng = random.Random(1)
+    ranges = [
+        (START_BLOCK, START_BLOCK),
+        (START_BLOCK, START_BLOCK + 1),
+        (START_BLOCK, BONUS_END_BLOCK),
+        (BONUS_END_BLOCK - 1, BONUS_END_BLOCK + 1),
+        (BONUS_END_BLOCK, BONUS_END_BLOCK + 10**6),
+    ]
+    for i in range(20):
+        fromBlock = START_BLOCK + rng.randrange(2 * BONUS_PERIOD_BLOCKS)
+        ranges.append((fromBlock, fromBlock + rng.randrange(10**7)))
+
+    for fromBlock, toBlock in ranges:
+        multiplier = masterChefPolygon.getMultiplierPrecise(fromBlock, toBlock)
+        assert(multiplier == getMultiplierPrecise(fromBlock, toBlock, START_BLOCK)[0])
+        if fromBlock < BONUS_END_BLOCK < toBlock:
+            # the prefix sums follow the schedule through the end of the bonus period
+            assert(abs(multiplier - legacyMultiplier(fromBlock, toBlock)) <= (BONUS_END_BLOCK - fromBlock) * 288000)
+        else:
+            assert(multiplier == legacyMultiplier(fromBlock, toBlock))
+
+    # splitting a range at a checkpoint doesn't change the total
+    fromBlock, toBlock = START_BLOCK + 5, BONUS_END_BLOCK + 5
+    middle = BONUS_END_BLOCK - 7
+    assert(masterChefPolygon.getMultiplierPrecise(fromBlock, toBlock) ==
+        masterChefPolygon.getMultiplierPrecise(fromBlock, middle) + masterChefPolygon.getMultiplierPrecise(middle, toBlock))
+
+def test_flatMultiplier(masterChefBSC):
+    for fromBlock, toBlock in [(START_BLOCK, START_BLOCK + 100), (0, 10**7), (START_BLOCK + 5, START_BLOCK + 5)]:
+        multiplier = masterChefBSC.getMultiplierPrecise(fromBlock, toBlock)
+        assert(multiplier == (toBlock - fromBlock) * 10**18)
+        assert(multiplier == getMultiplierPrecise(fromBlock, toBlock, START_BLOCK, "bsc")[0])
@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import Contract, reverts
+from brownie.exceptions import VirtualMachineError
+from offchain.helper_aggregate import HelperAggregator
+
+@pytest.fixture(scope="module")
+def helper(accounts, HelperImpl, HelperProxy):
+    proxy = accounts[0].deploy(HelperProxy, accounts[0].deploy(HelperImpl))
+    return Contract.from_abi("helper", address=proxy.address, abi=HelperImpl.abi)
+
+@pytest.fixture(autouse=True)
+def isolate(fn_isolation):
+    pass
+
+def test_aggregate(helper, bzx, DAI, LINK, accounts):
+    calls = [
+        (DAI, DAI.balanceOf.encode_input(accounts[0])),
+        (LINK, LINK.totalSupply.encode_input()),
+        (DAI, "0xdeadbeef"), # not a DAI function
+        (bzx, bzx.lendingFeePercent.encode_input()),
+    ]
+    results = helper.aggregate(calls, True)
+    assert([success for success, returnData in results] == [True, True, False, True])
+    assert(DAI.balanceOf.decode_output(results[0][1]) == DAI.balanceOf(accounts[0]))
+    assert(bzx.lendingFeePercent.decode_output(results[3][1]) == bzx.lendingFeePercent())
+
+    with reverts("call failed"):
+        helper.aggregate(calls, False)
+
+def test_helperAggregator(helper, bzx, DAI, LINK, accounts):
+    # 3 calls per chunk
+    aggregator = HelperAggregator(helper, maxGas=300000, callGas=100000)
+    expected = []
+    for account in accounts[:5]:
+        aggregator.add(DAI.balanceOf, account)
+        expected.append(DAI.balanceOf(account))
+        aggregator.add(LINK.allowance, account, bzx)
+        expected.append(LINK.allowance(account, bzx))
+    aggregator.add(bzx.getLenderInterestData, accounts[1], DAI)
+    expected.append(bzx.getLenderInterestData(accounts[1], DAI))
+    aggregator.add(bzx.lendingFeePercent, gas=50000)
+    expected.append(bzx.lendingFeePercent())
+
+    assert([len(chunk) for chunk in aggregator.chunks()] == [3, 3, 3, 3])
+    assert(aggregator.execute() == expected)
+
+def test_helperAggregatorFailure(helper, DAI, accounts):
+    aggregator = HelperAggregator(helper)
+    aggregator.add(DAI.balanceOf, accounts[0])
+    # an address without code
+    aggregator.add(Contract.from_abi("notAToken", address=accounts[1].address, abi=DAI.abi).balanceOf, accounts[0])
+    assert(aggregator.execute() == [DAI.balanceOf(accounts[0]), None])
+    with pytest.raises(ValueError):
+        aggregator.execute(allowFailure=False)
+
+def test_helperAggregatorSplit(helper, DAI, accounts):
+    # the estimates put every call in one chunk, which runs out of gas and is split until each part fits
+    aggregator = HelperAggregator(helper, maxGas=60000, callGas=1)
+    expected = []
+    for i in range(40):
+        account = accounts[i % len(accounts)]
+        aggregator.add(DAI.balanceOf, account)
+        expected.append(DAI.balanceOf(account))
+
+    assert(len(aggregator.chunks()) == 1)
+    with pytest.raises(VirtualMachineError):
+        helper.aggregate([(call.target, call.data) for call in aggregator.calls], True, {"gas": 60000})
+    assert(aggregator.execute() == expected)
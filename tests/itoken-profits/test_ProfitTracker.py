@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+
+import random
+import pytest
+from offchain.itoken_profits import ProfitTracker
+
+@pytest.fixture(scope="module")
+def iToken(accounts, LoanTokenLogicStandardMock, DAI):
+    iToken = accounts[0].deploy(LoanTokenLogicStandardMock, accounts[0])
+    iToken.setLoanToken(DAI, 1e18)
+    # interestOwedPerDay, interestUnPaid, lendingFeePercent; the unpaid interest is
+    # only in tokenPrice, so transfers are priced differently from mints and burns
+    iToken.setLenderInterest(0, 5 * 10**21, 10e18)
+    DAI.mint(iToken, 1e30, {"from": accounts[0]})
+    return iToken
+
+@pytest.fixture(autouse=True)
+def isolate(fn_isolation):
+    pass
+
+def movePrice(iToken, rng):
+    totalSupply = iToken.totalSupply()
+    if totalSupply != 0:
+        # no principal, the underlying balance covers any burn
+        iToken.setPool(totalSupply, 0, totalSupply * rng.randrange(10**18, 2 * 10**18) // 10**18)
+
+def randomActions(iToken, DAI, users, rng, count):
+    for i in range(count):
+        user = rng.choice(users)
+        balance = iToken.balanceOf(user)
+        action = rng.choice(["mint", "burn", "transfer"]) if balance != 0 else "mint"
+        if action == "mint":
+            amount = rng.randrange(10**21, 10**23)
+            DAI.mint(user, amount, {"from": user})
+            DAI.approve(iToken, amount, {"from": user})
+            iToken.mint(user, amount, {"from": user})
+        elif action == "burn":
+            iToken.burn(user, balance if rng.random() < 0.2 else rng.randrange(1, balance), {"from": user})
+        else:
+            # includes transfers of the whole balance and to self
+            iToken.transfer(rng.choice(users), balance if rng.random() < 0.2 else rng.randrange(1, balance), {"from": user})
+        movePrice(iToken, rng)
+
+def assertProfits(tracker, iToken, users):
+    currentPrice = iToken.tokenPrice()
+    profits = tracker.profits(iToken, currentPrice)
+    for user in users:
+        assert(tracker.profitOf(iToken, user, currentPrice) == iToken.profitOf(user))
+        realized, unrealized = profits.get(str(user), (0, 0))
+        assert(realized + unrealized == iToken.profitOf(user))
+
+def test_profitOf(iToken, DAI, accounts):
+    rng = random.Random(1)
+    users = accounts[1:5]
+    randomActions(iToken, DAI, users, rng, 60)
+
+    tracker = ProfitTracker([iToken])
+    tracker.sync(fromBlock=iToken.tx.block_number)
+    assert(set(tracker.users[iToken.address]) == set(str(user) for user in users))
+    assertProfits(tracker, iToken, users)
+    for user in users:
+        assert(tracker.users[iToken.address][str(user)][0] == iToken.balanceOf(user))
+        assert(tracker.users[iToken.address][str(user)][2] == iToken.checkpointPrice(user))
+
+def test_incrementalSync(iToken, DAI, accounts, tmp_path):
+    rng = random.Random(2)
+    users = accounts[1:4]
+    randomActions(iToken, DAI, users, rng, 30)
+
+    tracker = ProfitTracker([iToken])
+    tracker.sync(fromBlock=iToken.tx.block_number)
+    path = str(tmp_path / "profits.json")
+    tracker.save(path)
+
+    randomActions(iToken, DAI, users, rng, 30)
+    tracker = ProfitTracker([iToken]).load(path)
+    assert(tracker.sync() > 0)
+    assertProfits(tracker, iToken, users)
@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import reverts
+from offchain.itoken_rates import InterestRateSimulator
+
+# baseRate, rateMultiplier, targetLevel, kinkLevel, maxScaleRate
+CURVE = [2e18, 18e18, 60e18, 90e18, 120e18]
+TOTAL_SUPPLY = 10**24
+TOTAL_PRINCIPAL = 6 * 10**23
+UNDERLYING_BALANCE = 3 * 10**23
+
+@pytest.fixture(scope="module")
+def iToken(accounts, LoanTokenLogicStandardMock):
+    iToken = accounts[0].deploy(LoanTokenLogicStandardMock, accounts[0])
+    iToken.setDemandCurve(*CURVE)
+    iToken.setPool(TOTAL_SUPPLY, TOTAL_PRINCIPAL, UNDERLYING_BALANCE)
+    # interestOwedPerDay, interestUnPaid, lendingFeePercent
+    iToken.setLenderInterest(10**21, 5 * 10**21, 10e18)
+    return iToken
+
+@pytest.fixture(autouse=True)
+def isolate(fn_isolation):
+    pass
+
+def getSimulator(iToken):
+    # the mock answers the IBZx views for itself
+    return InterestRateSimulator([iToken], bzx=iToken).refresh()
+
+def test_nextBorrowInterestRate(iToken):
+    simulator = getSimulator(iToken)
+    # below target, linear, above the kink and capped at the liquidity
+    amounts = [0, 10**18, 10**23, 2 * 10**23, 25 * 10**22, 3 * 10**23, 10**24]
+    rates = simulator.nextBorrowInterestRate(amounts)
+    assert(rates.shape == (1, len(amounts)))
+    assert(list(rates[0]) == [iToken.nextBorrowInterestRate(amount) for amount in amounts])
+
+def test_borrowInterestRateGrid(iToken):
+    simulator = getSimulator(iToken)
+    # utilizations from 0 to 130%, the mock's supply is 10**24
+    borrowAmounts = [i * 10**22 - TOTAL_PRINCIPAL for i in range(60, 131, 5)]
+    utilRates = [(TOTAL_PRINCIPAL + amount) * 10**20 // TOTAL_SUPPLY for amount in borrowAmounts]
+    rates = simulator.borrowInterestRateAt([0] + utilRates)
+    assert(list(rates[0]) == [iToken.nextBorrowInterestRate2(0, 0)] + [iToken.nextBorrowInterestRate2(amount, TOTAL_SUPPLY) for amount in borrowAmounts])
+
+def test_sweepCurves(iToken):
+    simulator = getSimulator(iToken)
+    params, curve = simulator.sweepCurves(kinkLevel=[70e18, 95e18], maxScaleRate=[50e18, 150e18])
+    amounts = [10**22, 2 * 10**23]
+    rates = simulator.nextBorrowInterestRate(amounts, curve)
+    assert(rates.shape == (4, 1, 2))
+
+    for i, param in enumerate(params):
+        iToken.setDemandCurve(CURVE[0], CURVE[1], CURVE[2], param["kinkLevel"], param["maxScaleRate"])
+        assert(list(rates[i][0]) == [iToken.nextBorrowInterestRate(amount) for amount in amounts])
+
+def test_sweepCurvesReverts(iToken):
+    simulator = getSimulator(iToken)
+    # maxScaleRate under the rate at the kink, only used above it
+    params, curve = simulator.sweepCurves(maxScaleRate=[10e18])
+    simulator.nextBorrowInterestRate([10**23], curve)
+    with pytest.raises(ValueError):
+        simulator.nextBorrowInterestRate([3 * 10**23], curve)
+    iToken.setDemandCurve(CURVE[0], CURVE[1], CURVE[2], CURVE[3], 10e18)
+    with reverts():
+        iToken.nextBorrowInterestRate(3 * 10**23)
+
+def test_nextSupplyInterestRate(iToken):
+    simulator = getSimulator(iToken)
+    amounts = [0, 10**18, 10**23, 10**25]
+    rates = simulator.nextSupplyInterestRate(amounts)
+    assert(list(rates[0]) == [iToken.nextSupplyInterestRate(amount) for amount in amounts])
+    assert(rates[0][0] == iToken.supplyInterestRate())
+
+def test_marginTradeBorrowAmount(iToken):
+    simulator = getSimulator(iToken)
+    deposits = [10**18, 10**21, 5 * 10**22]
+    for leverage in [2e18, 5e18]:
+        borrowAmounts, interestRates = simulator.marginTradeBorrowAmount(deposits, leverage)
+        for i, deposit in enumerate(deposits):
+            assert(iToken.preMarginData(deposit, leverage) == (borrowAmounts[0][i], interestRates[0][i]))
+
+def test_poolState(iToken):
+    # unpaid interest net of the 10% fee, the mock never settles
+    assetSupply = UNDERLYING_BALANCE + TOTAL_PRINCIPAL + 5 * 10**21 * 90 // 100
+    assert(iToken.totalAssetSupply() == assetSupply)
+    assert(iToken.tokenPrice() == assetSupply * 10**18 // TOTAL_SUPPLY)
+    assert(iToken.marketLiquidity() == UNDERLYING_BALANCE)
+    assert(iToken.avgBorrowInterestRate() == 10**21 * 365 * 10**20 // TOTAL_PRINCIPAL)
+    assert(iToken.totalSupplyInterestRate(assetSupply) == getSimulator(iToken).nextSupplyInterestRate(assetSupply - UNDERLYING_BALANCE - TOTAL_PRINCIPAL)[0][0])
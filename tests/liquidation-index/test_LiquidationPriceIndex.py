@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+
+import pytest
+from helpers import getLoanId
+from offchain.loan_indexer import ActiveLoanIndexer
+from offchain.liquidation_index import LiquidationPriceIndex
+
+@pytest.fixture(scope="module")
+def LinkDaiBorrowParamsId(Constants, LINK, DAI, bzx, accounts):
+    loanParams = {
+        "id": "0x0",
+        "active": False,
+        "owner": Constants["ZERO_ADDRESS"],
+        "loanToken": DAI.address,
+        "collateralToken": LINK.address,
+        "minInitialMargin": 20e18,
+        "maintenanceMargin": 15e18,
+        "fixedLoanTerm": "0", # torque loan
+    }
+    tx = bzx.setupLoanParams([list(loanParams.values())])
+    return tx.events["LoanParamsIdSetup"][0]["id"]
+
+@pytest.fixture(scope="module")
+def loanId(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId):
+    return getLoanId(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId)
+
+@pytest.fixture(scope="function")
+def indexer(bzx, loanId):
+    indexer = ActiveLoanIndexer(bzx)
+    indexer.bootstrap()
+    return indexer
+
+def test_liquidationRateMatchesChain(bzx, priceFeeds, indexer, loanId, LINK, DAI):
+    index = LiquidationPriceIndex()
+    indexer.addListener(index)
+    liquidationRate = index.getLiquidationRate(indexer.getLoan(loanId).loanId)
+
+    # LINK and DAI both have 18 decimals, so the rate set is the rate used by getCurrentMargin
+    priceFeeds.setRates(LINK, DAI, liquidationRate + 1)
+    loan = bzx.getLoan(loanId)
+    assert(loan[11] > loan[10]) # currentMargin > maintenanceMargin
+    assert(index.getLiquidatable(DAI, LINK, liquidationRate + 1) == [])
+
+    priceFeeds.setRates(LINK, DAI, liquidationRate)
+    loan = bzx.getLoan(loanId)
+    assert(loan[11] <= loan[10])
+    assert(index.getLiquidatable(DAI, LINK, liquidationRate) == [indexer.getLoan(loanId).loanId])
+    assert(index.getNewlyLiquidatable(DAI, LINK, liquidationRate + 1, liquidationRate) == [indexer.getLoan(loanId).loanId])
+    assert(index.getLiquidatable(LINK, DAI, liquidationRate) == [])
+
+def test_indexUpdatesOnCollateralChange(bzx, indexer, loanId, LINK, accounts):
+    index = LiquidationPriceIndex()
+    indexer.addListener(index)
+    key = indexer.getLoan(loanId).loanId
+    rateBefore = index.getLiquidationRate(key)
+
+    LINK.mint(accounts[1], 1e18, { "from": accounts[0] })
+    LINK.approve(bzx, 1e18, { "from": accounts[1] })
+    indexer.processTransaction(bzx.depositCollateral(loanId, 1e18, { "from": accounts[1] }))
+    rateAfterDeposit = index.getLiquidationRate(key)
+    assert(rateAfterDeposit < rateBefore)
+
+    indexer.processTransaction(bzx.withdrawCollateral(loanId, accounts[1], 2e18, { "from": accounts[1] }))
+    assert(index.getLiquidationRate(key) > rateBefore)
+    assert(len(index) == 1)
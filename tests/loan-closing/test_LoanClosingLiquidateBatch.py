@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import Wei, reverts
+from helpers import getLoanId
+
+@pytest.fixture(scope="module")
+def LinkDaiBorrowParamsId(Constants, LINK, DAI, bzx, accounts):
+    loanParams = {
+        "id": "0x0",
+        "active": False,
+        "owner": Constants["ZERO_ADDRESS"],
+        "loanToken": DAI.address,
+        "collateralToken": LINK.address,
+        "minInitialMargin": 20e18,
+        "maintenanceMargin": 15e18,
+        "fixedLoanTerm": "0", # torque loan
+    }
+    tx = bzx.setupLoanParams([list(loanParams.values())])
+    return tx.events["LoanParamsIdSetup"][0]["id"]
+
+@pytest.fixture(scope="module")
+def loanIds(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId):
+    return [getLoanId(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId) for i in range(3)]
+
+@pytest.fixture(scope="function")
+def liquidator(accounts, bzx, DAI):
+    DAI.mint(accounts[3], 1000e18, { "from": accounts[0] })
+    DAI.approve(bzx, 1000e18, { "from": accounts[3] })
+    return accounts[3]
+
+def test_liquidateBatch(bzx, loanIds, priceFeeds, DAI, LINK, liquidator, accounts):
+    priceFeeds.setRates(LINK, DAI, 7e18)
+    expected = { l[0]: l for l in bzx.getActiveLoansAdvanced(0, 10, True, False) }
+
+    linkBefore = LINK.balanceOf(accounts[4])
+    tx = bzx.liquidateBatch(loanIds, accounts[4], [1000e18] * 3, { "from": liquidator })
+    loanCloseAmounts, seizedAmounts = tx.return_value
+
+    assert(len(tx.events["Liquidate"]) == 3)
+    for i, loanId in enumerate(loanIds):
+        assert(loanCloseAmounts[i] == expected[loanId][13]) # maxLiquidatable
+        assert(seizedAmounts[i] == expected[loanId][14]) # maxSeizable
+
+    # seized collateral is sent in a single transfer
+    assert(LINK.balanceOf(accounts[4]) - linkBefore == sum(seizedAmounts))
+    assert(len([e for e in tx.events["Transfer"] if e.address == LINK and e["to"] == accounts[4]]) == 1)
+
+def test_liquidateBatchMatchesLiquidate(bzx, loanIds, priceFeeds, DAI, LINK, liquidator):
+    priceFeeds.setRates(LINK, DAI, 7e18)
+
+    tx = bzx.liquidateBatch([loanIds[0]], liquidator, [10e18], { "from": liquidator })
+    loanCloseAmounts, seizedAmounts = tx.return_value
+
+    single = bzx.liquidate.call(loanIds[1], liquidator, 10e18, { "from": liquidator })
+    assert(loanCloseAmounts[0] == single[0])
+    assert(seizedAmounts[0] == single[1])
+
+def test_liquidateBatchSkipsHealthyAndClosed(bzx, loanIds, priceFeeds, DAI, LINK, liquidator):
+    # healthy at the current price
+    tx = bzx.liquidateBatch(loanIds, liquidator, [10e18] * 3, { "from": liquidator })
+    assert(tx.return_value[0] == [0, 0, 0])
+    assert("Liquidate" not in tx.events)
+
+    priceFeeds.setRates(LINK, DAI, 1e18)
+    bzx.liquidate(loanIds[0], liquidator, 1000e18, { "from": liquidator })
+    assert(bzx.loans(loanIds[0])[11] == False) # active
+
+    tx = bzx.liquidateBatch(loanIds, liquidator, [1000e18, 1000e18, 0], { "from": liquidator })
+    loanCloseAmounts, seizedAmounts = tx.return_value
+    assert(loanCloseAmounts[0] == 0) # already closed
+    assert(loanCloseAmounts[1] > 0)
+    assert(loanCloseAmounts[2] == 0) # nothing requested
+    assert(len(tx.events["Liquidate"]) == 1)
+
+def test_liquidateBatchCountMismatch(bzx, loanIds, liquidator):
+    with reverts("count mismatch"):
+        bzx.liquidateBatch(loanIds, liquidator, [1], { "from": liquidator })
+
+def test_liquidateBatchSkipsNothingToLiquidate(Constants, bzx, loanIds, priceFeeds, DAI, LINK, WETH, liquidator, accounts, PriceFeedReplayMock):
+    loanParams = {
+        "id": "0x0",
+        "active": False,
+        "owner": Constants["ZERO_ADDRESS"],
+        "loanToken": DAI.address,
+        "collateralToken": WETH.address,
+        "minInitialMargin": 20e18,
+        "maintenanceMargin": 15e18,
+        "fixedLoanTerm": "0", # torque loan
+    }
+    loanParamsId = bzx.setupLoanParams([list(loanParams.values())]).events["LoanParamsIdSetup"][0]["id"]
+
+    DAI.mint(bzx, 1e18, { "from": accounts[0] })
+    collateralTokenSent = bzx.getRequiredCollateral(DAI, WETH, 101e18, 50e18, True)
+    WETH.deposit({ "from": accounts[0], "value": collateralTokenSent })
+    WETH.transfer(bzx, collateralTokenSent, { "from": accounts[0] })
+    tx = bzx.borrowOrTradeFromPool(
+        loanParamsId,
+        "0", # loanId - starts a new loan
+        True, # isTorqueLoan,
+        50e18, # initialMargin
+        [accounts[2], accounts[1], accounts[1], Constants["ZERO_ADDRESS"]], # lender, borrower, receiver, manager
+        [5e18, 101e18, 1e18, 1e18, collateralTokenSent], # newRate, newPrincipal, torqueInterest, loanTokenSent, collateralTokenSent
+        b'',
+        { "from": accounts[1] }
+    )
+    wethLoanId = tx.events["Borrow"][0]["loanId"]
+
+    # the WETH/DAI rate rounds down to 0, so the loan is liquidatable but maxLiquidatable is 0
+    feed = accounts[0].deploy(PriceFeedReplayMock)
+    feed.pushAnswers([2e36])
+    priceFeeds.setPriceFeed([WETH, DAI], [feed, feed])
+    priceFeeds.setRates(LINK, DAI, 7e18)
+
+    with reverts("nothing to liquidate"):
+        bzx.liquidate(wethLoanId, liquidator, 1000e18, { "from": liquidator })
+
+    tx = bzx.liquidateBatch([loanIds[0], wethLoanId, loanIds[1]], liquidator, [1000e18] * 3, { "from": liquidator })
+    loanCloseAmounts, seizedAmounts = tx.return_value
+    assert(loanCloseAmounts[0] > 0)
+    assert(loanCloseAmounts[1] == 0 and seizedAmounts[1] == 0)
+    assert(loanCloseAmounts[2] > 0)
+    assert(len(tx.events["Liquidate"]) == 2)
+    assert(bzx.loans(wethLoanId)[11] == True) # active
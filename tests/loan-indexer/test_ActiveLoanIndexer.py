@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+
+import pytest
+from helpers import getLoanId
+from offchain.loan_indexer import ActiveLoanIndexer, toLoan
+
+@pytest.fixture(scope="module")
+def LinkDaiBorrowParamsId(Constants, LINK, DAI, bzx, accounts):
+    loanParams = {
+        "id": "0x0",
+        "active": False,
+        "owner": Constants["ZERO_ADDRESS"],
+        "loanToken": DAI.address,
+        "collateralToken": LINK.address,
+        "minInitialMargin": 20e18,
+        "maintenanceMargin": 15e18,
+        "fixedLoanTerm": "0", # torque loan
+    }
+    tx = bzx.setupLoanParams([list(loanParams.values())])
+    return tx.events["LoanParamsIdSetup"][0]["id"]
+
+def test_bootstrap(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId):
+    loanId = getLoanId(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId)
+
+    indexer = ActiveLoanIndexer(bzx)
+    assert(indexer.bootstrap() == 1)
+
+    loan = indexer.getLoan(loanId)
+    assert(loan == toLoan(bzx.getLoan(loanId)))
+    assert(loan.principal == 101e18)
+    assert(indexer.getLoansByBorrower(accounts[1]) == [loan])
+    assert(indexer.getLoansByLender(accounts[2]) == [loan])
+    assert(indexer.getLoansByLoanToken(DAI) == [loan])
+    assert(indexer.getLoansByCollateralToken(LINK) == [loan])
+    assert(indexer.getLoansByCollateralToken(DAI) == [])
+
+def test_syncBorrow(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId):
+    indexer = ActiveLoanIndexer(bzx)
+    assert(indexer.bootstrap() == 0)
+
+    loanId = getLoanId(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId)
+    assert(indexer.sync() == 1)
+
+    assert(indexer.getLoan(loanId) == toLoan(bzx.getLoan(loanId)))
+    assert(len(indexer.getLoansByBorrower(accounts[1])) == 1)
+
+def test_syncDepositCollateral(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId):
+    loanId = getLoanId(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId)
+    indexer = ActiveLoanIndexer(bzx)
+    indexer.bootstrap()
+    collateralBefore = indexer.getLoan(loanId).collateral
+
+    LINK.mint(accounts[1], 1e18, { "from": accounts[0] })
+    LINK.approve(bzx, 1e18, { "from": accounts[1] })
+    bzx.depositCollateral(loanId, 1e18, { "from": accounts[1] })
+
+    # nothing is read back until the events are synced
+    assert(indexer.getLoan(loanId).collateral == collateralBefore)
+    assert(indexer.sync() == 1)
+    assert(indexer.getLoan(loanId).collateral == collateralBefore + 1e18)
+    assert(indexer.getLoan(loanId) == toLoan(bzx.getLoan(loanId)))
+
+def test_processTransaction(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId):
+    loanId = getLoanId(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId)
+    indexer = ActiveLoanIndexer(bzx)
+    indexer.bootstrap()
+    collateralBefore = indexer.getLoan(loanId).collateral
+
+    tx = bzx.withdrawCollateral(loanId, accounts[1], 1e18, { "from": accounts[1] })
+    assert(indexer.processTransaction(tx) == 1)
+    assert(indexer.getLoan(loanId).collateral == collateralBefore - 1e18)
+    assert(indexer.sync() == 0)
+
+def test_syncLoanDuration(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId):
+    loanId = getLoanId(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId)
+    indexer = ActiveLoanIndexer(bzx)
+    indexer.bootstrap()
+    endTimestamp = indexer.getLoan(loanId).endTimestamp
+
+    DAI.mint(accounts[1], 1e18, { "from": accounts[0] })
+    DAI.approve(bzx, 1e18, { "from": accounts[1] })
+    bzx.extendLoanDuration(loanId, 1e18, False, b"", { "from": accounts[1] })
+    assert(indexer.sync() == 1)
+    assert(indexer.getLoan(loanId).endTimestamp > endTimestamp)
+    assert(indexer.getLoan(loanId) == toLoan(bzx.getLoan(loanId)))
+
+    endTimestamp = indexer.getLoan(loanId).endTimestamp
+    tx = bzx.reduceLoanDuration(loanId, accounts[1], 1e17, { "from": accounts[1] })
+    assert(indexer.processTransaction(tx) == 1)
+    assert(indexer.getLoan(loanId).endTimestamp < endTimestamp)
+    assert(indexer.getLoansByBorrower(accounts[1]) == [indexer.getLoan(loanId)])
@@ -151,15 +151,32 @@ def test_getUserLoans(bzx, loanId, accounts, DAI, LINK):
 def test_reduceLoanDuration(bzx, accounts, loanId):
     tx = bzx.reduceLoanDuration(loanId, accounts[1], 1, { "from": accounts[1]})
     print("tx", tx.info())
-    assert(tx.events["Transfer"][1]["from"] == bzx)
-    assert(tx.events["Transfer"][1]["to"] == accounts[1])
-    assert(tx.events["Transfer"][1]["value"] == 1)
+    # the lender's interest is settled but not transferred
+    assert(len(tx.events["Transfer"]) == 1)
+    assert(tx.events["Transfer"]["from"] == bzx)
+    assert(tx.events["Transfer"]["to"] == accounts[1])
+    assert(tx.events["Transfer"]["value"] == 1)
 
 def test_withdrawAccruedInterest(bzx, loanId, accounts, LINK):
     tx = bzx.withdrawAccruedInterest(LINK, { "from": accounts[2]})
     print("tx", tx.info())
     assert(tx.value == 0)
 
+def test_withdrawAccruedInterestPending(bzx, loanId, accounts, DAI, chain):
+    chain.sleep(10 * 86400)
+    bzx.reduceLoanDuration(loanId, accounts[1], 1, { "from": accounts[1]})
+    lenderInterest = bzx.lenderInterest(accounts[2], DAI)
+    pending = lenderInterest[5]
+    assert(pending > 0)
+    assert(bzx.getLenderInterestData(accounts[2], DAI)[3] >= pending)
+
+    balanceBefore = DAI.balanceOf(accounts[2])
+    tx = bzx.withdrawAccruedInterest(DAI, { "from": accounts[2]})
+    lendingFee = tx.events["PayLendingFee"]["amount"]
+    paidSince = bzx.lenderInterest(accounts[2], DAI)[3] - lenderInterest[3]
+    assert(DAI.balanceOf(accounts[2]) - balanceBefore + lendingFee == pending + paidSince)
+    assert(bzx.lenderInterest(accounts[2], DAI)[5] == 0)
+
 def test_withdrawCollateral(bzx, loanId, accounts):
     tx = bzx.withdrawCollateral(loanId, accounts[1], 1, { "from": accounts[1]})
     print("tx", tx.info())
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import Wei
+from helpers import getLoanId
+
+@pytest.fixture(scope="module")
+def LinkDaiBorrowParamsId(Constants, LINK, DAI, bzx, accounts, LoanMaintenance_2):
+    bzx.replaceContract(accounts[0].deploy(LoanMaintenance_2).address)
+
+    loanParams = {
+        "id": "0x0",
+        "active": False,
+        "owner": Constants["ZERO_ADDRESS"],
+        "loanToken": DAI.address,
+        "collateralToken": LINK.address,
+        "minInitialMargin": 20e18,
+        "maintenanceMargin": 15e18,
+        "fixedLoanTerm": "0", # torque loan
+    }
+    tx = bzx.setupLoanParams([list(loanParams.values())])
+    return tx.events["LoanParamsIdSetup"][0]["id"]
+
+@pytest.fixture(scope="module")
+def loanIds(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId):
+    return [getLoanId(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId) for i in range(3)]
+
+def test_getLiquidatableLoansHealthy(bzx, loanIds):
+    loans, nextCursor = bzx.getLiquidatableLoans(0, 10)
+    assert(len(loans) == 0)
+    assert(nextCursor == 3)
+
+def test_getLiquidatableLoansMatchesAdvanced(bzx, priceFeeds, loanIds, LINK, DAI):
+    priceFeeds.setRates(LINK, DAI, 7e18)
+
+    loans, nextCursor = bzx.getLiquidatableLoans(0, 10)
+    assert(nextCursor == 3)
+    assert(len(loans) == 3)
+
+    advanced = { l[0]: l for l in bzx.getActiveLoansAdvanced(0, 10, True, False) }
+    for loan in loans:
+        expected = advanced[loan[0]]
+        assert(loan[1] == expected[11]) # currentMargin
+        assert(loan[2] == expected[13]) # maxLiquidatable
+        assert(loan[3] == expected[14]) # maxSeizable
+        assert(loan[2] > 0)
+
+def test_getLiquidatableLoansCursor(bzx, priceFeeds, loanIds, LINK, DAI):
+    priceFeeds.setRates(LINK, DAI, 7e18)
+
+    found = []
+    cursor = 0
+    while cursor < bzx.getActiveLoansCount():
+        loans, cursor = bzx.getLiquidatableLoans(cursor, 1)
+        found += [l[0] for l in loans]
+    assert(sorted(found) == sorted(loanIds))
+
+    loans, nextCursor = bzx.getLiquidatableLoans(5, 10)
+    assert(len(loans) == 0)
+    assert(nextCursor == 3)
+
+def test_getLiquidatableLoansGasBudget(bzx, priceFeeds, loanIds, LINK, DAI):
+    priceFeeds.setRates(LINK, DAI, 7e18)
+
+    # with barely more than the reserve available the scan stops early instead of running out of gas
+    loans, nextCursor = bzx.getLiquidatableLoans.call(0, 10, { "gas": 150000 })
+    assert(nextCursor < 3)
+    assert(len(loans) == nextCursor)
+
+def test_getLiquidatableLoansProgress(bzx, priceFeeds, loanIds, LINK, DAI):
+    priceFeeds.setRates(LINK, DAI, 7e18)
+
+    # below the reserve from the start, the first loan is still processed so a sweep never stalls
+    loans, nextCursor = bzx.getLiquidatableLoans.call(0, 10, { "gas": 110000 })
+    assert(nextCursor == 1)
+    assert(len(loans) == 1)
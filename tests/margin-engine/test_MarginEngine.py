@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+
+import pytest
+from helpers import getLoanId
+from offchain.loan_indexer import toLoan
+from offchain.margin_engine import LoanBook, RateTable, computeMargins
+
+@pytest.fixture(scope="module")
+def LinkDaiBorrowParamsId(Constants, LINK, DAI, bzx, accounts):
+    loanParams = {
+        "id": "0x0",
+        "active": False,
+        "owner": Constants["ZERO_ADDRESS"],
+        "loanToken": DAI.address,
+        "collateralToken": LINK.address,
+        "minInitialMargin": 20e18,
+        "maintenanceMargin": 15e18,
+        "fixedLoanTerm": "0", # torque loan
+    }
+    tx = bzx.setupLoanParams([list(loanParams.values())])
+    return tx.events["LoanParamsIdSetup"][0]["id"]
+
+@pytest.fixture(scope="module")
+def loanIds(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId):
+    return [getLoanId(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId) for i in range(3)]
+
+def getBook(bzx):
+    loans = [toLoan(l) for l in bzx.getActiveLoans(0, 100, False)]
+    incentivePercents = {}
+    for l in loans:
+        incentivePercents[(str(l.loanToken), str(l.collateralToken))] = bzx.liquidationIncentivePercent(l.loanToken, l.collateralToken)
+    return loans, LoanBook.fromLoans(loans, incentivePercents)
+
+def checkAgainstChain(bzx, priceFeeds):
+    loans, book = getBook(bzx)
+    result = computeMargins(book, RateTable.fromPriceFeeds(priceFeeds, book.ratePairs()))
+
+    for i, loan in enumerate(loans):
+        assert(result.currentMargin[i] == loan.currentMargin)
+        assert(result.maxLiquidatable[i] == loan.maxLiquidatable)
+        assert(result.maxSeizable[i] == loan.maxSeizable)
+        assert(result.shouldLiquidate[i] == (loan.currentMargin <= loan.maintenanceMargin))
+    return result
+
+def test_computeMarginsHealthy(bzx, priceFeeds, loanIds):
+    result = checkAgainstChain(bzx, priceFeeds)
+    assert(len(result.loanIds) == 3)
+    assert(not result.shouldLiquidate.any())
+
+def test_computeMarginsAfterPriceDrop(bzx, priceFeeds, loanIds, LINK, DAI):
+    priceFeeds.setRates(LINK, DAI, 7e18)
+    result = checkAgainstChain(bzx, priceFeeds)
+    assert(result.shouldLiquidate.all())
+    assert(all(result.maxLiquidatable != 0))
+
+    liquidatable = bzx.getActiveLoansAdvanced(0, 100, False, True)
+    assert(len(liquidatable) == sum(result.currentMargin != 0))
+
+def test_computeMarginsUnderwater(bzx, priceFeeds, loanIds, LINK, DAI):
+    priceFeeds.setRates(LINK, DAI, 5e18)
+    result = checkAgainstChain(bzx, priceFeeds)
+    loans, book = getBook(bzx)
+    assert(all(result.currentMargin == 0))
+    assert(all(result.maxLiquidatable == book.principal))
+    assert(all(result.maxSeizable == book.collateral))
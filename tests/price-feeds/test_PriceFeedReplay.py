@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import reverts
+from helpers import getLoanId
+from offchain.price_replay import PriceReplay, replayLiquidations, toWei
+
+# LINK falls from 10 DAI to 7 DAI at step 2
+LINK_PRICES = [toWei("0.1"), toWei("0.1"), toWei("0.07"), toWei("0.07")]
+
+@pytest.fixture(scope="module")
+def replayFeeds(accounts, priceFeeds, PriceFeedReplayMock, WETH, DAI, LINK):
+    return PriceReplay.deploy(
+        priceFeeds,
+        PriceFeedReplayMock,
+        {
+            WETH.address: [toWei(1)] * len(LINK_PRICES),
+            DAI.address: [toWei("0.01")] * len(LINK_PRICES),
+            LINK.address: LINK_PRICES,
+        },
+        accounts[0],
+        interval=600
+    )
+
+@pytest.fixture(scope="function")
+def replay(replayFeeds):
+    # the chain is reverted between tests, so every test replays from round 0
+    return PriceReplay(
+        replayFeeds.priceFeeds,
+        replayFeeds.feeds,
+        replayFeeds.acct,
+        replayFeeds.steps,
+        replayFeeds.interval
+    )
+
+@pytest.fixture(scope="module")
+def LinkDaiBorrowParamsId(Constants, LINK, DAI, bzx, accounts, LoanMaintenance_2):
+    bzx.replaceContract(accounts[0].deploy(LoanMaintenance_2).address)
+
+    loanParams = {
+        "id": "0x0",
+        "active": False,
+        "owner": Constants["ZERO_ADDRESS"],
+        "loanToken": DAI.address,
+        "collateralToken": LINK.address,
+        "minInitialMargin": 20e18,
+        "maintenanceMargin": 15e18,
+        "fixedLoanTerm": "0", # torque loan
+    }
+    tx = bzx.setupLoanParams([list(loanParams.values())])
+    return tx.events["LoanParamsIdSetup"][0]["id"]
+
+@pytest.fixture(scope="module")
+def loanIds(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId, replayFeeds):
+    return [getLoanId(Constants, bzx, DAI, LINK, accounts, web3, LinkDaiBorrowParamsId) for i in range(3)]
+
+def test_replayMock(accounts, PriceFeedReplayMock):
+    feed = accounts[0].deploy(PriceFeedReplayMock)
+    assert(feed.latestAnswer() == 0)
+
+    feed.pushAnswers([5, 6])
+    feed.pushAnswers([7])
+    assert(feed.getAnswersCount() == 3)
+    assert(feed.latestAnswer() == 5)
+
+    tx = feed.setRound(2)
+    assert(feed.latestAnswer() == 7)
+    assert(feed.latestTimestamp() == tx.timestamp)
+
+    with reverts("invalid round"):
+        feed.setRound(3)
+    with reverts("unauthorized"):
+        feed.setRound(1, { "from": accounts[1] })
+
+    feed.clearAnswers()
+    assert(feed.getAnswersCount() == 0)
+    assert(feed.latestAnswer() == 0)
+
+def test_replayPricesFeedsLocal(replay, priceFeeds, DAI, LINK, chain):
+    assert(priceFeeds.queryRate(LINK, DAI) == (10e18, 1e18))
+
+    timestamp = chain[-1].timestamp
+    assert(replay.step())
+    assert(replay.step())
+    assert(chain[-1].timestamp >= timestamp + 2 * 600)
+    assert(priceFeeds.queryRate(LINK, DAI) == (7e18, 1e18))
+
+    assert(replay.step())
+    assert(not replay.step())
+    assert(replay.round == 3)
+
+def test_replayLiquidations(replay, bzx, loanIds, DAI, accounts):
+    DAI.mint(accounts[3], 1000e18, { "from": accounts[0] })
+    DAI.approve(bzx, 1000e18, { "from": accounts[3] })
+
+    reports = replayLiquidations(replay, bzx, accounts[3])
+
+    assert([r.step for r in reports] == [0, 1, 2, 3])
+    assert([r.liquidatable for r in reports] == [0, 0, 3, 0])
+    assert([r.liquidated for r in reports] == [0, 0, 3, 0])
+    assert(reports[2].gasUsed > 0)
+    assert(bzx.getLiquidatableLoans(0, 10)[0] == [])
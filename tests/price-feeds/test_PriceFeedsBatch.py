@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import reverts
+
+@pytest.fixture(scope="module")
+def USDC(accounts, TestToken):
+    return accounts[0].deploy(TestToken, "USDC", "USDC", 6, 1e50)
+
+@pytest.fixture(scope="module")
+def chainlinkFeeds(accounts, PriceFeeds, FixedPriceFeed, DAI, LINK, USDC):
+    # PriceFeeds reading one FixedPriceFeed per token (eth denominated answers)
+    feeds = accounts[0].deploy(PriceFeeds)
+    answers = [
+        (DAI, 5e15),
+        (LINK, 2e16),
+        (USDC, 4e15),
+    ]
+    tokens = []
+    oracles = []
+    for token, answer in answers:
+        oracle = accounts[0].deploy(FixedPriceFeed)
+        oracle.setLatestAnswer(answer)
+        tokens.append(token.address)
+        oracles.append(oracle.address)
+    feeds.setPriceFeed(tokens, oracles)
+    feeds.setDecimals(tokens)
+    return feeds
+
+def checkBatch(feeds, sourceTokens, destTokens):
+    rates, precisions = feeds.queryRates(sourceTokens, destTokens)
+    assert(len(rates) == len(sourceTokens))
+    for i in range(len(sourceTokens)):
+        assert((rates[i], precisions[i]) == feeds.queryRate(sourceTokens[i], destTokens[i]))
+
+    amounts = [(i + 1) * 1e18 for i in range(len(sourceTokens))]
+    destAmounts = feeds.queryReturns(sourceTokens, destTokens, amounts)
+    for i in range(len(sourceTokens)):
+        assert(destAmounts[i] == feeds.queryReturn(sourceTokens[i], destTokens[i], amounts[i]))
+
+def test_queryRates(priceFeeds, DAI, LINK, WETH):
+    checkBatch(
+        priceFeeds,
+        [LINK, WETH, WETH, DAI, LINK],
+        [DAI, LINK, DAI, LINK, LINK]
+    )
+
+def test_queryRatesCachedFeeds(chainlinkFeeds, DAI, LINK, USDC):
+    # tokens repeat across pairs, so the batch reads each feed once
+    checkBatch(
+        chainlinkFeeds,
+        [LINK, DAI, USDC, LINK, DAI, USDC, DAI],
+        [DAI, LINK, DAI, USDC, USDC, LINK, DAI]
+    )
+
+def test_queryRatesEmpty(priceFeeds):
+    assert(priceFeeds.queryRates([], []) == ([], []))
+    assert(priceFeeds.queryReturns([], [], []) == [])
+
+def test_queryRatesCountMismatch(priceFeeds, chainlinkFeeds, DAI, LINK):
+    for feeds in [priceFeeds, chainlinkFeeds]:
+        with reverts("count mismatch"):
+            feeds.queryRates([LINK, DAI], [DAI])
+        with reverts("count mismatch"):
+            feeds.queryReturns([LINK], [DAI], [1e18, 1e18])
+
+def test_queryRatesPaused(chainlinkFeeds, DAI, LINK, accounts):
+    chainlinkFeeds.setGlobalPricingPaused(True)
+
+    with reverts("pricing is paused"):
+        chainlinkFeeds.queryRates([LINK], [DAI])
+    assert(chainlinkFeeds.queryReturns([LINK], [DAI], [1e18]) == [0])
+
+    chainlinkFeeds.setGlobalPricingPaused(False)
+
+def test_queryRatesUnsupportedFeed(chainlinkFeeds, DAI, accounts, TestToken):
+    token = accounts[0].deploy(TestToken, "XYZ", "XYZ", 18, 1e50)
+    with reverts("unsupported price feed"):
+        chainlinkFeeds.queryRates([DAI, token], [token, DAI])
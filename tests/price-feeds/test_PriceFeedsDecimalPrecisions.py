@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+
+import pytest
+from offchain.margin_engine import getDecimalPrecision
+
+@pytest.fixture(scope="module")
+def USDC(accounts, TestToken):
+    return accounts[0].deploy(TestToken, "USDC", "USDC", 6, 1e50)
+
+@pytest.fixture(scope="module")
+def WBTC(accounts, TestToken):
+    return accounts[0].deploy(TestToken, "WBTC", "WBTC", 8, 1e50)
+
+@pytest.fixture(scope="module")
+def chainlinkFeeds(accounts, PriceFeeds, FixedPriceFeed, DAI, USDC, WBTC):
+    feeds = accounts[0].deploy(PriceFeeds)
+    tokens = [DAI.address, USDC.address, WBTC.address]
+    feeds.setPriceFeed(tokens, [accounts[0].deploy(FixedPriceFeed) for t in tokens])
+    return feeds
+
+def test_decimalPrecisionsFallback(chainlinkFeeds, DAI, USDC):
+    # decimals not set yet, precision is read from the tokens
+    assert(chainlinkFeeds.decimalPrecisions(DAI, USDC) == 0)
+    assert(chainlinkFeeds.queryPrecision(DAI, USDC) == getDecimalPrecision(18, 6))
+    assert(chainlinkFeeds.queryPrecision(USDC, DAI) == getDecimalPrecision(6, 18))
+
+def test_setDecimalsFillsPairs(chainlinkFeeds, DAI, USDC, WBTC):
+    weth = chainlinkFeeds.wethToken()
+    decimals = {
+        weth: 18,
+        DAI.address: 18,
+        USDC.address: 6,
+        WBTC.address: 8,
+    }
+
+    chainlinkFeeds.setDecimals([DAI, USDC])
+    chainlinkFeeds.setDecimals([WBTC])
+
+    assert(chainlinkFeeds.getPrecisionTokensCount() == 4)
+    for source in decimals:
+        for dest in decimals:
+            if source == dest:
+                assert(chainlinkFeeds.decimalPrecisions(source, dest) == 0)
+                continue
+            expected = getDecimalPrecision(decimals[source], decimals[dest])
+            assert(chainlinkFeeds.decimalPrecisions(source, dest) == expected)
+            assert(chainlinkFeeds.queryPrecision(source, dest) == expected)
+
+def test_setDecimalsRepeated(chainlinkFeeds, DAI, USDC):
+    chainlinkFeeds.setDecimals([USDC])
+    chainlinkFeeds.setDecimals([USDC, DAI])
+
+    assert(chainlinkFeeds.getPrecisionTokensCount() == 4)
+    assert(chainlinkFeeds.decimalPrecisions(USDC, DAI) == getDecimalPrecision(6, 18))
@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+
+# Duration aware sharding of tests/ over xdist workers, see tests/conftest.py.
+#
+#   brownie test tests/ -n 4
+#
+# brownie already gives every worker its own ganache-cli (port 8555 + worker id)
+# and merges the results and coverage into build/tests.json. On top of that the
+# modules are handed out longest first, using the durations of previous runs in
+# build/tests/durations.json, so a long module doesn't start last. The gas profile
+# of each worker (--gas) is merged into the master's report. The summary compares
+# the wall time with the summed module durations, which is what a serial run takes.
+
+import glob
+import json
+import os
+import time
+from collections import OrderedDict
+from brownie.network.state import TxHistory
+from brownie.test import output
+from xdist.scheduler import LoadFileScheduling
+
+from deploymentcache import CACHE_DIR
+
+DURATIONS_PATH = os.path.join(CACHE_DIR, "durations.json")
+GAS_PROFILE_PATH = os.path.join(CACHE_DIR, "gas-{}.json")
+
+
+def moduleOf(nodeid):
+    return nodeid.split("::", 1)[0]
+
+
+def isWorker(config):
+    return hasattr(config, "workerinput")
+
+
+def isMaster(config):
+    return not isWorker(config) and bool(getattr(config.option, "numprocesses", None))
+
+
+def loadDurations():
+    try:
+        with open(DURATIONS_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class DurationScheduling(LoadFileScheduling):
+    '''
+    LoadFileScheduling that hands out the modules longest first. Modules without
+    a recorded duration are treated as the longest.
+    '''
+
+    def __init__(self, config, log=None, durations=None):
+        super().__init__(config, log)
+        self.durations = durations or {}
+        self.isSorted = False
+
+    def _assign_work_unit(self, node):
+        # the work queue is complete on the first assignment
+        if not self.isSorted:
+            unknown = max(self.durations.values(), default=0) + 1
+            self.workqueue = OrderedDict(
+                sorted(self.workqueue.items(), key=lambda unit: -self.durations.get(unit[0], unknown))
+            )
+            self.isSorted = True
+        super()._assign_work_unit(node)
+
+
+class DurationRecorder(object):
+
+    def __init__(self):
+        self.started = time.time()
+        self.durations = {}
+
+    def add(self, report):
+        # setup, call and teardown, module fixtures included
+        module = moduleOf(report.nodeid)
+        self.durations[module] = self.durations.get(module, 0) + report.duration
+
+    def save(self):
+        durations = loadDurations()
+        durations.update(self.durations)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(DURATIONS_PATH, "w") as f:
+            json.dump(durations, f, indent=2, sort_keys=True)
+
+    def summary(self, workers):
+        wall = time.time() - self.started
+        serial = sum(self.durations.values())
+        return [
+            "{} modules on {} workers".format(len(self.durations), workers),
+            "wall time {:.1f}s, serial time {:.1f}s, speedup {:.2f}x".format(wall, serial, serial / wall if wall else 0),
+        ]
+
+
+def saveGasProfile(workerid):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(GAS_PROFILE_PATH.format(workerid), "w") as f:
+        json.dump(TxHistory().gas_profile, f)
+
+
+def removeGasProfiles():
+    for path in glob.glob(GAS_PROFILE_PATH.format("*")):
+        os.remove(path)
+
+
+def mergeGasProfiles():
+    # same aggregation as TxHistory._gas, per function over all workers
+    profile = TxHistory().gas_profile
+    for path in glob.glob(GAS_PROFILE_PATH.format("*")):
+        with open(path) as f:
+            for fnName, gas in json.load(f).items():
+                if fnName not in profile:
+                    profile[fnName] = gas
+                    continue
+                total = profile[fnName]
+                count = total["count"] + gas["count"]
+                total.update({
+                    "avg": (total["avg"] * total["count"] + gas["avg"] * gas["count"]) // count,
+                    "high": max(total["high"], gas["high"]),
+                    "low": min(total["low"], gas["low"]),
+                    "count": count,
+                })
+        os.remove(path)
+    return output._build_gas_profile_output()
@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+
+import pytest
+from helpers import getLoanId
+from offchain.fee_sweep import (
+    BZRX, CURVE_ASSETS, SWEEP_GAS, feeDistribution, getSweepPlan, planSweep, simulateSweeps, sweepAll
+)
+
+DAI, USDC, USDT = CURVE_ASSETS
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+LINK = "0x514910771AF9Ca656af840dff83E8264EcF986CA"
+GAS_PRICE = 100 * 10**9
+
+def test_planSweepSkipsDust():
+    uniswapCost = (SWEEP_GAS.withdrawFee + SWEEP_GAS.uniswapConversion) * GAS_PRICE
+    plan = planSweep([WETH, LINK, BZRX], [uniswapCost, uniswapCost - 1, SWEEP_GAS.withdrawFee * GAS_PRICE], GAS_PRICE)
+    assert(plan.assets == [WETH, BZRX])
+    assert(plan.gas == 2 * SWEEP_GAS.withdrawFee + SWEEP_GAS.uniswapConversion)
+    assert(plan.netValue == 0)
+
+    # nothing has fees
+    assert(planSweep([WETH, LINK], [0, 0], GAS_PRICE).assets == [])
+
+def test_planSweepGroupsCurveAssets():
+    curveCost = (3 * SWEEP_GAS.withdrawFee + SWEEP_GAS.curveConversion) * GAS_PRICE
+
+    # each stablecoin alone is dust, together they pay for the Curve deposit
+    plan = planSweep([DAI, USDC, USDT, LINK], [curveCost // 3 + 1] * 3 + [0], GAS_PRICE)
+    assert(plan.assets == [DAI, USDC, USDT])
+    assert(plan.gas == 3 * SWEEP_GAS.withdrawFee + SWEEP_GAS.curveConversion)
+
+    plan = planSweep([DAI, USDC, USDT], [curveCost // 3 - 1] * 3, GAS_PRICE)
+    assert(plan.assets == [])
+
+    # free gas sweeps everything with fees, as sweepFeesByAsset
+    values = [1, 0, 5, 7]
+    assert(planSweep([DAI, USDC, USDT, LINK], values, 0).assets == sweepAll([DAI, USDC, USDT, LINK], values, 0).assets)
+
+def test_simulateSweeps():
+    assets = [WETH, LINK, BZRX, DAI, USDC, USDT] + ["0x%040x" % (i + 1) for i in range(6)]
+    for name in ["uniform", "longTail", "concentrated"]:
+        accruals = feeDistribution(name, len(assets), 30, 2 * 10**15, seed=3)
+        reports = simulateSweeps(assets, accruals, [0, GAS_PRICE])
+
+        # without gas costs both strategies capture everything
+        assert(reports[0]["all"].value == reports[0]["aboveDust"].value == sum(sum(row) for row in accruals))
+
+        # with gas costs skipping dust never nets less per sweep
+        dust, everything = reports[GAS_PRICE]["aboveDust"], reports[GAS_PRICE]["all"]
+        assert(dust.netValuePerGas >= everything.netValuePerGas)
+
+def test_getSweepPlanUnpricedAsset(Constants, bzx, priceFeeds, DAI, LINK, WETH, accounts, web3, PriceFeedReplayMock):
+    loanParams = {
+        "id": "0x0",
+        "active": False,
+        "owner": Constants["ZERO_ADDRESS"],
+        "loanToken": DAI.address,
+        "collateralToken": LINK.address,
+        "minInitialMargin": 20e18,
+        "maintenanceMargin": 15e18,
+        "fixedLoanTerm": "0", # torque loan
+    }
+    loanParamsId = bzx.setupLoanParams([list(loanParams.values())]).events["LoanParamsIdSetup"][0]["id"]
+    # the borrowing fee is held in LINK
+    getLoanId(Constants, bzx, DAI, LINK, accounts, web3, loanParamsId)
+    assert(getSweepPlan(bzx, priceFeeds, [DAI, LINK], 0).assets == [LINK.address])
+
+    # a feed without answers makes amountInEth revert for LINK, which is then left out of the plan
+    feed = accounts[0].deploy(PriceFeedReplayMock)
+    priceFeeds.setPriceFeed([LINK, WETH], [feed, feed])
+    assert(getSweepPlan(bzx, priceFeeds, [DAI, LINK], 0).assets == [])
@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+
+import pytest
+import random
+from brownie import chain, web3
+from offchain.staking_rewards import (
+    REWARDS_PRECISION, VESTING_CLIFF_TIMESTAMP, VESTING_END_TIMESTAMP,
+    StakerRewardsCalculator, vestedBalanceForAmount
+)
+
+STAKER_COUNT = 60
+
+@pytest.fixture(scope="module")
+def stakers():
+    rng = random.Random(7)
+    return [web3.toChecksumAddress("0x" + "%040x" % rng.getrandbits(160)) for i in range(STAKER_COUNT)]
+
+@pytest.fixture(scope="module")
+def staking(accounts, StakingV1Mock, stakers):
+    staking = accounts[0].deploy(StakingV1Mock)
+    rng = random.Random(11)
+
+    def amounts(maxValue):
+        # about a quarter of the stakers hold none
+        return [rng.randrange(maxValue) if rng.random() > 0.25 else 0 for i in stakers]
+
+    bzrxPerTokenStored = rng.randrange(10**36)
+    stableCoinPerTokenStored = rng.randrange(10**35)
+    staking.setPerTokenStored(bzrxPerTokenStored, stableCoinPerTokenStored)
+    staking.setWeightsStored(rng.randrange(10**18), 10**18 + rng.randrange(10**18), rng.randrange(5 * 10**18))
+
+    for token in [staking.BZRX(), staking.iBZRX(), staking.vBZRX(), staking.LPToken()]:
+        staking.setBalances(token, stakers, amounts(10**24))
+
+    # paid up to date for some stakers, behind for the rest
+    staking.setRewardsPerTokenPaid(
+        stakers,
+        [rng.choice([bzrxPerTokenStored, rng.randrange(bzrxPerTokenStored)]) for i in stakers],
+        [rng.choice([stableCoinPerTokenStored, rng.randrange(stableCoinPerTokenStored)]) for i in stakers]
+    )
+    staking.setRewards(stakers, amounts(10**22), amounts(10**22))
+
+    # last syncs before the cliff, during vesting and after it ended
+    lastSync = [rng.choice([
+        0,
+        VESTING_CLIFF_TIMESTAMP - rng.randrange(10**6),
+        rng.randrange(VESTING_CLIFF_TIMESTAMP, VESTING_END_TIMESTAMP),
+        VESTING_END_TIMESTAMP + rng.randrange(10**6)
+    ]) for i in stakers]
+    staking.setVesting(stakers, amounts(10**22), amounts(10**22), lastSync)
+    return staking
+
+def test_vestedBalanceForAmount(staking):
+    timestamp = chain.time()
+    times = [0, VESTING_CLIFF_TIMESTAMP - 1, VESTING_CLIFF_TIMESTAMP + 12345, VESTING_END_TIMESTAMP - 1, VESTING_END_TIMESTAMP, timestamp]
+    for lastUpdate in times:
+        expected = [staking.vestedBalanceForAmount(REWARDS_PRECISION, lastUpdate, end) for end in times]
+        assert(list(vestedBalanceForAmount(REWARDS_PRECISION, [lastUpdate] * len(times), times, timestamp)) == expected)
+
+def test_earnedMatchesStaking(staking, stakers):
+    calculator = StakerRewardsCalculator(staking)
+    assert(calculator.bootstrap(stakers) == STAKER_COUNT)
+
+    earned = calculator.earned(chain.time())
+    for i, account in enumerate(stakers):
+        assert(staking.earned(account) == (
+            earned.bzrxRewardsEarned[i],
+            earned.stableCoinRewardsEarned[i],
+            earned.bzrxRewardsVesting[i],
+            earned.stableCoinRewardsVesting[i]
+        ))
+
+def test_refresh(staking, stakers):
+    calculator = StakerRewardsCalculator(staking)
+    calculator.bootstrap(stakers)
+
+    # new rewards only move the per token values
+    staking.setPerTokenStored(staking.bzrxPerTokenStored() + 10**35, staking.stableCoinPerTokenStored() + 10**34)
+    assert(calculator.sync() == 0)
+    account = stakers[3]
+    assert(calculator.earnedOf(account, chain.time()) == staking.earned(account))
+
+    # an updated staker is read again with refreshAccounts
+    staking.setBalances(staking.vBZRX(), [account], [10**24])
+    staking.setRewards([account], [5 * 10**21], [0])
+    assert(calculator.refreshAccounts([account]) == 1)
+    assert(len(calculator) == STAKER_COUNT)
+    assert(calculator.earnedOf(account, chain.time()) == staking.earned(account))
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+
+import pytest
+import random
+from brownie import Contract, web3
+
+STAKER_COUNT = 25
+
+@pytest.fixture(scope="module")
+def stakers():
+    rng = random.Random(5)
+    return [web3.toChecksumAddress("0x" + "%040x" % rng.getrandbits(160)) for i in range(STAKER_COUNT)]
+
+@pytest.fixture(scope="module")
+def staking(accounts, StakingProxy, StakingV1Mock, stakers):
+    proxy = accounts[0].deploy(StakingProxy, accounts[0].deploy(StakingV1Mock))
+    staking = Contract.from_abi("staking", address=proxy.address, abi=StakingV1Mock.abi, owner=accounts[0])
+    rng = random.Random(9)
+
+    def amounts(maxValue):
+        return [rng.randrange(maxValue) if rng.random() > 0.3 else 0 for i in stakers]
+
+    staking.setPerTokenStored(7 * 10**35, 3 * 10**34)
+    staking.setWeightsStored(3 * 10**17, 11 * 10**17, 2 * 10**18)
+    for token in [staking.BZRX(), staking.iBZRX(), staking.vBZRX(), staking.LPToken()]:
+        staking.setBalances(token, stakers, amounts(10**24))
+    staking.setRewardsPerTokenPaid(stakers, amounts(7 * 10**35), amounts(3 * 10**34))
+    staking.setRewards(stakers, amounts(10**22), amounts(10**22))
+    staking.setVesting(stakers, amounts(10**22), amounts(10**22), [rng.randrange(1610416800, 1720792800) for i in stakers])
+    return staking
+
+def test_balanceOfByAssetsBatch(staking, stakers):
+    balances = staking.balanceOfByAssetsBatch(stakers)
+    for i, account in enumerate(stakers):
+        assert(staking.balanceOfByAssets(account) == [b[i] for b in balances])
+
+def test_balanceOfStoredBatch(staking, stakers):
+    vestedBalances, vestingBalances = staking.balanceOfStoredBatch(stakers)
+    for i, account in enumerate(stakers):
+        assert(staking.balanceOfStored(account) == (vestedBalances[i], vestingBalances[i]))
+
+def test_earnedBatch(staking, stakers):
+    earned = staking.earnedBatch(stakers)
+    for i, account in enumerate(stakers):
+        assert(staking.earned(account) == [e[i] for e in earned])
+
+    # duplicates and unknown accounts are answered like single calls
+    accounts = [stakers[0], stakers[0], "0x0000000000000000000000000000000000000001"]
+    earned = staking.earnedBatch(accounts)
+    assert([e[2] for e in earned] == [0, 0, 0, 0])
+    assert([e[0] for e in earned] == [e[1] for e in earned])
+
+def test_emptyBatch(staking):
+    assert(staking.earnedBatch([]) == ([], [], [], []))
+    assert(staking.balanceOfStoredBatch([]) == ([], []))
@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import chain
+from offchain.staking_rewards import (
+    REWARDS_PRECISION, VESTING_CLIFF_TIMESTAMP, VESTING_END_TIMESTAMP,
+    StakerRewardsCalculator, vestingMultiplier
+)
+
+@pytest.fixture(scope="module")
+def staking(accounts, StakingV1Mock):
+    staking = accounts[0].deploy(StakingV1Mock)
+    staking.setPerTokenStored(3 * 10**35, 2 * 10**34)
+    staking.setWeightsStored(4 * 10**17, 11 * 10**17, 2 * 10**18)
+    return staking
+
+def test_vestingMultiplier(staking):
+    timestamp = chain.time()
+    times = [0, VESTING_CLIFF_TIMESTAMP - 1, VESTING_CLIFF_TIMESTAMP, VESTING_CLIFF_TIMESTAMP + 86400 * 77 + 13, VESTING_END_TIMESTAMP - 1, VESTING_END_TIMESTAMP, timestamp]
+    for lastUpdate in times:
+        for vestingEndTime in times:
+            expected = staking.vestedBalanceForAmount(REWARDS_PRECISION, lastUpdate, vestingEndTime)
+            assert(staking.vestingMultiplier(lastUpdate, vestingEndTime) == expected)
+            assert(vestingMultiplier(lastUpdate, vestingEndTime, timestamp) == expected)
+
+def test_updateRewards(staking, accounts):
+    # staking nothing still settles the account's rewards
+    account = accounts[1]
+    lastSync = VESTING_CLIFF_TIMESTAMP + 86400 * 300
+    staking.setBalances(staking.BZRX(), [account], [500e18])
+    staking.setBalances(staking.vBZRX(), [account], [2000e18])
+    staking.setRewardsPerTokenPaid([account], [10**35], [10**34])
+    staking.setRewards([account], [10e18], [3e18])
+    staking.setVesting([account], [7e18], [1e18], [lastSync])
+
+    calculator = StakerRewardsCalculator(staking)
+    calculator.bootstrap([account])
+    bzrxRewardsEarned, stableCoinRewardsEarned, _, _ = calculator.earnedOf(account, chain.time())
+
+    tx = staking.stake([staking.BZRX()], [0], {"from": account})
+    assert(staking.bzrxRewards(account) == bzrxRewardsEarned)
+    assert(staking.stableCoinRewards(account) == stableCoinRewardsEarned)
+    assert(staking.bzrxRewardsPerTokenPaid(account) == 3 * 10**35)
+    assert(staking.stableCoinRewardsPerTokenPaid(account) == 2 * 10**34)
+    assert(staking.vestingLastSync(account) == tx.timestamp)
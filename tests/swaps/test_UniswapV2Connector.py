@@ -0,0 +1,143 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import reverts
+from offchain.uniswap_quotes import ZERO_ADDRESS, PairReserves, UniswapV2QuoteEngine, getConnector
+
+@pytest.fixture(scope="module")
+def tokens(accounts, TestToken):
+    return {symbol: accounts[0].deploy(TestToken, symbol, symbol, 18, 10**30) for symbol in ["WETH", "USDT", "LINK", "UNI"]}
+
+@pytest.fixture(scope="module")
+def router(accounts, TestUniswapV2Router, tokens):
+    router = accounts[0].deploy(TestUniswapV2Router)
+    for token in tokens.values():
+        token.approve(router, 2**256-1, {"from": accounts[0]})
+    # 1 LINK = 2 UNI everywhere: a shallow direct pair, a deep route through WETH and a shallower one through USDT
+    router.createPair(tokens["LINK"], tokens["UNI"], 10**21, 2 * 10**21)
+    router.createPair(tokens["LINK"], tokens["WETH"], 10**23, 10**22)
+    router.createPair(tokens["WETH"], tokens["UNI"], 10**22, 2 * 10**23)
+    router.createPair(tokens["LINK"], tokens["USDT"], 5 * 10**22, 10**24)
+    router.createPair(tokens["USDT"], tokens["UNI"], 10**24, 10**23)
+    return router
+
+@pytest.fixture(scope="module")
+def connector(accounts, SwapsImplUniswapV2Mock, router, tokens):
+    connector = accounts[0].deploy(SwapsImplUniswapV2Mock)
+    connector.setRouter(router, [tokens["WETH"], tokens["USDT"]])
+    connector.setSupportedTokens(list(tokens.values()), True)
+    connector.setSwapApprovals(list(tokens.values()))
+    return connector
+
+@pytest.fixture(autouse=True)
+def isolate(fn_isolation):
+    pass
+
+def quoteEngine(connector, router):
+    # TestUniswapV2Router charges the PancakeSwap fee, and also serves getPair as the factory
+    settings = getConnector("BSC")
+    settings.router = router.address
+    settings.swapsImpl = connector
+    settings.splitRoutingEnabled = connector.splitRoutingEnabled()
+    reserves = PairReserves(router)
+    reserves.sync()
+    return UniswapV2QuoteEngine(settings, reserves)
+
+def test_dexAmountOut(connector, router, tokens):
+    LINK, UNI, WETH = tokens["LINK"], tokens["UNI"], tokens["WETH"]
+    engine = quoteEngine(connector, router)
+    for amountIn in [10**15, 10**18, 10**20, 10**22]:
+        amountOut, midToken = connector.dexAmountOut(LINK, UNI, amountIn)
+        assert((amountOut, midToken) == engine.dexAmountOut(LINK, UNI, amountIn))
+        assert(connector.dexAmountIn(LINK, UNI, amountOut) == engine.dexAmountIn(LINK, UNI, amountOut))
+
+    # small amounts take the direct pair, large ones the deeper WETH route
+    assert(connector.dexAmountOut(LINK, UNI, 10**18)[1] == ZERO_ADDRESS)
+    assert(connector.dexAmountOut(LINK, UNI, 10**22)[1] == WETH.address)
+
+    # more than every route holds
+    assert(connector.dexAmountIn(LINK, UNI, 10**24) == (0, ZERO_ADDRESS))
+
+def test_dexSwap(accounts, connector, router, tokens):
+    LINK, UNI = tokens["LINK"], tokens["UNI"]
+    engine = quoteEngine(connector, router)
+
+    amountIn = 10**22
+    expected, midToken = engine.dexAmountOut(LINK, UNI, amountIn)
+    LINK.transfer(connector, amountIn, {"from": accounts[0]})
+    tx = connector.dexSwap(LINK, UNI, accounts[1], accounts[0], amountIn, amountIn, 0, {"from": accounts[0]})
+    assert(tx.return_value == (expected, amountIn))
+    assert(UNI.balanceOf(accounts[1]) == expected)
+
+    # the cached reserves follow the swap through the pairs' Sync events
+    engine.reserves.sync()
+    assert(engine.dexAmountOut(LINK, UNI, amountIn) == connector.dexAmountOut(LINK, UNI, amountIn))
+
+    # exact out: the unused source amount goes back to returnToSender
+    required = 10**20
+    amountNeeded, _ = engine.dexAmountIn(LINK, UNI, required)
+    LINK.transfer(connector, 2 * amountNeeded, {"from": accounts[0]})
+    balanceBefore = LINK.balanceOf(accounts[0])
+    tx = connector.dexSwap(LINK, UNI, accounts[2], accounts[0], 0, 2 * amountNeeded, required, {"from": accounts[0]})
+    received, used = tx.return_value
+    assert(used == amountNeeded)
+    assert(received >= required)
+    assert(UNI.balanceOf(accounts[2]) == received)
+    assert(LINK.balanceOf(accounts[0]) == balanceBefore + amountNeeded)
+    assert(LINK.balanceOf(connector) == 0)
+
+def test_swapRoute(accounts, connector, router, tokens):
+    LINK, UNI, WETH, USDT = tokens["LINK"], tokens["UNI"], tokens["WETH"], tokens["USDT"]
+    assert(list(connector.getSwapRoute(LINK, UNI)) == [ZERO_ADDRESS, WETH.address, USDT.address])
+
+    with reverts("unauthorized"):
+        connector.setSwapRoute(LINK, UNI, [USDT], {"from": accounts[1]})
+    with reverts("too many routes"):
+        connector.setSwapRoute(LINK, UNI, [USDT] * 9, {"from": accounts[0]})
+
+    # only the listed mid tokens are tried, WETH is left out
+    tx = connector.setSwapRoute(LINK, UNI, [USDT, ZERO_ADDRESS], {"from": accounts[0]})
+    assert(list(tx.events["SetSwapRoute"][0]["midTokens"]) == [USDT.address, ZERO_ADDRESS])
+    assert(list(connector.getSwapRoute(LINK, UNI)) == [USDT.address, ZERO_ADDRESS])
+    amountOut, midToken = connector.dexAmountOut(LINK, UNI, 10**22)
+    assert(midToken == USDT.address)
+    assert((amountOut, midToken) == quoteEngine(connector, router).dexAmountOut(LINK, UNI, 10**22))
+    assert(connector.dexAmountIn(LINK, UNI, 10**20)[1] == USDT.address)
+
+    # the reverse direction keeps the default route
+    assert(connector.dexAmountOut(UNI, LINK, 2 * 10**22)[1] == WETH.address)
+
+    # an empty list restores the default route
+    connector.setSwapRoute(LINK, UNI, [], {"from": accounts[0]})
+    assert(list(connector.getSwapRoute(LINK, UNI)) == [ZERO_ADDRESS, WETH.address, USDT.address])
+    assert(connector.dexAmountOut(LINK, UNI, 10**22)[1] == WETH.address)
+
+def test_splitRouting(accounts, connector, router, tokens):
+    LINK, UNI, WETH, USDT = tokens["LINK"], tokens["UNI"], tokens["WETH"], tokens["USDT"]
+    amountIn = 2 * 10**22
+    single, singleMidToken = connector.dexAmountOut(LINK, UNI, amountIn)
+    assert(connector.dexAmountOutWithSplit(LINK, UNI, amountIn) == (single, singleMidToken, ZERO_ADDRESS, 0))
+
+    with reverts("unauthorized"):
+        connector.setSplitRouting(True, {"from": accounts[1]})
+    connector.setSplitRouting(True, {"from": accounts[0]})
+
+    # part of the amount goes through USDT, the second best route
+    amountOut, midToken, splitMidToken, splitAmountIn = connector.dexAmountOutWithSplit(LINK, UNI, amountIn)
+    assert(midToken == WETH.address)
+    assert(splitMidToken == USDT.address)
+    assert(splitAmountIn in [amountIn // 4, amountIn // 2, amountIn * 3 // 4])
+    assert(amountOut > single)
+    assert(connector.dexAmountOut(LINK, UNI, amountIn) == (amountOut, midToken))
+    engine = quoteEngine(connector, router)
+    assert((amountOut, midToken, splitMidToken, splitAmountIn) == tuple(a[0] for a in engine.dexAmountsOutWithSplit(LINK, UNI, [amountIn])))
+
+    # both legs are swapped
+    LINK.transfer(connector, amountIn, {"from": accounts[0]})
+    tx = connector.dexSwap(LINK, UNI, accounts[1], accounts[0], amountIn, amountIn, 0, {"from": accounts[0]})
+    assert(tx.return_value == (amountOut, amountIn))
+    assert(UNI.balanceOf(accounts[1]) == amountOut)
+    assert(len(tx.events["Sync"]) == 4)
+
+    # small amounts are not split
+    assert(connector.dexAmountOutWithSplit(LINK, UNI, 10**18)[3] == 0)
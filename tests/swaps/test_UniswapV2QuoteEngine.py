@@ -0,0 +1,109 @@
+#!/usr/bin/python3
+
+import pytest
+from munch import Munch
+from offchain.uniswap_quotes import MAX_UINT, ZERO_ADDRESS, PairReserves, UniswapV2QuoteEngine, getConnector
+
+@pytest.fixture(scope="module")
+def tokens(accounts):
+    # addresses only, no contracts are needed to quote from set reserves
+    return Munch({
+        "a": accounts[5].address,
+        "b": accounts[6].address,
+        "weth": accounts[7].address,
+        "dai": accounts[8].address,
+    })
+
+@pytest.fixture(scope="function")
+def engine(tokens):
+    connector = getConnector("ETH")
+    connector.midTokens = [tokens.weth, tokens.dai]
+    reserves = PairReserves()
+    reserves.setReserves(tokens.a, tokens.b, 1000e18, 500e18)
+    return UniswapV2QuoteEngine(connector, reserves)
+
+def test_getAmountsOut(engine, tokens):
+    # amountIn * 997 * reserveOut / (reserveIn * 1000 + amountIn * 997)
+    assert(list(engine.getAmountsOut([1e18, 0], [tokens.a, tokens.b])) == [498003490519951608, 0])
+    assert(list(engine.getAmountsOut([1e18], [tokens.b, tokens.a])) == [1990031876438381866])
+
+    # no pair, overflow
+    assert(list(engine.getAmountsOut([1e18], [tokens.a, tokens.dai])) == [0])
+    assert(list(engine.getAmountsOut([2**250], [tokens.a, tokens.b])) == [0])
+
+def test_getAmountsIn(engine, tokens):
+    # reserveIn * amountOut * 1000 / ((reserveOut - amountOut) * 997) + 1
+    assert(list(engine.getAmountsIn([1e18], [tokens.a, tokens.b])) == [2010038130423334131])
+
+    # amountOut == 0, amountOut >= reserveOut, no pair
+    assert(list(engine.getAmountsIn([0, 500e18], [tokens.a, tokens.b])) == [MAX_UINT, MAX_UINT])
+    assert(list(engine.getAmountsIn([1e18], [tokens.a, tokens.dai])) == [MAX_UINT])
+
+def test_dexAmountOutMidToken(engine, tokens):
+    assert(engine.dexAmountOut(tokens.a, tokens.b, 1e18) == (498003490519951608, ZERO_ADDRESS))
+    assert(engine.dexAmountOut(tokens.a, tokens.a, 1e18) == (1e18, ZERO_ADDRESS))
+    assert(engine.dexAmountOut(tokens.a, tokens.b, 0) == (0, ZERO_ADDRESS))
+
+    # a deeper route through weth wins for large amounts only
+    engine.reserves.setReserves(tokens.a, tokens.weth, 10**23, 10**23)
+    engine.reserves.setReserves(tokens.weth, tokens.b, 10**23, 5 * 10**22)
+    amountsOut, midTokens = engine.dexAmountsOut(tokens.a, tokens.b, [1e15, 100e18])
+    assert(midTokens[0] == ZERO_ADDRESS)
+    assert(midTokens[1] == tokens.weth)
+    assert(amountsOut[1] == engine.getAmountsOut([100e18], [tokens.a, tokens.weth, tokens.b])[0])
+    assert(amountsOut[1] > engine.getAmountsOut([100e18], [tokens.a, tokens.b])[0])
+
+def test_dexAmountInMidToken(engine, tokens):
+    assert(engine.dexAmountIn(tokens.a, tokens.b, 1e18) == (2010038130423334131, ZERO_ADDRESS))
+
+    # more than the direct pair holds: only the weth route can fill it
+    engine.reserves.setReserves(tokens.a, tokens.weth, 10**23, 10**23)
+    engine.reserves.setReserves(tokens.weth, tokens.b, 10**23, 5 * 10**22)
+    amountIn, midToken = engine.dexAmountIn(tokens.a, tokens.b, 600e18)
+    assert(midToken == tokens.weth)
+    assert(amountIn == engine.getAmountsIn([600e18], [tokens.a, tokens.weth, tokens.b])[0])
+
+    # nothing can fill it
+    assert(engine.dexAmountIn(tokens.a, tokens.b, 60000e18) == (0, ZERO_ADDRESS))
+
+def test_pancakeFee(tokens):
+    connector = getConnector("BSC")
+    reserves = PairReserves()
+    reserves.setReserves(tokens.a, tokens.b, 1000e18, 500e18)
+    engine = UniswapV2QuoteEngine(connector, reserves)
+
+    amountInWithFee = 10**18 * 9975
+    assert(engine.getAmountsOut([1e18], [tokens.a, tokens.b])[0] == amountInWithFee * 500 * 10**18 // (1000 * 10**18 * 10000 + amountInWithFee))
+
+def test_swapRoute(engine, tokens):
+    engine.reserves.setReserves(tokens.a, tokens.weth, 10**23, 10**23)
+    engine.reserves.setReserves(tokens.weth, tokens.b, 10**23, 5 * 10**22)
+    assert(engine.getRoute(tokens.a, tokens.b) == [ZERO_ADDRESS, tokens.weth, tokens.dai])
+
+    # a route set with setSwapRoute: only the listed mid tokens are tried
+    engine.connector.routes[(tokens.a, tokens.b)] = [tokens.dai, ZERO_ADDRESS]
+    assert([midToken for midToken, _ in engine.candidatePaths(tokens.a, tokens.b)] == [tokens.dai, ZERO_ADDRESS])
+    assert(engine.dexAmountOut(tokens.a, tokens.b, 100e18) == (engine.getAmountsOut([100e18], [tokens.a, tokens.b])[0], ZERO_ADDRESS))
+
+    # the reverse direction keeps the default route
+    assert(engine.dexAmountOut(tokens.b, tokens.a, 100e18)[1] == tokens.weth)
+
+def test_splitRoute(engine, tokens):
+    # two pools of the same depth: half through each beats either one alone
+    engine.reserves.setReserves(tokens.a, tokens.weth, 10**21, 10**21)
+    engine.reserves.setReserves(tokens.weth, tokens.b, 10**23, 5 * 10**22)
+    amountIn = 100 * 10**18
+    direct = engine.getAmountsOut([amountIn], [tokens.a, tokens.b])[0]
+    assert(engine.dexAmountOut(tokens.a, tokens.b, amountIn) == (direct, ZERO_ADDRESS))
+
+    engine.connector.splitRoutingEnabled = True
+    amountOut, midToken, splitMidToken, splitAmountIn = [a[0] for a in engine.dexAmountsOutWithSplit(tokens.a, tokens.b, [amountIn])]
+    assert(midToken == ZERO_ADDRESS)
+    assert(splitMidToken == tokens.weth)
+    assert(splitAmountIn in [amountIn // 4, amountIn // 2, amountIn * 3 // 4])
+    assert(amountOut == engine.getAmountsOut([amountIn - splitAmountIn], [tokens.a, tokens.b])[0]
+        + engine.getAmountsOut([splitAmountIn], [tokens.a, tokens.weth, tokens.b])[0])
+    assert(amountOut > direct)
+
+    # no second path, no split
+    assert([a[0] for a in engine.dexAmountsOutWithSplit(tokens.b, tokens.dai, [amountIn])] == [0, ZERO_ADDRESS, ZERO_ADDRESS, 0])
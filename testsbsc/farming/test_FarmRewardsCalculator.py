@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import Contract, chain
+
+from testsbsc.conftest import initBalance, requireFork
+from offchain.farm_rewards import FarmRewardsCalculator
+
+INITIAL_LP_TOKEN_ACCOUNT_AMOUNT = 10 * 10 ** 18
+PID = 0
+GOV_POOL_PID = 7
+
+
+@pytest.fixture(autouse=True)
+def isolate(fn_isolation):
+    pass
+
+
+def assertMatchesFarm(masterChef, calculator, users):
+    # eth_call can run in the pending block, so the calculator is checked at both
+    pendingGOV = [calculator.pendingGOV(chain.height), calculator.pendingGOV(chain.height + 1)]
+    altRewards = calculator.pendingAltRewards()
+    for user in users:
+        i = calculator.users.index(str(user))
+        assert list(masterChef.getPendingGOV(user)) in [list(pendingGOV[0][i]), list(pendingGOV[1][i])]
+        assert altRewards[i] == masterChef.pendingAltRewards(user)
+
+
+def testFarming_rewardsCalculator(requireFork, accounts, masterChef, tokens, bgovToken, MasterChef_BSC):
+    # the alt reward functions are not part of IMasterChefAdmin
+    masterChef = Contract.from_abi("masterChef", address=masterChef.address, abi=MasterChef_BSC.abi)
+    masterChef.setLocked(PID, False, {'from': masterChef.owner()})
+    lpToken = tokens['iBNB']
+    users = [accounts[2], accounts[3]]
+    for user in users:
+        initBalance(user, tokens['BNB'], lpToken, INITIAL_LP_TOKEN_ACCOUNT_AMOUNT)
+        lpToken.approve(masterChef, 2**256-1, {'from': user})
+        masterChef.deposit(PID, lpToken.balanceOf(user), {'from': user})
+    chain.mine(10)
+
+    calculator = FarmRewardsCalculator(masterChef, "bsc")
+    calculator.bootstrap(users)
+    assertMatchesFarm(masterChef, calculator, users)
+
+    # claimed rewards go to the GOV pool, which earns the alt rewards
+    masterChef.claimReward(PID, {'from': users[0]})
+    bgovToken.approve(masterChef, 2**256-1, {'from': users[0]})
+    masterChef.deposit(GOV_POOL_PID, bgovToken.balanceOf(users[0]), {'from': users[0]})
+    masterChef.addAltReward({'from': accounts[0], 'value': 10**18})
+    masterChef.claimReward(PID, {'from': users[1]})
+    chain.mine(10)
+
+    assert calculator.sync() == 2
+    assert calculator.pendingAltRewards()[0] > 0
+    assertMatchesFarm(masterChef, calculator, users)
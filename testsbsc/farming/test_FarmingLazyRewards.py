@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import chain, reverts
+
+from testsbsc.conftest import initBalance, requireFork
+
+INITIAL_LP_TOKEN_ACCOUNT_AMOUNT = 10 * 10 ** 18
+PID = 0
+
+
+@pytest.fixture(autouse=True)
+def isolate(fn_isolation):
+    pass
+
+
+def accrued(masterChef, fromBlock, toBlock, GOVPerBlock, totalAllocPoint):
+    return masterChef.getMultiplierPrecise(fromBlock, toBlock) * GOVPerBlock * 10**12 // totalAllocPoint
+
+
+def testFarming_migrateToLazyRewards(requireFork, accounts, masterChef, tokens):
+    owner = masterChef.owner()
+    account1 = accounts[2]
+    lpToken = tokens['iBNB']
+    initBalance(account1, tokens['BNB'], lpToken, INITIAL_LP_TOKEN_ACCOUNT_AMOUNT)
+    lpToken.approve(masterChef, 2**256-1, {'from': account1})
+    masterChef.deposit(PID, lpToken.balanceOf(account1), {'from': account1})
+    chain.mine(10)
+
+    with reverts("Ownable: caller is not the owner"):
+        masterChef.migrateToLazyRewards({'from': account1})
+
+    pendingBefore = masterChef.pendingGOV(PID, account1)
+    tx = masterChef.migrateToLazyRewards({'from': owner})
+    assert masterChef.lazyRewardsEnabled()
+    assert masterChef.lastGlobalRewardBlock() == tx.block_number
+    assert masterChef.accGOVPerAllocPoint() == 0
+    assert tx.events['EmissionCheckpoint'][0]['totalAllocPoint'] == masterChef.totalAllocPoint()
+    for pid in range(masterChef.poolLength()):
+        assert masterChef.poolInfo(pid)[2] >= tx.block_number # lastRewardBlock
+        assert masterChef.poolGOVPerAllocPointPaid(pid) == 0
+
+    # pending rewards carry over and keep accruing
+    chain.mine(10)
+    assert masterChef.pendingGOV(PID, account1) > pendingBefore
+
+    with reverts("migrated"):
+        masterChef.migrateToLazyRewards({'from': owner})
+
+
+def testFarming_lazyUpdatePool(requireFork, accounts, masterChef, tokens):
+    owner = masterChef.owner()
+    account1 = accounts[2]
+    lpToken = tokens['iBNB']
+    initBalance(account1, tokens['BNB'], lpToken, INITIAL_LP_TOKEN_ACCOUNT_AMOUNT)
+    lpToken.approve(masterChef, 2**256-1, {'from': account1})
+    masterChef.deposit(PID, lpToken.balanceOf(account1), {'from': account1})
+
+    masterChef.migrateToLazyRewards({'from': owner})
+    fromBlock = masterChef.lastGlobalRewardBlock()
+    chain.mine(10)
+
+    tx = masterChef.updatePool(PID, {'from': account1})
+    acc = accrued(masterChef, fromBlock, tx.block_number, masterChef.GOVPerBlock(), masterChef.totalAllocPoint())
+    assert masterChef.accGOVPerAllocPoint() == acc
+    assert masterChef.poolGOVPerAllocPointPaid(PID) == acc
+    assert masterChef.poolInfo(PID)[2] == tx.block_number
+
+    # after the update nothing is pending for the pool at the same block
+    pending = masterChef.pendingGOV(PID, account1)
+    masterChef.claimReward(PID, {'from': account1})
+    assert masterChef.pendingGOV(PID, account1) == 0
+    assert pending > 0
+
+
+def testFarming_lazySetAndEmissionChange(requireFork, accounts, masterChef):
+    owner = masterChef.owner()
+    masterChef.migrateToLazyRewards({'from': owner})
+    otherPid = 1 if PID != 1 else 2
+    otherLastRewardBlock = masterChef.poolInfo(otherPid)[2]
+
+    # set only settles the pool it changes, _withUpdate is not needed
+    chain.mine(5)
+    allocPoint = masterChef.poolInfo(PID)[1]
+    tx = masterChef.set(PID, allocPoint * 2, True, {'from': owner})
+    assert masterChef.poolInfo(PID)[2] == tx.block_number
+    assert masterChef.poolInfo(otherPid)[2] == otherLastRewardBlock
+    assert masterChef.lastGlobalRewardBlock() == tx.block_number
+    assert tx.events['EmissionCheckpoint'][0]['totalAllocPoint'] == masterChef.totalAllocPoint()
+
+    # the emission change is checkpointed, blocks before it accrue at the old rate
+    GOVPerBlock = masterChef.GOVPerBlock()
+    totalAllocPoint = masterChef.totalAllocPoint()
+    fromBlock = masterChef.lastGlobalRewardBlock()
+    accBefore = masterChef.accGOVPerAllocPoint()
+    chain.mine(5)
+    tx = masterChef.setGOVPerBlock(GOVPerBlock // 2, {'from': owner})
+    checkpointBlock = tx.block_number
+    accCheckpoint = accBefore + accrued(masterChef, fromBlock, checkpointBlock, GOVPerBlock, totalAllocPoint)
+    assert masterChef.accGOVPerAllocPoint() == accCheckpoint
+    assert masterChef.poolInfo(otherPid)[2] == otherLastRewardBlock
+
+    chain.mine(5)
+    tx = masterChef.updatePool(otherPid, {'from': owner})
+    assert masterChef.accGOVPerAllocPoint() == accCheckpoint + accrued(masterChef, checkpointBlock, tx.block_number, GOVPerBlock // 2, totalAllocPoint)
+    assert masterChef.poolGOVPerAllocPointPaid(otherPid) == masterChef.accGOVPerAllocPoint()
+
+
+def testFarming_lazySetWhilePaused(requireFork, accounts, masterChef):
+    owner = masterChef.owner()
+    masterChef.migrateToLazyRewards({'from': owner})
+    lastRewardBlock = masterChef.poolInfo(PID)[2]
+
+    # the allocation can still be changed while farming is paused, the pool is settled after unpausing
+    masterChef.togglePause(True, {'from': owner})
+    chain.mine(5)
+    allocPoint = masterChef.poolInfo(PID)[1]
+    tx = masterChef.set(PID, allocPoint * 2, False, {'from': owner})
+    assert masterChef.poolInfo(PID)[1] == allocPoint * 2
+    assert masterChef.poolInfo(PID)[2] == lastRewardBlock
+    assert masterChef.lastGlobalRewardBlock() == tx.block_number
+
+    masterChef.togglePause(False, {'from': owner})
+    tx = masterChef.updatePool(PID, {'from': owner})
+    assert masterChef.poolInfo(PID)[2] == tx.block_number
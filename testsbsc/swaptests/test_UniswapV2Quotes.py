@@ -0,0 +1,25 @@
+#!/usr/bin/python3
+
+import pytest
+from offchain.uniswap_quotes import PairReserves, UniswapV2QuoteEngine, getConnector
+
+@pytest.fixture(scope="module")
+def swaps(accounts, SwapsImplUniswapV2_BSC):
+    return accounts[0].deploy(SwapsImplUniswapV2_BSC)
+
+def test_quotesMatchConnector(requireFork, swaps, BNB, ETH, WBTC, USDT, BUSD):
+    connector = getConnector("BSC", swaps)
+    engine = UniswapV2QuoteEngine(connector, PairReserves.fromConnector(connector))
+
+    tokens = [BNB, ETH, WBTC, USDT, BUSD]
+    for sourceToken in tokens:
+        decimals = sourceToken.decimals()
+        amounts = [10**decimals // 1000, 10**decimals, 1000 * 10**decimals, 10**6 * 10**decimals]
+        for destToken in tokens:
+            if sourceToken == destToken:
+                continue
+            amountsOut, midTokensOut = engine.dexAmountsOut(sourceToken, destToken, amounts)
+            amountsIn, midTokensIn = engine.dexAmountsIn(destToken, sourceToken, amounts)
+            for i, amount in enumerate(amounts):
+                assert(swaps.dexAmountOut(sourceToken, destToken, amount) == (amountsOut[i], midTokensOut[i]))
+                assert(swaps.dexAmountIn(destToken, sourceToken, amount) == (amountsIn[i], midTokensIn[i]))
@@ -2,6 +2,7 @@
 
 import pytest
 from brownie import ETH_ADDRESS, network, Contract, Wei, chain
+from brownie.exceptions import VirtualMachineError
 
 @pytest.fixture(scope="module")
 def requireMainnetFork():
@@ -64,7 +65,33 @@ def loadContractFromAbi(address, alias, abi):
         contract = Contract.from_abi(alias, address=address, abi=abi)
         return contract
 
-    
+
+
+def currentFeeTokens(feeExtractor):
+    # the public getter reverts past the end of the array
+    tokens = []
+    while True:
+        try:
+            tokens.append(feeExtractor.currentFeeTokens(len(tokens)))
+        except VirtualMachineError:
+            return tokens
+
+def testFeeExtractorAboveThreshold(requireMainnetFork, fn_isolation, FEE_EXTRACTOR, BZX, accounts):
+    tokens = currentFeeTokens(FEE_EXTRACTOR)
+    FEE_EXTRACTOR.setMinSwapValue(1e17, {"from": accounts[9]})
+    # USDT is swapped to BNB through BUSD
+    FEE_EXTRACTOR.setSwapHops(["0x55d398326f99059fF775485246999027B3197955"], ["0xe9e7CEA3DedcA5984780Bafc599bD69ADd087D56"], {"from": accounts[9]})
+
+    sweepAssets, valuesInBNB = FEE_EXTRACTOR.getSweepPlan(tokens)
+    skipped = [token for token in tokens if token not in sweepAssets]
+    feesHeld = BZX.queryFees(skipped, 0)[0]
+    tx = FEE_EXTRACTOR.sweepFeesAboveThreshold({"from": accounts[9]})
+
+    assert BZX.queryFees(sweepAssets, 0)[0] == [0] * len(sweepAssets)
+    assert BZX.queryFees(skipped, 0)[0] == feesHeld
+    if len(sweepAssets) != 0:
+        assert "ExtractAndDistribute" in tx.events
+
 
 def testFeeExtractor(requireMainnetFork, FEE_EXTRACTOR, BZX, MASTER_CHEF, BGOV, BZRX, WBNB, TestToken, accounts):
 
@@ -0,0 +1,29 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import network, Contract
+
+@pytest.fixture(scope="module")
+def requireMainnetFork():
+    assert (network.show_active() == "mainnet-fork" or network.show_active() == "mainnet-fork-alchemy")
+
+@pytest.fixture(scope="module")
+def BZRX(TestToken):
+    return Contract.from_abi("BZRX", "0x56d811088235F11C8920698a204A5010a788f4b3", TestToken.abi)
+
+def test_delegateBalanceOfBatch(requireMainnetFork, stakingV1, BZRX, accounts):
+    for i, amount in enumerate([100e18, 250e18, 0]):
+        if amount != 0:
+            BZRX.transfer(accounts[i], amount, {"from": BZRX.address})
+            BZRX.approve(stakingV1, amount, {"from": accounts[i]})
+            stakingV1.stake([BZRX], [amount], {"from": accounts[i]})
+
+    stakers = [accounts[0], accounts[1], accounts[2]]
+    totalVotes = stakingV1.delegateBalanceOfBatch(stakers)
+    assert(list(totalVotes) == [stakingV1.delegateBalanceOf(account) for account in stakers])
+    assert(totalVotes[0] >= 100e18)
+    assert(totalVotes[2] == 0)
+
+    earned = stakingV1.earnedBatch(stakers)
+    for i, account in enumerate(stakers):
+        assert(stakingV1.earned(account) == [e[i] for e in earned])
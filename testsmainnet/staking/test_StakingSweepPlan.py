@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import network, Contract, interface
+from offchain.fee_sweep import getSweepPlan
+
+@pytest.fixture(scope="module")
+def requireMainnetFork():
+    assert (network.show_active() == "mainnet-fork" or network.show_active() == "mainnet-fork-alchemy")
+
+@pytest.fixture(scope="module")
+def feeTokens(stakingV1):
+    # the 11 assets set with setFeeTokens in conftest
+    return [stakingV1.currentFeeTokens(i) for i in range(11)]
+
+@pytest.fixture(scope="module")
+def priceFeeds(bzx):
+    return Contract.from_abi("priceFeeds", address=bzx.priceFeeds(), abi=interface.IPriceFeeds.abi)
+
+def test_getSweepPlan(requireMainnetFork, stakingV1, bzx, priceFeeds, feeTokens):
+    assets = feeTokens
+    for gasPrice in [0, 50e9, 10**15]:
+        sweepAssets, valuesInEth = stakingV1.getSweepPlan(assets, gasPrice)
+        plan = getSweepPlan(bzx, priceFeeds, assets, gasPrice)
+        assert(list(sweepAssets) == plan.assets)
+        assert(sum(v for a, v in zip(assets, valuesInEth) if a in plan.assets) == plan.value)
+
+    # with free gas, every asset with priced fees is swept
+    sweepAssets, valuesInEth = stakingV1.getSweepPlan(assets, 0)
+    assert(list(sweepAssets) == [a for a, v in zip(assets, valuesInEth) if v != 0])
+
+def test_sweepFeesAboveDust(requireMainnetFork, stakingV1, bzx, feeTokens, accounts):
+    assets = feeTokens
+    gasPrice = 500e9
+    sweepAssets, _ = stakingV1.getSweepPlan(assets, gasPrice)
+    amountsBefore, _ = bzx.queryFees(assets, 0)
+
+    tx = stakingV1.sweepFeesAboveDust({"from": accounts[0], "gas_price": gasPrice})
+    assert("DistributeFees" in tx.events)
+
+    # dust stays in the protocol for a later sweep
+    amountsAfter, _ = bzx.queryFees(assets, 0)
+    for asset, before, after in zip(assets, amountsBefore, amountsAfter):
+        assert(after == (0 if asset in sweepAssets else before))
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import network, reverts, Contract
+from offchain.uniswap_quotes import ZERO_ADDRESS, PairReserves, UniswapV2QuoteEngine, getConnector
+
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+DAI = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+USDT = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+LINK = "0x514910771AF9Ca656af840dff83E8264EcF986CA"
+
+@pytest.fixture(scope="module")
+def requireMainnetFork():
+    assert (network.show_active() == "mainnet-fork" or network.show_active() == "mainnet-fork-alchemy")
+
+@pytest.fixture(scope="module")
+def swaps(accounts, SwapsImplUniswapV2_ETH):
+    return accounts[0].deploy(SwapsImplUniswapV2_ETH)
+
+def getEngine(swaps):
+    connector = getConnector("ETH", swaps)
+    return UniswapV2QuoteEngine(connector, PairReserves.fromConnector(connector))
+
+def test_defaultRoute(requireMainnetFork, swaps):
+    assert(swaps.getSwapRoute(LINK, DAI) == [ZERO_ADDRESS, WETH, DAI, USDC, USDT])
+    assert(swaps.splitRoutingEnabled() == False)
+
+    engine = getEngine(swaps)
+    for amount in [1e18, 1000e18, 100000e18]:
+        assert(swaps.dexAmountOut(LINK, DAI, amount) == engine.dexAmountOut(LINK, DAI, amount))
+        assert(swaps.dexAmountIn(LINK, DAI, amount) == engine.dexAmountIn(LINK, DAI, amount))
+
+def test_setSwapRoute(requireMainnetFork, swaps, accounts):
+    tx = swaps.setSwapRoute(LINK, DAI, [USDC], {"from": accounts[0]})
+    assert(tx.events["SetSwapRoute"]["midTokens"] == [USDC])
+    assert(swaps.getSwapRoute(LINK, DAI) == [USDC])
+    assert(swaps.getSwapRoute(DAI, LINK)[0] == ZERO_ADDRESS)
+
+    amountOut, midToken = swaps.dexAmountOut(LINK, DAI, 1000e18)
+    assert(midToken == USDC)
+    assert(amountOut == swaps._getAmountOut(1000e18, [LINK, USDC, DAI]))
+    assert(swaps.dexAmountIn(LINK, DAI, 1000e18)[1] == USDC)
+    assert(swaps.dexAmountOut(LINK, DAI, 1000e18) == getEngine(swaps).dexAmountOut(LINK, DAI, 1000e18))
+
+    # an empty list restores the default route
+    swaps.setSwapRoute(LINK, DAI, [], {"from": accounts[0]})
+    assert(swaps.getSwapRoute(LINK, DAI) == [ZERO_ADDRESS, WETH, DAI, USDC, USDT])
+
+    with reverts("too many routes"):
+        swaps.setSwapRoute(LINK, DAI, [WETH] * 9, {"from": accounts[0]})
+
+    with reverts("unauthorized"):
+        swaps.setSwapRoute(LINK, DAI, [USDC], {"from": accounts[1]})
+
+    with reverts("unauthorized"):
+        swaps.setSplitRouting(True, {"from": accounts[1]})
+
+def test_splitRouting(requireMainnetFork, swaps, accounts):
+    amountsIn = [1e18, 1000e18, 1000000e18]
+    singlePath = [swaps.dexAmountOut(LINK, USDC, amount) for amount in amountsIn]
+
+    tx = swaps.setSplitRouting(True, {"from": accounts[0]})
+    assert(tx.events["SetSplitRouting"]["enabled"] == True)
+
+    engine = getEngine(swaps)
+    amountsOut, midTokens, splitMidTokens, splitAmountsIn = engine.dexAmountsOutWithSplit(LINK, USDC, amountsIn)
+    for i, amount in enumerate(amountsIn):
+        amountOut, midToken, splitMidToken, splitAmountIn = swaps.dexAmountOutWithSplit(LINK, USDC, amount)
+        assert((amountOut, midToken, splitMidToken, splitAmountIn) == (amountsOut[i], midTokens[i], splitMidTokens[i], splitAmountsIn[i]))
+        assert(midToken == singlePath[i][1])
+        assert(amountOut >= singlePath[i][0])
+        if splitAmountIn == 0:
+            assert(amountOut == singlePath[i][0])
+            assert(splitMidToken == ZERO_ADDRESS)
+        else:
+            assert(splitMidToken != midToken)
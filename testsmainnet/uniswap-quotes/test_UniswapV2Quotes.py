@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+
+import pytest
+from brownie import network, Contract, interface
+from offchain.uniswap_quotes import PairReserves, UniswapV2QuoteEngine, getConnector
+
+@pytest.fixture(scope="module")
+def requireMainnetFork():
+    assert (network.show_active() == "mainnet-fork" or network.show_active() == "mainnet-fork-alchemy")
+
+@pytest.fixture(scope="module")
+def swaps(accounts, SwapsImplUniswapV2_ETH):
+    return accounts[0].deploy(SwapsImplUniswapV2_ETH)
+
+@pytest.fixture(scope="module")
+def tokens(TestToken):
+    return {
+        "WETH": Contract.from_abi("WETH", "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", TestToken.abi),
+        "DAI": Contract.from_abi("DAI", "0x6B175474E89094C44Da98b954EedeAC495271d0F", TestToken.abi),
+        "USDC": Contract.from_abi("USDC", "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", TestToken.abi),
+        "WBTC": Contract.from_abi("WBTC", "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599", TestToken.abi),
+        "LINK": Contract.from_abi("LINK", "0x514910771AF9Ca656af840dff83E8264EcF986CA", TestToken.abi),
+    }
+
+@pytest.fixture(scope="function")
+def engine(swaps):
+    connector = getConnector("ETH", swaps)
+    return UniswapV2QuoteEngine(connector, PairReserves.fromConnector(connector))
+
+def checkQuotes(swaps, engine, sourceToken, destToken):
+    decimals = sourceToken.decimals()
+    amounts = [10**decimals // 1000, 10**decimals, 1000 * 10**decimals, 10**6 * 10**decimals]
+
+    amountsOut, midTokensOut = engine.dexAmountsOut(sourceToken, destToken, amounts)
+    amountsIn, midTokensIn = engine.dexAmountsIn(destToken, sourceToken, amounts)
+    for i, amount in enumerate(amounts):
+        assert(swaps.dexAmountOut(sourceToken, destToken, amount) == (amountsOut[i], midTokensOut[i]))
+        assert(swaps.dexAmountIn(destToken, sourceToken, amount) == (amountsIn[i], midTokensIn[i]))
+
+def test_quotesMatchConnector(requireMainnetFork, swaps, engine, tokens):
+    names = list(tokens.keys())
+    for source in names:
+        for dest in names:
+            if source != dest:
+                checkQuotes(swaps, engine, tokens[source], tokens[dest])
+
+def test_quotesFollowSync(requireMainnetFork, swaps, engine, tokens, accounts):
+    weth = Contract.from_abi("WETH", tokens["WETH"].address, interface.IWethERC20.abi)
+    dai = tokens["DAI"]
+    engine.reserves.getPair(weth, dai)
+    engine.reserves.sync()
+
+    weth.deposit({ "from": accounts[0], "value": 10e18 })
+    weth.approve(engine.connector.router, 10e18, { "from": accounts[0] })
+    interface.IUniswapV2Router(engine.connector.router).swapExactTokensForTokens(
+        10e18,
+        1,
+        [weth, dai],
+        accounts[0],
+        2**32,
+        { "from": accounts[0] }
+    )
+
+    engine.reserves.sync()
+    pair = engine.reserves.getPair(weth, dai)
+    assert(engine.reserves.reserves[pair] == tuple(interface.IPancakePair(pair).getReserves()[:2]))
+    checkQuotes(swaps, engine, weth, dai)
@@ -0,0 +1,21 @@
+#!/usr/bin/python3
+
+import pytest
+from offchain.uniswap_quotes import PairReserves, UniswapV2QuoteEngine, getConnector
+
+def test_quotesMatchConnector(requireMaticFork, swaps, ETH, WBTC, USDC, USDT, DAI, WMATIC):
+    connector = getConnector("POLYGON", swaps)
+    engine = UniswapV2QuoteEngine(connector, PairReserves.fromConnector(connector))
+
+    tokens = [ETH, WBTC, USDC, USDT, DAI, WMATIC]
+    for sourceToken in tokens:
+        decimals = sourceToken.decimals()
+        amounts = [10**decimals // 1000, 10**decimals, 1000 * 10**decimals, 10**6 * 10**decimals]
+        for destToken in tokens:
+            if sourceToken == destToken:
+                continue
+            amountsOut, midTokensOut = engine.dexAmountsOut(sourceToken, destToken, amounts)
+            amountsIn, midTokensIn = engine.dexAmountsIn(destToken, sourceToken, amounts)
+            for i, amount in enumerate(amounts):
+                assert(swaps.dexAmountOut(sourceToken, destToken, amount) == (amountsOut[i], midTokensOut[i]))
+                assert(swaps.dexAmountIn(destToken, sourceToken, amount) == (amountsIn[i], midTokensIn[i]))